@@ -0,0 +1,389 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+
+"""
+Reproducible benchmark of grid2op, meant to compare the performances of different versions.
+
+It only uses the environments shipped with grid2op (`test=True`) so it runs offline. Each scenario
+uses fixed seeds (for the environment and for the agent) and reports:
+
+- "step": the number of steps per second (and the detailed timings of each phase of `env.step`,
+  see `env.get_timings()`, which are ``null`` for the grid2op versions that do not have it)
+- "simulate": the number of calls to `obs.simulate` per second
+- "reset": the latency of `env.reset`
+- "copy": the latency of `env.copy()`
+- "runner": the number of steps per second when the agent is evaluated with the `Runner`
+- "memory": the peak resident memory of the process (and optionally the peak memory allocated
+  by python, see `--trace-memory`). Each scenario is run in its own process, so that this peak
+  is not the one of the previous scenarios.
+
+Results are written as json, and can be compared with the results of another run:
+
+.. code-block:: bash
+
+    python benchmark_suite.py --out bench_1.10.4.json
+    # install another version of grid2op
+    python benchmark_suite.py --out bench_1.10.5.json --compare bench_1.10.4.json
+
+"""
+
+import argparse
+import concurrent.futures
+import copy
+import datetime
+import json
+import multiprocessing
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+
+import grid2op
+from grid2op.Action import PlayableAction
+from grid2op.Agent import BaseAgent
+from grid2op.Backend import PandaPowerBackend
+from grid2op.Parameters import Parameters
+from grid2op.Runner import Runner
+
+try:
+    import resource
+    RESOURCE_AVAIL = True
+except ImportError:
+    # not available on windows
+    RESOURCE_AVAIL = False
+
+
+SEED = 0
+NB_STEP = 200
+NB_WARMUP = 10
+NB_SIMULATE = 100
+NB_RESET = 10
+NB_COPY = 10
+NB_EPISODE_RUNNER = 2
+# metric used to compare two runs, with True if "higher is better"
+COMPARED_METRICS = {("step", "steps_per_s"): True,
+                    ("simulate", "simulate_per_s"): True,
+                    ("reset", "mean_ms"): False,
+                    ("copy", "mean_ms"): False,
+                    ("runner", "steps_per_s"): True,
+                    }
+
+
+class _PolicyAgent(BaseAgent):
+    """agent that uses the (seeded) policies of the scenarios below, to be usable by the runner"""
+    def __init__(self, action_space, policy, seed=SEED):
+        super().__init__(action_space)
+        self._policy = policy
+        self._seed = seed
+        self._rng = np.random.default_rng(seed)
+
+    def seed(self, seed):
+        self._rng = np.random.default_rng(seed)
+        return (seed, )
+
+    def reset(self, obs):
+        self._rng = np.random.default_rng(self._seed)
+
+    def act(self, observation, reward, done=False):
+        return self._policy(self.action_space, observation, self._rng)
+
+
+def _do_nothing(action_space, obs, rng):
+    return action_space()
+
+
+_TOPO_ACTIONS = {}
+
+
+def _topology(action_space, obs, rng):
+    # change the topology of a substation one step out of 4
+    if rng.random() >= 0.25:
+        return action_space()
+    sub_id = int(rng.choice([1, 2, 3, 4, 5, 8, 12]))
+    key = (type(action_space), sub_id)
+    if key not in _TOPO_ACTIONS:
+        _TOPO_ACTIONS[key] = action_space.get_all_unitary_topologies_set(action_space, sub_id=sub_id)
+    candidates = _TOPO_ACTIONS[key]
+    return candidates[int(rng.integers(len(candidates)))]
+
+
+def _redispatch(action_space, obs, rng):
+    gen_ids = np.nonzero(type(obs).gen_redispatchable)[0]
+    gen_id = int(rng.choice(gen_ids))
+    amount = float(rng.uniform(-0.5 * obs.gen_max_ramp_down[gen_id],
+                               0.5 * obs.gen_max_ramp_up[gen_id]))
+    return action_space({"redispatch": [(gen_id, amount)]})
+
+
+def _curtailment_storage(action_space, obs, rng):
+    cls = type(obs)
+    gen_ids = np.nonzero(cls.gen_renewable)[0]
+    curtail = [(int(gen_id), float(rng.uniform(0.5, 1.)))
+               for gen_id in gen_ids]
+    storage = [(int(sto_id), float(rng.uniform(-0.5 * cls.storage_max_p_absorb[sto_id],
+                                                0.5 * cls.storage_max_p_prod[sto_id])))
+               for sto_id in range(cls.n_storage)]
+    return action_space({"curtail": curtail, "set_storage": storage})
+
+
+# name: (env_name, kwargs of grid2op.make, policy)
+SCENARIOS = {
+    "do_nothing": ("l2rpn_case14_sandbox", {}, _do_nothing),
+    "topology": ("l2rpn_case14_sandbox", {}, _topology),
+    "redispatch": ("educ_case14_redisp", {}, _redispatch),
+    "curtailment_storage": ("educ_case14_storage", {"action_class": PlayableAction}, _curtailment_storage),
+    "opponent": ("l2rpn_icaps_2021",
+                 {"opponent_init_budget": 1000., "opponent_attack_cooldown": 12},
+                 _do_nothing),
+}
+
+
+def _stats_ms(durations):
+    durations = 1000. * np.asarray(durations, dtype=float)
+    return {"nb": int(durations.shape[0]),
+            "mean_ms": float(durations.mean()),
+            "p50_ms": float(np.percentile(durations, 50.)),
+            "max_ms": float(durations.max())}
+
+
+def _peak_rss_mb():
+    if not RESOURCE_AVAIL:
+        return None
+    res = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # in bytes on macos, in kilobytes on linux
+        return res / 1024. ** 2
+    return res / 1024.
+
+
+def make_env(env_name, make_kwargs, name, seed=SEED):
+    param = Parameters()
+    # games over would make the number of steps done depend on the speed of the agent
+    param.NO_OVERFLOW_DISCONNECTION = True
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        env = grid2op.make(env_name,
+                           test=True,
+                           param=param,
+                           backend=PandaPowerBackend(),
+                           _add_to_name=f"_bench_{name}",
+                           **make_kwargs)
+    env.seed(seed)
+    return env
+
+
+def bench_step(env, policy, nb_step, nb_warmup=NB_WARMUP, seed=SEED):
+    rng = np.random.default_rng(seed)
+    # first steps are slower (caches, lazy imports, etc.)
+    obs = env.reset(seed=seed, options={"time serie id": 0})
+    for _ in range(nb_warmup):
+        env.step(policy(env.action_space, obs, rng))
+    rng = np.random.default_rng(seed)
+    obs = env.reset(seed=seed, options={"time serie id": 0})
+    # the detailed timings are not available in all grid2op versions
+    timings_avail = hasattr(env, "enable_timings")
+    if timings_avail:
+        env.enable_timings()
+        env.reset_timings()
+    nb_done = 0
+    total_time = 0.
+    for _ in range(nb_step):
+        act = policy(env.action_space, obs, rng)
+        beg_ = time.perf_counter()
+        obs, reward, done, info = env.step(act)
+        total_time += time.perf_counter() - beg_
+        if done:
+            nb_done += 1
+            obs = env.reset(seed=seed + nb_done, options={"time serie id": 0})
+    res = {"nb_step": int(nb_step),
+           "nb_game_over": nb_done,
+           "total_s": total_time,
+           "steps_per_s": nb_step / total_time,
+           "timings": None}
+    if timings_avail:
+        res["timings"] = env.get_timings().to_dict()
+        env.enable_timings(False)
+    return res
+
+
+def bench_simulate(env, policy, nb_simulate, seed=SEED):
+    rng = np.random.default_rng(seed)
+    obs = env.reset(seed=seed, options={"time serie id": 0})
+    # the actions are computed before, the agent is not benchmarked
+    acts = [policy(env.action_space, obs, rng) for _ in range(nb_simulate)]
+    beg_ = time.perf_counter()
+    for act in acts:
+        obs.simulate(act)
+    total_time = time.perf_counter() - beg_
+    return {"nb_simulate": int(nb_simulate),
+            "total_s": total_time,
+            "simulate_per_s": nb_simulate / total_time}
+
+
+def bench_reset(env, nb_reset, seed=SEED):
+    nb_chron = len(env.chronics_handler.subpaths) if hasattr(env.chronics_handler, "subpaths") else 1
+    durations = []
+    for i in range(nb_reset):
+        beg_ = time.perf_counter()
+        env.reset(seed=seed + i, options={"time serie id": i % nb_chron})
+        durations.append(time.perf_counter() - beg_)
+    return _stats_ms(durations)
+
+
+def bench_copy(env, nb_copy, seed=SEED):
+    env.reset(seed=seed, options={"time serie id": 0})
+    durations = []
+    for _ in range(nb_copy):
+        beg_ = time.perf_counter()
+        env_cpy = env.copy()
+        durations.append(time.perf_counter() - beg_)
+        env_cpy.close()
+    return _stats_ms(durations)
+
+
+def bench_runner(env, policy, nb_episode, nb_process, max_iter, seed=SEED):
+    agent = _PolicyAgent(env.action_space, policy, seed=seed)
+    runner = Runner(**env.get_params_for_runner(), agentClass=None, agentInstance=agent)
+    beg_ = time.perf_counter()
+    res = runner.run(nb_episode=nb_episode,
+                     nb_process=nb_process,
+                     max_iter=max_iter,
+                     episode_id=[i for i in range(nb_episode)],
+                     env_seeds=[seed + i for i in range(nb_episode)],
+                     agent_seeds=[seed + i for i in range(nb_episode)])
+    total_time = time.perf_counter() - beg_
+    nb_step = int(sum([el[3] for el in res]))
+    return {"nb_episode": int(nb_episode),
+            "nb_process": int(nb_process),
+            "nb_step": nb_step,
+            "total_s": total_time,
+            "steps_per_s": nb_step / total_time}
+
+
+def run_scenario(name, args):
+    env_name, make_kwargs, policy = SCENARIOS[name]
+    if args.trace_memory:
+        tracemalloc.start()
+    env = make_env(env_name, make_kwargs, name, seed=args.seed)
+    try:
+        res = {"env_name": env_name}
+        res["step"] = bench_step(env, policy, args.nb_step, nb_warmup=args.nb_warmup, seed=args.seed)
+        res["simulate"] = bench_simulate(env, policy, args.nb_simulate, seed=args.seed)
+        res["reset"] = bench_reset(env, args.nb_reset, seed=args.seed)
+        res["copy"] = bench_copy(env, args.nb_copy, seed=args.seed)
+        if args.nb_episode_runner > 0:
+            res["runner"] = bench_runner(env, policy,
+                                         args.nb_episode_runner,
+                                         args.nb_process_runner,
+                                         args.nb_step,
+                                         seed=args.seed)
+    finally:
+        env.close()
+    res["memory"] = {"peak_rss_mb": _peak_rss_mb()}
+    if args.trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        res["memory"]["peak_traced_mb"] = peak / 1024. ** 2
+    return res
+
+
+def run_scenario_in_process(name, args):
+    """run the scenario in a new process (the peak memory of a process can only increase)"""
+    ctx = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=ctx) as executor:
+        return executor.submit(run_scenario, name, args).result()
+
+
+def get_meta(args):
+    import pandapower
+    import scipy
+    return {"grid2op": grid2op.__version__,
+            "numpy": np.__version__,
+            "scipy": scipy.__version__,
+            "pandapower": pandapower.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "date": datetime.datetime.now().isoformat(),
+            "args": copy.deepcopy(vars(args))}
+
+
+def compare(res, res_ref, tol):
+    """print the relative change of the main metrics, returns the list of regressions"""
+    regressions = []
+    for name, res_sc in res["scenarios"].items():
+        if name not in res_ref["scenarios"]:
+            continue
+        ref_sc = res_ref["scenarios"][name]
+        for (bench, metric), higher_is_better in COMPARED_METRICS.items():
+            if bench not in res_sc or bench not in ref_sc:
+                continue
+            val = res_sc[bench][metric]
+            ref = ref_sc[bench][metric]
+            ratio = val / ref
+            speedup = ratio if higher_is_better else 1. / ratio
+            flag = ""
+            if speedup < 1. - tol:
+                flag = "  <-- REGRESSION"
+                regressions.append((name, bench, metric, speedup))
+            print(f"{name:>20s} {bench:>9s} {metric:>15s}: {ref:12.3f} -> {val:12.3f} "
+                  f"(speed up x{speedup:.2f}){flag}", file=sys.stderr)
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Reproducible benchmark of grid2op")
+    parser.add_argument("--out", default=None, type=str,
+                        help="Path of the json file to write (printed if not provided)")
+    parser.add_argument("--scenarios", default=list(SCENARIOS.keys()), nargs="+",
+                        choices=list(SCENARIOS.keys()), help="Scenarios to run")
+    parser.add_argument("--seed", default=SEED, type=int)
+    parser.add_argument("--nb-step", default=NB_STEP, type=int,
+                        help="Number of steps per scenario (also the max_iter of the runner)")
+    parser.add_argument("--nb-warmup", default=NB_WARMUP, type=int,
+                        help="Number of steps done (and not measured) before the steps are benchmarked")
+    parser.add_argument("--nb-simulate", default=NB_SIMULATE, type=int)
+    parser.add_argument("--nb-reset", default=NB_RESET, type=int)
+    parser.add_argument("--nb-copy", default=NB_COPY, type=int)
+    parser.add_argument("--nb-episode-runner", default=NB_EPISODE_RUNNER, type=int,
+                        help="Number of episodes for the runner (0 to skip it)")
+    parser.add_argument("--nb-process-runner", default=1, type=int)
+    parser.add_argument("--trace-memory", default=False, action="store_true",
+                        help="Also report the peak memory allocated by python (slows down everything)")
+    parser.add_argument("--compare", default=None, type=str,
+                        help="Path of a json file written by a previous run to compare the results with")
+    parser.add_argument("--tol", default=0.1, type=float,
+                        help="Slow down tolerated before a metric is flagged as a regression")
+    args = parser.parse_args(args)
+
+    res = {"meta": get_meta(args), "scenarios": {}}
+    for name in args.scenarios:
+        print(f"Running scenario \"{name}\"", file=sys.stderr)
+        res["scenarios"][name] = run_scenario_in_process(name, args)
+
+    if args.out is not None:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(res, fp=f, indent=4, sort_keys=True)
+    else:
+        print(json.dumps(res, indent=4, sort_keys=True))
+
+    if args.compare is not None:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            res_ref = json.load(f)
+        regressions = compare(res, res_ref, args.tol)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,7 +8,7 @@
 
 import copy
 import numpy as np
-from typing import Tuple, Union
+from typing import Tuple, Union, Dict, List
 try:
     from typing import Self
 except ImportError:
@@ -569,6 +569,48 @@ class _BackendAction(GridObjects):
         res = self.__deepcopy__()  # nothing less to do
         return res
 
+    def _aux_value_store_names(self) -> List[str]:
+        res = ["last_topo_registered", "current_topo", "prod_p", "prod_v", "load_p", "load_q", "storage_power"]
+        if type(self).shunts_data_available:
+            res += ["shunt_p", "shunt_q", "shunt_bus", "current_shunt_bus"]
+        return res
+
+    def _get_state(self) -> Dict[str, np.ndarray]:
+        """
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Copy of the arrays representing this object (used by :func:`grid2op.Environment.BaseEnv.get_state`)
+
+        .. versionadded:: 1.10.5
+        """
+        res = {}
+        for attr_nm in self._aux_value_store_names():
+            val_store = getattr(self, attr_nm)
+            res[attr_nm] = (val_store.values.copy(), val_store.changed.copy(), val_store.last_index)
+        res["activated_bus"] = self.activated_bus.copy()
+        for attr_nm in ["_status_or_before", "_status_ex_before", "_status_or", "_status_ex"]:
+            res[attr_nm] = getattr(self, attr_nm).copy()
+        return res
+
+    def _set_state(self, state: Dict[str, np.ndarray]) -> None:
+        """
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Restore the state obtained with :func:`_BackendAction._get_state` (used by
+        :func:`grid2op.Environment.BaseEnv.set_state`)
+
+        .. versionadded:: 1.10.5
+        """
+        for attr_nm in self._aux_value_store_names():
+            val_store = getattr(self, attr_nm)
+            values, changed, last_index = state[attr_nm]
+            val_store.values[:] = values
+            val_store.changed[:] = changed
+            val_store.last_index = last_index
+        self.activated_bus[:, :] = state["activated_bus"]
+        for attr_nm in ["_status_or_before", "_status_ex_before", "_status_or", "_status_ex"]:
+            getattr(self, attr_nm)[:] = state[attr_nm]
+
     def reorder(self, no_load, no_gen, no_topo, no_storage, no_shunt) -> None:
         """
         .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
@@ -456,6 +456,12 @@ class BaseAction(GridObjects):
         self._lines_impacted = None
         self._subs_impacted = None
 
+        # see `BaseAction.freeze`
+        self._frozen = False
+        self._cache_ambiguity = None
+        self._cache_topo_impact = None
+        self._topo_impact_lines = None
+
         # shunts
         if type(self).shunts_data_available:
             self.shunt_p = np.full(
@@ -915,6 +921,7 @@ class BaseAction(GridObjects):
         self._modif_alert = self._raise_alert.any()
 
     def _assign_attr_from_name(self, attr_nm, vect):
+        self._raise_if_frozen()
         if hasattr(self, attr_nm):
             if attr_nm not in type(self).attr_list_set:
                 raise AmbiguousAction(
@@ -1185,6 +1192,22 @@ class BaseAction(GridObjects):
 
             print(action)
         """
+        if self._frozen:
+            # result only depends on the status of the powerlines this action acts on
+            if powerline_status is None:
+                key = None
+            else:
+                key = powerline_status[self._topo_impact_lines].tobytes()
+            if key not in self._cache_topo_impact:
+                lines_impacted, subs_impacted = self._aux_get_topological_impact(powerline_status)
+                lines_impacted.flags.writeable = False
+                subs_impacted.flags.writeable = False
+                self._cache_topo_impact[key] = (lines_impacted, subs_impacted)
+            self._lines_impacted, self._subs_impacted = self._cache_topo_impact[key]
+            return self._lines_impacted, self._subs_impacted
+        return self._aux_get_topological_impact(powerline_status)
+
+    def _aux_get_topological_impact(self, powerline_status=None) -> Tuple[np.ndarray, np.ndarray]:
         if self._dont_affect_topology():
             # action is not impacting the topology
             # so it does not modified anything concerning the topology
@@ -1377,6 +1400,7 @@ class BaseAction(GridObjects):
             
             
         """
+        self._raise_if_frozen()
         if not check_cooldown:
             line_under_cooldown = np.full(self.n_line, fill_value=True, dtype=dt_bool)
             if obs is None:
@@ -1476,6 +1500,7 @@ class BaseAction(GridObjects):
         Reset the action to the "do nothing" state.
 
         """
+        self._raise_if_frozen()
         # False(line is disconnected) / True(line is connected)
         self._set_line_status[:] = 0
         self._switch_line_status[:] = False
@@ -1718,6 +1743,7 @@ class BaseAction(GridObjects):
             print(act1)
 
         """
+        self._raise_if_frozen()
 
         # deal with injections
         self._aux_iadd_inj(other)
@@ -2151,6 +2177,7 @@ class BaseAction(GridObjects):
         Need to be called when update is called !
 
         """
+        self._raise_if_frozen()
         self._vectorized = None
         self._subs_impacted = None
         self._lines_impacted = None
@@ -2385,6 +2412,76 @@ class BaseAction(GridObjects):
 
         return self
 
+    def freeze(self) -> "BaseAction":
+        """
+        .. versionadded:: 1.10.5
+
+        Make this action immutable. The result of :func:`BaseAction.is_ambiguous` is then computed once and
+        stored, as well as the results of :func:`BaseAction.get_topological_impact`, so that the (many) calls
+        to these functions made by the environment (and the rules) at each step are simple lookups.
+
+        This is done for the actions of the :class:`grid2op.Converter.IdToAct` converter (and thus the
+        ones of the `DiscreteActSpace` of the gym compatibility module) that are used over and over.
+
+        Once frozen, the action cannot be modified anymore (:func:`BaseAction.update`, the `+=` operator,
+        setting the `set_bus` property etc. will raise an error). Use `act.copy()` to get a (non frozen)
+        copy of it that can be modified.
+
+        Returns
+        -------
+        self: :class:`BaseAction`
+            The (now frozen) action
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"  # or any other name
+            env = grid2op.make(env_name)
+
+            act = env.action_space({"set_line_status": [(0, -1)]}).freeze()
+            act.is_frozen  # True
+            act_cpy = act.copy()
+            act_cpy.is_frozen  # False
+            act_cpy.update({"set_line_status": [(1, -1)]})  # works
+            # act.update({"set_line_status": [(1, -1)]})  # would raise an error
+
+        """
+        if self._frozen:
+            return self
+        self._cache_ambiguity = self.is_ambiguous()
+        self._cache_topo_impact = {}
+        cls = type(self)
+        self._topo_impact_lines = (self._switch_line_status |
+                                   (self._set_line_status != 0) |
+                                   (self._set_topo_vect[cls.line_or_pos_topo_vect] != 0) |
+                                   (self._set_topo_vect[cls.line_ex_pos_topo_vect] != 0)
+                                   ).nonzero()[0]
+        for el in self._dict_inj.values():
+            el.flags.writeable = False
+        for attr_nm in ["_set_line_status", "_switch_line_status", "_set_topo_vect", "_change_bus_vect",
+                        "_hazards", "_maintenance", "_redispatch", "_storage_power", "_curtail",
+                        "_raise_alarm", "_raise_alert", "shunt_p", "shunt_q", "shunt_bus"]:
+            tmp = getattr(self, attr_nm)
+            if tmp is not None:
+                tmp.flags.writeable = False
+        self._frozen = True
+        return self
+
+    @property
+    def is_frozen(self) -> bool:
+        """.. versionadded:: 1.10.5
+
+        Whether this action is frozen (immutable), see :func:`BaseAction.freeze`"""
+        return self._frozen
+
+    def _raise_if_frozen(self):
+        if self._frozen:
+            raise AmbiguousAction("This action is frozen and cannot be modified. "
+                                  "Use `act.copy()` to get a copy that you can modify.")
+
     def is_ambiguous(self) -> Tuple[bool, AmbiguousAction]:
         """
         Says if the action, as defined is ambiguous *per se* or not.
@@ -2398,6 +2495,8 @@ class BaseAction(GridObjects):
         info: ``dict`` or not
             More information about the error. If the action is not ambiguous, it values to ``None``
         """
+        if self._frozen:
+            return self._cache_ambiguity
         try:
             self._check_for_ambiguity()
             res = False
@@ -6599,6 +6698,7 @@ class BaseAction(GridObjects):
         .. versionadded:: 1.10.2
         
         """
+        self._raise_if_frozen()
         if self._change_bus_vect.any():
             warnings.warn("This action modified the buses with `change_bus` ")
             self._change_bus_vect[:] = False
@@ -55,17 +55,9 @@ class GreedyAgent(BaseAgent):
         """
         self.tested_action = self._get_tested_action(observation)
         if len(self.tested_action) > 1:
-            self.resulting_rewards = np.full(
-                shape=len(self.tested_action), fill_value=np.NaN, dtype=dt_float
-            )
-            for i, action in enumerate(self.tested_action):
-                (
-                    simul_obs,
-                    simul_reward,
-                    simul_has_error,
-                    simul_info,
-                ) = observation.simulate(action)
-                self.resulting_rewards[i] = simul_reward
+            # all actions are simulated on the same forecast state
+            res_sim = observation.simulate_batch(self.tested_action)
+            self.resulting_rewards = res_sim["reward"].astype(dt_float)
             reward_idx = int(
                 np.argmax(self.resulting_rewards)
             )  # rewards.index(max(rewards))
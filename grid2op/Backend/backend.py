@@ -995,6 +995,147 @@ class Backend(GridObjects, ABC):
         bk_act += action
         self.apply_action(bk_act)
 
+    def _disconnect_lines(self, mask : np.ndarray) -> None:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using the action space to disconnect powerlines.
+            
+        Disconnect all the powerlines for which `mask` is ``True`` in the backend. This is used
+        by :func:`Backend.next_grid_state` to disconnect all the powerlines at once at 
+        each stage of a cascading failure.
+
+        The default implementation calls :func:`Backend._disconnect_line` for each powerline
+        if this method is overidden, otherwise it builds a single action for all the powerlines.
+        
+        .. versionadded:: 1.10.5
+        
+        .. note::
+            You might want to implement it for a new backend (default implementation most 
+            likely not efficient at all).
+            
+        Parameters
+        ----------
+        mask: ``numpy.ndarray``
+            A vector of boolean (with `n_line` elements), ``True`` for powerlines that 
+            will be disconnected.
+
+        """
+        my_cls = type(self)
+        if my_cls._disconnect_line is not Backend._disconnect_line:
+            # _disconnect_line is implemented by the backend, I use it
+            for id_ in np.flatnonzero(mask):
+                self._disconnect_line(int(id_))
+            return
+        action = my_cls._complete_action_class()
+        action.update({"set_line_status": [(int(id_), -1) for id_ in np.flatnonzero(mask)]})
+        bk_act = my_cls.my_bk_act_class()
+        bk_act += action
+        self.apply_action(bk_act)
+        
+    def _get_cascading_failure_snapshot(self) -> Dict[str, np.ndarray]:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+        
+        Retrieve the state of the powerlines at a given stage of a cascading failure. It is
+        stored in the "detailed_infos_for_cascading_failures" (when 
+        :attr:`Backend.detailed_infos_for_cascading_failures` is ``True``).
+        
+        .. versionadded:: 1.10.5
+        
+        Returns
+        -------
+        res: ``dict``
+            With keys "line_status", "p_or", "q_or", "v_or", "a_or", "p_ex", "q_ex", "v_ex", "a_ex"
+            (all of them copied)
+        """
+        p_or, q_or, v_or, a_or = self.lines_or_info()
+        p_ex, q_ex, v_ex, a_ex = self.lines_ex_info()
+        res = {"line_status": copy.deepcopy(self.get_line_status())}
+        for nm_, arr_ in zip(["p_or", "q_or", "v_or", "a_or", "p_ex", "q_ex", "v_ex", "a_ex"],
+                             [p_or, q_or, v_or, a_or, p_ex, q_ex, v_ex, a_ex]):
+            res[nm_] = copy.deepcopy(arr_)
+        return res
+
+    def get_internal_state(self) -> Dict[str, Any]:
+        """
+        .. versionadded:: 1.10.5
+
+        .. note::
+            It is not mandatory to implement this function when creating a backend. If it
+            is not available, :func:`grid2op.Environment.BaseEnv.get_state` and
+            :func:`grid2op.Environment.BaseEnv.set_state` cannot be used.
+
+        Retrieve everything that is modified by :func:`Backend.apply_action` and :func:`Backend.runpf`
+        (the inputs of the solver and its results) in a compact (and picklable) form, made of numpy arrays.
+
+        It should be much cheaper than a :func:`Backend.copy`: the static data of the grid (*eg*
+        the line parameters) are not part of it.
+
+        After a call to `backend.set_internal_state(state)` the backend should behave exactly
+        as it did when `state = backend.get_internal_state()` was called.
+
+        Returns
+        -------
+        res: ``dict``
+            The internal state of the backend (all values are copied)
+        """
+        raise NotImplementedError(
+            "Your backend does not support the retrieval of its internal state."
+        )
+
+    def set_internal_state(self, state: Dict[str, Any]) -> None:
+        """
+        .. versionadded:: 1.10.5
+
+        Restore the backend in the state `state`, obtained with :func:`Backend.get_internal_state`
+        from this backend or from a backend representing the same grid.
+
+        The `state` is not modified and can be used multiple times.
+
+        Parameters
+        ----------
+        state: ``dict``
+            The state, returned by :func:`Backend.get_internal_state`
+        """
+        raise NotImplementedError(
+            "Your backend does not support the modification of its internal state."
+        )
+
+    def get_dc_line_susceptance(self) -> np.ndarray:
+        """
+        .. versionadded:: 1.10.5
+
+        .. note::
+            It is not mandatory to implement this function when creating a backend. If it
+            is not available, the :class:`grid2op.simulator.SensitivitySimulator` cannot be used.
+
+        Retrieve the susceptance of each powerline (and transformer) as used in a DC powerflow, such that
+        the active power flowing from the origin side of powerline `l` is (in MW):
+
+        .. code-block:: python
+
+            p_or[l] = b[l] * (theta_or[l] - theta_ex[l])
+
+        with the voltage angles `theta_or` and `theta_ex` in radian (phase shifters are not taken into account).
+
+        It only depends on the static data of the grid (it does not change when the topology or the
+        injections change).
+
+        Returns
+        -------
+        b: ``np.ndarray``
+            The susceptance of each powerline, in MW / rad, of shape `(n_line, )`
+
+        """
+        raise NotImplementedError(
+            "Your backend does not give access to the susceptance of the powerlines."
+        )
+
     def _runpf_with_diverging_exception(self, is_dc : bool) -> Optional[Exception]:
         """
         INTERNAL
@@ -1058,8 +1199,12 @@ class Backend(GridObjects, ABC):
 
         infos: ``list``
             If :attr:`Backend.detailed_infos_for_cascading_failures` is ``True`` then it returns the different
-            state computed by the powerflow (can drastically slow down this function, as it requires
-            deep copy of backend object). Otherwise the list is always empty.
+            state computed by the powerflow (one dictionary per stage of the cascading failure, see 
+            :func:`Backend._get_cascading_failure_snapshot`). Otherwise the list is always empty.
+            
+        .. versionchanged:: 1.10.5
+            The `infos` are not copies of the backend anymore, but only the flows and the status 
+            of the powerlines (it was too slow to copy the backend).
 
         """
         infos = []
@@ -1097,14 +1242,12 @@ class Backend(GridObjects, ABC):
             disconnected_during_cf[to_disc] = ts
             
             # perform the disconnection action
-            for i, el in enumerate(to_disc):
-                if el:
-                    self._disconnect_line(i)
+            self._disconnect_lines(to_disc)
 
             # start a powerflow on this new state
             conv_ = self._runpf_with_diverging_exception(is_dc)
             if self.detailed_infos_for_cascading_failures:
-                infos.append(self.copy())
+                infos.append(self._get_cascading_failure_snapshot())
 
             if conv_ is not None:
                 break
@@ -2010,8 +2153,24 @@ class Backend(GridObjects, ABC):
                 '"grid2op.Observation.CompleteObservation".'
             )
 
+        backend_action = type(self).my_bk_act_class()
+        backend_action += self._get_action_from_obs(obs)
+        self.apply_action(backend_action)
+
+    def _get_action_from_obs(self,
+                             obs: "grid2op.Observation.CompleteObservation") -> "grid2op.Action.CompleteAction":
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.10.5
+
+        Get the complete action that sets a backend in the state described by the observation `obs`
+        (see :func:`Backend.update_from_obs`). This is the counterpart of :func:`Backend.get_action_to_set`
+        for an observation.
+        """
         cls = type(self)
-        backend_action = cls.my_bk_act_class()
         act = cls._complete_action_class()
         line_status = self._aux_get_line_status_to_set(obs.line_status)
         # skip the action part and update directly the backend action !
@@ -2046,8 +2205,7 @@ class Backend(GridObjects, ABC):
         elif cls.shunts_data_available and not type(obs).shunts_data_available:
             warnings.warn("Backend supports shunt but not the observation. This behaviour is non standard.")
         act.update(dict_)
-        backend_action += act
-        self.apply_action(backend_action)
+        return act
 
     def assert_grid_correct(self, _local_dir_cls=None) -> None:
         """
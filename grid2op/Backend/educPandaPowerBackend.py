@@ -15,13 +15,15 @@ import numpy as np
 import pandas as pd
 from typing import Optional, Tuple, Union
 
-import pandapower as pp
 import scipy
 
+from grid2op._glop_lazy_import import LazyModule
 from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Backend.backend import Backend
 from grid2op.Exceptions import *
 
+pp = LazyModule("pandapower")
+
 
 class EducPandaPowerBackend(Backend):
     """
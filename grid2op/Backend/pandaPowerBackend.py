@@ -9,18 +9,20 @@
 import os  # load the python os default module
 import sys  # laod the python sys default module
 import copy
+import inspect
 import warnings
+import importlib.util
 
 import numpy as np
 import pandas as pd
-from typing import Optional, Union, Tuple
+from typing import Optional, Union, Tuple, List, Dict
 
-import pandapower as pp
 import scipy
 # check that pandapower does not introduce some 
 from packaging import version
 
 import grid2op
+from grid2op._glop_lazy_import import LazyModule
 from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Action import BaseAction
 from grid2op.Exceptions import BackendError
@@ -28,11 +30,12 @@ from grid2op.Backend.backend import Backend
 
 MIN_LS_VERSION_VM_PU = version.parse("0.6.0")
 
-try:
-    import numba
-    NUMBA_ = True
-except (ImportError, ModuleNotFoundError):
-    NUMBA_ = False
+# pandapower (and numba) are imported only when first needed, this saves a lot of time
+# when grid2op is imported
+pp = LazyModule("pandapower")
+
+NUMBA_ = importlib.util.find_spec("numba") is not None
+if not NUMBA_:
     warnings.warn(
         "Numba cannot be loaded. You will gain possibly massive speed if installing it by "
         "\n\t{} -m pip install numba\n".format(sys.executable)
@@ -122,6 +125,9 @@ class PandaPowerBackend(Backend):
         max_iter : int=10,
         can_be_copied: bool=True,
         with_numba: bool=NUMBA_,
+        warm_start: bool=False,
+        skip_identical_pf: bool=False,
+        fast_reset: bool=False,
     ):
         from grid2op.MakeEnv.Make import _force_test_dataset
         if _force_test_dataset():
@@ -129,6 +135,9 @@ class PandaPowerBackend(Backend):
                 warnings.warn(f"Forcing `test=True` will disable numba for {type(self)}")
             with_numba = False
             
+        extra_kwargs = type(self)._aux_kwargs_for_copy({"warm_start": warm_start,
+                                                        "skip_identical_pf": skip_identical_pf,
+                                                        "fast_reset": fast_reset})
         Backend.__init__(
             self,
             detailed_infos_for_cascading_failures=detailed_infos_for_cascading_failures,
@@ -136,7 +145,8 @@ class PandaPowerBackend(Backend):
             lightsim2grid=lightsim2grid,
             dist_slack=dist_slack,
             max_iter=max_iter,
-            with_numba=with_numba
+            with_numba=with_numba,
+            **extra_kwargs
         )
         self.with_numba : bool = with_numba
         self.prod_pu_to_kv : Optional[np.ndarray] = None
@@ -171,6 +181,17 @@ class PandaPowerBackend(Backend):
         self._pf_init : str = "results"
         self._nb_bus_before : Optional[int] = None  # number of active bus at the preceeding step
 
+        # warm start of the AC powerflow and skipping of identical powerflows
+        self._warm_start : bool = warm_start
+        self._skip_identical_pf : bool = skip_identical_pf
+        self._topo_before : Optional[List[np.ndarray]] = None  # topology of the last converging AC powerflow
+        self._inj_before : Optional[List[np.ndarray]] = None  # injections of the last converging powerflow
+        self._is_dc_before : Optional[bool] = None
+        self._pf_stats : Dict[str, int] = {"skip_hits": 0,
+                                           "skip_misses": 0,
+                                           "warm_start_hits": 0,
+                                           "warm_start_misses": 0}
+
         self.thermal_limit_a : Optional[np.ndarray]  = None
 
         self._iref_slack : Optional[int] = None
@@ -198,7 +219,17 @@ class PandaPowerBackend(Backend):
         self._get_vector_inj = None
         self._big_topo_to_obj = None
         self._big_topo_to_backend = None
+        # same information as `_big_topo_to_backend` stored as vectors, used to read
+        # the bus of some elements of the topo_vect only (-1 type for storage units)
+        self._big_topo_to_type : Optional[np.ndarray] = None
+        self._big_topo_to_id_topo : Optional[np.ndarray] = None
+        # see `get_dc_line_susceptance`
+        self._dc_line_susceptance : Optional[np.ndarray] = None
         self.__pp_backend_initial_grid = None  # initial state to facilitate the "reset"
+        # only what grid2op modifies in the initial grid (see `get_internal_state`), used
+        # by the "reset" when the backend is created with `fast_reset=True`
+        self._fast_reset : bool = fast_reset
+        self.__pp_backend_initial_state : Optional[Dict] = None
 
         # Mapping some fun to apply bus updates
         self._type_to_bus_set = [
@@ -229,6 +260,11 @@ class PandaPowerBackend(Backend):
         self._in_service_storage_cold_id = None
         self.div_exception = None
 
+        # positions of the results in the pandapower result tables (see `_aux_get_res_plan`)
+        self._res_plan : Optional[Dict] = None
+        # pairs (load, generator) on the same substation (see `_aux_fix_load_v_dc`)
+        self._load_gen_same_sub : Optional[Tuple[np.ndarray, np.ndarray]] = None
+
     def _check_for_non_modeled_elements(self):
         """This function check for elements in the pandapower grid that will have no impact on grid2op.
         See the full list of grid2op modeled elements in :ref:`modeled-elements-module`
@@ -302,6 +338,23 @@ class PandaPowerBackend(Backend):
     def _load_grid_load_q_mvar(grid) -> pd.Series:
         return grid.load["q_mvar"]
 
+    @classmethod
+    def _aux_kwargs_for_copy(cls, kwargs : Dict) -> Dict:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Keeps only the kwargs accepted by the `__init__` of this class. They are stored in
+        `Backend._my_kwargs` and used to create copies of this backend (by the runner, the multi mix
+        environment etc.). Classes inheriting from this one with another signature can still be
+        copied: they opt in an option by accepting it in their `__init__` (or with `**kwargs`).
+        """
+        params = inspect.signature(cls.__init__).parameters
+        if any(el.kind == inspect.Parameter.VAR_KEYWORD for el in params.values()):
+            return kwargs
+        return {k: v for k, v in kwargs.items() if k in params}
+
     @staticmethod
     def _load_grid_gen_p_mw(grid) -> pd.Series:
         return grid.gen["p_mw"]
@@ -321,11 +374,19 @@ class PandaPowerBackend(Backend):
         Reload the grid.
         For pandapower, it is a bit faster to store of a copy of itself at the end of load_grid
         and deep_copy it to itself instead of calling load_grid again
+
+        If the backend is created with `fast_reset=True` (added in grid2op 1.10.5) the grid is not
+        copied: only the columns of the pandapower tables modified by grid2op (and the results of
+        the powerflow) are set back to their initial values (see
+        :func:`PandaPowerBackend.get_internal_state`).
         """
-        # Assign the content of itself as saved at the end of load_grid
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", FutureWarning)
-            self._grid = copy.deepcopy(self.__pp_backend_initial_grid)
+        if self._fast_reset and self.__pp_backend_initial_state is not None:
+            self._aux_set_grid_state(self.__pp_backend_initial_state)
+        else:
+            # Assign the content of itself as saved at the end of load_grid
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", FutureWarning)
+                self._grid = copy.deepcopy(self.__pp_backend_initial_grid)
         self._reset_all_nan()
         self._topo_vect[:] = self._get_topo_vect()
         self.comp_time = 0.0
@@ -541,6 +602,8 @@ class PandaPowerBackend(Backend):
                 pp.create_bus(self._grid, index=ind, **el)
         self._init_private_attrs()
         self._aux_run_pf_init()  # run yet another powerflow with the added buses
+        # static data, read from the internal representation of pandapower built by this powerflow
+        self._dc_line_susceptance = self._aux_get_dc_line_susceptance()
         
         # do this at the end
         self._in_service_line_col_id = int((self._grid.line.columns == "in_service").nonzero()[0][0])
@@ -738,6 +801,7 @@ class PandaPowerBackend(Backend):
         self.storage_q = np.full(self.n_storage, dtype=dt_float, fill_value=np.NaN)
         self.storage_v = np.full(self.n_storage, dtype=dt_float, fill_value=np.NaN)
         self._nb_bus_before = None
+        self._aux_forget_last_pf()
 
         # store the topoid -> objid
         self._big_topo_to_obj = [(None, None) for _ in range(self.dim_topo)]
@@ -778,6 +842,12 @@ class PandaPowerBackend(Backend):
                     l_id - self.__nb_powerline,
                     5,
                 )
+        self._big_topo_to_type = np.array([-1 if type_obj is None else type_obj
+                                           for _, _, type_obj in self._big_topo_to_backend],
+                                          dtype=dt_int)
+        self._big_topo_to_id_topo = np.array([-1 if id_topo is None else id_topo
+                                              for _, id_topo, _ in self._big_topo_to_backend],
+                                             dtype=dt_int)
 
         self.theta_or = np.full(self.n_line, fill_value=np.NaN, dtype=dt_float)
         self.theta_ex = np.full(self.n_line, fill_value=np.NaN, dtype=dt_float)
@@ -797,6 +867,8 @@ class PandaPowerBackend(Backend):
             self.__pp_backend_initial_grid = copy.deepcopy(
                 self._grid
             )  # will be initialized in the "assert_grid_correct"
+        if self._fast_reset:
+            self.__pp_backend_initial_state = self._aux_get_grid_state()
 
     def storage_deact_for_backward_comaptibility(self) -> None:
         cls = type(self)
@@ -910,12 +982,17 @@ class PandaPowerBackend(Backend):
                                                                                           cls.shunt_to_subid[chg_and_in_service])
 
         # i made at least a real change, so i implement it in the backend
-        for id_el, new_bus in topo__:
-            id_el_backend, id_topo, type_obj = self._big_topo_to_backend[id_el]
-
-            if type_obj is not None:
-                # storage unit are handled elsewhere
-                self._type_to_bus_set[type_obj](new_bus, id_el_backend, id_topo)
+        if (topo__.changed).any():
+            # elements already on their target bus are not modified (for example
+            # the complete "set_bus" vector sent when the environment is reset)
+            pos_changed = topo__.changed.nonzero()[0]
+            pos_changed = pos_changed[topo__.values[pos_changed] != self._get_topo_vect_at(pos_changed)]
+            for id_el in pos_changed:
+                id_el_backend, id_topo, type_obj = self._big_topo_to_backend[id_el]
+
+                if type_obj is not None:
+                    # storage unit are handled elsewhere
+                    self._type_to_bus_set[type_obj](topo__.values[id_el], id_el_backend, id_topo)
 
     def _apply_load_bus(self, new_bus, id_el_backend, id_topo):
         new_bus_backend = type(self).local_bus_to_global_int(
@@ -1007,7 +1084,127 @@ class PandaPowerBackend(Backend):
         )
         return res
 
-    def _aux_runpf_pp(self, is_dc: bool):
+    # columns read in the result tables after each powerflow
+    _RES_LINE_COLS = ("p_from_mw", "q_from_mvar", "vm_from_pu", "i_from_ka", "va_from_degree",
+                      "p_to_mw", "q_to_mvar", "vm_to_pu", "i_to_ka", "va_to_degree")
+    _RES_TRAFO_COLS = ("p_hv_mw", "q_hv_mvar", "vm_hv_pu", "i_hv_ka", "va_hv_degree",
+                       "p_lv_mw", "q_lv_mvar", "vm_lv_pu", "i_lv_ka", "va_lv_degree")
+    _RES_GEN_COLS = ("p_mw", "q_mvar", "vm_pu", "va_degree")
+    _RES_LOAD_COLS = ("p_mw", "q_mvar")
+    _RES_STORAGE_COLS = ("p_mw", "q_mvar")
+    _RES_BUS_COLS = ("vm_pu", "va_degree")
+
+    def _aux_get_res_plan(self) -> Dict:
+        """positions (in the pandapower result tables) of all the results read after each powerflow.
+        
+        It is computed once and only computed again if the layout of these tables changes.
+        """
+        grid = self._grid
+        tables = [("res_line", "_RES_LINE_COLS"),
+                  ("res_trafo", "_RES_TRAFO_COLS"),
+                  ("res_gen", "_RES_GEN_COLS"),
+                  ("res_load", "_RES_LOAD_COLS"),
+                  ("res_bus", "_RES_BUS_COLS")]
+        if type(self).n_storage:
+            tables.append(("res_storage", "_RES_STORAGE_COLS"))
+        plan = self._res_plan
+        if (plan is not None and
+            grid.res_bus.index.equals(plan["res_bus_index"]) and
+            all(grid[tab_nm].columns.equals(plan[tab_nm][0]) for tab_nm, _ in tables)):
+            return plan
+
+        plan = {}
+        for tab_nm, cols_attr in tables:
+            columns = grid[tab_nm].columns
+            cols_nm = getattr(type(self), cols_attr)
+            cols_id = columns.get_indexer(cols_nm)
+            if (cols_id < 0).any():
+                missing = [el for el, id_ in zip(cols_nm, cols_id) if id_ < 0]
+                raise BackendError(f"Impossible to read the results of the powerflow: columns {missing} "
+                                   f"are missing from the pandapower table \"{tab_nm}\".")
+            plan[tab_nm] = (columns, cols_id)
+        # position, in res_bus, of each bus (by its pandapower id)
+        res_bus_index = grid.res_bus.index
+        bus_to_pos = np.full(max(grid.bus.index.max(), res_bus_index.max()) + 1, fill_value=-1, dtype=dt_int)
+        bus_to_pos[res_bus_index.values] = np.arange(res_bus_index.shape[0])
+        plan["res_bus_index"] = res_bus_index
+        plan["bus_to_pos"] = bus_to_pos
+        self._res_plan = plan
+        return plan
+
+    @staticmethod
+    def _aux_res_values(table, cols) -> np.ndarray:
+        """some columns of a result table, as a float64 numpy array (without any pandas indexing)"""
+        return np.asarray(table.values, dtype=np.float64)[:, cols]
+
+    def _aux_runpp(self):
+        pp.runpp(
+            self._grid,
+            check_connectivity=False,
+            init=self._pf_init,
+            numba=self.with_numba,
+            lightsim2grid=self._lightsim2grid,
+            max_iteration=self._max_iter,
+            distributed_slack=self._dist_slack,
+        )
+
+    # columns of the pandapower tables used to know if the topology
+    # (resp. the injections) changed between two powerflows
+    _PF_TOPO_COLS = (("bus", "in_service"),
+                     ("line", "in_service"), ("line", "from_bus"), ("line", "to_bus"),
+                     ("trafo", "in_service"), ("trafo", "hv_bus"), ("trafo", "lv_bus"),
+                     ("gen", "in_service"), ("gen", "bus"),
+                     ("load", "in_service"), ("load", "bus"),
+                     ("ext_grid", "in_service"), ("ext_grid", "bus"),
+                     ("storage", "in_service"), ("storage", "bus"),
+                     ("shunt", "in_service"), ("shunt", "bus"),
+                     )
+    _PF_INJ_COLS = (("gen", "p_mw"), ("gen", "vm_pu"),
+                    ("load", "p_mw"), ("load", "q_mvar"),
+                    ("ext_grid", "vm_pu"),
+                    ("storage", "p_mw"),
+                    ("shunt", "p_mw"), ("shunt", "q_mvar"),
+                    )
+
+    def _get_pf_topo(self) -> List[np.ndarray]:
+        """all the "topological" inputs of the powerflow (copied)"""
+        return [self._grid[tab_nm][col_nm].values.copy() for tab_nm, col_nm in type(self)._PF_TOPO_COLS]
+
+    def _get_pf_inj(self) -> List[np.ndarray]:
+        """all the injections used by the powerflow (copied)"""
+        return [self._grid[tab_nm][col_nm].values.copy() for tab_nm, col_nm in type(self)._PF_INJ_COLS]
+
+    @staticmethod
+    def _aux_same_arrays(arrays, arrays_before) -> bool:
+        for arr, arr_before in zip(arrays, arrays_before):
+            if not np.array_equal(arr, arr_before):
+                return False
+        return True
+
+    def _aux_forget_last_pf(self) -> None:
+        """the next powerflow will be neither skipped nor warm started"""
+        self._topo_before = None
+        self._inj_before = None
+        self._is_dc_before = None
+
+    def get_pf_stats(self) -> Dict[str, int]:
+        """
+        .. versionadded:: 1.10.5
+        
+        Get the number of times the powerflow was skipped (``skip_hits``) or not (``skip_misses``)
+        because nothing changed since the last one (only counted if the backend is created 
+        with `skip_identical_pf=True`) and the number of times an AC powerflow was initialized
+        with the results of the previous one (``warm_start_hits``) or not (``warm_start_misses``)
+        (only counted if the backend is created with `warm_start=True`).
+
+        Returns
+        -------
+        res: ``dict``
+            The counters described above (this is a copy)
+        """
+        return copy.deepcopy(self._pf_stats)
+
+    def _aux_runpf_pp(self, is_dc: bool, pf_topo: Optional[List[np.ndarray]]=None):
         with warnings.catch_warnings():
             # remove the warning if _grid non connex. And it that case load flow as not converged
             warnings.filterwarnings(
@@ -1016,13 +1213,17 @@ class PandaPowerBackend(Backend):
             warnings.filterwarnings("ignore", category=RuntimeWarning)
             warnings.filterwarnings("ignore", category=DeprecationWarning)
             self._pf_init = "dc"
-            # nb_bus = self.get_nb_active_bus()
-            # if self._nb_bus_before is None:
-            #     self._pf_init = "dc"
-            # elif nb_bus == self._nb_bus_before:
-            #     self._pf_init = "results"
-            # else:
-            #     self._pf_init = "auto"
+            if not is_dc and self._warm_start:
+                if pf_topo is None:
+                    pf_topo = self._get_pf_topo()
+                if (self._is_dc_before is False and
+                    self._grid.res_bus.index.equals(self._grid.bus.index) and
+                    self._aux_same_arrays(pf_topo, self._topo_before)):
+                    # same topology as the last (converging) AC powerflow: start from its results
+                    self._pf_init = "results"
+                    self._pf_stats["warm_start_hits"] += 1
+                else:
+                    self._pf_stats["warm_start_misses"] += 1
 
             if (~self._grid.load["in_service"]).any():
                 # TODO see if there is a better way here -> do not handle this here, but rather in Backend._next_grid_state
@@ -1047,15 +1248,14 @@ class PandaPowerBackend(Backend):
                     # if dc i start normally next time i call an ac powerflow
                     self._nb_bus_before = None
                 else:
-                    pp.runpp(
-                        self._grid,
-                        check_connectivity=False,
-                        init=self._pf_init,
-                        numba=self.with_numba,
-                        lightsim2grid=self._lightsim2grid,
-                        max_iteration=self._max_iter,
-                        distributed_slack=self._dist_slack,
-                    )
+                    try:
+                        self._aux_runpp()
+                    except pp.powerflow.LoadflowNotConverged:
+                        if self._pf_init != "results":
+                            raise
+                        # the warm start did not work, try again with the default initialization
+                        self._pf_init = "dc"
+                        self._aux_runpp()
             except IndexError as exc_:
                 raise pp.powerflow.LoadflowNotConverged(f"Surprising behaviour of pandapower when a bus is not connected to "
                                                         f"anything but present on the bus (with check_connectivity=False). "
@@ -1078,18 +1278,45 @@ class PandaPowerBackend(Backend):
 
         .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
 
-        Run a power flow on the underlying _grid. This implements an optimization of the powerflow
-        computation: if the number of
-        buses has not changed between two calls, the previous results are re used. This speeds up the computation
-        in case of "do nothing" action applied.
+        Run a power flow on the underlying _grid. 
+        
+        This implements two optimizations of the powerflow computation (both disabled by default):
+        
+        - if the backend is created with `warm_start=True` and if the topology has not changed since
+          the last AC powerflow, the previous results are used to initialize the solver (instead of 
+          a DC powerflow). This speeds up the computation in case of "do nothing" action applied.
+        - if the backend is created with `skip_identical_pf=True` and if nothing (neither
+          the topology nor the injections) changed since the last powerflow, the powerflow is
+          not computed at all and the previous results are kept.
+        
+        See :func:`PandaPowerBackend.get_pf_stats` to know how often these optimizations are used.
         """
+        pf_topo = None
+        pf_inj = None
+        if self._skip_identical_pf:
+            pf_topo = self._get_pf_topo()
+            pf_inj = self._get_pf_inj()
+            if (self._inj_before is not None and 
+                self._is_dc_before == is_dc and
+                self._aux_same_arrays(pf_inj, self._inj_before) and
+                self._aux_same_arrays(pf_topo, self._topo_before)):
+                # nothing changed since the last powerflow, results are the same
+                self._pf_stats["skip_hits"] += 1
+                return True, None
+            self._pf_stats["skip_misses"] += 1
+        elif self._warm_start and not is_dc:
+            pf_topo = self._get_pf_topo()
+            
         try:
-            self._aux_runpf_pp(is_dc)
+            self._aux_runpf_pp(is_dc, pf_topo)
             cls = type(self)     
+            plan = self._aux_get_res_plan()
+            res_bus = self._aux_res_values(self._grid.res_bus, plan["res_bus"][1])
             # if a connected bus has a no voltage, it's a divergence (grid was not connected)
-            if self._grid.res_bus.loc[self._grid.bus["in_service"]]["va_degree"].isnull().any():
-                buses_ko = self._grid.res_bus.loc[self._grid.bus["in_service"]]["va_degree"].isnull()
-                buses_ko = buses_ko.values.nonzero()[0]
+            bus_in_service = self._aux_bus_pos(self._grid.bus.index.values[self._grid.bus["in_service"].values])
+            buses_ko = ~np.isfinite(res_bus[bus_in_service, 1])
+            if buses_ko.any():
+                buses_ko = buses_ko.nonzero()[0]
                 raise pp.powerflow.LoadflowNotConverged(f"Isolated bus, check buses {buses_ko} with `env.backend._grid.res_bus.iloc[{buses_ko}, :]`")
                                            
             (
@@ -1103,7 +1330,7 @@ class PandaPowerBackend(Backend):
                 self.load_q[:],
                 self.load_v[:],
                 self.load_theta[:],
-            ) = self._loads_info()
+            ) = self._loads_info(res_bus)
             
             if not is_dc:
                 if not np.isfinite(self.load_v).all():
@@ -1113,42 +1340,29 @@ class PandaPowerBackend(Backend):
             else:
                 # fix voltages magnitude that are always "nan" for dc case
                 # self._grid.res_bus["vm_pu"] is always nan when computed in DC
-                self.load_v[:] = self.load_pu_to_kv  # TODO
-                # need to assign the correct value when a generator is present at the same bus
-                # TODO optimize this ugly loop
-                # see https://github.com/e2nIEE/pandapower/issues/1996 for a fix
-                for l_id in range(cls.n_load):
-                    if cls.load_to_subid[l_id] in cls.gen_to_subid:
-                        ind_gens = (
-                            cls.gen_to_subid == cls.load_to_subid[l_id]
-                        ).nonzero()[0]
-                        for g_id in ind_gens:
-                            if (
-                                self._topo_vect[cls.load_pos_topo_vect[l_id]]
-                                == self._topo_vect[cls.gen_pos_topo_vect[g_id]]
-                            ):
-                                self.load_v[l_id] = self.prod_v[g_id]
-                                break
+                self._aux_fix_load_v_dc()
                             
             self.line_status[:] = self._get_line_status()
             # I retrieve the data once for the flows, so has to not re read multiple dataFrame
-            self.p_or[:] = self._aux_get_line_info("p_from_mw", "p_hv_mw")
-            self.q_or[:] = self._aux_get_line_info("q_from_mvar", "q_hv_mvar")
-            self.v_or[:] = self._aux_get_line_info("vm_from_pu", "vm_hv_pu")
-            self.a_or[:] = self._aux_get_line_info("i_from_ka", "i_hv_ka") * 1000.
-            self.theta_or[:] = self._aux_get_line_info(
-                "va_from_degree", "va_hv_degree"
+            res_line = np.concatenate(
+                (
+                    self._aux_res_values(self._grid.res_line, plan["res_line"][1]),
+                    self._aux_res_values(self._grid.res_trafo, plan["res_trafo"][1]),
+                )
             )
+            self.p_or[:] = res_line[:, 0]
+            self.q_or[:] = res_line[:, 1]
+            self.v_or[:] = res_line[:, 2]
+            self.a_or[:] = res_line[:, 3] * 1000.
+            self.theta_or[:] = res_line[:, 4]
             self.a_or[~np.isfinite(self.a_or)] = 0.0
             self.v_or[~np.isfinite(self.v_or)] = 0.0
 
-            self.p_ex[:] = self._aux_get_line_info("p_to_mw", "p_lv_mw")
-            self.q_ex[:] = self._aux_get_line_info("q_to_mvar", "q_lv_mvar")
-            self.v_ex[:] = self._aux_get_line_info("vm_to_pu", "vm_lv_pu")
-            self.a_ex[:] = self._aux_get_line_info("i_to_ka", "i_lv_ka") * 1000.
-            self.theta_ex[:] = self._aux_get_line_info(
-                "va_to_degree", "va_lv_degree"
-            )
+            self.p_ex[:] = res_line[:, 5]
+            self.q_ex[:] = res_line[:, 6]
+            self.v_ex[:] = res_line[:, 7]
+            self.a_ex[:] = res_line[:, 8] * 1000.
+            self.theta_ex[:] = res_line[:, 9]
             self.a_ex[~np.isfinite(self.a_ex)] = 0.0
             self.v_ex[~np.isfinite(self.v_ex)] = 0.0
 
@@ -1174,7 +1388,7 @@ class PandaPowerBackend(Backend):
                 self.storage_q[:],
                 self.storage_v[:],
                 self.storage_theta[:],
-            ) = self._storages_info()
+            ) = self._storages_info(res_bus)
             deact_storage = ~np.isfinite(self.storage_v)
             if (np.abs(self.storage_p[deact_storage]) > self.tol).any():
                 raise pp.powerflow.LoadflowNotConverged(
@@ -1189,6 +1403,10 @@ class PandaPowerBackend(Backend):
             if not self._grid.converged:
                 raise pp.powerflow.LoadflowNotConverged("Divergence without specific reason (self._grid.converged is False)")
             self.div_exception = None
+            # remember the inputs of this powerflow (for the warm start and to skip the next one)
+            self._topo_before = pf_topo
+            self._inj_before = pf_inj
+            self._is_dc_before = bool(is_dc)
             return True, None
 
         except pp.powerflow.LoadflowNotConverged as exc_:
@@ -1217,6 +1435,7 @@ class PandaPowerBackend(Backend):
         self.storage_q[:] = np.NaN
         self.storage_v[:] = np.NaN
         self._nb_bus_before = None
+        self._aux_forget_last_pf()
 
         self.theta_or[:] = np.NaN
         self.theta_ex[:] = np.NaN
@@ -1277,6 +1496,10 @@ class PandaPowerBackend(Backend):
 
         res._pf_init = self._pf_init
         res._nb_bus_before = self._nb_bus_before
+        res._topo_before = copy.deepcopy(self._topo_before)
+        res._inj_before = copy.deepcopy(self._inj_before)
+        res._is_dc_before = self._is_dc_before
+        res._pf_stats = copy.deepcopy(self._pf_stats)
 
         res.thermal_limit_a = copy.deepcopy(self.thermal_limit_a)
 
@@ -1305,9 +1528,14 @@ class PandaPowerBackend(Backend):
         res._get_vector_inj = copy.deepcopy(self._get_vector_inj)
         res._big_topo_to_obj = copy.deepcopy(self._big_topo_to_obj)
         res._big_topo_to_backend = copy.deepcopy(self._big_topo_to_backend)
+        res._big_topo_to_type = copy.deepcopy(self._big_topo_to_type)
+        res._big_topo_to_id_topo = copy.deepcopy(self._big_topo_to_id_topo)
+        res._dc_line_susceptance = copy.deepcopy(self._dc_line_susceptance)
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", FutureWarning)  
             res.__pp_backend_initial_grid = copy.deepcopy(self.__pp_backend_initial_grid)
+        # (it is never modified)
+        res.__pp_backend_initial_state = self.__pp_backend_initial_state
         
         # this is NOT the pandapower tolerance !!!! this is used to check if a storage unit
         # produce / absorbs anything
@@ -1321,6 +1549,7 @@ class PandaPowerBackend(Backend):
         res.gen_theta = copy.deepcopy(self.gen_theta)
         res.storage_theta = copy.deepcopy(self.storage_theta)
         
+        res._load_gen_same_sub = copy.deepcopy(self._load_gen_same_sub)
         res._in_service_line_col_id = self._in_service_line_col_id
         res._in_service_trafo_col_id = self._in_service_trafo_col_id
         
@@ -1328,6 +1557,115 @@ class PandaPowerBackend(Backend):
         res.div_exception = self.div_exception
         return res
 
+    # results of the powerflow stored in the backend (see `runpf`)
+    _STATE_RES_ATTRS = ("p_or", "q_or", "v_or", "a_or", "theta_or",
+                        "p_ex", "q_ex", "v_ex", "a_ex", "theta_ex",
+                        "load_p", "load_q", "load_v", "load_theta",
+                        "prod_p", "prod_q", "prod_v", "gen_theta",
+                        "storage_p", "storage_q", "storage_v", "storage_theta",
+                        "line_status", "_topo_vect")
+    # pandapower result tables (used to read the results and to warm start the solver)
+    _STATE_RES_TABLES = ("res_bus", "res_line", "res_trafo", "res_gen", "res_load",
+                         "res_ext_grid", "res_storage", "res_shunt")
+
+    def get_internal_state(self) -> Dict:
+        """
+        .. versionadded:: 1.10.5
+
+        See :func:`grid2op.Backend.Backend.get_internal_state`.
+
+        For this backend, it is made of the columns of the pandapower tables that can be
+        modified by grid2op (see `PandaPowerBackend._PF_TOPO_COLS` and `PandaPowerBackend._PF_INJ_COLS`),
+        of the pandapower result tables and of the results stored in the backend. The whole
+        pandapower grid is never copied.
+        """
+        res = self._aux_get_grid_state()
+        res["topo_before"] = copy.deepcopy(self._topo_before)
+        res["inj_before"] = copy.deepcopy(self._inj_before)
+        res["is_dc_before"] = self._is_dc_before
+        res["div_exception"] = self.div_exception
+        for attr_nm in type(self)._STATE_RES_ATTRS:
+            res[attr_nm] = getattr(self, attr_nm).copy()
+        return res
+
+    def _aux_get_grid_state(self) -> Dict:
+        """the part of the internal state stored in the pandapower grid"""
+        grid = self._grid
+        res_tables = {}
+        for tab_nm in type(self)._STATE_RES_TABLES:
+            if tab_nm not in grid:
+                continue
+            table = grid[tab_nm]
+            res_tables[tab_nm] = (table.values.copy(), table.index.values.copy(), table.columns.tolist())
+        return {"pf_topo": self._get_pf_topo(),
+                "pf_inj": self._get_pf_inj(),
+                "res_tables": res_tables,
+                "converged": bool(grid.converged),
+                }
+
+    def set_internal_state(self, state: Dict) -> None:
+        """
+        .. versionadded:: 1.10.5
+
+        See :func:`grid2op.Backend.Backend.set_internal_state`
+        """
+        cls = type(self)
+        self._aux_set_grid_state(state)
+        for attr_nm in cls._STATE_RES_ATTRS:
+            getattr(self, attr_nm)[:] = state[attr_nm]
+        self._topo_before = copy.deepcopy(state["topo_before"])
+        self._inj_before = copy.deepcopy(state["inj_before"])
+        self._is_dc_before = state["is_dc_before"]
+        self.div_exception = state["div_exception"]
+        self._nb_bus_before = None
+
+    def _aux_set_grid_state(self, state: Dict) -> None:
+        """restore the part of the internal state stored in the pandapower grid (see `_aux_get_grid_state`)"""
+        cls = type(self)
+        grid = self._grid
+        for (tab_nm, col_nm), arr in zip(cls._PF_TOPO_COLS, state["pf_topo"]):
+            grid[tab_nm][col_nm] = arr.copy()
+        for (tab_nm, col_nm), arr in zip(cls._PF_INJ_COLS, state["pf_inj"]):
+            grid[tab_nm][col_nm] = arr.copy()
+        for tab_nm, (values, index, columns) in state["res_tables"].items():
+            grid[tab_nm] = pd.DataFrame(values.copy(), index=index, columns=columns)
+        grid.converged = state["converged"]
+
+    def get_dc_line_susceptance(self) -> np.ndarray:
+        """
+        .. versionadded:: 1.10.5
+
+        See :func:`grid2op.Backend.Backend.get_dc_line_susceptance`
+
+        It is read, when the grid is loaded, from the internal representation of the grid used by
+        pandapower (the same as the one used by pandapower for its DC powerflows).
+        """
+        if self._dc_line_susceptance is None:
+            raise BackendError("Impossible to retrieve the susceptance of the powerlines: the grid is not loaded.")
+        return self._dc_line_susceptance.copy()
+
+    def _aux_get_dc_line_susceptance(self) -> Optional[np.ndarray]:
+        """susceptance of the powerlines read from the internal representation of pandapower (``None`` if no
+        powerflow has been run)"""
+        from pandapower.pypower.idx_brch import BR_X, TAP
+        ppc = self._grid._ppc if "_ppc" in self._grid else None
+        if ppc is None or "branch" not in ppc:
+            return None
+        branch = ppc["branch"]
+        lookup = self._grid._pd2ppc_lookups["branch"]
+        res = np.zeros(type(self).n_line, dtype=dt_float)
+        for el_nm, (start_g2op, end_g2op) in zip(("line", "trafo"),
+                                                 ((0, self.__nb_powerline),
+                                                  (self.__nb_powerline, type(self).n_line))):
+            if end_g2op <= start_g2op:
+                continue
+            start_ppc, end_ppc = lookup[el_nm]
+            x_pu = np.real(branch[start_ppc:end_ppc, BR_X])
+            tap = np.real(branch[start_ppc:end_ppc, TAP])
+            tap[tap == 0.] = 1.
+            res[start_g2op:end_g2op] = ppc["baseMVA"] / (x_pu * tap)
+        return res
+
     def close(self) -> None:
         """
         INTERNAL
@@ -1341,6 +1679,7 @@ class PandaPowerBackend(Backend):
         self._grid = None
         del self.__pp_backend_initial_grid
         self.__pp_backend_initial_grid = None
+        self.__pp_backend_initial_state = None
 
     def save_file(self, full_path: Union[os.PathLike, str]) -> None:
         """
@@ -1387,6 +1726,19 @@ class PandaPowerBackend(Backend):
         self._topo_vect[self.line_ex_pos_topo_vect[id_]] = -1
         self.line_status[id_] = False
 
+    def _disconnect_lines(self, mask):
+        ids = np.flatnonzero(mask)
+        if ids.shape[0] == 0:
+            return
+        is_line = ids < self._number_true_line
+        if is_line.any():
+            self._grid.line.iloc[ids[is_line], self._in_service_line_col_id] = False
+        if (~is_line).any():
+            self._grid.trafo.iloc[ids[~is_line] - self._number_true_line, self._in_service_trafo_col_id] = False
+        self._topo_vect[self.line_or_pos_topo_vect[ids]] = -1
+        self._topo_vect[self.line_ex_pos_topo_vect[ids]] = -1
+        self.line_status[ids] = False
+
     def _reconnect_line(self, id_):
         if id_ < self._number_true_line:
             self._grid.line.iloc[id_, self._in_service_line_col_id] = True
@@ -1423,17 +1775,41 @@ class PandaPowerBackend(Backend):
             res[cls.storage_pos_topo_vect[~storage_status]] = -1
         return res
 
+    # (table, bus column) of each type of `_big_topo_to_backend`
+    _TOPO_TYPE_TO_COL = (("load", "bus"), ("gen", "bus"),
+                         ("line", "from_bus"), ("trafo", "hv_bus"),
+                         ("line", "to_bus"), ("trafo", "lv_bus"))
+
+    def _get_topo_vect_at(self, pos_topo_vect):
+        """
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Same as :func:`PandaPowerBackend._get_topo_vect` but only for the elements
+        at positions `pos_topo_vect` of the topo_vect (read directly from the grid).
+
+        Storage units are not handled here (they are set to -1).
+        """
+        cls = type(self)
+        res = np.full(pos_topo_vect.shape[0], fill_value=-1, dtype=dt_int)
+        types = self._big_topo_to_type[pos_topo_vect]
+        for type_obj, (tab_nm, bus_col) in enumerate(self._TOPO_TYPE_TO_COL):
+            mask = types == type_obj
+            if not mask.any():
+                continue
+            table = self._grid[tab_nm]
+            id_topo = self._big_topo_to_id_topo[pos_topo_vect[mask]]
+            local_bus = cls.global_bus_to_local(table[bus_col].values[id_topo],
+                                                cls._topo_vect_to_sub[pos_topo_vect[mask]])
+            local_bus[~table["in_service"].values[id_topo]] = -1
+            res[mask] = local_bus
+        return res
+
     def _gens_info(self):
-        prod_p = self.cst_1 * self._grid.res_gen["p_mw"].values.astype(dt_float)
-        prod_q = self.cst_1 * self._grid.res_gen["q_mvar"].values.astype(dt_float)
-        prod_v = (
-            self.cst_1
-            * self._grid.res_gen["vm_pu"].values.astype(dt_float)
-            * self.prod_pu_to_kv
-        )
-        prod_theta = self.cst_1 * self._grid.res_gen["va_degree"].values.astype(
-            dt_float
-        )
+        res_gen = self._aux_res_values(self._grid.res_gen, self._aux_get_res_plan()["res_gen"][1]).astype(dt_float)
+        prod_p = self.cst_1 * res_gen[:, 0]
+        prod_q = self.cst_1 * res_gen[:, 1]
+        prod_v = self.cst_1 * res_gen[:, 2] * self.prod_pu_to_kv
+        prod_theta = self.cst_1 * res_gen[:, 3]
         if self._iref_slack is not None:
             # slack bus and added generator are on same bus. I need to add power of slack bus to this one.
 
@@ -1447,20 +1823,55 @@ class PandaPowerBackend(Backend):
                 ]
         return prod_p, prod_q, prod_v, prod_theta
 
-    def _loads_info(self):
-        load_p = self.cst_1 * self._grid.res_load["p_mw"].values.astype(dt_float)
-        load_q = self.cst_1 * self._grid.res_load["q_mvar"].values.astype(dt_float)
-        load_v = (
-            self._grid.res_bus.loc[self._grid.load["bus"].values][
-                "vm_pu"
-            ].values.astype(dt_float)
-            * self.load_pu_to_kv
-        )
-        load_theta = self._grid.res_bus.loc[self._grid.load["bus"].values][
-            "va_degree"
-        ].values.astype(dt_float)
+    def _aux_bus_pos(self, buses) -> np.ndarray:
+        """position, in `res_bus`, of the given (pandapower) buses"""
+        pos = self._aux_get_res_plan()["bus_to_pos"][buses]
+        if (pos < 0).any():
+            missing = np.unique(np.asarray(buses)[pos < 0])
+            raise BackendError(f"Impossible to read the results of the powerflow: buses {missing} "
+                               f"are missing from the pandapower table \"res_bus\".")
+        return pos
+
+    def _aux_res_bus_at(self, res_bus, buses) -> np.ndarray:
+        """voltage magnitude (pu) and angle (degree) of the given (pandapower) buses"""
+        if res_bus is None:
+            plan = self._aux_get_res_plan()
+            res_bus = self._aux_res_values(self._grid.res_bus, plan["res_bus"][1])
+        return res_bus[self._aux_bus_pos(buses)].astype(dt_float)
+
+    def _loads_info(self, res_bus=None):
+        res_load = self._aux_res_values(self._grid.res_load, self._aux_get_res_plan()["res_load"][1]).astype(dt_float)
+        load_p = self.cst_1 * res_load[:, 0]
+        load_q = self.cst_1 * res_load[:, 1]
+        bus_res = self._aux_res_bus_at(res_bus, self._grid.load["bus"].values)
+        load_v = bus_res[:, 0] * self.load_pu_to_kv
+        load_theta = bus_res[:, 1]
         return load_p, load_q, load_v, load_theta
 
+    def _aux_fix_load_v_dc(self):
+        """In DC, the voltages magnitude are not computed by pandapower. Loads get their nominal voltage, 
+        except if they are connected to the same bus as a generator (in this case they get the 
+        voltage setpoint of the first such generator)
+        
+        See https://github.com/e2nIEE/pandapower/issues/1996 for a fix on pandapower side
+        """
+        cls = type(self)
+        self.load_v[:] = self.load_pu_to_kv
+        if self._load_gen_same_sub is None:
+            # all pairs (load, generator) on the same substation, sorted by load then by generator
+            load_ids, gen_ids = (cls.load_to_subid.reshape(-1, 1) == cls.gen_to_subid.reshape(1, -1)).nonzero()
+            self._load_gen_same_sub = (load_ids, gen_ids)
+        load_ids, gen_ids = self._load_gen_same_sub
+        if load_ids.shape[0] == 0:
+            return
+        same_bus = (self._topo_vect[cls.load_pos_topo_vect[load_ids]] == 
+                    self._topo_vect[cls.gen_pos_topo_vect[gen_ids]])
+        load_ids = load_ids[same_bus]
+        gen_ids = gen_ids[same_bus]
+        # only the first generator of each load is used
+        load_ids, first_pos = np.unique(load_ids, return_index=True)
+        self.load_v[load_ids] = self.prod_v[gen_ids[first_pos]]
+
     def generators_info(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         return (
             self.cst_1 * self.prod_p,
@@ -1516,24 +1927,17 @@ class PandaPowerBackend(Backend):
             self.cst_1 * self.storage_v,
         )
 
-    def _storages_info(self):
+    def _storages_info(self, res_bus=None):
         if self.n_storage:
             # this is because we support "backward comaptibility" feature. So the storage can be
             # deactivated from the Environment...
-            p_storage = self._grid.res_storage["p_mw"].values.astype(dt_float)
-            q_storage = self._grid.res_storage["q_mvar"].values.astype(dt_float)
-            v_storage = (
-                self._grid.res_bus.loc[self._grid.storage["bus"].values][
-                    "vm_pu"
-                ].values.astype(dt_float)
-                * self.storage_pu_to_kv
-            )
-            theta_storage = (
-                self._grid.res_bus.loc[self._grid.storage["bus"].values][
-                    "vm_pu"
-                ].values.astype(dt_float)
-                * self.storage_pu_to_kv
-            )
+            res_storage = self._aux_res_values(self._grid.res_storage,
+                                               self._aux_get_res_plan()["res_storage"][1]).astype(dt_float)
+            p_storage = res_storage[:, 0]
+            q_storage = res_storage[:, 1]
+            bus_res = self._aux_res_bus_at(res_bus, self._grid.storage["bus"].values)
+            v_storage = bus_res[:, 0] * self.storage_pu_to_kv
+            theta_storage = bus_res[:, 1]
             v_storage[~self._grid.storage["in_service"].values] = 0.
         else:
             p_storage = np.zeros(shape=0, dtype=dt_float)
@@ -76,6 +76,16 @@ class GridStateFromFileWithForecastsWithMaintenance(GridStateFromFileWithForecas
         names_chronics_to_backend=None,
     ):
 
+        self._aux_init_maintenance_params(order_backend_lines)
+        super().initialize(
+            order_backend_loads,
+            order_backend_prods,
+            order_backend_lines,
+            order_backend_subs,
+            names_chronics_to_backend,
+        )
+
+    def _aux_init_maintenance_params(self, order_backend_lines):
         self.name_line = order_backend_lines
 
         # properties of maintenance
@@ -115,14 +125,34 @@ class GridStateFromFileWithForecastsWithMaintenance(GridStateFromFileWithForecas
                 ]]
             else:
                 self.maintenance_day_of_week = np.arange(5)
-                
-        super().initialize(
+
+    def _npy_cache_arrays(self):
+        # maintenance are generated randomly, they are not stored in the cache
+        return [el for el in super()._npy_cache_arrays()
+                if el not in ("maintenance", "maintenance_time", "maintenance_duration", "_order_maintenance")]
+
+    def _init_from_npy_cache(
+        self,
+        path_cache,
+        n_,
+        order_backend_loads,
+        order_backend_prods,
+        order_backend_lines,
+        order_backend_subs,
+        names_chronics_to_backend=None,
+    ):
+        self._aux_init_maintenance_params(order_backend_lines)
+        super()._init_from_npy_cache(
+            path_cache,
+            n_,
             order_backend_loads,
             order_backend_prods,
             order_backend_lines,
             order_backend_subs,
             names_chronics_to_backend,
         )
+        # same as in `_init_attrs` when the data are read from the csv
+        self._sample_maintenance()
 
     def _init_attrs(
         self, load_p, load_q, prod_p, prod_v, hazards=None, maintenance=None,
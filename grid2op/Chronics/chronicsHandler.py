@@ -238,4 +238,12 @@ class ChronicsHandler(RandomObject):
         if  self._real_data is None:
             return
         self._real_data.cleanup_action_space()
+
+    def close(self):
+        """INTERNAL, used to release the resources held by the time series
+        when the environment is closed (added in grid2op 1.10.5).
+        """
+        if self._real_data is None:
+            return
+        self._real_data.close()
         
\ No newline at end of file
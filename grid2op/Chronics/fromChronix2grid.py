@@ -71,6 +71,7 @@ class FromChronix2grid(GridValue):
                       "params_loss.json", "params_opf.json", "params_res.json", 
                       "prods_charac.csv", "scenario_params.json"]
     MULTI_CHRONICS = False
+    _CURSOR_ATTRS = GridValue._CURSOR_ATTRS + ("current_index",)
     def __init__(self,
                  env_path: os.PathLike,
                  with_maintenance: bool,
@@ -95,7 +95,30 @@ class GridStateFromFileWithForecastsWithoutMaintenance(GridStateFromFileWithFore
             order_backend_subs,
             names_chronics_to_backend=names_chronics_to_backend,
         )
+        self._aux_init_no_maint()
 
+    def _init_from_npy_cache(
+        self,
+        path_cache,
+        n_,
+        order_backend_loads,
+        order_backend_prods,
+        order_backend_lines,
+        order_backend_subs,
+        names_chronics_to_backend=None,
+    ):
+        super()._init_from_npy_cache(
+            path_cache,
+            n_,
+            order_backend_loads,
+            order_backend_prods,
+            order_backend_lines,
+            order_backend_subs,
+            names_chronics_to_backend=names_chronics_to_backend,
+        )
+        self._aux_init_no_maint()
+
+    def _aux_init_no_maint(self):
         self.maintenance_time_no_maint = (
             np.zeros(shape=(self.n_line,), dtype=dt_int) - 1
         )
@@ -189,6 +189,15 @@ class FromMultiEpisodeData(GridValue):
     
     def fast_forward(self, nb_timestep):
         self.data.fast_forward(nb_timestep)
+
+    def seek(self, time_step: int) -> None:
+        self.data.seek(time_step)
+
+    def get_cursor_state(self) -> Dict:
+        return self.data.get_cursor_state()
+
+    def set_cursor_state(self, state: Dict) -> None:
+        self.data.set_cursor_state(state)
         
     def get_init_action(self, names_chronics_to_backend: Optional[Dict[Literal["loads", "prods", "lines"], Dict[str, str]]]=None) -> Union["grid2op.Action.playableAction.PlayableAction", None]:
         return self.data.get_init_action(names_chronics_to_backend)
@@ -111,6 +111,7 @@ class FromNPY(GridValue):
     TODO
     """
     MULTI_CHRONICS = False
+    _CURSOR_ATTRS = GridValue._CURSOR_ATTRS + ("current_index",)
 
     def __init__(
         self,
@@ -360,6 +361,21 @@ class FromNPY(GridValue):
             prod_v,
         )
 
+    def fast_forward(self, nb_timestep):
+        self.seek(self.curr_iter + int(nb_timestep))
+
+    def seek(self, time_step: int) -> None:
+        nb_timestep = self._aux_nb_step_to_skip(time_step)
+        if nb_timestep == 0:
+            return
+        new_index = self.current_index + nb_timestep
+        if new_index > self._i_end or new_index >= self._load_p.shape[0]:
+            raise StopIteration
+        # maintenance and hazards are stored for all the steps, nothing to update for them
+        self.current_index = new_index
+        self.curr_iter = time_step
+        self.current_datetime += nb_timestep * self.time_interval
+
     def check_validity(
         self, backend: Optional["grid2op.Backend.backend.Backend"]
     ) -> None:
@@ -152,6 +152,8 @@ class FromOneEpisodeData(GridValue):
         
     """
     MULTI_CHRONICS = False
+    # the forecasts are computed from the injections of the current step
+    _CURSOR_ATTRS = GridValue._CURSOR_ATTRS + ("current_inj",)
        
     def __init__(
         self,
@@ -120,6 +120,7 @@ class GridStateFromFile(GridValue):
         backed. See the help of :func:`GridValue.initialize` for more information).
     """
     MULTI_CHRONICS = False
+    _CURSOR_ATTRS = GridValue._CURSOR_ATTRS + ("current_index",)
 
     def __init__(
         self,
@@ -194,6 +195,9 @@ class GridStateFromFile(GridValue):
         self._order_hazards = None
         self._order_maintenance = None
 
+        # where the data are memory mapped from, if loaded from a npy cache
+        self._npy_cache_path = None
+
         # order of the names in the backend
         self._order_backend_loads = None
         self._order_backend_prods = None
@@ -226,6 +230,9 @@ class GridStateFromFile(GridValue):
         self._order_hazards = None
         self._order_maintenance = None
 
+        # where the data are memory mapped from, if loaded from a npy cache
+        self._npy_cache_path = None
+
         # order of the names in the backend
         self._order_backend_loads = None
         self._order_backend_prods = None
@@ -511,48 +518,11 @@ class GridStateFromFile(GridValue):
         See help of :func:`GridValue.initialize` for a detailed help about the parameters.
 
         """
-        self.n_gen = len(order_backend_prods)
-        self.n_load = len(order_backend_loads)
-        self.n_line = len(order_backend_lines)
-
-        self._order_backend_loads = order_backend_loads
-        self._order_backend_prods = order_backend_prods
-        self._order_backend_lines = order_backend_lines
-
-        self.names_chronics_to_backend = copy.deepcopy(names_chronics_to_backend)
-        if self.names_chronics_to_backend is None:
-            self.names_chronics_to_backend = {}
-        if not "loads" in self.names_chronics_to_backend:
-            self.names_chronics_to_backend["loads"] = {
-                k: k for k in order_backend_loads
-            }
-        else:
-            self._assert_correct(
-                self.names_chronics_to_backend["loads"], order_backend_loads
-            )
-        if not "prods" in self.names_chronics_to_backend:
-            self.names_chronics_to_backend["prods"] = {
-                k: k for k in order_backend_prods
-            }
-        else:
-            self._assert_correct(
-                self.names_chronics_to_backend["prods"], order_backend_prods
-            )
-        if not "lines" in self.names_chronics_to_backend:
-            self.names_chronics_to_backend["lines"] = {
-                k: k for k in order_backend_lines
-            }
-        else:
-            self._assert_correct(
-                self.names_chronics_to_backend["lines"], order_backend_lines
-            )
-        if not "subs" in self.names_chronics_to_backend:
-            self.names_chronics_to_backend["subs"] = {k: k for k in order_backend_subs}
-        else:
-            self._assert_correct(
-                self.names_chronics_to_backend["subs"], order_backend_subs
-            )
-
+        self._aux_init_names(order_backend_loads,
+                             order_backend_prods,
+                             order_backend_lines,
+                             order_backend_subs,
+                             names_chronics_to_backend)
         self._init_date_time()
 
         # read the data
@@ -666,6 +636,66 @@ class GridStateFromFile(GridValue):
                     ' use  "ChangeNothing" and not "{}" to load chronics.'
                     "".format(self.path, type(self))
                 )
+        self._aux_set_n_max_iter(n_)
+
+        self._init_attrs(
+            load_p, load_q, prod_p, prod_v, hazards=hazards, maintenance=maintenance,
+            is_init=True
+        )
+
+        self.curr_iter = 0
+
+    def _aux_init_names(
+        self,
+        order_backend_loads,
+        order_backend_prods,
+        order_backend_lines,
+        order_backend_subs,
+        names_chronics_to_backend,
+    ):
+        self.n_gen = len(order_backend_prods)
+        self.n_load = len(order_backend_loads)
+        self.n_line = len(order_backend_lines)
+
+        self._order_backend_loads = order_backend_loads
+        self._order_backend_prods = order_backend_prods
+        self._order_backend_lines = order_backend_lines
+
+        self.names_chronics_to_backend = copy.deepcopy(names_chronics_to_backend)
+        if self.names_chronics_to_backend is None:
+            self.names_chronics_to_backend = {}
+        if not "loads" in self.names_chronics_to_backend:
+            self.names_chronics_to_backend["loads"] = {
+                k: k for k in order_backend_loads
+            }
+        else:
+            self._assert_correct(
+                self.names_chronics_to_backend["loads"], order_backend_loads
+            )
+        if not "prods" in self.names_chronics_to_backend:
+            self.names_chronics_to_backend["prods"] = {
+                k: k for k in order_backend_prods
+            }
+        else:
+            self._assert_correct(
+                self.names_chronics_to_backend["prods"], order_backend_prods
+            )
+        if not "lines" in self.names_chronics_to_backend:
+            self.names_chronics_to_backend["lines"] = {
+                k: k for k in order_backend_lines
+            }
+        else:
+            self._assert_correct(
+                self.names_chronics_to_backend["lines"], order_backend_lines
+            )
+        if not "subs" in self.names_chronics_to_backend:
+            self.names_chronics_to_backend["subs"] = {k: k for k in order_backend_subs}
+        else:
+            self._assert_correct(
+                self.names_chronics_to_backend["subs"], order_backend_subs
+            )
+
+    def _aux_set_n_max_iter(self, n_):
         self.n_ = n_  # the -1 is present because the initial grid state doesn't count as a "time step"
 
         if self._max_iter > 0:
@@ -681,13 +711,88 @@ class GridStateFromFile(GridValue):
             # from these data.
             self._max_iter = self.n_ - 1
 
-        self._init_attrs(
-            load_p, load_q, prod_p, prod_v, hazards=hazards, maintenance=maintenance,
-            is_init=True
-        )
+    def _npy_cache_arrays(self):
+        """name of the attributes stored in the npy cache (see :func:`MultifolderWithCache.build_npy_cache`)"""
+        return ["load_p", "load_q", "prod_p", "prod_v",
+                "hazards", "hazard_duration",
+                "maintenance", "maintenance_time", "maintenance_duration",
+                "_order_load_p", "_order_load_q", "_order_prod_p", "_order_prod_v",
+                "_order_hazards", "_order_maintenance"]
+
+    def _save_npy_cache(self, path_out):
+        """
+        INTERNAL
 
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Used by :func:`MultifolderWithCache.build_npy_cache`
+
+        Save the data (in the order of the backend) of an initialized instance in `path_out` 
+        (one ".npy" file per array). It returns the number of rows of the data.
+        """
+        for nm in self._npy_cache_arrays():
+            arr = getattr(self, nm)
+            if arr is not None:
+                np.save(os.path.join(path_out, f"{nm}.npy"), np.asarray(arr))
+        return int(self.n_)
+
+    def _init_from_npy_cache(
+        self,
+        path_cache,
+        n_,
+        order_backend_loads,
+        order_backend_prods,
+        order_backend_lines,
+        order_backend_subs,
+        names_chronics_to_backend=None,
+    ):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Used by :class:`MultifolderWithCache`
+
+        Same as :func:`GridStateFromFile.initialize` but the data are memory mapped (read only) from
+        the ".npy" files written by :func:`GridStateFromFile._save_npy_cache` instead of being read
+        from the csv.
+        """
+        self._aux_init_names(order_backend_loads,
+                             order_backend_prods,
+                             order_backend_lines,
+                             order_backend_subs,
+                             names_chronics_to_backend)
+        self._init_date_time()
+        for nm in self._npy_cache_arrays():
+            path_arr = os.path.join(path_cache, f"{nm}.npy")
+            arr = None
+            if os.path.exists(path_arr):
+                arr = np.load(path_arr, mmap_mode="r")
+            setattr(self, nm, arr)
+        self._npy_cache_path = path_cache
+        self._aux_set_n_max_iter(n_)
+        self.tmp_max_index = self.n_
         self.curr_iter = 0
 
+    def __getstate__(self):
+        res = self.__dict__.copy()
+        if self._npy_cache_path is not None:
+            # memory mapped arrays are neither copied nor pickled: they are mapped
+            # again from the npy cache (so the memory is still shared)
+            mapped = []
+            for nm in self._npy_cache_arrays():
+                if isinstance(res.get(nm), np.memmap):
+                    res[nm] = None
+                    mapped.append(nm)
+            res["_npy_cache_mapped"] = mapped
+        return res
+
+    def __setstate__(self, state):
+        mapped = state.pop("_npy_cache_mapped", [])
+        self.__dict__.update(state)
+        for nm in mapped:
+            setattr(self, nm, np.load(os.path.join(self._npy_cache_path, f"{nm}.npy"), mmap_mode="r"))
+
     @staticmethod
     def _file_len(fname, ext_):
         res = pd.read_csv(fname, sep="@", dtype=str).shape[0]
@@ -809,7 +914,39 @@ class GridStateFromFile(GridValue):
         if self._max_iter == -1:
             return self.n_ - 1
         return self._max_iter 
-    
+
+    def get_cursor_state(self) -> Dict:
+        if self.chunk_size is not None:
+            raise ChronicsError("Impossible to retrieve the position in the time series when they are "
+                                "read by chunk (`chunk_size` is not None): the data already read are "
+                                "not kept in memory.")
+        return super().get_cursor_state()
+
+    def fast_forward(self, nb_timestep):
+        self.seek(self.curr_iter + int(nb_timestep))
+
+    def seek(self, time_step: int) -> None:
+        if self.chunk_size is not None:
+            # data are read by chunk, they need to be read in order (and the chunks
+            # of the forecasts are loaded when the forecasts are read)
+            for _ in range(self._aux_nb_step_to_skip(time_step)):
+                self.load_next()
+                self.forecasts()
+            return
+        nb_timestep = self._aux_nb_step_to_skip(time_step)
+        if nb_timestep == 0:
+            return
+        new_index = self.current_index + nb_timestep
+        if new_index >= self.tmp_max_index:
+            raise StopIteration
+        if self._max_iter > 0 and time_step - 1 > self._max_iter:
+            raise StopIteration
+        # maintenance and hazards (and their durations) are computed for
+        # all the steps when the data are read, nothing to update for them
+        self.current_index = new_index
+        self.curr_iter = time_step
+        self.current_datetime += nb_timestep * self.time_interval
+
     def _data_in_memory(self):
         if self.chunk_size is None:
             # if i don't use chunk, all the data are in memory alreay
@@ -220,6 +220,12 @@ class GridStateFromFileWithForecasts(GridStateFromFile):
             load_p, load_q, prod_p, prod_v
         )
 
+    def _npy_cache_arrays(self):
+        return super()._npy_cache_arrays() + [
+            "load_p_forecast", "load_q_forecast", "prod_p_forecast", "prod_v_forecast",
+            "_order_load_p_forecasted", "_order_load_q_forecasted",
+            "_order_prod_p_forecasted", "_order_prod_v_forecasted"]
+
     def _init_attrs_forecast(self, load_p, load_q, prod_p, prod_v):
         # TODO refactor that with _init_attrs from super()
         self.load_p_forecast = None
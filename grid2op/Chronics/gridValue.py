@@ -10,12 +10,12 @@ import numpy as np
 import warnings
 from datetime import datetime, timedelta
 from abc import ABC, abstractmethod
-from typing import Union, Dict, Literal
+from typing import Union, Dict, Literal, Any
 
 import grid2op
 from grid2op.dtypes import dt_int
 from grid2op.Space import RandomObject
-from grid2op.Exceptions import EnvError, Grid2OpException
+from grid2op.Exceptions import EnvError, Grid2OpException, ChronicsError
 
 # TODO sous echantillonner ou sur echantilloner les scenario: need to modify everything that affect the number
 # TODO of time steps there, for example "Space.gen_min_time_on" or "params.NB_TIMESTEP_POWERFLOW_ALLOWED" for
@@ -821,6 +821,89 @@ class GridValue(RandomObject, ABC):
         for _ in range(nb_timestep):
             self.load_next()
 
+    def seek(self, time_step: int) -> None:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.fast_forward_chronics`
+
+        .. versionadded:: 1.10.5
+
+        Put this object in the state it would be in after `time_step` calls to
+        :func:`GridValue.load_next` since the beginning of the episode (the next call to
+        `load_next` will then return the data of step `time_step + 1`).
+
+        By default, this calls :func:`GridValue.fast_forward` (so :func:`GridValue.load_next` is
+        called once per step skipped). Classes that can directly "jump" to a given step in their
+        data (for example :class:`GridStateFromFile`, :class:`FromNPY` or :class:`FromHandlers`)
+        overload it, in which case the cost of this function does not depend on the number of steps skipped.
+
+        It is only possible to go "forward" in the time series.
+
+        Parameters
+        ----------
+        time_step: ``int``
+            The step to go to (number of steps since the beginning of the episode)
+
+        Raises
+        ------
+        StopIteration
+            If there are not enough data to reach this step.
+        """
+        self.fast_forward(self._aux_nb_step_to_skip(time_step))
+
+    def _aux_nb_step_to_skip(self, time_step: int) -> int:
+        time_step = int(time_step)
+        if time_step < self.curr_iter:
+            raise ChronicsError(f"Impossible to go back in the time series: asking to go to step {time_step} "
+                                f"but step {self.curr_iter} has already been read.")
+        return time_step - self.curr_iter
+
+    # attributes giving the position of this object in its time series
+    # (see `get_cursor_state`), classes that read the data with another "cursor" extend it
+    _CURSOR_ATTRS = ("curr_iter", "current_datetime")
+
+    def get_cursor_state(self) -> Dict[str, Any]:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.get_state`
+
+        .. versionadded:: 1.10.5
+
+        Position of this object in the time series it currently reads. After a call to
+        `self.set_cursor_state(state)`, the data (see :func:`GridValue.load_next` and
+        :func:`GridValue.forecasts`) are read from where they were when
+        `state = self.get_cursor_state()` was called.
+
+        It cannot be used to change the time series used (see :func:`GridValue.get_id`).
+
+        Returns
+        -------
+        res: ``dict``
+            The position in the time series
+        """
+        return {attr_nm: getattr(self, attr_nm) for attr_nm in type(self)._CURSOR_ATTRS}
+
+    def set_cursor_state(self, state: Dict[str, Any]) -> None:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.set_state`
+
+        .. versionadded:: 1.10.5
+
+        Set the position in the time series to `state` (see :func:`GridValue.get_cursor_state`)
+        """
+        for attr_nm in type(self)._CURSOR_ATTRS:
+            setattr(self, attr_nm, state[attr_nm])
+
     def get_init_action(self, names_chronics_to_backend: Dict[Literal["loads", "prods", "lines"], Dict[str, str]]) -> Union["grid2op.Action.playableAction.PlayableAction", None]:
         """
         It is used when the environment is reset (*ie* when :func:`grid2op.Environment.Environment.reset` is called)
@@ -857,6 +940,17 @@ class GridValue(RandomObject, ABC):
         self.__action_space = None
         # NB the action space is not closed as it is NOT own by this class
 
+    def close(self):
+        """
+        INTERNAL
+
+        .. versionadded:: 1.10.5
+
+        Called when the environment using these time series is closed, to release the
+        resources (*eg* threads) they might hold. It does nothing by default.
+        """
+        pass
+
     def regenerate_with_new_seed(self):
         """
         INTERNAL this function is called by some classes (*eg* :class:`MultifolderWithCache`)
@@ -481,6 +481,44 @@ class BaseHandler(RandomObject):
         """
         return None
 
+    def can_seek(self, time_step: int) -> bool:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.10.5
+
+        Whether this handler can directly go to the step `time_step` (see :func:`BaseHandler.seek`).
+
+        If one of the handlers of a :class:`grid2op.Chronics.FromHandlers` cannot, then the
+        steps are all read one by one when the time series are "fast forwarded".
+
+        By default it returns ``False``.
+        """
+        return False
+
+    def seek(self, time_step: int) -> None:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.10.5
+
+        This function is called by the :class:`grid2op.Chronics.FromHandlers` (only if
+        `self.can_seek(time_step)` is ``True``) to put the handler in the state it would be after
+        `time_step` steps since the beginning of the episode (*ie* as if :func:`BaseHandler.load_next`
+        -- or :func:`BaseHandler.forecast` for each horizon for the forecast handlers --
+        was called `time_step` times).
+
+        Parameters
+        ----------
+        time_step : int
+            The step to go to
+        """
+        raise NotImplementedError()
+
     def get_init_dict_action(self) -> Union[dict, None]:
         """
         INTERNAL
@@ -363,6 +363,17 @@ class CSVHandler(BaseHandler):
         self.curr_iter = 0
         if self.chunk_size is not None:
             self._clear()  # we should have to reload everything if all data have been already loaded
+
+    def can_seek(self, time_step):
+        # when read by chunk, data need to be read in order
+        return self.chunk_size is None and self.array is not None
+
+    def seek(self, time_step):
+        # `_nb_row_per_step` rows are read at each step (one per horizon for the forecasts)
+        new_index = int(time_step) * self._nb_row_per_step - 1
+        if new_index >= self.tmp_max_index:
+            raise StopIteration
+        self.current_index = new_index
     
     def get_future_data(self, horizon: int, quiet_warnings : bool=False):
         horizon = int(horizon)
@@ -34,6 +34,14 @@ class DoNothingHandler(BaseHandler):
     def done(self):
         # there is nothing to do for the DoNothingHandler
         return False
+
+    def can_seek(self, time_step):
+        # there is nothing to do for the DoNothingHandler
+        return True
+
+    def seek(self, time_step):
+        # there is nothing to do for the DoNothingHandler
+        pass
         
     def forecast(self,
                  forecast_horizon_id,
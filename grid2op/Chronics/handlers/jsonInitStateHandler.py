@@ -38,6 +38,14 @@ class JSONInitStateHandler(BaseHandler):
     
     def done(self) -> bool:
         return False
+
+    def can_seek(self, time_step: int) -> bool:
+        # the initial state does not depend on the step
+        return True
+
+    def seek(self, time_step: int) -> None:
+        # the initial state does not depend on the step
+        pass
     
     def get_init_dict_action(self) -> Union[dict, None]:
         maybe_path = os.path.join(self.path, "init_state.json")
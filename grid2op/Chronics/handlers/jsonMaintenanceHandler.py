@@ -131,6 +131,14 @@ class JSONMaintenanceHandler(BaseHandler):
     def done(self):
         # maintenance can be generated on the fly so they are never "done"
         return False
+
+    def can_seek(self, time_step):
+        # when the end of the maintenance generated is reached, new ones are
+        # generated (step by step)
+        return self.maintenance is not None and int(time_step) < self.maintenance.shape[0]
+
+    def seek(self, time_step):
+        self.current_index = int(time_step)
     
     def regenerate_with_new_seed(self):
         if self.dict_meta_data is not None:
@@ -47,6 +47,14 @@ class LoadQFromPHandler(BaseHandler):
         # this is never done as long as there is a "load_p"
         return False
 
+    def can_seek(self, time_step):
+        # this handler does not depend on the previous steps
+        return True
+
+    def seek(self, time_step):
+        # this handler does not depend on the previous steps
+        pass
+
     def load_next(self, dict_):
         if "load_p" in dict_ and not "prod_p" in dict_ and not "prod_v" in dict_:
             if dict_["load_p"] is not None:
@@ -215,4 +215,8 @@ class NoisyForecastHandler(PerfectForecastHandler):
 
     def regenerate_with_new_seed(self):
         # there is nothing to do for this handler as things are generated "on the fly"
-        pass
\ No newline at end of file
+        pass
+
+    def can_seek(self, time_step):
+        # the noise is sampled at each step, skipping the steps would change the forecasts
+        return False
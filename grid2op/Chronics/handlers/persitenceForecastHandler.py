@@ -36,6 +36,14 @@ class PersistenceForecastHandler(BaseHandler):
     def done(self):
         # this handler is never "done", only when the "real data" it depends on is done
         return False
+
+    def can_seek(self, time_step):
+        # forecasts are computed from the "real data" of the current step only
+        return True
+
+    def seek(self, time_step):
+        # forecasts are computed from the "real data" of the current step only
+        pass
     
     def load_next(self, dict_):
         raise HandlerError("You should only use this class for FORECAST data, and not for ENVIRONMENT data. "
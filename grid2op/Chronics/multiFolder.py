@@ -8,6 +8,7 @@
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Optional, Dict, Literal
 import warnings
 import numpy as np
@@ -55,6 +56,32 @@ class Multifolder(GridValue):
         :attr:`Multifolder.path`. Each one should contain data in a format that is readable by
         :attr:`MultiFolder.gridvalueClass`.
 
+    Notes
+    -----
+    .. versionadded:: 1.10.5
+
+    If created with `prefetch=True` (*eg* `grid2op.make(..., data_feeding_kwargs={"prefetch": True})`)
+    the data of the next time series (the one that will be used if the "next_chronics" is called,
+    which is the case at each `env.reset()` if neither `env.set_id` nor
+    `env.chronics_handler.sample_next_chronics` is used) are read from the hard drive
+    in a background thread while the current episode is played.
+
+    The next `env.reset()` then does not wait for the data to be read. The data are seeded when they
+    are used (and not when they are read, see :func:`GridValue.regenerate_with_new_seed`) so the
+    results are the same with or without prefetching.
+
+    If another time series is selected instead, the prefetched data are discarded and the
+    data are read as usual.
+
+    .. warning::
+        With `prefetch=True`, :func:`GridValue.initialize` of the :attr:`Multifolder.gridvalueClass`
+        runs in another thread while the environment is used. Custom time series classes should not
+        modify, in `initialize`, data shared with other objects (for example class attributes
+        used as caches) without protecting them with a lock.
+
+        It cannot be used with a :class:`MultifolderWithCache` (and its npy cache), which keeps
+        all the time series in memory anyway.
+
     """
     MULTI_CHRONICS = True
 
@@ -68,6 +95,7 @@ class Multifolder(GridValue):
         max_iter=-1,
         chunk_size=None,
         filter_func=None,
+        prefetch=False,
         **kwargs
     ):
         self._kwargs = kwargs
@@ -113,6 +141,11 @@ class Multifolder(GridValue):
         self._prev_cache_id = 0
         self._order = None
 
+        # read the data of the next time series in the background
+        self._prefetch : bool = bool(prefetch)
+        self._prefetch_executor : Optional[ThreadPoolExecutor] = None
+        self._prefetched = None  # (key, data, future)
+
     def init_subpath(self):
         """
         Read the content of the main directory and initialize the `subpaths` 
@@ -227,6 +260,13 @@ class Multifolder(GridValue):
         if self._filter != self._default_filter:
             dict_["filter_func"] = self._filter
 
+    def __getstate__(self):
+        res = self.__dict__.copy()
+        # data being read in the background are neither copied nor pickled
+        res["_prefetch_executor"] = None
+        res["_prefetched"] = None
+        return res
+
     def available_chronics(self):
         """return the list of available chronics.
 
@@ -428,25 +468,81 @@ class Multifolder(GridValue):
             # initialize the cache
             self.reset()
 
+        init_args = (order_backend_loads,
+                     order_backend_prods,
+                     order_backend_lines,
+                     order_backend_subs,
+                     names_chronics_to_backend)
         id_scenario = self._order[self._prev_cache_id]
         this_path = self.subpaths[id_scenario]
-        self.data = self._get_nex_data(this_path)
+        self.data = self._get_prefetched_data(this_path, init_args)
+        prefetched = self.data is not None
+        if not prefetched:
+            self.data = self._get_nex_data(this_path)
         if self.seed is not None:
             max_int = np.iinfo(dt_int).max
             seed_chronics = self.space_prng.randint(max_int)
             self.data.seed(seed_chronics)
 
-        self.data.initialize(
-            order_backend_loads,
-            order_backend_prods,
-            order_backend_lines,
-            order_backend_subs,
-            names_chronics_to_backend=names_chronics_to_backend,
-        )
+        if prefetched:
+            # data have been initialized before being seeded
+            self.data.regenerate_with_new_seed()
+        else:
+            self.data.initialize(
+                order_backend_loads,
+                order_backend_prods,
+                order_backend_lines,
+                order_backend_subs,
+                names_chronics_to_backend=names_chronics_to_backend,
+            )
         if self.action_space is not None:
             self.data.action_space = self.action_space
+        if self._prefetch:
+            # before max_iter is set to the one of the data
+            self._start_prefetch(init_args)
         self._max_iter = self.data.max_iter
 
+    def _start_prefetch(self, init_args):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Starts reading, in a background thread, the time series that will be used after
+        a call to :func:`Multifolder.next_chronics`.
+
+        .. versionadded:: 1.10.5
+        """
+        next_id = (self._prev_cache_id + 1) % len(self._order)
+        this_path = self.subpaths[self._order[next_id]]
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1,
+                                                         thread_name_prefix="grid2op_prefetch")
+        # the object is created in this thread, only the data are read in the background
+        data = self._get_nex_data(this_path)
+        future = self._prefetch_executor.submit(data.initialize,
+                                                *init_args[:4],
+                                                names_chronics_to_backend=init_args[4])
+        # the data read in the background can only be used if they
+        # are read with the same parameters
+        self._prefetched = ((this_path, self.max_iter, self.chunk_size, init_args), data, future)
+
+    def _get_prefetched_data(self, this_path, init_args):
+        """returns the data read in the background, if they match `this_path` (``None`` otherwise)"""
+        if self._prefetched is None:
+            return None
+        (path_, max_iter_, chunk_size_, init_args_), data, future = self._prefetched
+        self._prefetched = None
+        if (path_ != this_path or
+            max_iter_ != self.max_iter or
+            chunk_size_ != self.chunk_size or
+            any(el_ is not el for el_, el in zip(init_args_, init_args))):
+            # another time series is used (or it is not initialized the same way)
+            return None
+        # waits for the data to be read (and raises the error encountered, if any)
+        future.result()
+        return data
+
     def done(self):
         """
         Tells the :class:`grid2op.Environment` if the episode is over.
@@ -787,6 +883,15 @@ class Multifolder(GridValue):
     def fast_forward(self, nb_timestep):
         self.data.fast_forward(nb_timestep)
 
+    def seek(self, time_step: int) -> None:
+        self.data.seek(time_step)
+
+    def get_cursor_state(self) -> Dict:
+        return self.data.get_cursor_state()
+
+    def set_cursor_state(self, state: Dict) -> None:
+        self.data.set_cursor_state(state)
+
     def get_init_action(self, names_chronics_to_backend: Optional[Dict[Literal["loads", "prods", "lines"], Dict[str, str]]]=None) -> Union["grid2op.Action.playableAction.PlayableAction", None]:
         return self.data.get_init_action(names_chronics_to_backend)
 
@@ -795,3 +900,14 @@ class Multifolder(GridValue):
         if self.data is None:
             return
         self.data.cleanup_action_space()
+
+    def close(self):
+        """stops the reading of the data in the background (if any), see :func:`GridValue.close`"""
+        self._prefetched = None
+        if self._prefetch_executor is not None:
+            # data already being read cannot be cancelled, they are waited for so that nothing
+            # runs in the background once the environment is closed
+            self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_executor = None
+        if self.data is not None:
+            self.data.close()
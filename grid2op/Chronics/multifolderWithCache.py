@@ -5,6 +5,8 @@
 # you can obtain one at http://mozilla.org/MPL/2.0/.
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+import os
+import json
 import numpy as np
 from datetime import timedelta, datetime
 import warnings
@@ -87,6 +89,33 @@ class MultifolderWithCache(Multifolder):
             act = my_agent.act(obs, reward, done)
             obs, reward, done, info = env.step(act)  # and step will NOT load any data from disk.
 
+    .. versionadded:: 1.10.5
+        The data can also be stored in a "npy cache" (see :func:`MultifolderWithCache.build_npy_cache`):
+        the csv are converted once in binary ".npy" files (one per array, already in the
+        order of the backend) which are then memory mapped (read only) instead of being read
+        and stored in RAM by each process. All the processes using the same cache then share the
+        same memory (the page cache of the operating system) and the call to
+        `env.chronics_handler.reset()` is almost instantaneous.
+
+        .. code-block:: python
+
+            import grid2op
+            from grid2op.Chronics import MultifolderWithCache
+            env_name = "l2rpn_case14_sandbox"
+            npy_cache_dir = ...  # where you want to store the cache
+
+            # do this only once
+            env = grid2op.make(env_name, chronics_class=MultifolderWithCache)
+            env.chronics_handler.real_data.build_npy_cache(npy_cache_dir)
+
+            # then, in all your (training) processes
+            env = grid2op.make(env_name,
+                               chronics_class=MultifolderWithCache,
+                               data_feeding_kwargs={"npy_cache_dir": npy_cache_dir})
+            env.chronics_handler.reset()  # does not read the csv anymore
+
+        Scenarios not present in the cache are still read from the csv files.
+
     """
     MULTI_CHRONICS = True
     ERROR_MSG_NOT_LOADED = ("We detected a misusage of the `MultifolderWithCache` class: the cache "
@@ -96,6 +125,9 @@ class MultifolderWithCache(Multifolder):
                             "you want to keep and then `env.chronics_handler.reset()` "
                             "to load them. \nFor more information consult the documentation:\n"
                             "https://grid2op.readthedocs.io/en/latest/chronics.html#grid2op.Chronics.MultifolderWithCache")
+    NPY_CACHE_META = "npy_cache_meta.json"
+    NPY_CACHE_VERSION = 1
+
     def __init__(
         self,
         path,
@@ -127,6 +159,12 @@ class MultifolderWithCache(Multifolder):
         else:
             self.__nb_init_called = -1
         
+        self.npy_cache_dir = None
+        if "npy_cache_dir" in kwargs:
+            self.npy_cache_dir = kwargs["npy_cache_dir"]
+            del kwargs["npy_cache_dir"]
+        self._npy_cache_meta = None
+        
         # now init the data
         Multifolder.__init__(
             self,
@@ -140,6 +178,11 @@ class MultifolderWithCache(Multifolder):
             filter_func=filter_func,
             **kwargs
         )
+        if self._prefetch:
+            # all the data are read when the cache is built, and the npy cache is not meant to
+            # be used from different threads
+            raise ChronicsError("`prefetch=True` cannot be used with a MultifolderWithCache: all the "
+                                "time series are already kept in memory.")
         self._cached_data = None
         self.cache_size = 0
         if not (issubclass(self.gridvalueClass, GridStateFromFile) or 
@@ -152,6 +195,9 @@ class MultifolderWithCache(Multifolder):
             warnings.warn("You use caching with handler data. This is possible but "
                           "might be a bit risky especially if your handlers are "
                           "heavily 'random' and you want fully reproducible results.")
+        if self.npy_cache_dir is not None and issubclass(self.gridvalueClass, FromHandlers):
+            raise ChronicsError("The npy cache is not compatible with handler data (\"gridvalueClass\" "
+                                "inheriting from \"FromHandlers\").")
         self.__i = 0
         self._cached_seeds = None
 
@@ -189,7 +235,9 @@ class MultifolderWithCache(Multifolder):
         # select the right paths, and store their id in "_order"
         super().reset()
         self.cache_size = 0
-        max_int = np.iinfo(dt_int).max
+        self._npy_cache_meta = None
+        if self.npy_cache_dir is not None:
+            self._npy_cache_meta = self._load_npy_cache_meta()
         for i in self._order:
             # everything in "_order" need to be put in cache
             path = self.subpaths[i]
@@ -198,13 +246,26 @@ class MultifolderWithCache(Multifolder):
             if self._cached_seeds is not None:
                 data.seed(self._cached_seeds[i])
 
-            data.initialize(
-                self._order_backend_loads,
-                self._order_backend_prods,
-                self._order_backend_lines,
-                self._order_backend_subs,
-                self._names_chronics_to_backend,
-            )
+            scen_id = os.path.basename(path)
+            if self._npy_cache_meta is not None and scen_id in self._npy_cache_meta["scenarios"]:
+                # data are memory mapped from the npy cache
+                data._init_from_npy_cache(
+                    os.path.join(self.npy_cache_dir, scen_id),
+                    self._npy_cache_meta["scenarios"][scen_id],
+                    self._order_backend_loads,
+                    self._order_backend_prods,
+                    self._order_backend_lines,
+                    self._order_backend_subs,
+                    self._names_chronics_to_backend,
+                )
+            else:
+                data.initialize(
+                    self._order_backend_loads,
+                    self._order_backend_prods,
+                    self._order_backend_lines,
+                    self._order_backend_subs,
+                    self._names_chronics_to_backend,
+                )
             
             if self._cached_seeds is not None:
                 data.regenerate_with_new_seed()
@@ -373,10 +434,111 @@ class MultifolderWithCache(Multifolder):
         self._cached_seeds = None
         return super().set_filter(filter_fun)
 
+    def build_npy_cache(self, npy_cache_dir, subpaths=None):
+        """
+        .. versionadded:: 1.10.5
+
+        Convert (once) the csv of the time series into binary ".npy" files (one per array,
+        already in the order of the backend) that will then be memory mapped by
+        :func:`MultifolderWithCache.reset` (instead of reading the csv and storing the
+        data in RAM).
+
+        Scenarios are converted one at a time, so the memory needed is the one of a
+        single scenario.
+
+        After this call, this instance uses the cache (next time
+        :func:`MultifolderWithCache.reset` is called). To use it in other environments,
+        pass `data_feeding_kwargs={"npy_cache_dir": npy_cache_dir}` to :func:`grid2op.make`.
+
+        .. note::
+            The cache is built with all the rows of the csv (the `max_iter` is not taken into
+            account). Setting the `max_iter` of an environment using the cache works as usual.
+
+        .. warning::
+            Only the data read from the csv are cached. The random elements (*eg* the maintenance
+            of :class:`GridStateFromFileWithForecastsWithMaintenance`) are still sampled
+            when the data are loaded, with the same seeds as without the cache.
+
+        Parameters
+        ----------
+        npy_cache_dir: ``str``
+            The directory where the cache will be stored (it is created if needed)
+
+        subpaths: ``list``, optional
+            The scenarios to convert (all of them by default)
+
+        """
+        if issubclass(self.gridvalueClass, FromHandlers):
+            raise ChronicsError("The npy cache is not compatible with handler data (\"gridvalueClass\" "
+                                "inheriting from \"FromHandlers\").")
+        if self._order_backend_loads is None:
+            raise ChronicsError("Impossible to build the npy cache before the chronics are initialized "
+                                "(it is done when the environment is created).")
+        if subpaths is None:
+            subpaths = self.subpaths
+        os.makedirs(npy_cache_dir, exist_ok=True)
+        scenarios = {}
+        for path in subpaths:
+            data = self.gridvalueClass(
+                time_interval=self.time_interval,
+                sep=self.sep,
+                path=path,
+                max_iter=-1,
+                chunk_size=None,
+                **self._kwargs
+            )
+            data.initialize(
+                self._order_backend_loads,
+                self._order_backend_prods,
+                self._order_backend_lines,
+                self._order_backend_subs,
+                self._names_chronics_to_backend,
+            )
+            scen_id = os.path.basename(path)
+            path_out = os.path.join(npy_cache_dir, scen_id)
+            os.makedirs(path_out, exist_ok=True)
+            scenarios[scen_id] = data._save_npy_cache(path_out)
+            del data
+
+        meta = {"version": type(self).NPY_CACHE_VERSION,
+                "gridvalueClass": self.gridvalueClass.__name__,
+                "name_load": [str(el) for el in self._order_backend_loads],
+                "name_gen": [str(el) for el in self._order_backend_prods],
+                "name_line": [str(el) for el in self._order_backend_lines],
+                "scenarios": scenarios}
+        with open(os.path.join(npy_cache_dir, type(self).NPY_CACHE_META), "w", encoding="utf-8") as f:
+            json.dump(obj=meta, fp=f, indent=4, sort_keys=True)
+        self.npy_cache_dir = npy_cache_dir
+
+    def _load_npy_cache_meta(self):
+        path_meta = os.path.join(self.npy_cache_dir, type(self).NPY_CACHE_META)
+        if not os.path.exists(path_meta):
+            warnings.warn(f"No npy cache found in \"{self.npy_cache_dir}\", the data will be read "
+                          "from the csv files.")
+            return None
+        with open(path_meta, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != type(self).NPY_CACHE_VERSION:
+            raise ChronicsError(f"The npy cache in \"{self.npy_cache_dir}\" has been built with another "
+                                "version of grid2op, please build it again.")
+        if meta["gridvalueClass"] != self.gridvalueClass.__name__:
+            raise ChronicsError(f"The npy cache in \"{self.npy_cache_dir}\" has been built for "
+                                f"\"{meta['gridvalueClass']}\" and not for "
+                                f"\"{self.gridvalueClass.__name__}\".")
+        for key, order in (("name_load", self._order_backend_loads),
+                           ("name_gen", self._order_backend_prods),
+                           ("name_line", self._order_backend_lines)):
+            if meta[key] != [str(el) for el in order]:
+                raise ChronicsError(f"The npy cache in \"{self.npy_cache_dir}\" has been built for another "
+                                    f"grid (\"{key}\" do not match).")
+        return meta
+
     def get_kwargs(self, dict_):
         dict_["_DONTUSE_nb_reset_called"] = self.__nb_reset_called
         dict_["_DONTUSE_nb_step_called"] = self.__nb_step_called
         dict_["_DONTUSE_nb_init_called"] = self.__nb_init_called
+        if self.npy_cache_dir is not None:
+            dict_["npy_cache_dir"] = self.npy_cache_dir
         return super().get_kwargs(dict_)
 
     def cleanup_action_space(self):
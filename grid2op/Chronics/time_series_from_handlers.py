@@ -14,7 +14,7 @@ from typing import Optional, Union, Dict, Literal
 
 import grid2op
 from grid2op.Exceptions import (
-    ChronicsNotFoundError, HandlerError
+    ChronicsNotFoundError, HandlerError, ChronicsError
 )
 
 from grid2op.Chronics.gridValue import GridValue
@@ -526,10 +526,28 @@ class FromHandlers(GridValue):
             self.time_interval = timedelta(hours=tmp.hour, minutes=tmp.minute)
             
     def fast_forward(self, nb_timestep):
-        for _ in range(nb_timestep):
-            self.load_next()
-            # for this class I suppose the real data AND the forecast are read each step
-            self.forecasts()
+        self.seek(self.curr_iter + int(nb_timestep))
+
+    def seek(self, time_step: int) -> None:
+        nb_timestep = self._aux_nb_step_to_skip(time_step)
+        if nb_timestep == 0:
+            return
+        if not all(handl.can_seek(time_step) for handl in self._active_handlers):
+            # at least one handler needs to read all the steps
+            for _ in range(nb_timestep):
+                self.load_next()
+                # for this class I suppose the real data AND the forecast are read each step
+                self.forecasts()
+            return
+        for handl in self._active_handlers:
+            handl.seek(time_step)
+        self.curr_iter = time_step
+        self.current_datetime += nb_timestep * self.time_interval
+
+    def get_cursor_state(self) -> Dict:
+        # each handler reads its data in its own way
+        raise ChronicsError("Retrieving the position in the time series is not supported (yet) "
+                            "for the `FromHandlers` time series.")
 
     def get_init_action(self, names_chronics_to_backend: Optional[Dict[Literal["loads", "prods", "lines"], Dict[str, str]]]=None) -> Union["grid2op.Action.playableAction.PlayableAction", None]:
         from grid2op.Action import BaseAction
@@ -60,6 +60,10 @@ class IdToAct(Converter):
     - `encoded_act` are positive integer, representing the index of the actions.
     - `transformed_obs` are regular observations.
 
+    **NB** The actions of this converter are frozen (see :func:`grid2op.Action.BaseAction.freeze`): they cannot
+    be modified (use `act.copy()` if you need to) and whether they are ambiguous, as well as their topological
+    impact, are computed once and for all instead of at each step.
+
     **NB** The number of actions in this converter can be especially big. For example, if a substation counts N elements
     there are roughly 2^(N-1) possible actions in this substation. This means if there are a single substation with
     more than N = 15 or 16 elements, the amount of actions (for this substation alone) will be higher than 16.000
@@ -285,6 +289,10 @@ class IdToAct(Converter):
             # does not copy here (to save memory in case of shared memory setting)
             self.all_actions = all_actions
         self.n = len(self.all_actions)
+        if self.all_actions is not all_actions:
+            # actions are reused over and over: the checks performed at each step are cached
+            for act in self.all_actions:
+                act.freeze()
 
     def filter_action(self, filtering_fun):
         """
@@ -6,9 +6,13 @@ __all__ = [
     "MultiEnvMultiProcess",
     "MultiMixEnvironment",
     "TimedOutEnvironment",
-    "MaskedEnvironment"
+    "MaskedEnvironment",
+    "StepTimings",
+    "EnvState"
 ]
 
+from grid2op.Environment.stepTimings import StepTimings
+from grid2op.Environment.envState import EnvState
 from grid2op.Environment.baseEnv import BaseEnv
 from grid2op.Environment.environment import Environment
 from grid2op.Environment.baseMultiProcessEnv import BaseMultiProcessEnvironment
@@ -0,0 +1,159 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+"""
+INTERNAL
+
+.. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+Exact solver for the redispatching problem solved at each step by the environment.
+
+The problem solved by :func:`grid2op.Environment.BaseEnv._compute_dispatch_vect` is:
+
+.. math::
+
+    \\min_x \\sum_{i \\in M} w_i (x_i - t_i)^2 \\\\
+    s.t. \\sum_i x_i = C \\\\
+    lo_i \\leq x_i \\leq hi_i
+
+where `M` is the set of generators that have been "redispatched" by the agent. This is
+a weighted projection onto the intersection of a box and an hyperplane. The KKT conditions
+show that :math:`x_i(\\lambda) = clip(t_i + \\lambda / w_i, lo_i, hi_i)` for a single
+(scalar) multiplier :math:`\\lambda`, that can be found exactly by sorting the
+"breakpoints" of the (piecewise linear, non decreasing) function
+:math:`\\lambda \\mapsto \\sum_i x_i(\\lambda)`.
+
+Generators not in `M` have no cost in the original problem. To make the solution unique,
+they are used first (in a lexicographic way) to absorb the imbalance, and among them,
+the imbalance is split according to the same weights (the solution of the
+problem above restricted to these generators and with :math:`t_i = 0` for them, which
+corresponds to their target dispatch).
+"""
+
+import numpy as np
+from typing import Optional
+
+
+def _weighted_projection(weights: np.ndarray,
+                         target: np.ndarray,
+                         lo: np.ndarray,
+                         hi: np.ndarray,
+                         total: float,
+                         tol: float) -> Optional[np.ndarray]:
+    """solves :math:`\\min_x \\sum_i w_i (x_i - t_i)^2` subject to :math:`\\sum_i x_i = total` and
+    :math:`lo \\leq x \\leq hi` in O(n log(n)).
+
+    It returns ``None`` if the problem is infeasible (more than `tol` away from the bounds)
+    """
+    if total < lo.sum() - tol or total > hi.sum() + tol:
+        return None
+    if total <= lo.sum():
+        return 1.0 * lo
+    if total >= hi.sum():
+        return 1.0 * hi
+
+    inv_w = 1.0 / weights
+    # breakpoints: x_i "leaves" lo_i at lambda = a_i and reaches hi_i at lambda = b_i
+    bp_lo = (lo - target) * weights
+    bp_hi = (hi - target) * weights
+    events = np.concatenate((bp_lo, bp_hi))
+    # change of the constant part of sum_i x_i(lambda) (once multiplied by lambda) at each event
+    d_cst = np.concatenate((target - lo, hi - target))
+    d_slope = np.concatenate((inv_w, -inv_w))
+    order = np.argsort(events, kind="stable")
+    events = events[order]
+    cst = lo.sum() + np.cumsum(d_cst[order])
+    slope = np.cumsum(d_slope[order])
+    # value of sum_i x_i(lambda) just after each event (the function is continuous)
+    vals = cst + slope * events
+
+    # first event where the sum is above the total
+    k = int(np.searchsorted(vals, total, side="left"))
+    k = min(max(k, 1), events.shape[0] - 1)
+    if slope[k - 1] > 0.:
+        lambda_ = (total - cst[k - 1]) / slope[k - 1]
+    else:
+        lambda_ = events[k]
+    res = np.clip(target + lambda_ * inv_w, lo, hi)
+    return res
+
+
+def closed_form_dispatch(weights: np.ndarray,
+                         target: np.ndarray,
+                         is_modified: np.ndarray,
+                         lo: np.ndarray,
+                         hi: np.ndarray,
+                         total: float,
+                         tol: float) -> Optional[np.ndarray]:
+    """
+    INTERNAL
+
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    Compute the redispatching (see the module documentation for the problem solved).
+
+    Parameters
+    ----------
+    weights: ``numpy.ndarray``
+        The (positive) weights of each generator in the objective
+
+    target: ``numpy.ndarray``
+        The target for each generator
+
+    is_modified: ``numpy.ndarray``
+        For each generator, whether it is part of the objective function (`M` in the
+        module documentation)
+
+    lo: ``numpy.ndarray``
+        The lowest value each generator can take
+
+    hi: ``numpy.ndarray``
+        The highest value each generator can take
+
+    total: ``float``
+        The value of the sum of the dispatch
+
+    tol: ``float``
+        The tolerance used to check the feasibility of the problem
+
+    Returns
+    -------
+    res: ``numpy.ndarray``
+        The optimal dispatch, or ``None`` if the problem is infeasible (in this case a
+        "generic" solver should be used instead)
+    """
+    res = np.zeros(weights.shape[0], dtype=float)
+    lo = np.minimum(lo, hi)
+    is_free = ~is_modified
+    if not is_free.any():
+        return _weighted_projection(weights, target, lo, hi, total, tol)
+
+    # generators that are modified: try to match exactly their target
+    res[is_modified] = np.clip(target[is_modified], lo[is_modified], hi[is_modified])
+    remaining = total - res[is_modified].sum()
+    lo_free = lo[is_free]
+    hi_free = hi[is_free]
+    if lo_free.sum() <= remaining <= hi_free.sum():
+        # the "free" generators can absorb all the imbalance
+        tmp = _weighted_projection(weights[is_free], target[is_free],
+                                   lo_free, hi_free, remaining, tol)
+        if tmp is None:
+            return None
+        res[is_free] = tmp
+        return res
+
+    # free generators are not enough, they are all at their bounds
+    # and the modified generators are used to absorb the rest
+    res[is_free] = lo_free if remaining < lo_free.sum() else hi_free
+    tmp = _weighted_projection(weights[is_modified], target[is_modified],
+                               lo[is_modified], hi[is_modified],
+                               total - res[is_free].sum(), tol)
+    if tmp is None:
+        return None
+    res[is_modified] = tmp
+    return res
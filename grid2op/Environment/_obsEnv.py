@@ -357,6 +357,35 @@ class _ObsEnv(BaseEnv):
             raise EnvError("Impossible to use a Observation backend with an "
                            "environment that cannot be copied.")
         
+        set_status, topo_vect = self._aux_init_vectors(obs, time_step)
+            
+        # TODO set the shunts here
+        # update the action that set the grid to the real value
+        self._backend_action_set += self._helper_action_env(
+            {
+                "set_line_status": set_status,
+                "set_bus": topo_vect,
+                "injection": {
+                    "prod_p": obs.gen_p,
+                    "prod_v": obs.gen_v,
+                    "load_p": obs.load_p,
+                    "load_q": obs.load_q,
+                },
+            }
+        )
+        self._backend_action_set += new_state_action
+        # for storage unit
+        if time_step > 0:
+            self._backend_action_set.storage_power.values[:] = 0.0
+        self._backend_action_set.all_changed()
+        self._aux_finish_init(time_stamp)
+
+    def _aux_init_vectors(self, obs, time_step):
+        """reset the "BaseEnv" and all its time dependant vectors to the 
+        state of `obs`, `time_step` steps ahead. 
+        
+        It returns the line status and the topology vector that should be set in the 
+        backend."""
         self.reset()  # reset the "BaseEnv"
         self._reset_to_orig_state(obs)
         self._topo_vect[:] = obs.topo_vect
@@ -388,26 +417,9 @@ class _ObsEnv(BaseEnv):
         else:
             set_status = self._line_status_me
             topo_vect = self._topo_vect
-            
-        # TODO set the shunts here
-        # update the action that set the grid to the real value
-        self._backend_action_set += self._helper_action_env(
-            {
-                "set_line_status": set_status,
-                "set_bus": topo_vect,
-                "injection": {
-                    "prod_p": obs.gen_p,
-                    "prod_v": obs.gen_v,
-                    "load_p": obs.load_p,
-                    "load_q": obs.load_q,
-                },
-            }
-        )
-        self._backend_action_set += new_state_action
-        # for storage unit
-        if time_step > 0:
-            self._backend_action_set.storage_power.values[:] = 0.0
-        self._backend_action_set.all_changed()
+        return set_status, topo_vect
+    
+    def _aux_finish_init(self, time_stamp):
         self._backend_action = copy.deepcopy(self._backend_action_set)
         
         # for curtailment
@@ -491,6 +503,60 @@ class _ObsEnv(BaseEnv):
         obs, reward, done, info = self.step(action)
         return obs, reward, done, info
 
+    def simulate_batch(self,
+                       actions: List["grid2op.Action.BaseAction"],
+                       new_state_action,
+                       time_stamp,
+                       obs,
+                       time_step=1) -> Dict[str, Any]:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+            Prefer using `obs.simulate_batch(actions)`
+
+        Simulate the effect of each action in `actions` on the same forecasted grid state.
+
+        The forecasted state (the "_backend_action_set") is computed only once, it is then
+        reused for all the actions. Only the (cheap) time dependant vectors of this 
+        environment are reset between two simulations.
+        
+        No observation is copied, the results are directly read from the (internal) observation 
+        of this environment after each call to `step`.
+        """
+        if self.__unusable:
+            raise EnvError("Impossible to use a Observation backend with an "
+                           "environment that cannot be copied.")
+        cls = type(self)
+        nb_act = len(actions)
+        rho = np.zeros((nb_act, cls.n_line), dtype=dt_float)
+        p_or = np.zeros((nb_act, cls.n_line), dtype=dt_float)
+        a_or = np.zeros((nb_act, cls.n_line), dtype=dt_float)
+        rewards = np.zeros(nb_act, dtype=dt_float)
+        dones = np.zeros(nb_act, dtype=dt_bool)
+        infos = []
+        
+        self.init(new_state_action, time_stamp=time_stamp, obs=obs, time_step=time_step)
+        for act_id, act in enumerate(actions):
+            if act_id > 0:
+                # back to the forecasted state, without recomputing it
+                self._aux_init_vectors(obs, time_step)
+                self._aux_finish_init(time_stamp)
+            sim_obs, reward, done, info = self.simulate(act)
+            rho[act_id] = sim_obs.rho
+            p_or[act_id] = sim_obs.p_or
+            a_or[act_id] = sim_obs.a_or
+            rewards[act_id] = reward
+            dones[act_id] = done
+            info["disc_lines"] = copy.deepcopy(info["disc_lines"])  # this is a pointer to self._disc_lines
+            infos.append(info)
+        return {"rho": rho,
+                "p_or": p_or,
+                "a_or": a_or,
+                "reward": rewards,
+                "done": dones,
+                "info": infos}
+        
     def get_obs(self, _update_state=True, _do_copy=True):
         """
         INTERNAL
@@ -511,7 +577,11 @@ class _ObsEnv(BaseEnv):
             self.current_obs.update(self, with_forecast=False)
             
         if _do_copy:
-            res = copy.deepcopy(self.current_obs)
+            if self._ptr_orig_obs_space is not None:
+                # might reuse an observation of the pool (see `ObservationSpace.set_obs_pool_size`)
+                res = self._ptr_orig_obs_space._copy_obs(self.current_obs, simulated=True)
+            else:
+                res = copy.deepcopy(self.current_obs)
         else:
             res = self.current_obs
         return res
@@ -20,7 +20,6 @@ import sys
 
 import warnings
 import numpy as np
-from scipy.optimize import (minimize, LinearConstraint)
 
 from abc import ABC, abstractmethod
 from grid2op.Observation import (BaseObservation,
@@ -31,6 +30,7 @@ from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Space import GridObjects, RandomObject
 from grid2op.Exceptions import (Grid2OpException,
                                 EnvError,
+                                ChronicsError,
                                 InvalidRedispatching,
                                 GeneratorTurnedOffTooSoon,
                                 GeneratorTurnedOnTooSoon,
@@ -42,6 +42,9 @@ from grid2op.Opponent import OpponentSpace, NeverAttackBudget, BaseOpponent
 from grid2op.Action import DontAct, BaseAction, ActionSpace
 from grid2op.operator_attention import LinearAttentionBudget
 from grid2op.Action._backendAction import _BackendAction
+from grid2op.Environment._dispatchSolver import closed_form_dispatch
+from grid2op.Environment.stepTimings import StepTimings
+from grid2op.Environment.envState import EnvState
 from grid2op.Chronics import ChronicsHandler
 from grid2op.Rules import AlwaysLegal, BaseRules, AlwaysLegal
 from grid2op.typing_variables import STEP_INFO_TYPING, RESET_OPTIONS_TYPING
@@ -404,6 +407,8 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         self._time_opponent: float = dt_float(0)
         self._time_redisp: float = dt_float(0)
         self._time_step: float = dt_float(0)
+        # detailed timings (histograms), only computed if `enable_timings` is called
+        self._timings: Optional[StepTimings] = None
 
         # data relative to interpolation
         self._epsilon_poly: float = dt_float(epsilon_poly)
@@ -677,6 +682,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         new_obj._time_opponent = self._time_opponent
         new_obj._time_redisp = self._time_redisp
         new_obj._time_step = self._time_step
+        new_obj._timings = copy.deepcopy(self._timings)
 
         # data relative to interpolation
         new_obj._epsilon_poly = self._epsilon_poly
@@ -934,6 +940,205 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             # breaks for some version of lightsim2grid... (a powerflow need to be run to retrieve the observation)
             new_obj.current_obs = new_obj.get_obs()
 
+    # attributes of the environment that are modified at each step (see `get_state`)
+    _STATE_VALUES = ("time_stamp",
+                     "nb_time_step",
+                     "current_reward",
+                     "_amount_storage",
+                     "_amount_storage_prev",
+                     "_sum_curtailment_mw",
+                     "_sum_curtailment_mw_prev",
+                     "_limited_before",
+                     "_is_alarm_illegal",
+                     "_is_alarm_used_in_reward",
+                     "_is_alert_illegal",
+                     "_is_alert_used_in_reward",
+                     "_total_number_of_alert",
+                     )
+    _STATE_ARRAYS = ("_line_status",
+                     "_timestep_overflow",
+                     "_times_before_line_status_actionable",
+                     "_times_before_topology_actionable",
+                     "_time_next_maintenance",
+                     "_duration_next_maintenance",
+                     "_hazard_duration",
+                     "_target_dispatch",
+                     "_already_modified_gen",
+                     "_actual_dispatch",
+                     "_gen_uptime",
+                     "_gen_downtime",
+                     "_gen_activeprod_t",
+                     "_gen_activeprod_t_redisp",
+                     "_disc_lines",
+                     "_storage_current_charge",
+                     "_storage_previous_charge",
+                     "_action_storage",
+                     "_storage_power",
+                     "_storage_power_prev",
+                     "_limit_curtailment",
+                     "_limit_curtailment_prev",
+                     "_gen_before_curtailment",
+                     "_last_alert",
+                     "_time_since_last_alert",
+                     "_alert_duration",
+                     "_time_since_last_attack",
+                     "_is_already_attacked",
+                     "_attack_under_alert",
+                     "_was_alert_used_after_attack",
+                     )
+
+    def get_state(self) -> EnvState:
+        """
+        .. versionadded:: 1.10.5
+
+        Retrieve the "dynamic" state of this environment: everything that changes from one step to
+        another (topology, injections, redispatching, storage units, curtailment, overflow counters,
+        cooldowns, maintenance, opponent budget and attacks, alerts, position in the time series and
+        state of the random generators of the environment and of the opponent).
+
+        The environment can be put back in this state with :func:`BaseEnv.set_state` which is much faster
+        than a :func:`grid2op.Environment.Environment.copy` of the environment (nothing static is copied).
+        This is useful for example for tree search agents that need to explore multiple actions
+        from the same state.
+
+        Notes
+        -----
+        It requires the backend to implement :func:`grid2op.Backend.Backend.get_internal_state` (this is
+        the case of the :class:`grid2op.Backend.PandaPowerBackend`).
+
+        The internal states of the rewards (if any) are not part of it.
+
+        Returns
+        -------
+        res: :class:`grid2op.Environment.EnvState`
+            The state of the environment. It does not share any memory with the environment.
+
+        Raises
+        ------
+        :class:`grid2op.Exceptions.EnvError`
+            If the environment is closed, not initialized or in a "game over" state, or if the
+            backend or the time series do not support it.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"
+            env = grid2op.make(env_name)
+            obs = env.reset()
+
+            state = env.get_state()
+            obs1, reward1, done1, info1 = env.step(env.action_space({"set_line_status": [(0, -1)]}))
+
+            obs = env.set_state(state)  # back before the powerline was disconnected
+            obs2, reward2, done2, info2 = env.step(env.action_space())
+
+        """
+        if self.__closed:
+            raise EnvError("This environment is closed, you cannot get its state.")
+        if not self.__is_init:
+            raise EnvError("This environment is not initialized (or it is in a \"game over\" state), "
+                           "you cannot get its state. Have you called `env.reset()` ?")
+        try:
+            chronics_state = copy.deepcopy(self.chronics_handler.get_cursor_state())
+        except ChronicsError as exc_:
+            raise EnvError(f"Impossible to retrieve the state of the environment with the time series "
+                           f"{type(self.chronics_handler.real_data)}: {exc_}") from exc_
+        try:
+            backend_state = self.backend.get_internal_state()
+        except NotImplementedError as exc_:
+            raise EnvError(f"Impossible to retrieve the state of the environment with the backend "
+                           f"{type(self.backend)}: {exc_}") from exc_
+        cls = type(self)
+        env_values = {attr_nm: copy.deepcopy(getattr(self, attr_nm)) for attr_nm in cls._STATE_VALUES}
+        env_arrays = {attr_nm: copy.deepcopy(getattr(self, attr_nm)) for attr_nm in cls._STATE_ARRAYS}
+        others = {"env_prng": self.space_prng.get_state()}
+        if self._oppSpace is not None:
+            others["opp_space"] = copy.deepcopy(self._oppSpace._get_state())
+            others["opponent_prng"] = self._opponent.space_prng.get_state()
+        if self._has_attention_budget:
+            others["attention_budget"] = copy.deepcopy(self._attention_budget.get_state())
+        return EnvState(env_name=self.name,
+                        time_serie_id=self.chronics_handler.get_id(),
+                        env_values=env_values,
+                        env_arrays=env_arrays,
+                        backend_action=self._backend_action._get_state(),
+                        backend=backend_state,
+                        chronics=chronics_state,
+                        others=others)
+
+    def set_state(self, state: EnvState) -> BaseObservation:
+        """
+        .. versionadded:: 1.10.5
+
+        Put back this environment in the state `state` (obtained with :func:`BaseEnv.get_state`
+        on this environment or on a copy of it). The cost of this function is proportional to the
+        size of the state, nothing is re-computed except the observation.
+
+        The `state` is not modified: it can be used as many times as needed.
+
+        It is only possible to go back to a state of the time series currently used
+        (if needed, reset the environment on the right time series before with
+        `env.reset(options={"time serie id": state.time_serie_id})`).
+
+        Parameters
+        ----------
+        state: :class:`grid2op.Environment.EnvState`
+            The state in which to put the environment
+
+        Returns
+        -------
+        obs: :class:`grid2op.Observation.BaseObservation`
+            The observation of the environment in this state
+
+        Raises
+        ------
+        :class:`grid2op.Exceptions.EnvError`
+            If the state does not come from this environment or from the current time series.
+
+        """
+        if self.__closed:
+            raise EnvError("This environment is closed, you cannot set its state.")
+        if not isinstance(state, EnvState):
+            raise EnvError(f"The state should be an `EnvState` (obtained with `env.get_state()`) "
+                           f"and not a {type(state)}.")
+        if state.env_name != self.name:
+            raise EnvError(f"Impossible to set the state of the environment \"{self.name}\" with a state "
+                           f"coming from the environment \"{state.env_name}\".")
+        if state.time_serie_id != self.chronics_handler.get_id():
+            raise EnvError(f"Impossible to set the state: it has been retrieved on the time series "
+                           f"\"{state.time_serie_id}\" but the environment currently uses "
+                           f"\"{self.chronics_handler.get_id()}\". Call "
+                           f"`env.reset(options={{\"time serie id\": ...}})` first.")
+        for attr_nm, val in state._env_values.items():
+            setattr(self, attr_nm, copy.deepcopy(val))
+        for attr_nm, val in state._env_arrays.items():
+            arr = getattr(self, attr_nm)
+            if isinstance(arr, np.ndarray) and isinstance(val, np.ndarray) and arr.shape == val.shape:
+                arr[...] = val
+            else:
+                setattr(self, attr_nm, copy.deepcopy(val))
+        self._backend_action._set_state(state._backend_action)
+        self.backend.set_internal_state(state._backend)
+        self.chronics_handler.set_cursor_state(copy.deepcopy(state._chronics))
+
+        others = state._others
+        self.space_prng.set_state(others["env_prng"])
+        if "opp_space" in others:
+            self._oppSpace._set_state(*copy.deepcopy(others["opp_space"]))
+            self._opponent.space_prng.set_state(others["opponent_prng"])
+        if "attention_budget" in others:
+            self._attention_budget.set_state(copy.deepcopy(others["attention_budget"]))
+
+        self.done = False
+        self.__is_init = True
+        self._last_obs = None
+        self._forecasts = None
+        self.current_obs = self.get_obs(_do_copy=False)
+        return self.get_obs()
+
     def get_path_env(self):
         """
         Get the path that allows to create this environment.
@@ -1667,6 +1872,43 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             self._observation_space.with_forecast = False
         self.with_forecast = False
 
+    def set_obs_pool_size(self, pool_size: int) -> None:
+        """
+        .. versionadded:: 1.10.5
+
+        Activate (with `pool_size >= 2`) or deactivate (with `pool_size = 0`, the default) the
+        recycling of the observations returned by this environment and by `obs.simulate`.
+
+        When activated, no new observation is allocated at each call to `env.step` or `obs.simulate`:
+        the data are written in place in one of the `pool_size` observations kept by the
+        observation space. This is faster, especially for loops performing lots of `obs.simulate`.
+
+        .. warning::
+            An observation is then overwritten once `pool_size - 1` other observations have been returned
+            (by the environment or, independently, by `obs.simulate`). Use `obs.copy()` if you need
+            to keep it for longer.
+
+        See :func:`grid2op.Observation.ObservationSpace.set_obs_pool_size` for more information.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"
+            env = grid2op.make(env_name)
+            env.set_obs_pool_size(4)
+
+            obs = env.reset()
+            prev_obs = obs.copy()  # this one is never overwritten
+            obs, reward, done, info = env.step(env.action_space())
+
+        """
+        if self.__closed:
+            raise EnvError("This environment is closed, you cannot use it.")
+        self._observation_space.set_obs_pool_size(pool_size)
+
     def reactivate_forecast(self):
         """
         This function will have the effect to reactivate the `obs.simulate`, the forecast will be updated
@@ -1979,6 +2221,8 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         return valid, except_
 
     def _compute_dispatch_vect(self, already_modified_gen, new_p):        
+        from scipy.optimize import minimize, LinearConstraint
+
         except_ = None
         
         # handle the case where there are storage or redispatching
@@ -2123,6 +2367,19 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         max_disp = np.minimum(p_max_const, ramp_up_const)
         max_disp = max_disp.astype(dt_float)
 
+        if self._parameters.REDISPATCHING_SOLVER == "closed_form":
+            # exact solver, SLSQP is only used if it fails
+            res_x = closed_form_dispatch(weights,
+                                         target_vals,
+                                         already_modified_gen_me,
+                                         min_disp,
+                                         max_disp,
+                                         float(const_sum_0_no_turn_on[0]),
+                                         self._tol_poly)
+            if res_x is not None:
+                self._actual_dispatch[gen_participating] += res_x
+                return except_
+
         # add everything into a linear constraint object
         # equality
         added = 0.5 * self._epsilon_poly
@@ -2506,10 +2763,71 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                 env=self, _update_state=_update_state
             )
         if _do_copy:
-            return copy.deepcopy(self._last_obs)
+            # regular deepcopy, unless the observation pool is activated (see `set_obs_pool_size`)
+            return self._observation_space._copy_obs(self._last_obs)
         else:
             return self._last_obs
 
+    def _aux_record_timing(self, phase: str, duration: float):
+        if self._timings is not None:
+            self._timings.record(phase, duration)
+
+    def enable_timings(self, enable: bool=True) -> None:
+        """
+        .. versionadded:: 1.10.5
+
+        Activate (or deactivate if `enable` is ``False``) the detailed profiling of
+        :func:`BaseEnv.step`. Once activated, the duration of each phase of each step
+        is stored in a :class:`grid2op.Environment.StepTimings` that
+        can be retrieved with :func:`BaseEnv.get_timings`.
+
+        The timings are not reset when the environment is reset, you need to call
+        :func:`BaseEnv.reset_timings` for that (and the internal step performed by `env.reset`
+        is not profiled). Deactivating them forget everything that has been recorded.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"
+            env = grid2op.make(env_name)
+            env.enable_timings()
+
+            obs = env.reset()
+            for _ in range(10):
+                obs, reward, done, info = env.step(env.action_space())
+            print(env.get_timings().to_dict())
+
+        """
+        if enable:
+            if self._timings is None:
+                self._timings = StepTimings()
+        else:
+            self._timings = None
+
+    def get_timings(self) -> StepTimings:
+        """
+        .. versionadded:: 1.10.5
+
+        Get (a copy of) the detailed timings recorded since :func:`BaseEnv.enable_timings`
+        or since the last call to :func:`BaseEnv.reset_timings`.
+        """
+        if self._timings is None:
+            raise EnvError("The detailed timings are not computed for this environment. "
+                           "Call `env.enable_timings()` first.")
+        return self._timings.copy()
+
+    def reset_timings(self) -> None:
+        """
+        .. versionadded:: 1.10.5
+
+        Forget all the timings recorded (does nothing if they are not enabled)
+        """
+        if self._timings is not None:
+            self._timings.reset()
+
     def get_thermal_limit(self):
         """
         Get the current thermal limit in amps registered for the environment.
@@ -3019,11 +3337,22 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         # the environment must make sure it's a zero-sum action.
         # same kind of limit for the storage
         res_exc_ = None
-        action._redispatch[:] = 0.0
-        action._storage_power[:] = self._storage_power
-        self._backend_action += action
-        action._storage_power[:] = action_storage_power
-        action._redispatch[:] = init_disp
+        if action.is_frozen:
+            # frozen actions cannot be modified in place, vectors are swapped instead
+            redisp_orig, storage_orig = action._redispatch, action._storage_power
+            action._redispatch = np.zeros_like(redisp_orig)
+            action._storage_power = self._storage_power
+            try:
+                self._backend_action += action
+            finally:
+                action._redispatch = redisp_orig
+                action._storage_power = storage_orig
+        else:
+            action._redispatch[:] = 0.0
+            action._storage_power[:] = self._storage_power
+            self._backend_action += action
+            action._storage_power[:] = action_storage_power
+            action._redispatch[:] = init_disp
         # TODO storage: check the original action, even when replaced by do nothing is not modified
         self._backend_action += self._env_modification
         self._backend_action.set_redispatch(self._actual_dispatch)
@@ -3099,9 +3428,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         if self._max_timestep_line_status_deactivated > 0:
             # i update the cooldown only when this does not impact the line disconnected for the
             # opponent or by maintenance for example
-            cond = aff_lines  # powerlines i modified
-            # powerlines that are not affected by any other "forced disconnection"
-            cond &= (
+            # powerlines i modified (not modified in place: it can be cached by the action)
+            # and that are not affected by any other "forced disconnection"
+            cond = aff_lines & (
                 self._times_before_line_status_actionable
                 < self._max_timestep_line_status_deactivated
             )
@@ -3132,7 +3461,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         self.current_obs = self.get_obs(_do_copy=False)
         # TODO storage: get back the result of the storage ! with the illegal action when a storage unit
         # TODO is non zero and disconnected, this should be ok.
-        self._time_extract_obs += time.perf_counter() - beg_res
+        dt_ = time.perf_counter() - beg_res
+        self._time_extract_obs += dt_
+        self._aux_record_timing("extract_obs", dt_)
 
     def _backend_next_grid_state(self):
         """overlaoded in MaskedEnv"""
@@ -3148,7 +3479,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             beg_pf = time.perf_counter()
             disc_lines, detailed_info, conv_ = self._backend_next_grid_state()
             self._disc_lines[:] = disc_lines
-            self._time_powerflow += time.perf_counter() - beg_pf
+            dt_ = time.perf_counter() - beg_pf
+            self._time_powerflow += dt_
+            self._aux_record_timing("powerflow", dt_)
             if conv_ is None:
                 # everything went well, so i register what is needed
                 self._aux_register_env_converged(
@@ -3323,7 +3656,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                         action.raise_alert = init_alert
                 except_.append(except_tmp)
 
+            beg_rules = time.perf_counter()
             is_legal, reason = self._game_rules(action=action, env=self)
+            self._aux_record_timing("rules", time.perf_counter() - beg_rules)
             if not is_legal:
                 # action is replace by do nothing
                 action = self._action_space({})
@@ -3346,7 +3681,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                     self._is_alarm_illegal = reason_alarm_illegal is not None
 
             # get the modification of generator active setpoint from the environment
+            beg_chronics = time.perf_counter()
             self._env_modification, prod_v_chronics = self._update_actions()
+            self._aux_record_timing("chronics", time.perf_counter() - beg_chronics)
             self._env_modification._single_act = (
                 False  # because it absorbs all redispatching actions
             )
@@ -3374,7 +3711,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                 )
                 action, is_illegal_redisp, is_illegal_reco, is_done = res_disp
                 
-            self._time_redisp += time.perf_counter() - beg__redisp
+            dt_ = time.perf_counter() - beg__redisp
+            self._time_redisp += dt_
+            self._aux_record_timing("redisp", dt_)
             
             if not is_done:
                 self._aux_update_backend_action(action, action_storage_power, init_disp)
@@ -3390,7 +3729,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                 )
                 tock = time.perf_counter()
                 self._time_opponent += tock - tick
+                self._aux_record_timing("opponent", tock - tick)
                 self._time_create_bk_act += tock - beg_
+                self._aux_record_timing("create_bk_act", tock - beg_)
                 try:
                     self.backend.apply_action(self._backend_action)
                 except ImpossibleTopology as exc_:
@@ -3399,7 +3740,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                     is_done = True
                     # TODO in this case: cancel the topological action of the agent
                     # and continue instead of "game over"
-                self._time_apply_act += time.perf_counter() - beg_
+                dt_ = time.perf_counter() - beg_
+                self._time_apply_act += dt_
+                self._aux_record_timing("apply_act", dt_)
 
                 # now it's time to run the powerflow properly
                 # and to update the time dependant properties
@@ -3416,7 +3759,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             
         self._backend_action.reset()
         end_step = time.perf_counter()
-        self._time_step += end_step - beg_step
+        dt_ = end_step - beg_step
+        self._time_step += dt_
+        self._aux_record_timing("step", dt_)
         if conv_ is not None:
             except_.append(conv_)
         with warnings.catch_warnings():
@@ -3443,6 +3788,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             self.infos["detailed_infos_for_cascading_failures"] = detailed_info
             
         self.done = self._is_done(has_error, is_done)
+        beg_reward = time.perf_counter()
         self.current_reward, other_reward = self._get_reward(
             action,
             has_error,
@@ -3450,6 +3796,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             is_illegal or is_illegal_redisp or is_illegal_reco,
             is_ambiguous,
         )
+        self._aux_record_timing("reward", time.perf_counter() - beg_reward)
         self.infos["rewards"] = other_reward
         if has_error and self.current_obs is not None:
             # forward to the observation if an alarm is used or not
@@ -3634,6 +3981,10 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                 # close the "other rewards"
                 reward.close()
             self.other_rewards = None
+
+        if hasattr(self, "chronics_handler") and self.chronics_handler is not None:
+            # release the resources of the time series (eg the threads reading them in the background)
+            self.chronics_handler.close()
             
         self.backend : Backend = None
         self.__is_init = False
@@ -3654,6 +4005,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             "_time_opponent",
             "_time_redisp",
             "_time_step",
+            "_timings",
             "_epsilon_poly",
             "_helper_action_class",
             "_helper_observation_class",
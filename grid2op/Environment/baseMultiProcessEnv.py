@@ -5,19 +5,124 @@
 # you can obtain one at http://mozilla.org/MPL/2.0/.
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+import multiprocessing
 from multiprocessing import Process, Pipe, Array
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait as wait_connections
+import sys
 import numpy as np
 import warnings
 import time
 
 from grid2op.Exceptions import EnvError
-from grid2op.dtypes import dt_int
+from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Exceptions import Grid2OpException, MultiEnvException
 from grid2op.Space import GridObjects
 from grid2op.Environment.environment import Environment
+from grid2op.Environment.stepTimings import StepTimings
 from grid2op.Action import BaseAction
 
 
+class _SharedMemoryBuffer(object):
+    """
+    INTERNAL
+
+     .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    Block of shared memory used to transfer the results of the steps (observation as vector,
+    reward, done and a compact version of the "info" dictionary) from the sub processes
+    to the main process without any serialization.
+
+    There is one "slot" (one row of each array) per sub environment. Each sub process only
+    writes in its own slot and the main process only reads them once all sub processes
+    have notified they were done.
+    """
+    # flags of the "info" dictionary stored in the shared memory
+    INFO_FLAGS = ("is_illegal", "is_ambiguous", "is_dispatching_illegal", "is_illegal_reco")
+    _ALIGN = 8
+
+    def __init__(self, nb_env, obs_size, n_line, name=None):
+        self.nb_env = int(nb_env)
+        self.obs_size = int(obs_size)
+        self.n_line = int(n_line)
+        layout = [("obs", dt_float, (self.nb_env, self.obs_size)),
+                  ("reward", dt_float, (self.nb_env,)),
+                  ("done", dt_bool, (self.nb_env,)),
+                  ("info_flags", dt_bool, (self.nb_env, len(type(self).INFO_FLAGS))),
+                  ("disc_lines", dt_int, (self.nb_env, self.n_line)),
+                  ]
+        offsets = []
+        total = 0
+        for _, dtype_, shape_ in layout:
+            offsets.append(total)
+            nb_bytes = int(np.prod(shape_)) * np.dtype(dtype_).itemsize
+            total += (nb_bytes + self._ALIGN - 1) // self._ALIGN * self._ALIGN
+
+        self._owner = name is None
+        if self._owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=max(total, 1))
+        else:
+            self.shm = type(self)._attach(name)
+        self.name = self.shm.name
+        for (attr_nm, dtype_, shape_), offset in zip(layout, offsets):
+            # np.frombuffer (contrary to np.ndarray(..., buffer=)) keeps the buffer exported as long as
+            # a view exists, so that the memory cannot be unmapped while it is still used
+            arr_ = np.frombuffer(self.shm.buf, dtype=dtype_, count=int(np.prod(shape_)), offset=offset)
+            setattr(self, attr_nm, arr_.reshape(shape_))
+
+    @staticmethod
+    def _attach(name):
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)
+        res = shared_memory.SharedMemory(name=name)
+        if multiprocessing.get_start_method(allow_none=True) != "fork":
+            # the sub process has its own resource tracker that would otherwise
+            # destroy the memory block when it exits (only the main process owns it)
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(res._name, "shared_memory")
+        return res
+
+    def write(self, slot, obs_v, reward, done, info):
+        """write the results of a step in the given slot (called by the sub process)"""
+        self.obs[slot, :] = obs_v
+        self.reward[slot] = reward
+        self.done[slot] = done
+        if info is not None:
+            self.info_flags[slot, :] = [bool(info.get(el, False)) for el in type(self).INFO_FLAGS]
+            disc_lines = info.get("disc_lines", None)
+            if disc_lines is not None:
+                self.disc_lines[slot, :] = disc_lines
+            else:
+                self.disc_lines[slot, :] = -1
+        else:
+            self.info_flags[slot, :] = False
+            self.disc_lines[slot, :] = -1
+
+    def read_info(self, slot, exceptions):
+        """build back the (compact) info dictionary of the given slot (called by the main process)"""
+        res = {el: bool(self.info_flags[slot, i]) for i, el in enumerate(type(self).INFO_FLAGS)}
+        res["disc_lines"] = self.disc_lines[slot].copy()
+        res["exception"] = exceptions if exceptions is not None else []
+        return res
+
+    def close(self):
+        # views on the buffer must be released before closing it
+        for attr_nm in ["obs", "reward", "done", "info_flags", "disc_lines"]:
+            setattr(self, attr_nm, None)
+        try:
+            self.shm.close()
+        except BufferError:
+            # some views are still used (observations returned with `obs_as_class=False`)
+            warnings.warn("Some observations returned by the environment are still used: the shared memory "
+                          "will only be released once they are deleted.")
+            # the memory is unmapped when the last view is deleted, only the file descriptor is closed here
+            self.shm._buf = None
+            self.shm._mmap = None
+            self.shm.close()
+        if self._owner:
+            self.shm.unlink()
+
+
 class RemoteEnv(Process):
     """
     INTERNAL
@@ -43,6 +148,8 @@ class RemoteEnv(Process):
         name=None,
         return_info=True,
         _obs_to_vect=True,
+        shm_name=None,
+        shm_shape=None,
     ):
         Process.__init__(self, group=None, target=None, name=name)
 
@@ -70,6 +177,11 @@ class RemoteEnv(Process):
         self._obs_to_vect = _obs_to_vect
         self._comp_time = 0.0
 
+        # shared memory (optional) used to send back the results of the steps
+        self._shm_name = shm_name
+        self._shm_shape = shm_shape
+        self._shm = None
+
     def init_env(self):
         """
         INTERNAL
@@ -100,6 +212,9 @@ class RemoteEnv(Process):
                 **self.env_params, backend=self.backend, logger=self.logger
             )
 
+        if self._shm_name is not None:
+            self._shm = _SharedMemoryBuffer(*self._shm_shape, name=self._shm_name)
+
         env_seed = self.space_prng.randint(np.iinfo(dt_int).max)
         self.all_seeds = self.env.seed(env_seed)
         self.env.chronics_handler.shuffle(
@@ -143,6 +258,25 @@ class RemoteEnv(Process):
             res = obs
         return res
 
+    def _send_step_res(self, obs_v, reward, done, info):
+        if self._shm is None:
+            self.remote.send((obs_v, reward, done, info))
+            return
+        # results are written in shared memory, only a small notification
+        # (with the exceptions if any) goes through the pipe
+        self._shm.write(self.p_id, obs_v, reward, done, info)
+        exceptions = None
+        if info is not None and info.get("exception", None):
+            exceptions = info["exception"]
+        self.remote.send(exceptions)
+
+    def _send_obs(self, obs_v):
+        if self._shm is None:
+            self.remote.send(obs_v)
+            return
+        self._shm.obs[self.p_id, :] = obs_v
+        self.remote.send(None)
+
     def run(self):
         if self.env is None:
             self.init_env()
@@ -172,14 +306,16 @@ class RemoteEnv(Process):
                     info = None
                 end_ = time.perf_counter()
                 self._comp_time += end_ - beg_
-                self.remote.send((res_obs, reward, done, info))
+                self._send_step_res(res_obs, reward, done, info)
             elif cmd == "r":
                 # perfom a reset
                 obs_v = self.get_obs_ifnotconv()
-                self.remote.send(obs_v)
+                self._send_obs(obs_v)
             elif cmd == "c":
                 # close everything
                 self.env.close()
+                if self._shm is not None:
+                    self._shm.close()
                 self.remote.close()
                 break
             elif cmd == "z":
@@ -206,6 +342,14 @@ class RemoteEnv(Process):
                 self.remote.send(self.env.backend.comp_time)
             elif cmd == "step_time":
                 self.remote.send(self.env._time_step)
+            elif cmd == "enable_timings":
+                self.env.enable_timings(data)
+                self.remote.send(None)
+            elif cmd == "get_timings":
+                self.remote.send(self.env._timings)
+            elif cmd == "reset_timings":
+                self.env.reset_timings()
+                self.remote.send(None)
             elif cmd == "set_filter":
                 self.env.chronics_handler.set_filter(data)
                 self.env.chronics_handler.reset()
@@ -218,7 +362,7 @@ class RemoteEnv(Process):
                 obs = self.env.get_obs()
                 sim_obs, sim_reward, sim_done, sim_info = obs.simulate(action)
                 sim_obs_v = sim_obs.to_vect()
-                self.remote.send((sim_obs_v, sim_reward, sim_done, sim_info))
+                self._send_step_res(sim_obs_v, sim_reward, sim_done, sim_info)
             elif hasattr(self.env, cmd):
                 tmp = getattr(self.env, cmd)
                 self.remote.send(tmp)
@@ -274,9 +418,23 @@ class BaseMultiProcessEnvironment(GridObjects):
     return_info: ``bool``
         Whether to return the information dictionary or not (might speed up computation)
 
+    use_shared_memory: ``bool``
+        Whether to transfer the results of :func:`BaseMultiProcessEnvironment.step` (and 
+        :func:`BaseMultiProcessEnvironment.reset`) through a block of shared memory instead of 
+        pickling them in a ``Pipe`` (default ``False``). This is faster, especially with
+        lots of sub environments, but:
+
+        - the "info" dictionaries only contain the keys "is_illegal", "is_ambiguous",
+          "is_dispatching_illegal", "is_illegal_reco", "disc_lines" and "exception"
+        - if `obs_as_class` is ``False``, the returned observations are a view on the shared memory 
+          (no copy is made): they are overwritten at the next call to `step` or `reset`. Copy them
+          if you need to keep them.
+
+        .. versionadded:: 1.10.5
+
     """
 
-    def __init__(self, envs, obs_as_class=True, return_info=True, logger=None):
+    def __init__(self, envs, obs_as_class=True, return_info=True, logger=None, use_shared_memory=False):
         GridObjects.__init__(self)
         self.__closed = False
         for env in envs:
@@ -291,6 +449,19 @@ class BaseMultiProcessEnvironment(GridObjects):
         max_int = np.iinfo(dt_int).max
         _remotes, _work_remotes = zip(*[Pipe() for _ in range(self.nb_env)])
 
+        self._shm = None
+        shm_shape = None
+        if use_shared_memory:
+            obs_sizes = {sub_env.observation_space.size() for sub_env in envs}
+            if len(obs_sizes) != 1:
+                raise MultiEnvException(
+                    "Impossible to use the shared memory if all the environments do not have "
+                    "observations of the same size."
+                )
+            shm_shape = (self.nb_env, obs_sizes.pop(), type(envs[0]).n_line)
+            self._shm = _SharedMemoryBuffer(*shm_shape)
+        self.use_shared_memory = self._shm is not None
+
         env_params = [sub_env.get_kwargs(with_backend=False, with_backend_kwargs=True) for sub_env in envs]
         self._ps = [
             RemoteEnv(
@@ -304,6 +475,8 @@ class BaseMultiProcessEnvironment(GridObjects):
                 logger=logger.getChild("BaseMultiProcessEnvironment")
                 if logger is not None
                 else None,
+                shm_name=self._shm.name if self._shm is not None else None,
+                shm_shape=shm_shape,
             )
             for i, (work_remote, remote, env_) in enumerate(
                 zip(_work_remotes, _remotes, env_params)
@@ -323,27 +496,111 @@ class BaseMultiProcessEnvironment(GridObjects):
         for remote in self._work_remotes:
             remote.close()
         self.obs_as_class = obs_as_class
-        # self.__return_info = return_info
+        self.return_info = return_info
         self._waiting = True
         self._read_from_local_dir = env._read_from_local_dir
 
-    def _send_act(self, actions):
-        for remote, action in zip(self._remotes, actions):
+        # for the asynchronous steps: which sub env is computing a step
+        # and the (raw) results already received
+        self._busy = np.zeros(self.nb_env, dtype=dt_bool)
+        self._pending_res = [None for _ in range(self.nb_env)]
+        self._has_res = np.zeros(self.nb_env, dtype=dt_bool)
+
+    def _send_act(self, actions, env_ids=None):
+        if env_ids is None:
+            env_ids = np.arange(self.nb_env)
+        for id_, action in zip(env_ids, actions):
             vect = action.to_vect()
             # vect = None  # TODO
-            remote.send(("s", vect))
+            self._remotes[id_].send(("s", vect))
+        self._busy[env_ids] = True
         self._waiting = True
 
     def _wait_for_obs(self):
         results = [remote.recv() for remote in self._remotes]
         self._waiting = False
+        return self._format_res(np.arange(self.nb_env), results)
+
+    def _format_res(self, env_ids, results):
+        if self._shm is not None:
+            return self._read_shm(env_ids, results)
         obs, rews, dones, infos = zip(*results)
         if self.obs_as_class:
             obs = [
-                self.envs[e].observation_space.from_vect(ob) for e, ob in enumerate(obs)
+                self.envs[e].observation_space.from_vect(ob) for e, ob in zip(env_ids, obs)
             ]
         return np.stack(obs), np.stack(rews), np.stack(dones), infos
 
+    def _read_shm(self, env_ids, exceptions):
+        obs = self._get_obs_shm(env_ids)
+        if self.return_info:
+            infos = tuple(self._shm.read_info(e, exc) for e, exc in zip(env_ids, exceptions))
+        else:
+            infos = tuple(None for _ in env_ids)
+        return obs, self._shm.reward[env_ids], self._shm.done[env_ids], infos
+
+    def _get_obs_shm(self, env_ids=None):
+        if env_ids is None:
+            env_ids = np.arange(self.nb_env)
+        if self.obs_as_class:
+            return np.stack([
+                self.envs[e].observation_space.from_vect(self._shm.obs[e]) for e in env_ids
+            ])
+        if env_ids.shape[0] == self.nb_env and (env_ids == np.arange(self.nb_env)).all():
+            # no copy in this case
+            return self._shm.obs
+        return self._shm.obs[env_ids]
+
+    def _aux_check_actions(self, actions, nb_act):
+        if len(actions) != nb_act:
+            raise MultiEnvException(
+                "Incorrect number of actions provided. You provided {} actions, but the "
+                "MultiEnvironment counts {} different environment."
+                "".format(len(actions), nb_act)
+            )
+        for act in actions:
+            if not isinstance(act, BaseAction):
+                raise MultiEnvException(
+                    'All actions send to MultiEnvironment.step should be of type "grid2op.BaseAction"'
+                    "and not {}".format(type(act))
+                )
+
+    def _aux_check_env_ids(self, env_ids):
+        if env_ids is None:
+            return np.arange(self.nb_env)
+        try:
+            env_ids = np.array(env_ids, dtype=dt_int).reshape(-1)
+        except Exception as exc_:
+            raise MultiEnvException(
+                '"env_ids" should be convertible to a list of integers.'
+            ) from exc_
+        if (env_ids < 0).any() or (env_ids >= self.nb_env).any():
+            raise MultiEnvException(
+                '"env_ids" should contain the ids of sub environments, between 0 and '
+                "{}".format(self.nb_env - 1)
+            )
+        if np.unique(env_ids).shape[0] != env_ids.shape[0]:
+            raise MultiEnvException('"env_ids" should not contain duplicates.')
+        return env_ids
+
+    def _aux_check_not_busy(self):
+        if self._busy.any():
+            raise MultiEnvException(
+                "Some sub environments are still computing a step (see `step_async`). "
+                "Call `step_wait` before doing anything else."
+            )
+
+    def _recv_ready(self, timeout):
+        """receive the results of the sub environments that are ready (waiting at most `timeout` seconds)"""
+        waiting_ids = np.flatnonzero(self._busy & ~self._has_res)
+        if waiting_ids.shape[0] == 0:
+            return
+        remote_to_id = {self._remotes[id_]: id_ for id_ in waiting_ids}
+        for remote in wait_connections(list(remote_to_id.keys()), timeout=timeout):
+            id_ = remote_to_id[remote]
+            self._pending_res[id_] = remote.recv()
+            self._has_res[id_] = True
+
     def copy(self):
         raise NotImplementedError(
             "It is not possible to copy multiprocessing environments at the moment."
@@ -448,25 +705,160 @@ class BaseMultiProcessEnvironment(GridObjects):
             # obs1 = obs1_aux
             # CAREFULLL in this case, obs1 is NOT obs1_tmp but is really
 
+        """
+        self.step_async(actions)
+        obs, rews, dones, infos = self.step_wait()
+        return obs, rews, dones, infos
+
+    def step_async(self, actions, env_ids=None):
+        """
+        Send the actions to (some of) the underlying environments, and return without waiting
+        for the results.
+
+        The results are then retrieved with :func:`BaseMultiProcessEnvironment.step_wait` (and
+        :func:`BaseMultiProcessEnvironment.poll` can be used to know which sub environments are
+        done computing their step). This allows to do something else (for example
+        computing the actions of the sub environments already done) while the
+        powerflows are being computed.
+
+        A call to :func:`BaseMultiProcessEnvironment.step` is equivalent to
+        `multi_env.step_async(actions)` followed by `multi_env.step_wait()`
+
+        .. versionadded:: 1.10.5
+
+        Parameters
+        ----------
+        actions: ``list``
+            List of :class:`grid2op.Action.BaseAction`, one per sub environments in `env_ids`
+
+        env_ids: ``list`` of ``int``
+            The ids of the sub environments to send the actions to. By default (``None``) all of them.
+            None of these sub environments should already be computing a step.
+
+        Examples
+        ---------
+
+        .. code-block:: python
+
+            import grid2op
+            from grid2op.Environment import SingleEnvMultiProcess
+
+            env = grid2op.make("l2rpn_case14_sandbox")
+            multi_env = SingleEnvMultiProcess(env, nb_env=4)
+            obss = multi_env.reset()
+
+            multi_env.step_async([env.action_space() for _ in range(multi_env.nb_env)])
+            while True:
+                ready_ids = multi_env.poll(timeout=0.01)
+                if len(ready_ids):
+                    obss, rews, dones, infos = multi_env.step_wait(env_ids=ready_ids)
+                    # compute the next actions for these sub environments
+                    next_acts = [env.action_space() for _ in ready_ids]
+                    # and start their next step without waiting for the other ones
+                    multi_env.step_async(next_acts, env_ids=ready_ids)
+                # do something else in the meantime
+
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
-        if len(actions) != self.nb_env:
+        env_ids = self._aux_check_env_ids(env_ids)
+        self._aux_check_actions(actions, env_ids.shape[0])
+        if self._busy[env_ids].any():
             raise MultiEnvException(
-                "Incorrect number of actions provided. You provided {} actions, but the "
-                "MultiEnvironment counts {} different environment."
-                "".format(len(actions), self.nb_env)
+                "Sub environments {} are already computing a step. Call `step_wait` first."
+                "".format(env_ids[self._busy[env_ids]])
             )
-        for act in actions:
-            if not isinstance(act, BaseAction):
-                raise MultiEnvException(
-                    'All actions send to MultiEnvironment.step should be of type "grid2op.BaseAction"'
-                    "and not {}".format(type(act))
-                )
+        self._send_act(actions, env_ids)
 
-        self._send_act(actions)
-        obs, rews, dones, infos = self._wait_for_obs()
-        return obs, rews, dones, infos
+    def poll(self, timeout=0.):
+        """
+        Get the ids of the sub environments for which the step (sent with
+        :func:`BaseMultiProcessEnvironment.step_async`) is over. Their results can then be
+        retrieved, without blocking, with `multi_env.step_wait(env_ids=ready_ids)`.
+
+        .. versionadded:: 1.10.5
+
+        Parameters
+        ----------
+        timeout: ``float``
+            Maximum number of seconds to wait for at least one sub environment to be ready.
+            By default (``0.``) it does not block. Use ``None`` to wait until at least
+            one sub environment is ready.
+
+        Returns
+        -------
+        ready_ids: ``numpy.ndarray``
+            The (sorted) ids of the sub environments that are ready.
+
+        """
+        if self.__closed:
+            raise EnvError("This environment is closed, you cannot use it.")
+        if (self._busy & ~self._has_res).any() and not (self._busy & self._has_res).any():
+            # nothing is ready yet, wait for (at most) timeout
+            self._recv_ready(timeout)
+        else:
+            self._recv_ready(0.)
+        return np.flatnonzero(self._busy & self._has_res)
+
+    def step_wait(self, timeout=None, env_ids=None):
+        """
+        Wait for the results of the steps sent with :func:`BaseMultiProcessEnvironment.step_async`.
+
+        .. versionadded:: 1.10.5
+
+        Parameters
+        ----------
+        timeout: ``float``
+            Maximum number of seconds to wait for the results. By default (``None``) it
+            waits as long as needed. If the timeout is reached a :class:`grid2op.Exceptions.MultiEnvException`
+            is raised and the sub environments are left untouched: `step_wait` can be called again later.
+
+        env_ids: ``list`` of ``int``
+            The ids of the sub environments for which you want the results. By default (``None``) all
+            sub environments currently computing a step (in increasing order).
+
+        Returns
+        -------
+        obs, rews, dones, infos:
+            Same as :func:`BaseMultiProcessEnvironment.step`, but only for the sub environments
+            in `env_ids` (in the same order)
+
+        """
+        if self.__closed:
+            raise EnvError("This environment is closed, you cannot use it.")
+        if env_ids is None:
+            env_ids = np.flatnonzero(self._busy)
+        else:
+            env_ids = self._aux_check_env_ids(env_ids)
+        if env_ids.shape[0] == 0:
+            raise MultiEnvException("No step is being computed, call `step_async` first.")
+        if not self._busy[env_ids].all():
+            raise MultiEnvException(
+                "Sub environments {} are not computing any step, call `step_async` first."
+                "".format(env_ids[~self._busy[env_ids]])
+            )
+
+        beg_ = time.perf_counter()
+        while not self._has_res[env_ids].all():
+            if timeout is None:
+                remaining = None
+            else:
+                remaining = timeout - (time.perf_counter() - beg_)
+                if remaining <= 0.:
+                    raise MultiEnvException(
+                        "Timeout reached, sub environments {} are still computing their step."
+                        "".format(env_ids[~self._has_res[env_ids]])
+                    )
+            self._recv_ready(remaining)
+
+        results = [self._pending_res[id_] for id_ in env_ids]
+        res = self._format_res(env_ids, results)
+        for id_ in env_ids:
+            self._pending_res[id_] = None
+        self._busy[env_ids] = False
+        self._has_res[env_ids] = False
+        self._waiting = self._busy.any()
+        return res
 
     def reset(self):
         """
@@ -485,9 +877,12 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        self._aux_check_not_busy()
         for remote in self._remotes:
             remote.send(("r", None))
         res = [remote.recv() for e, remote in enumerate(self._remotes)]
+        if self._shm is not None:
+            return self._get_obs_shm()
         if self.obs_as_class:
             res = [
                 self.envs[e].observation_space.from_vect(el) for e, el in enumerate(res)
@@ -501,8 +896,17 @@ class BaseMultiProcessEnvironment(GridObjects):
         if self.__closed:
             return
 
+        # results of the steps still being computed are not used
+        while (self._busy & ~self._has_res).any():
+            self._recv_ready(None)
         for remote in self._remotes:
             remote.send(("c", None))
+        if self._shm is not None:
+            # wait for the sub processes to release the shared memory
+            for p in self._ps:
+                p.join()
+            self._shm.close()
+            self._shm = None
         self.__closed = True
 
     def set_chunk_size(self, new_chunk_size):
@@ -562,6 +966,7 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        self._aux_check_not_busy()
         for remote in self._remotes:
             remote.send(("seed", None))
         res = [remote.recv() for remote in self._remotes]
@@ -573,6 +978,7 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        self._aux_check_not_busy()
         for remote in self._remotes:
             remote.send(("params", None))
         res = [remote.recv() for remote in self._remotes]
@@ -582,6 +988,7 @@ class BaseMultiProcessEnvironment(GridObjects):
         """implement the get_obs function that is "broken" if you use the __getattr__"""
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        self._aux_check_not_busy()
         for remote in self._remotes:
             remote.send(("o", None))
         res = [
@@ -639,18 +1046,8 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
-        if len(actions) != self.nb_env:
-            raise MultiEnvException(
-                "Incorrect number of actions provided. You provided {} actions, but the "
-                "MultiEnvironment counts {} different environment."
-                "".format(len(actions), self.nb_env)
-            )
-        for act in actions:
-            if not isinstance(act, BaseAction):
-                raise MultiEnvException(
-                    "All actions send to MultiEnvironment.step should be of type "
-                    '"grid2op.BaseAction" and not {}'.format(type(act))
-                )
+        self._aux_check_not_busy()
+        self._aux_check_actions(actions, self.nb_env)
 
         self._send_sim(actions)
         sim_obs, sim_rews, sim_dones, sim_infos = self._wait_for_obs()
@@ -679,6 +1076,7 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        self._aux_check_not_busy()
         res = True
         for sub_env in self.envs:
             if not hasattr(sub_env, name):
@@ -699,6 +1097,7 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        self._aux_check_not_busy()
         for remote in self._remotes:
             remote.send(("comp_time", None))
         res = [remote.recv() for remote in self._remotes]
@@ -710,6 +1109,7 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        self._aux_check_not_busy()
         for remote in self._remotes:
             remote.send(("powerflow_time", None))
         res = [remote.recv() for remote in self._remotes]
@@ -721,11 +1121,77 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        self._aux_check_not_busy()
         for remote in self._remotes:
             remote.send(("step_time", None))
         res = [remote.recv() for remote in self._remotes]
         return res
 
+    def _aux_send_timings_cmd(self, cmd, data=None):
+        if self.__closed:
+            raise EnvError("This environment is closed, you cannot use it.")
+        self._aux_check_not_busy()
+        for remote in self._remotes:
+            remote.send((cmd, data))
+        return [remote.recv() for remote in self._remotes]
+
+    def enable_timings(self, enable=True):
+        """
+        .. versionadded:: 1.10.5
+
+        Activate (or deactivate) the detailed profiling of the steps in all the sub environments.
+
+        See :func:`grid2op.Environment.BaseEnv.enable_timings` for more information.
+        """
+        self._aux_send_timings_cmd("enable_timings", bool(enable))
+
+    def reset_timings(self):
+        """
+        .. versionadded:: 1.10.5
+
+        Forget all the detailed timings recorded in all the sub environments.
+
+        See :func:`grid2op.Environment.BaseEnv.reset_timings` for more information.
+        """
+        self._aux_send_timings_cmd("reset_timings")
+
+    def get_timings(self, aggregate=True):
+        """
+        .. versionadded:: 1.10.5
+
+        Get the detailed timings of the sub environments (see :func:`grid2op.Environment.BaseEnv.get_timings`).
+
+        Parameters
+        ----------
+        aggregate: ``bool``
+            If ``True`` (default) the timings of all the sub environments are merged in a single
+            :class:`grid2op.Environment.StepTimings`, otherwise a list with the timings of each
+            sub environment is returned.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            from grid2op.Environment import SingleEnvMultiProcess
+            env = grid2op.make("l2rpn_case14_sandbox")
+            multi_env = SingleEnvMultiProcess(env, nb_env=2)
+            multi_env.enable_timings()
+            obs = multi_env.reset()
+            for _ in range(10):
+                obs, reward, done, info = multi_env.step([env.action_space() for _ in range(2)])
+            print(multi_env.get_timings().percentile("powerflow", 90))
+
+        """
+        res = self._aux_send_timings_cmd("get_timings")
+        if any([el is None for el in res]):
+            raise EnvError("The detailed timings are not computed for at least one sub environment. "
+                           "Call `multi_env.enable_timings()` first.")
+        if aggregate:
+            res = StepTimings.aggregate(res)
+        return res
+
     def set_filter(self, filter_funs):
         """
         Set a `filter_fun` for each of the underlying environment.
@@ -738,6 +1204,7 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        self._aux_check_not_busy()
         if callable(filter_funs):
             filter_funs = [filter_funs for _ in range(self.nb_env)]
         if len(filter_funs) != self.nb_env:
@@ -768,6 +1235,7 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        self._aux_check_not_busy()
         if isinstance(id_, int):
             id_ = [id_ for _ in range(self.nb_env)]
         if len(id_) != self.nb_env:
@@ -0,0 +1,103 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import copy
+import datetime
+from typing import Any, Dict
+
+import numpy as np
+
+
+class EnvState(object):
+    """
+    .. versionadded:: 1.10.5
+
+    Snapshot of the "dynamic" part of an environment: everything that changes from one step
+    to another (topology, injections, redispatching, storage units, overflow counters, cooldowns,
+    maintenance, opponent budget, position in the time series, etc.).
+
+    It is returned by :func:`grid2op.Environment.BaseEnv.get_state` and it is used to put an
+    environment back in this state with :func:`grid2op.Environment.BaseEnv.set_state`.
+
+    It is only made of (small) numpy arrays and python objects: it can be pickled (for example to be sent
+    to another process running the same environment) and it is much lighter than a copy of the
+    environment. It is never modified by :func:`grid2op.Environment.BaseEnv.set_state` so the same state
+    can be used as many times as needed.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import grid2op
+        env_name = "l2rpn_case14_sandbox"
+        env = grid2op.make(env_name)
+        obs = env.reset()
+
+        state = env.get_state()
+        for act in [env.action_space(), env.action_space({"set_line_status": [(0, -1)]})]:
+            # all actions are evaluated from the same state
+            obs = env.set_state(state)
+            obs, reward, done, info = env.step(act)
+
+    """
+    def __init__(self,
+                 env_name: str,
+                 time_serie_id: str,
+                 env_values: Dict[str, Any],
+                 env_arrays: Dict[str, np.ndarray],
+                 backend_action: Dict[str, Any],
+                 backend: Dict[str, Any],
+                 chronics: Dict[str, Any],
+                 others: Dict[str, Any]):
+        #: name of the environment this state comes from
+        self.env_name: str = env_name
+        #: id of the time series used when the state was retrieved (see `env.chronics_handler.get_id()`)
+        self.time_serie_id: str = time_serie_id
+        self._env_values = env_values
+        self._env_arrays = env_arrays
+        self._backend_action = backend_action
+        self._backend = backend
+        self._chronics = chronics
+        self._others = others
+
+    @property
+    def nb_time_step(self) -> int:
+        """Number of steps played in the episode when this state was retrieved"""
+        return self._env_values["nb_time_step"]
+
+    @property
+    def time_stamp(self) -> datetime.datetime:
+        """Date and time of the environment when this state was retrieved"""
+        return self._env_values["time_stamp"]
+
+    @staticmethod
+    def _aux_nbytes(obj) -> int:
+        if isinstance(obj, np.ndarray):
+            return obj.nbytes
+        if isinstance(obj, dict):
+            return sum(EnvState._aux_nbytes(el) for el in obj.values())
+        if isinstance(obj, (list, tuple)):
+            return sum(EnvState._aux_nbytes(el) for el in obj)
+        return 0
+
+    @property
+    def nbytes(self) -> int:
+        """Total size (in bytes) of the numpy arrays of this state"""
+        return sum(self._aux_nbytes(el) for el in [self._env_arrays,
+                                                   self._backend_action,
+                                                   self._backend,
+                                                   self._chronics,
+                                                   self._others])
+
+    def copy(self) -> "EnvState":
+        return copy.deepcopy(self)
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(env_name=\"{self.env_name}\", time_serie_id=\"{self.time_serie_id}\", "
+                f"nb_time_step={self.nb_time_step}, nbytes={self.nbytes})")
@@ -976,7 +976,12 @@ class Environment(BaseEnv):
                                        f"is not understood (use one of `combine` or `ignore` and "
                                        f"not `{method}`)")
         init_action._set_topo_vect.nonzero()
-        *_, fail_to_start, info = self.step(init_action)
+        # this "step" is part of the reset, it is not profiled in the detailed timings
+        timings, self._timings = self._timings, None
+        try:
+            *_, fail_to_start, info = self.step(init_action)
+        finally:
+            self._timings = timings
         if fail_to_start:
             raise Grid2OpException(
                 "Impossible to initialize the powergrid, the powerflow diverge at iteration 0. "
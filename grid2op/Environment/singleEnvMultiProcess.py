@@ -74,7 +74,8 @@ class SingleEnvMultiProcess(BaseMultiProcessEnvironment):
 
     """
 
-    def __init__(self, env, nb_env, obs_as_class=True, return_info=True, logger=None):
+    def __init__(self, env, nb_env, obs_as_class=True, return_info=True, logger=None,
+                 use_shared_memory=False):
         envs = [env for _ in range(nb_env)]
         super().__init__(
             envs,
@@ -83,6 +84,7 @@ class SingleEnvMultiProcess(BaseMultiProcessEnvironment):
             logger=logger.getChild("SingleEnvMultiProcess")
             if logger is not None
             else None,
+            use_shared_memory=use_shared_memory,
         )
 
 
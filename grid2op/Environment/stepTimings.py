@@ -0,0 +1,231 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import copy
+from bisect import bisect_right
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from grid2op.Exceptions import EnvError
+
+
+class StepTimings(object):
+    """
+    .. versionadded:: 1.10.5
+
+    Histograms of the time spent in the different phases of :func:`grid2op.Environment.BaseEnv.step`.
+
+    Each time a phase is timed, its duration (in seconds) is added to a histogram with fixed
+    log spaced bins (:attr:`StepTimings.BINS_PER_DECADE` bins per decade between
+    :attr:`StepTimings.MIN_TIME` and :attr:`StepTimings.MAX_TIME`). As the bins are the same
+    for every instances, histograms computed in different environments (for example
+    in different processes of a :class:`grid2op.Runner.Runner` or of a
+    :class:`grid2op.Environment.BaseMultiProcessEnvironment`) can be merged
+    exactly with :func:`StepTimings.merge` or :func:`StepTimings.aggregate`. Percentiles
+    are then estimated from the histogram, with a relative error bounded by the width of a bin
+    (around 12% with the default settings).
+
+    The phases are:
+
+    - "step": the whole call to `env.step` (without the reward computation)
+    - "chronics": reading the next values of the time series
+    - "rules": checking the action is legal
+    - "create_bk_act": building the action sent to the backend (from the start of the step, same
+      as `env._time_create_bk_act`)
+    - "redisp": computing the redispatching (same as `env._time_redisp`)
+    - "opponent": the opponent attack (same as `env._time_opponent`)
+    - "apply_act": applying the action to the backend (from the start of the step, same as
+      `env._time_apply_act`)
+    - "powerflow": the call to `backend.next_grid_state` (same as `env._time_powerflow`)
+    - "extract_obs": the update of the environment and the creation of the observation
+      (same as `env._time_extract_obs`)
+    - "reward": the computation of the reward and of the "other rewards"
+    - "setup": (only filled by the :class:`grid2op.Runner.Runner`, once per episode) the time needed to
+      prepare an episode: building the environment and the agent (if they are not reused), resetting them
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import grid2op
+        env_name = "l2rpn_case14_sandbox"
+        env = grid2op.make(env_name)
+        env.enable_timings()
+
+        obs = env.reset()
+        for _ in range(10):
+            obs, reward, done, info = env.step(env.action_space())
+
+        timings = env.get_timings()
+        print(timings.percentile("powerflow", 99))
+        print(timings.to_dict())
+
+    """
+    PHASES = ("step",
+              "chronics",
+              "rules",
+              "create_bk_act",
+              "redisp",
+              "opponent",
+              "apply_act",
+              "powerflow",
+              "extract_obs",
+              "reward",
+              "setup")
+    MIN_TIME = 1e-7
+    MAX_TIME = 1e3
+    BINS_PER_DECADE = 20
+
+    def __init__(self):
+        nb_decade = int(round(np.log10(self.MAX_TIME / self.MIN_TIME)))
+        self._bin_edges = np.logspace(np.log10(self.MIN_TIME),
+                                      np.log10(self.MAX_TIME),
+                                      nb_decade * self.BINS_PER_DECADE + 1)
+        # bisect on a list is much faster than np.searchsorted for scalars
+        self._bin_edges_li = self._bin_edges.tolist()
+        # first bin is for times below MIN_TIME, last one for times above MAX_TIME
+        self._counts = {phase: np.zeros(self._bin_edges.shape[0] + 1, dtype=np.int64)
+                        for phase in self.PHASES}
+        self._total = {phase: 0. for phase in self.PHASES}
+        self._min = {phase: np.inf for phase in self.PHASES}
+        self._max = {phase: 0. for phase in self.PHASES}
+
+    def _check_phase(self, phase: str):
+        if phase not in self._counts:
+            raise EnvError(f"Unknown phase \"{phase}\" for the timings. "
+                           f"Available phases are {self.PHASES}")
+
+    def record(self, phase: str, duration: float):
+        """Add a measure, in seconds, to the histogram of the phase `phase`"""
+        self._counts[phase][bisect_right(self._bin_edges_li, duration)] += 1
+        self._total[phase] += duration
+        if duration < self._min[phase]:
+            self._min[phase] = duration
+        if duration > self._max[phase]:
+            self._max[phase] = duration
+
+    def reset(self):
+        """Forget everything that has been recorded"""
+        for phase in self.PHASES:
+            self._counts[phase][:] = 0
+            self._total[phase] = 0.
+            self._min[phase] = np.inf
+            self._max[phase] = 0.
+
+    def copy(self) -> "StepTimings":
+        return copy.deepcopy(self)
+
+    def merge(self, other: "StepTimings") -> "StepTimings":
+        """Add (inplace) all the measures of `other` into this instance. It returns `self`"""
+        if not isinstance(other, StepTimings):
+            raise EnvError(f"Impossible to merge timings with an object of type {type(other)}")
+        if not np.array_equal(self._bin_edges, other._bin_edges):
+            raise EnvError("Impossible to merge timings that do not use the same bins.")
+        for phase in self.PHASES:
+            self._counts[phase] += other._counts[phase]
+            self._total[phase] += other._total[phase]
+            self._min[phase] = min(self._min[phase], other._min[phase])
+            self._max[phase] = max(self._max[phase], other._max[phase])
+        return self
+
+    @classmethod
+    def aggregate(cls, timings: Iterable[Optional["StepTimings"]]) -> "StepTimings":
+        """
+        Merge the timings of different environments (for example the ones returned by
+        the runner when `add_timings=True` or by `BaseMultiProcessEnvironment.get_timings`)
+        into a new :class:`StepTimings`. ``None`` are ignored.
+        """
+        res = cls()
+        for el in timings:
+            if el is not None:
+                res.merge(el)
+        return res
+
+    def count(self, phase: str) -> int:
+        """Number of measures made for this phase"""
+        self._check_phase(phase)
+        return int(self._counts[phase].sum())
+
+    def total(self, phase: str) -> float:
+        """Total time (in seconds) spent in this phase"""
+        self._check_phase(phase)
+        return self._total[phase]
+
+    def mean(self, phase: str) -> float:
+        """Average time (in seconds) spent in this phase, ``nan`` if it has never been measured"""
+        nb = self.count(phase)
+        if nb == 0:
+            return np.nan
+        return self._total[phase] / nb
+
+    def percentile(self, phase: str, q: float) -> float:
+        """
+        Estimation (from the histogram) of the `q` th percentile (`q` between 0 and 100)
+        of the time spent in a phase. It returns ``nan`` if the phase has never been measured.
+        """
+        self._check_phase(phase)
+        if q < 0. or q > 100.:
+            raise EnvError(f"Percentiles should be between 0 and 100, you provided {q}")
+        counts = self._counts[phase]
+        nb = counts.sum()
+        if nb == 0:
+            return np.nan
+        # extreme values are known exactly
+        if q == 0.:
+            return float(self._min[phase])
+        if q == 100.:
+            return float(self._max[phase])
+        cumsum = np.cumsum(counts)
+        bin_id = int(np.searchsorted(cumsum, max(q / 100. * nb, 1), side="left"))
+        if bin_id == 0:
+            res = self._min[phase]
+        elif bin_id == counts.shape[0] - 1:
+            res = self._max[phase]
+        else:
+            # geometric center of the bin
+            res = np.sqrt(self._bin_edges[bin_id - 1] * self._bin_edges[bin_id])
+        return float(min(max(res, self._min[phase]), self._max[phase]))
+
+    def histogram(self, phase: str):
+        """
+        Returns the counts and the bin edges of the histogram for this phase. The first
+        (resp. last) count is for the times below (resp. above) the first (resp. last) edge.
+        """
+        self._check_phase(phase)
+        return self._counts[phase].copy(), self._bin_edges.copy()
+
+    def to_dict(self, percentiles=(50., 90., 99.)) -> Dict[str, Dict[str, float]]:
+        """
+        Summary of the timings, serializable in json. Only the phases that have been
+        measured are present.
+        """
+        res = {}
+        for phase in self.PHASES:
+            nb = self.count(phase)
+            if nb == 0:
+                continue
+            tmp = {"count": nb,
+                   "total": float(self._total[phase]),
+                   "mean": float(self.mean(phase)),
+                   "min": float(self._min[phase]),
+                   "max": float(self._max[phase]),
+                   }
+            for q in percentiles:
+                tmp[f"p{q:g}"] = self.percentile(phase, q)
+            res[phase] = tmp
+        return res
+
+    def __repr__(self) -> str:
+        li = [f"{type(self).__name__}("]
+        for phase, vals in self.to_dict().items():
+            li.append(f"\t{phase}: count={vals['count']}, total={vals['total']:.3e}s, "
+                      f"p50={vals['p50']:.3e}s, p99={vals['p99']:.3e}s")
+        li.append(")")
+        return "\n".join(li)
@@ -21,6 +21,7 @@ from grid2op.Exceptions import (
 )
 from grid2op.Action import ActionSpace
 from grid2op.Observation import ObservationSpace
+from grid2op.Episode._npyStream import _NpyStream
 
 # TODO refacto the "save / load" logic. For now save is in the CollectionWrapper and load in the EpisodeData
 
@@ -73,6 +74,20 @@ class EpisodeData:
     All of the above should allow to read back, and better understand the behaviour of some
     :class:`grid2op.Agent.BaseAgent`, even though such utility functions have not been coded yet.
 
+    .. versionadded:: 1.10.5
+        With `storage_format="npy"` (see the `episode_storage_format` argument of the
+        :class:`grid2op.Runner.Runner`) the arrays are stored uncompressed in ".npy" files
+        (*eg* "observations.npy" instead of "observations.npz") that can be memory mapped: with
+        `EpisodeData.from_disk(..., lazy=True)` only the steps that are accessed are read from the hard
+        drive (and converted to grid2op objects). See also :class:`grid2op.Episode.EpisodeDataset` to
+        access the steps of many episodes.
+
+        When the runner is used with `episode_flush_every=...` the actions, observations etc. are
+        written on the hard drive every `episode_flush_every` steps (instead of at the end of the episode)
+        and only the last steps are kept in memory. In this case, an episode that has not been
+        completed (for example because the process crashed) can still be loaded with
+        `EpisodeData.from_disk`: it contains the steps written on the hard drive.
+
     Attributes
     ----------
     actions: ``type``
@@ -147,6 +162,9 @@ class EpisodeData:
     ATTACK = "opponent_attack.npz"
     REWARDS = "rewards.npz"
     GRID2OPINFO_FILE = "grid2op.info"
+    PROGRESS = "episode_progress.json"
+
+    STORAGE_FORMATS = ("npz", "npy")
 
     ATTR_EPISODE = [
         PARAMS,
@@ -189,8 +207,17 @@ class EpisodeData:
         legal=None,
         ambiguous=None,
         has_legal_ambiguous=False,
+        storage_format="npz",
+        flush_every=None,
         _init_collections=False,
+        _lazy_collections=False,
     ):
+        if storage_format not in EpisodeData.STORAGE_FORMATS:
+            raise Grid2OpException(f"Unknown storage format \"{storage_format}\", it should be "
+                                   f"one of {EpisodeData.STORAGE_FORMATS}")
+        self.storage_format = storage_format
+        self._flush_every = flush_every
+        self._nb_step_stored = 0
         self.parameters = None
         self.actions = CollectionWrapper(
             actions,
@@ -198,10 +225,12 @@ class EpisodeData:
             "actions",
             check_legit=False,
             init_me=_init_collections,
+            lazy=_lazy_collections,
         )
 
         self.observations = CollectionWrapper(
-            observations, observation_space, "observations", init_me=_init_collections
+            observations, observation_space, "observations", init_me=_init_collections,
+            lazy=_lazy_collections,
         )
 
         self.env_actions = CollectionWrapper(
@@ -210,11 +239,17 @@ class EpisodeData:
             "env_actions",
             check_legit=False,
             init_me=_init_collections,
+            lazy=_lazy_collections,
         )
 
         self.attacks = CollectionWrapper(
-            attack, attack_space, "attacks", init_me=_init_collections
+            attack, attack_space, "attacks", init_me=_init_collections,
+            lazy=_lazy_collections,
         )
+        if flush_every is not None and not force_detail:
+            # the data are written on the hard drive, i don't keep all the objects in memory
+            for collection in (self.actions, self.observations, self.env_actions, self.attacks):
+                collection._keep_objects = False
 
         self.meta = meta
         # gives a unique game over for everyone
@@ -386,7 +421,9 @@ class EpisodeData:
                 continue
             ok_ = True
             for file_that_should_be in EpisodeData.ATTR_EPISODE:
-                if not os.path.exists(os.path.join(this_dir, file_that_should_be)):
+                path_file = os.path.join(this_dir, file_that_should_be)
+                if (not os.path.exists(path_file) and
+                    not os.path.exists(EpisodeData._aux_npy_path(path_file))):
                     # one file is missing
                     ok_ = False
                     break
@@ -420,8 +457,51 @@ class EpisodeData:
             return min(tmp, len(self.observations))
         return len(self.observations)
 
+    @staticmethod
+    def _aux_npy_path(path):
+        """path of the ".npy" file corresponding to the ".npz" file `path`"""
+        return os.path.splitext(path)[0] + ".npy"
+
+    @staticmethod
+    def _aux_load_array(path, lazy=False):
+        """load the array stored at `path` (".npz") or in the corresponding ".npy" file, memory mapped if `lazy`"""
+        path_npy = EpisodeData._aux_npy_path(path)
+        if os.path.exists(path_npy):
+            return np.load(path_npy, mmap_mode="r" if lazy else None)
+        return np.load(path)["data"]
+
+    def _aux_save_array(self, path, array):
+        if self.storage_format == "npy":
+            np.save(EpisodeData._aux_npy_path(path), array)
+        else:
+            np.savez_compressed(path, data=array)
+
+    @staticmethod
+    def _aux_load_spaces(agent_path):
+        """load the observation space, action space, env modification space and attack space stored in `agent_path`"""
+        observation_space = ObservationSpace.from_dict(
+            os.path.join(agent_path, EpisodeData.OBS_SPACE)
+        )
+        action_space = ActionSpace.from_dict(
+            os.path.join(agent_path, EpisodeData.ACTION_SPACE)
+        )
+        helper_action_env = ActionSpace.from_dict(
+            os.path.join(agent_path, EpisodeData.ENV_MODIF_SPACE)
+        )
+        attack_space = ActionSpace.from_dict(
+            os.path.join(agent_path, EpisodeData.ATTACK_SPACE)
+        )
+        if observation_space.glop_version != grid2op.__version__:
+            warnings.warn(
+                'You are using a "grid2op compatibility" feature (the data you saved '
+                "have been saved with a previous grid2op version). When we loaded your data, we attempted "
+                "to not include most recent grid2op features. This is feature is not well tested. It would "
+                "be wise to regenerate the data with the latest grid2Op version."
+            )
+        return observation_space, action_space, helper_action_env, attack_space
+
     @classmethod
-    def from_disk(cls, agent_path, name="1"):
+    def from_disk(cls, agent_path, name="1", lazy=False, _spaces=None):
         """
         This function allows you to reload an episode stored using the runner.
 
@@ -435,6 +515,14 @@ class EpisodeData:
         name: ``str``
             The name of the episode you want to reload.
 
+        lazy: ``bool``
+            .. versionadded:: 1.10.5
+
+            If ``True`` the actions and observations are converted to grid2op objects only when
+            they are accessed (and not all at once when the episode is loaded). When the
+            episode has been stored with `storage_format="npy"` the data are also
+            memory mapped and only the rows accessed are read from the hard drive.
+
         Returns
         -------
         res:
@@ -448,35 +536,43 @@ class EpisodeData:
         episode_path = os.path.abspath(os.path.join(agent_path, name))
 
         try:
-            with open(os.path.join(episode_path, EpisodeData.PARAMS)) as f:
-                _parameters = json.load(fp=f)
-            with open(os.path.join(episode_path, EpisodeData.META)) as f:
-                episode_meta = json.load(fp=f)
-            with open(os.path.join(episode_path, EpisodeData.TIMES)) as f:
-                episode_times = json.load(fp=f)
-            with open(os.path.join(episode_path, EpisodeData.OTHER_REWARDS)) as f:
-                other_rewards = json.load(fp=f)
-
-            times = np.load(os.path.join(episode_path, EpisodeData.AG_EXEC_TIMES))[
-                "data"
-            ]
-            actions = np.load(os.path.join(episode_path, EpisodeData.ACTIONS_FILE))["data"]
-            env_actions = np.load(os.path.join(episode_path, EpisodeData.ENV_ACTIONS_FILE))[
-                "data"
-            ]
-            observations = np.load(
-                os.path.join(episode_path, EpisodeData.OBSERVATIONS_FILE)
-            )["data"]
-            disc_lines = np.load(
-                os.path.join(episode_path, EpisodeData.LINES_FAILURES)
-            )["data"]
-            attack = np.load(os.path.join(episode_path, EpisodeData.ATTACK))["data"]
-            rewards = np.load(os.path.join(episode_path, EpisodeData.REWARDS))["data"]
+            if (not os.path.exists(os.path.join(episode_path, EpisodeData.META)) and
+                os.path.exists(os.path.join(episode_path, EpisodeData.PROGRESS))):
+                # episode not complete (see `flush_every`), only the steps played are available
+                with open(os.path.join(episode_path, EpisodeData.PROGRESS)) as f:
+                    episode_meta = json.load(fp=f)
+                _parameters = None
+                if os.path.exists(os.path.join(episode_path, EpisodeData.PARAMS)):
+                    with open(os.path.join(episode_path, EpisodeData.PARAMS)) as f:
+                        _parameters = json.load(fp=f)
+                episode_times = None
+                other_rewards = []
+            else:
+                with open(os.path.join(episode_path, EpisodeData.PARAMS)) as f:
+                    _parameters = json.load(fp=f)
+                with open(os.path.join(episode_path, EpisodeData.META)) as f:
+                    episode_meta = json.load(fp=f)
+                with open(os.path.join(episode_path, EpisodeData.TIMES)) as f:
+                    episode_times = json.load(fp=f)
+                with open(os.path.join(episode_path, EpisodeData.OTHER_REWARDS)) as f:
+                    other_rewards = json.load(fp=f)
+
+            storage_format = "npz"
+            if os.path.exists(EpisodeData._aux_npy_path(os.path.join(episode_path, EpisodeData.ACTIONS_FILE))):
+                storage_format = "npy"
+            times = cls._aux_load_array(os.path.join(episode_path, EpisodeData.AG_EXEC_TIMES), lazy)
+            actions = cls._aux_load_array(os.path.join(episode_path, EpisodeData.ACTIONS_FILE), lazy)
+            env_actions = cls._aux_load_array(os.path.join(episode_path, EpisodeData.ENV_ACTIONS_FILE), lazy)
+            observations = cls._aux_load_array(os.path.join(episode_path, EpisodeData.OBSERVATIONS_FILE), lazy)
+            disc_lines = cls._aux_load_array(os.path.join(episode_path, EpisodeData.LINES_FAILURES), lazy)
+            attack = cls._aux_load_array(os.path.join(episode_path, EpisodeData.ATTACK), lazy)
+            rewards = cls._aux_load_array(os.path.join(episode_path, EpisodeData.REWARDS), lazy)
 
             path_legal_ambiguous = os.path.join(episode_path, EpisodeData.LEGAL_AMBIGUOUS)
             has_legal_ambiguous = False
-            if os.path.exists(path_legal_ambiguous):
-                legal_ambiguous = np.load(path_legal_ambiguous)["data"]
+            if (os.path.exists(path_legal_ambiguous) or
+                os.path.exists(EpisodeData._aux_npy_path(path_legal_ambiguous))):
+                legal_ambiguous = cls._aux_load_array(path_legal_ambiguous)
                 legal = copy.deepcopy(legal_ambiguous[:, 0])
                 ambiguous = copy.deepcopy(legal_ambiguous[:, 1])
                 has_legal_ambiguous = True
@@ -487,25 +583,9 @@ class EpisodeData:
         except FileNotFoundError as ex:
             raise Grid2OpException(f"EpisodeData file not found \n {str(ex)}")
 
-        observation_space = ObservationSpace.from_dict(
-            os.path.join(agent_path, EpisodeData.OBS_SPACE)
-        )
-        action_space = ActionSpace.from_dict(
-            os.path.join(agent_path, EpisodeData.ACTION_SPACE)
-        )
-        helper_action_env = ActionSpace.from_dict(
-            os.path.join(agent_path, EpisodeData.ENV_MODIF_SPACE)
-        )
-        attack_space = ActionSpace.from_dict(
-            os.path.join(agent_path, EpisodeData.ATTACK_SPACE)
-        )
-        if observation_space.glop_version != grid2op.__version__:
-            warnings.warn(
-                'You are using a "grid2op compatibility" feature (the data you saved '
-                "have been saved with a previous grid2op version). When we loaded your data, we attempted "
-                "to not include most recent grid2op features. This is feature is not well tested. It would "
-                "be wise to regenerate the data with the latest grid2Op version."
-            )
+        if _spaces is None:
+            _spaces = cls._aux_load_spaces(agent_path)
+        observation_space, action_space, helper_action_env, attack_space = _spaces
 
         return cls(
             actions=actions,
@@ -529,7 +609,9 @@ class EpisodeData:
             legal=legal,
             ambiguous=ambiguous,
             has_legal_ambiguous=has_legal_ambiguous,
+            storage_format=storage_format,
             _init_collections=True,
+            _lazy_collections=lazy,
         )
 
     def set_parameters(self, env):
@@ -694,6 +776,49 @@ class EpisodeData:
                 self.legal = np.concatenate((self.legal, (not info["is_illegal"],)))
                 self.ambiguous = np.concatenate((self.ambiguous, (info["is_ambiguous"],)))
 
+        self._nb_step_stored = time_step
+        if self._flush_every is not None and time_step % self._flush_every == 0:
+            self._aux_flush(time_step)
+
+    def _aux_flush(self, time_step):
+        """write on the hard drive all the steps of the episode played so far (when `flush_every` is used)"""
+        if not self.serialize:
+            return
+        for collection, nb_row in ((self.actions, time_step),
+                                   (self.env_actions, time_step),
+                                   (self.observations, time_step + 1),
+                                   (self.attacks, time_step)):
+            if isinstance(collection.collection, _NpyStream):
+                collection.collection.flush(nb_row)
+        if isinstance(self.disc_lines, _NpyStream):
+            self.disc_lines.flush(time_step)
+
+        # these arrays are small, they are kept in memory and written completely
+        self._aux_save_array(os.path.join(self.episode_path, EpisodeData.AG_EXEC_TIMES), self.times)
+        self._aux_save_array(os.path.join(self.episode_path, EpisodeData.REWARDS), self.rewards)
+        if self.has_legal_ambiguous:
+            self._aux_save_array(os.path.join(self.episode_path, EpisodeData.LEGAL_AMBIGUOUS),
+                                 np.stack((self.legal, self.ambiguous), axis=1))
+        parameters_path = os.path.join(self.episode_path, EpisodeData.PARAMS)
+        if self.parameters is not None and not os.path.exists(parameters_path):
+            with open(parameters_path, "w", encoding="utf-8") as f:
+                json.dump(obj=self.parameters, fp=f, indent=4, sort_keys=True)
+        with open(os.path.join(self.episode_path, EpisodeData.PROGRESS), "w", encoding="utf-8") as f:
+            json.dump(obj={"nb_timestep_played": int(time_step),
+                           "chronics_max_timestep": int(self.actions.collection.shape[0])},
+                      fp=f, indent=4, sort_keys=True)
+
+    def _aux_close_streams(self):
+        """write the last steps on the hard drive and replace the streams by the (memory mapped) arrays stored"""
+        self._aux_flush(self._nb_step_stored)
+        for collection in (self.actions, self.env_actions, self.observations, self.attacks):
+            if isinstance(collection.collection, _NpyStream):
+                collection.collection.close()
+                collection.collection = np.load(collection.collection.path, mmap_mode="r")
+        if isinstance(self.disc_lines, _NpyStream):
+            self.disc_lines.close()
+            self.disc_lines = np.load(self.disc_lines.path, mmap_mode="r")
+
     def _convert_to_float(self, el):
         try:
             res = float(el)
@@ -752,6 +877,10 @@ class EpisodeData:
 
         """
         if self.serialize:
+            is_streamed = self._flush_every is not None
+            if is_streamed:
+                # the actions, observations etc. are already on the hard drive
+                self._aux_close_streams()
             parameters_path = os.path.join(self.episode_path, EpisodeData.PARAMS)
             with open(parameters_path, "w", encoding="utf-8") as f:
                 json.dump(obj=self.parameters, fp=f, indent=4, sort_keys=True)
@@ -770,27 +899,37 @@ class EpisodeData:
             with open(episode_other_rewards_path, "w", encoding="utf-8") as f:
                 json.dump(obj=self.other_rewards, fp=f, indent=4, sort_keys=True)
 
-            np.savez_compressed(
+            self._aux_save_array(
                 os.path.join(self.episode_path, EpisodeData.AG_EXEC_TIMES),
-                data=self.times,
-            )
-            self.actions.save(os.path.join(self.episode_path, EpisodeData.ACTIONS_FILE))
-            self.env_actions.save(
-                os.path.join(self.episode_path, EpisodeData.ENV_ACTIONS_FILE)
-            )
-            self.observations.save(
-                os.path.join(self.episode_path, EpisodeData.OBSERVATIONS_FILE)
+                self.times,
             )
-            self.attacks.save(
-                os.path.join(os.path.join(self.episode_path, EpisodeData.ATTACK))
-            )
-            np.savez_compressed(
-                os.path.join(self.episode_path, EpisodeData.LINES_FAILURES),
-                data=self.disc_lines,
-            )
-            np.savez_compressed(
-                os.path.join(self.episode_path, EpisodeData.REWARDS), data=self.rewards
+            if not is_streamed:
+                self.actions.save(os.path.join(self.episode_path, EpisodeData.ACTIONS_FILE),
+                                  self.storage_format)
+                self.env_actions.save(
+                    os.path.join(self.episode_path, EpisodeData.ENV_ACTIONS_FILE),
+                    self.storage_format
+                )
+                self.observations.save(
+                    os.path.join(self.episode_path, EpisodeData.OBSERVATIONS_FILE),
+                    self.storage_format
+                )
+                self.attacks.save(
+                    os.path.join(os.path.join(self.episode_path, EpisodeData.ATTACK)),
+                    self.storage_format
+                )
+                self._aux_save_array(
+                    os.path.join(self.episode_path, EpisodeData.LINES_FAILURES),
+                    self.disc_lines,
+                )
+            self._aux_save_array(
+                os.path.join(self.episode_path, EpisodeData.REWARDS), self.rewards
             )
+            if self.storage_format == "npy" and self.has_legal_ambiguous:
+                self._aux_save_array(
+                    os.path.join(self.episode_path, EpisodeData.LEGAL_AMBIGUOUS),
+                    np.stack((self.legal, self.ambiguous), axis=1),
+                )
 
             with open(
                 os.path.join(self.episode_path, self.GRID2OPINFO_FILE),
@@ -800,6 +939,11 @@ class EpisodeData:
                 dict_ = {"version": f"{grid2op.__version__}"}
                 json.dump(obj=dict_, fp=f, indent=4, sort_keys=True)
 
+            path_progress = os.path.join(self.episode_path, EpisodeData.PROGRESS)
+            if os.path.exists(path_progress):
+                # the episode is complete
+                os.remove(path_progress)
+
     def _aux_make_obs_space_serializable(self):
         """I put it here because it's also used by CompactEpisodeData.
         
@@ -902,7 +1046,9 @@ class CollectionWrapper:
         The time step at which the game_over occurs. None if there is no game_over
 
     objects:
-        The collection of objects built with the `from_vect` method
+        The collection of objects built with the `from_vect` method. If the collection is
+        lazy (episodes stored in the "npy" format) the objects are built when accessed with
+        `collection_wrapper[i]` (or when iterating through it) and this list only holds ``None``.
 
     Methods
     -------
@@ -921,7 +1067,7 @@ class CollectionWrapper:
     """
 
     def __init__(
-        self, collection, helper, collection_name, check_legit=True, init_me=True
+        self, collection, helper, collection_name, check_legit=True, init_me=True, lazy=False
     ):
         self.collection = collection
         if not hasattr(helper, "from_vect"):
@@ -934,10 +1080,14 @@ class CollectionWrapper:
         self.i = 0
         self._game_over = None
         self.objects = []
+        self._check_legit = check_legit
+        self._lazy = lazy
+        self._keep_objects = True
 
-        if not init_me:
+        if not init_me or lazy:
             # the runner just has been created, so i don't need to update this collection
             # from previous data, but we need to initialize the list holder
+            # (if lazy, the objects are built when accessed)
             self.objects = [None] * len(self.collection)
             return
 
@@ -969,13 +1119,27 @@ class CollectionWrapper:
             return self._game_over
 
     def __getitem__(self, i):
-        if isinstance(i, slice) or i < len(self):
+        if self._lazy:
+            if isinstance(i, slice):
+                return [self._aux_build(j) for j in range(*i.indices(len(self)))]
+            if -len(self) <= i < len(self):
+                return self._aux_build(i % len(self))
+        elif isinstance(i, slice) or i < len(self):
             return self.objects[i]
-        else:
-            raise Grid2OpException(
-                f"Trying to reach {self.elem_name} {i + 1} but "
-                f"there are only {len(self)} {self.collection_name}."
-            )
+        raise Grid2OpException(
+            f"Trying to reach {self.elem_name} {i + 1} but "
+            f"there are only {len(self)} {self.collection_name}."
+        )
+
+    def _aux_build(self, i):
+        """build the object at position `i` from the (possibly memory mapped) collection"""
+        if self.objects[i] is not None:
+            return self.objects[i]
+        try:
+            return self.helper.from_vect(np.array(self.collection[i, :]), check_legit=self._check_legit)
+        except IncorrectNumberOfElements as exc_:
+            raise Grid2OpException("grid2op does not allow to load the object: there is a mismatch "
+                                   "between what has been stored and what is currently used.") from exc_
 
     def __iter__(self):
         self.i = 0
@@ -984,7 +1148,7 @@ class CollectionWrapper:
     def __next__(self):
         self.i = self.i + 1
         if self.i < len(self) + 1:
-            return self.objects[self.i - 1]
+            return self[self.i - 1]
         else:
             raise StopIteration
 
@@ -995,12 +1159,16 @@ class CollectionWrapper:
             self.collection = np.concatenate(
                 (self.collection, value.to_vect().reshape(1, -1))
             )
-        self.objects[time_step - 1] = value
+        if self._keep_objects:
+            self.objects[time_step - 1] = value
 
-    def save(self, path):
-        np.savez_compressed(
-            path, data=self.collection
-        )  # do not change keyword arguments
+    def save(self, path, storage_format="npz"):
+        if storage_format == "npy":
+            np.save(EpisodeData._aux_npy_path(path), self.collection)
+        else:
+            np.savez_compressed(
+                path, data=self.collection
+            )  # do not change keyword arguments
 
     def reboot(self):
         self.i = 0
@@ -0,0 +1,195 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import json
+import os
+from collections import OrderedDict
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from grid2op.dtypes import dt_int
+from grid2op.Exceptions import Grid2OpException
+from grid2op.Episode.EpisodeData import EpisodeData
+
+
+class EpisodeDataset(object):
+    """
+    .. versionadded:: 1.10.5
+
+    This class gives a random access to all the steps of all the episodes stored by a :class:`grid2op.Runner.Runner`
+    in the same directory (for example to train an agent "offline").
+
+    An index (the name of the episodes and the number of steps played in each of them) is stored in the
+    directory (in the "episode_index.json" file) so that it is not read again each time the dataset is used. It
+    is updated when new episodes are added to the directory.
+
+    The episodes are loaded "lazily" (see `lazy` argument of :func:`grid2op.Episode.EpisodeData.from_disk`): if
+    they have been stored with `episode_storage_format="npy"` (see :class:`grid2op.Runner.Runner`), accessing a
+    step only reads this step from the hard drive. For episodes stored in the default (compressed) format,
+    the whole episode is read the first time one of its steps is accessed.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import grid2op
+        import numpy as np
+        from grid2op.Runner import Runner
+        from grid2op.Episode import EpisodeDataset
+
+        env = grid2op.make("l2rpn_case14_sandbox")
+        runner = Runner(**env.get_params_for_runner(), episode_storage_format="npy")
+        runner.run(nb_episode=2, path_save="i_saved_the_runner_here")
+
+        dataset = EpisodeDataset("i_saved_the_runner_here")
+        print(f"There are {len(dataset)} steps in {dataset.nb_episode} episodes")
+        for step_id in np.random.choice(len(dataset), size=32):
+            obs, act, reward, next_obs, done = dataset[step_id]
+
+    """
+    INDEX_FILE = "episode_index.json"
+
+    def __init__(self, path_agent: str, max_episode_cache: int = 16):
+        self._path_agent = os.path.abspath(path_agent)
+        if not os.path.isdir(self._path_agent):
+            raise Grid2OpException(f"No directory found at \"{path_agent}\"")
+        self._max_episode_cache = int(max_episode_cache)
+        self._episode_cache = OrderedDict()
+        self._spaces = None
+        self._names: List[str] = []
+        self._nb_steps = np.zeros(0, dtype=dt_int)
+        self._offsets = np.zeros(1, dtype=dt_int)
+        self.update_index()
+
+    def update_index(self) -> None:
+        """
+        Update the index of the dataset (if episodes have been added or removed from the directory), and
+        save it.
+        """
+        path_index = os.path.join(self._path_agent, self.INDEX_FILE)
+        known_episodes = {}
+        if os.path.exists(path_index):
+            with open(path_index, "r", encoding="utf-8") as f:
+                known_episodes = dict(json.load(fp=f)["episodes"])
+
+        names = [name for _, name in EpisodeData.list_episode(self._path_agent)]
+        nb_steps = []
+        for name in names:
+            if name not in known_episodes:
+                with open(os.path.join(self._path_agent, name, EpisodeData.META), "r", encoding="utf-8") as f:
+                    known_episodes[name] = int(json.load(fp=f)["nb_timestep_played"])
+            nb_steps.append(known_episodes[name])
+
+        self._names = names
+        self._nb_steps = np.array(nb_steps, dtype=dt_int)
+        self._offsets = np.concatenate(([0], np.cumsum(self._nb_steps))).astype(dt_int)
+        with open(path_index, "w", encoding="utf-8") as f:
+            json.dump(obj={"episodes": [[name, int(nb)] for name, nb in zip(self._names, self._nb_steps)]},
+                      fp=f, indent=4, sort_keys=True)
+
+    @property
+    def episode_names(self) -> List[str]:
+        """The name of the episodes of this dataset"""
+        return list(self._names)
+
+    @property
+    def nb_episode(self) -> int:
+        return len(self._names)
+
+    @property
+    def nb_steps(self) -> np.ndarray:
+        """The number of steps played in each episode"""
+        return self._nb_steps.copy()
+
+    def __len__(self) -> int:
+        """total number of steps (in all episodes)"""
+        return int(self._offsets[-1])
+
+    def get_episode(self, episode: Union[int, str]) -> EpisodeData:
+        """
+        Get an episode of the dataset (loaded "lazily").
+
+        Parameters
+        ----------
+        episode: ``int`` or ``str``
+            The id (in this dataset) or the name of the episode
+
+        Returns
+        -------
+        res: :class:`grid2op.Episode.EpisodeData`
+            The episode
+        """
+        if isinstance(episode, (int, np.integer)):
+            if episode < 0 or episode >= len(self._names):
+                raise Grid2OpException(f"Episode {episode} does not exist, there are only {self.nb_episode} "
+                                       "episodes in this dataset.")
+            name = self._names[episode]
+        else:
+            name = str(episode)
+            if name not in self._names:
+                raise Grid2OpException(f"No episode named \"{name}\" in this dataset.")
+
+        if name in self._episode_cache:
+            self._episode_cache.move_to_end(name)
+            return self._episode_cache[name]
+        if self._spaces is None:
+            # spaces are shared by all the episodes of the directory
+            self._spaces = EpisodeData._aux_load_spaces(self._path_agent)
+        res = EpisodeData.from_disk(self._path_agent, name, lazy=True, _spaces=self._spaces)
+        if self._max_episode_cache > 0:
+            self._episode_cache[name] = res
+            if len(self._episode_cache) > self._max_episode_cache:
+                self._episode_cache.popitem(last=False)
+        return res
+
+    def locate(self, step_id: int) -> Tuple[int, int]:
+        """
+        Find to which episode (and which step of this episode) the step `step_id` of the dataset corresponds
+
+        Returns
+        -------
+        episode_id: ``int``
+            The id of the episode (in this dataset)
+        time_step: ``int``
+            The step in this episode
+        """
+        step_id = int(step_id)
+        if step_id < 0:
+            step_id += len(self)
+        if step_id < 0 or step_id >= len(self):
+            raise Grid2OpException(f"Step {step_id} does not exist, there are only {len(self)} steps "
+                                   "in this dataset.")
+        episode_id = int(np.searchsorted(self._offsets, step_id, side="right")) - 1
+        return episode_id, step_id - int(self._offsets[episode_id])
+
+    def __getitem__(self, step_id: int):
+        """
+        Get the transition `step_id` of the dataset.
+
+        Returns
+        -------
+        obs: :class:`grid2op.Observation.BaseObservation`
+            The observation seen by the agent
+        act: :class:`grid2op.Action.BaseAction`
+            The action taken by the agent after having seen `obs`
+        reward: ``float``
+            The reward obtained after this action
+        next_obs: :class:`grid2op.Observation.BaseObservation`
+            The observation after the action
+        done: ``bool``
+            Whether this is the last step of the episode
+        """
+        episode_id, time_step = self.locate(step_id)
+        episode = self.get_episode(episode_id)
+        return (episode.observations[time_step],
+                episode.actions[time_step],
+                float(episode.rewards[time_step]),
+                episode.observations[time_step + 1],
+                time_step == self._nb_steps[episode_id] - 1)
@@ -1,12 +1,22 @@
-__all__ = ["EpisodeData"]
+__all__ = ["EpisodeData", "EpisodeDataset"]
+
+import importlib
+import importlib.util
 
 from grid2op.Episode.EpisodeData import EpisodeData
 from grid2op.Episode.CompactEpisodeData import CompactEpisodeData
+from grid2op.Episode.EpisodeDataset import EpisodeDataset
 
-# Try to import optional module
-try:
-    from grid2op.Episode.EpisodeReplay import EpisodeReplay
-
+# Optional module: it relies on matplotlib (and imageio) which are slow to import,
+# so it is only imported when first accessed
+if (importlib.util.find_spec("matplotlib") is not None and
+    importlib.util.find_spec("imageio") is not None):
     __all__.append("EpisodeReplay")
-except ImportError:
-    pass  # Silent fail for optional dependencies
+
+
+def __getattr__(name):
+    if name == "EpisodeReplay":
+        res = importlib.import_module("grid2op.Episode.EpisodeReplay").EpisodeReplay
+        globals()[name] = res
+        return res
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,122 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import struct
+import numpy as np
+
+from grid2op.Exceptions import Grid2OpException
+
+
+class _NpyStream(object):
+    """
+    INTERNAL
+
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    .. versionadded:: 1.10.5
+
+    An "append only" 2d (or 1d) array stored in a ".npy" file.
+
+    It can be used (for writing) as a numpy array of shape `shape`, but the rows must be written
+    in increasing order: only the last `chunk_size` rows are kept in memory,
+    the others are written on the hard drive (in the ".npy" file).
+
+    The header of the ".npy" file is updated each time some rows are written, so that the file is
+    always a valid ".npy" file containing all the rows written so far (even if the process writing it crashes).
+    """
+    # number of digits reserved for the number of rows in the header
+    _MAX_NB_ROW = 10**15
+
+    def __init__(self, path, shape, dtype, chunk_size, fill_value=np.NaN):
+        self.path = path
+        self.shape = tuple(int(el) for el in shape)
+        self.dtype = np.dtype(dtype)
+        self._fill_value = fill_value
+        self._buffer = np.full((int(chunk_size),) + self.shape[1:], fill_value=fill_value, dtype=self.dtype)
+        self._start = 0  # id of the first row of the buffer
+        self._nb_row_buffer = 0  # number of rows of the buffer that have been set
+
+        # size of the header is fixed, so that it can be rewritten "in place"
+        header_max = self._aux_header(self._MAX_NB_ROW)
+        # (the magic string, the version and the header length take 10 bytes, the total is aligned on 64 bytes)
+        self._header_len = 64 * ((10 + len(header_max) + 1 + 63) // 64) - 10
+        self._file = open(self.path, "wb")
+        self._aux_write_header()
+
+    @property
+    def nb_row_written(self):
+        """number of rows stored in the ".npy" file"""
+        return self._start
+
+    def __len__(self):
+        return self.shape[0]
+
+    def _aux_header(self, nb_row):
+        dict_ = {"descr": np.lib.format.dtype_to_descr(self.dtype),
+                 "fortran_order": False,
+                 "shape": (int(nb_row), ) + self.shape[1:]}
+        return repr(dict_).encode("latin1")
+
+    def _aux_write_header(self):
+        header = self._aux_header(self._start)
+        header = header + b" " * (self._header_len - len(header) - 1) + b"\n"
+        self._file.seek(0)
+        self._file.write(np.lib.format.magic(1, 0) + struct.pack("<H", self._header_len) + header)
+        self._file.seek(0, 2)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, tuple):
+            row, other = key[0], key[1:]
+        else:
+            row, other = key, ()
+        if row < 0:
+            row += self.shape[0]
+        if row >= self.shape[0]:
+            raise Grid2OpException(f"Row {row} is out of bounds for an array of shape {self.shape}")
+        if row < self._start:
+            raise Grid2OpException(f"Row {row} has already been written in \"{self.path}\", "
+                                   "it cannot be modified.")
+        if row - self._start >= self._buffer.shape[0]:
+            self.flush()
+            while row - self._start >= self._buffer.shape[0]:
+                # rows that have not been set, they are filled with `fill_value`
+                self._nb_row_buffer = self._buffer.shape[0]
+                self.flush()
+        idx = row - self._start
+        self._buffer[(idx, ) + other] = value
+        self._nb_row_buffer = max(self._nb_row_buffer, idx + 1)
+
+    def flush(self, nb_row=None):
+        """
+        Write the rows in memory on the hard drive. If `nb_row` is provided, the file will have at
+        least `nb_row` rows (the rows not set are filled with `fill_value`).
+        """
+        if nb_row is not None:
+            while nb_row - self._start > self._buffer.shape[0]:
+                self._nb_row_buffer = self._buffer.shape[0]
+                self.flush()
+            self._nb_row_buffer = max(self._nb_row_buffer, nb_row - self._start)
+        if self._nb_row_buffer == 0:
+            return
+        self._file.write(self._buffer[:self._nb_row_buffer].tobytes())
+        self._start += self._nb_row_buffer
+        self._buffer[:self._nb_row_buffer] = self._fill_value
+        self._nb_row_buffer = 0
+        self._aux_write_header()
+        self._file.flush()
+
+    def close(self, nb_row=None):
+        """flush the data and close the file"""
+        if self._file.closed:
+            return
+        self.flush(nb_row)
+        self._file.close()
+
+    def __del__(self):
+        if hasattr(self, "_file") and not self._file.closed:
+            self._file.close()
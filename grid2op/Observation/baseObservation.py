@@ -8,8 +8,9 @@
 
 import copy
 import datetime
+import threading
 import warnings
-import networkx
+from collections import OrderedDict
 from abc import abstractmethod
 import numpy as np
 from scipy.sparse import csr_matrix
@@ -23,6 +24,7 @@ except ImportError:
     from typing_extensions import Self
 
 import grid2op  # for type hints
+from grid2op._glop_lazy_import import LazyModule
 from grid2op.typing_variables import STEP_INFO_TYPING
 from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Exceptions import (
@@ -39,6 +41,9 @@ from grid2op.Space import GridObjects
 
 # TODO be consistent with gen_* and prod_* also in dictionaries
 
+# networkx is only loaded when a graph is built
+networkx = LazyModule("networkx")
+
 ERROR_ONLY_SINGLE_EL = "You can only the inspect the effect of an action on one single element"
 
 class BaseObservation(GridObjects):
@@ -493,6 +498,14 @@ class BaseObservation(GridObjects):
     # value to assess if two observations are equal
     _tol_equal = 1e-3
 
+    # maximum number of topologies for which the graph structures (see `connectivity_matrix`,
+    # `bus_connectivity_matrix` and `flow_bus_matrix`) are kept in cache. This cache
+    # is shared by all the observations of the same class (0 to deactivate it)
+    TOPO_CACHE_SIZE = 128
+    _topo_cache = None
+    # observations can be used in different threads (eg threads based runners)
+    _topo_cache_lock = threading.Lock()
+
     def __init__(self,
                  obs_env=None,
                  action_helper=None,
@@ -752,24 +765,43 @@ class BaseObservation(GridObjects):
         res = type(self)(obs_env=self._obs_env,
                          action_helper=self.action_helper,
                          kwargs_env=self._ptr_kwargs_env)
+        self._deepcopy_into(res, memodict)
+        return res
+
+    def _deepcopy_into(self, other: Self, memodict=None) -> None:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.10.5
+
+        Same as `other = copy.deepcopy(self)` but the data are written in `other`
+        (which must be an observation of the same class) without allocating any new
+        numpy array for the "vector" attributes. It is used by the observation pool
+        (see :func:`grid2op.Observation.ObservationSpace.set_obs_pool_size`).
+        """
+        if memodict is None:
+            memodict = {}
+        other._obs_env = self._obs_env
+        other.action_helper = self.action_helper
+        other._ptr_kwargs_env = self._ptr_kwargs_env
 
         # copy regular attributes
-        self._aux_copy(other=res)
+        self._aux_copy(other=other)
 
         # just deepcopy
-        res._connectivity_matrix_ = copy.deepcopy(self._connectivity_matrix_, memodict)
-        res._bus_connectivity_matrix_ = copy.deepcopy(
+        other._connectivity_matrix_ = copy.deepcopy(self._connectivity_matrix_, memodict)
+        other._bus_connectivity_matrix_ = copy.deepcopy(
             self._bus_connectivity_matrix_, memodict
         )
-        res._dictionnarized = copy.deepcopy(self._dictionnarized, memodict)
-        res._vectorized = copy.deepcopy(self._vectorized, memodict)
+        other._dictionnarized = copy.deepcopy(self._dictionnarized, memodict)
+        other._vectorized = copy.deepcopy(self._vectorized, memodict)
 
         # handles the forecasts here
-        res._forecasted_grid_act = copy.deepcopy(self._forecasted_grid_act, memodict)
-        res._forecasted_inj = copy.deepcopy(self._forecasted_inj, memodict)
-        res._env_internal_params = copy.deepcopy(self._env_internal_params, memodict)
-
-        return res
+        other._forecasted_grid_act = copy.deepcopy(self._forecasted_grid_act, memodict)
+        other._forecasted_inj = copy.deepcopy(self._forecasted_inj, memodict)
+        other._env_internal_params = copy.deepcopy(self._env_internal_params, memodict)
 
     def state_of(
         self,
@@ -1679,68 +1711,66 @@ class BaseObservation(GridObjects):
         """
         pass
 
+    def _aux_get_topo_cache(self) -> dict:
+        """
+        Returns the entry of the topology cache (shared by all the observations of the same class)
+        for the current topology (`topo_vect` and `line_status`). It is empty if this topology
+        has not been seen recently.
+        """
+        cls = type(self)
+        key = self.topo_vect.tobytes() + self.line_status.tobytes()
+        # NB the entries are filled without the lock: at worst a structure is computed twice
+        with cls._topo_cache_lock:
+            if cls.__dict__.get("_topo_cache") is None:
+                # each class has its own cache (there is one class per grid)
+                cls._topo_cache = OrderedDict()
+            cache = cls._topo_cache
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+            res = {}
+            if cls.TOPO_CACHE_SIZE > 0:
+                cache[key] = res
+                if len(cache) > cls.TOPO_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return res
+
     def _aux_build_conn_mat(self, as_csr_matrix):
-        # self._connectivity_matrix_ = np.zeros(shape=(self.dim_topo, self.dim_topo), dtype=dt_float)
-        # fill it by block for the objects
-        beg_ = 0
-        end_ = 0
-        row_ind = []
-        col_ind = []
+        topo_cache = self._aux_get_topo_cache()
+        if "conn_mat" not in topo_cache:
+            topo_cache["conn_mat"] = self._aux_build_conn_mat_csr()
+        if as_csr_matrix:
+            # the cache is shared, the matrix in it should not be modified
+            self._connectivity_matrix_ = topo_cache["conn_mat"].copy()
+        else:
+            self._connectivity_matrix_ = topo_cache["conn_mat"].toarray()
+
+    def _aux_build_conn_mat_csr(self) -> csr_matrix:
         cls = type(self)
-        for sub_id, nb_obj in enumerate(cls.sub_info):
-            # it must be a vanilla python integer, otherwise it's not handled by some backend
-            # especially if written in c++
-            nb_obj = int(nb_obj)
-            end_ += nb_obj
-            # tmp = np.zeros(shape=(nb_obj, nb_obj), dtype=dt_float)
-            for obj1 in range(nb_obj):
-                my_bus = self.topo_vect[beg_ + obj1]
-                if my_bus == -1:
-                    # object is disconnected, nothing is done
-                    continue
-                # connect an object to itself
-                row_ind.append(beg_ + obj1)
-                col_ind.append(beg_ + obj1)
-
-                # connect the other objects to it
-                for obj2 in range(obj1 + 1, nb_obj):
-                    my_bus2 = self.topo_vect[beg_ + obj2]
-                    if my_bus2 == -1:
-                        # object is disconnected, nothing is done
-                        continue
-                    if my_bus == my_bus2:
-                        # objects are on the same bus
-                        # tmp[obj1, obj2] = 1
-                        # tmp[obj2, obj1] = 1
-                        row_ind.append(beg_ + obj2)
-                        col_ind.append(beg_ + obj1)
-                        row_ind.append(beg_ + obj1)
-                        col_ind.append(beg_ + obj2)
-            beg_ += nb_obj
+        # objects are connected together (and to themselves) if they are on the same bus
+        # of the same substation
+        obj_conn = np.flatnonzero(self.topo_vect != -1)
+        bus_key = (cls._topo_vect_to_sub[obj_conn] * (cls.n_busbar_per_sub + 1) + 
+                   self.topo_vect[obj_conn])
+        _, obj_to_bus = np.unique(bus_key, return_inverse=True)
+        nb_bus = obj_to_bus.max() + 1 if obj_to_bus.shape[0] else 0
+        obj_bus_mat = csr_matrix((np.ones(obj_conn.shape[0], dtype=dt_float), (obj_conn, obj_to_bus)),
+                                 shape=(cls.dim_topo, nb_bus),
+                                 dtype=dt_float)
+        res = obj_bus_mat.dot(obj_bus_mat.T)
 
         # both ends of a line are connected together (if line is connected)
-        for q_id in range(cls.n_line):
-            if self.line_status[q_id]:
-                # if powerline is connected connect both its side
-                row_ind.append(cls.line_or_pos_topo_vect[q_id])
-                col_ind.append(cls.line_ex_pos_topo_vect[q_id])
-                row_ind.append(cls.line_ex_pos_topo_vect[q_id])
-                col_ind.append(cls.line_or_pos_topo_vect[q_id])
-        row_ind = np.array(row_ind).astype(dt_int)
-        col_ind = np.array(col_ind).astype(dt_int)
-        if not as_csr_matrix:
-            self._connectivity_matrix_ = np.zeros(
-                shape=(cls.dim_topo, cls.dim_topo), dtype=dt_float
-            )
-            self._connectivity_matrix_[row_ind.T, col_ind] = 1.0
-        else:
-            data = np.ones(row_ind.shape[0], dtype=dt_float)
-            self._connectivity_matrix_ = csr_matrix(
-                (data, (row_ind, col_ind)),
-                shape=(cls.dim_topo, cls.dim_topo),
-                dtype=dt_float,
-            )
-        
+        lor_pos = cls.line_or_pos_topo_vect[self.line_status]
+        lex_pos = cls.line_ex_pos_topo_vect[self.line_status]
+        row_ind = np.concatenate((lor_pos, lex_pos)).astype(dt_int)
+        col_ind = np.concatenate((lex_pos, lor_pos)).astype(dt_int)
+        res = res + csr_matrix((np.ones(row_ind.shape[0], dtype=dt_float), (row_ind, col_ind)),
+                               shape=(cls.dim_topo, cls.dim_topo),
+                               dtype=dt_float)
+        res = csr_matrix(res, dtype=dt_float)
+        res.data[:] = 1.0
+        return res
+
     def connectivity_matrix(self, as_csr_matrix: bool=False) -> Union[np.ndarray, csr_matrix]:
         """
         Computes and return the "connectivity matrix" `con_mat`.
@@ -1759,6 +1789,13 @@ class BaseObservation(GridObjects):
 
         By definition, the diagonal is made of 0.
 
+        .. versionchanged:: 1.10.5
+            The matrix is computed with vectorized operations and kept in a cache shared by all the
+            observations of the same environment (indexed by the `topo_vect` and `line_status`), so
+            it is not computed again for observations with the same topology.
+            See :attr:`BaseObservation.TOPO_CACHE_SIZE`. Same for :func:`BaseObservation.bus_connectivity_matrix`
+            and for the part of :func:`BaseObservation.flow_bus_matrix` that depends on the topology.
+
         Returns
         -------
         res: ``numpy.ndarray``, shape:dim_topo,dim_topo, dtype:float
@@ -1932,7 +1969,7 @@ class BaseObservation(GridObjects):
                 lex_bus = np.zeros(cls.n_line, dtype=dt_int)
                 res = (tmp_, lor_bus, lex_bus)
             return res
-        if (
+        need_build_mat = (
             self._bus_connectivity_matrix_ is None
             or (
                 isinstance(self._bus_connectivity_matrix_, csr_matrix)
@@ -1942,17 +1979,14 @@ class BaseObservation(GridObjects):
                 (not isinstance(self._bus_connectivity_matrix_, csr_matrix))
                 and as_csr_matrix
             )
-            or return_lines_index
-        ):
-            nb_bus, unique_bus, bus_or, bus_ex = self._aux_fun_get_bus()
-
-            # convert the bus id (from 0 to 2 * n_sub) to the row / column in the matrix (number between 0 and nb_bus)
-            all_indx = np.arange(nb_bus)
-            tmplate = np.arange(np.max(unique_bus) + 1)
-            tmplate[unique_bus] = all_indx
-            bus_or_in_mat = tmplate[bus_or]
-            bus_ex_in_mat = tmplate[bus_ex]
+        )
+        if need_build_mat or return_lines_index:
+            topo_cache = self._aux_get_topo_cache()
+            if "bus_mat" not in topo_cache:
+                topo_cache["bus_mat"] = self._aux_build_bus_conn_mat()
+            nb_bus, tmplate, all_indx, bus_or_in_mat, bus_ex_in_mat, bus_mat_csr = topo_cache["bus_mat"]
 
+        if need_build_mat:
             if not as_csr_matrix:
                 self._bus_connectivity_matrix_ = np.zeros(
                     shape=(nb_bus, nb_bus), dtype=dt_float
@@ -1961,19 +1995,11 @@ class BaseObservation(GridObjects):
                 self._bus_connectivity_matrix_[bus_ex_in_mat, bus_or_in_mat] = 1.0
                 self._bus_connectivity_matrix_[all_indx, all_indx] = 1.0
             else:
-                data = np.ones(
-                    nb_bus + bus_or_in_mat.shape[0] + bus_ex_in_mat.shape[0],
-                    dtype=dt_float,
-                )
-                row_ind = np.concatenate((all_indx, bus_or_in_mat, bus_ex_in_mat))
-                col_ind = np.concatenate((all_indx, bus_ex_in_mat, bus_or_in_mat))
-                self._bus_connectivity_matrix_ = csr_matrix(
-                    (data, (row_ind, col_ind)), shape=(nb_bus, nb_bus), dtype=dt_float
-                )
+                # the cache is shared, the matrix in it should not be modified
+                self._bus_connectivity_matrix_ = bus_mat_csr.copy()
         if not return_lines_index:
             res = self._bus_connectivity_matrix_
         else:
-            # bus or and bus ex are defined above is return_line_index is True
             lor_bus, _ = self._get_bus_id(
                 self.line_or_pos_topo_vect, self.line_or_to_subid
             )
@@ -1983,6 +2009,28 @@ class BaseObservation(GridObjects):
             res = (self._bus_connectivity_matrix_, (tmplate[lor_bus], tmplate[lex_bus]))
         return res
 
+    def _aux_build_bus_conn_mat(self):
+        """see in bus_connectivity matrix, results are stored in the topology cache"""
+        nb_bus, unique_bus, bus_or, bus_ex = self._aux_fun_get_bus()
+
+        # convert the bus id (from 0 to 2 * n_sub) to the row / column in the matrix (number between 0 and nb_bus)
+        all_indx = np.arange(nb_bus)
+        tmplate = np.arange(np.max(unique_bus) + 1)
+        tmplate[unique_bus] = all_indx
+        bus_or_in_mat = tmplate[bus_or]
+        bus_ex_in_mat = tmplate[bus_ex]
+
+        data = np.ones(
+            nb_bus + bus_or_in_mat.shape[0] + bus_ex_in_mat.shape[0],
+            dtype=dt_float,
+        )
+        row_ind = np.concatenate((all_indx, bus_or_in_mat, bus_ex_in_mat))
+        col_ind = np.concatenate((all_indx, bus_ex_in_mat, bus_or_in_mat))
+        bus_mat_csr = csr_matrix(
+            (data, (row_ind, col_ind)), shape=(nb_bus, nb_bus), dtype=dt_float
+        )
+        return nb_bus, tmplate, all_indx, bus_or_in_mat, bus_ex_in_mat, bus_mat_csr
+
     def _get_bus_id(self, id_topo_vect, sub_id):
         """
         get the bus id with the internal convention that:
@@ -2086,22 +2134,16 @@ class BaseObservation(GridObjects):
             lex_bus = np.zeros(cls.n_line, dtype=dt_int)
             return flow_mat, (load_bus, prod_bus, stor_bus, lor_bus, lex_bus)
         
-        nb_bus, unique_bus, bus_or, bus_ex = self._aux_fun_get_bus()
-        prod_bus, prod_conn = self._get_bus_id(
-            cls.gen_pos_topo_vect, cls.gen_to_subid
-        )
-        load_bus, load_conn = self._get_bus_id(
-            cls.load_pos_topo_vect, cls.load_to_subid
-        )
-        stor_bus, stor_conn = self._get_bus_id(
-            cls.storage_pos_topo_vect, cls.storage_to_subid
-        )
-        lor_bus, lor_conn = self._get_bus_id(
-            cls.line_or_pos_topo_vect, cls.line_or_to_subid
-        )
-        lex_bus, lex_conn = self._get_bus_id(
-            cls.line_ex_pos_topo_vect, cls.line_ex_to_subid
-        )
+        topo_cache = self._aux_get_topo_cache()
+        if "flow_mat" not in topo_cache:
+            topo_cache["flow_mat"] = self._aux_build_flow_bus_struct()
+        (nb_bus, all_indx,
+         (prod_bus, prod_conn, nb_prod, map_mat_prod),
+         (load_bus, load_conn, nb_load, map_mat_load),
+         (stor_bus, stor_conn, nb_stor, map_mat_stor),
+         (lor_bus, lor_conn, nb_lor),
+         (lex_bus, lex_conn, nb_lex),
+         row_ind, col_ind) = topo_cache["flow_mat"]
 
         if cls.shunts_data_available:
             sh_bus = 1 * self._shunt_bus
@@ -2111,16 +2153,6 @@ class BaseObservation(GridObjects):
             )
             sh_conn = self._shunt_bus != -1
 
-        # convert the bus to be "id of row or column in the matrix" instead of the bus id with
-        # the "grid2op convention"
-        all_indx = np.arange(nb_bus)
-        tmplate = np.arange(np.max(unique_bus) + 1)
-        tmplate[unique_bus] = all_indx
-        prod_bus = tmplate[prod_bus]
-        load_bus = tmplate[load_bus]
-        lor_bus = tmplate[lor_bus]
-        lex_bus = tmplate[lex_bus]
-        stor_bus = tmplate[stor_bus]
         if active_flow:
             prod_vect = self.gen_p
             load_vect = self.load_p
@@ -2138,43 +2170,20 @@ class BaseObservation(GridObjects):
             if cls.shunts_data_available:
                 sh_vect = self._shunt_q
 
-        nb_lor = lor_conn.sum()
-        nb_lex = lex_conn.sum()
         data = np.zeros(nb_bus + nb_lor + nb_lex, dtype=dt_float)
 
         # if two generators / loads / storage unit are connected at the same bus
         # this is why i go with matrix product and sparse matrices
-        nb_prod = prod_conn.sum()
         if nb_prod:
-            bus_prod = np.arange(prod_bus[prod_conn].max() + 1)
-            map_mat = csr_matrix(
-                (np.ones(nb_prod), (prod_bus[prod_conn], np.arange(nb_prod))),
-                shape=(bus_prod.shape[0], nb_prod),
-                dtype=dt_float,
-            )
-            data[bus_prod] += map_mat.dot(prod_vect[prod_conn])
+            data[:map_mat_prod.shape[0]] += map_mat_prod.dot(prod_vect[prod_conn])
 
         # handle load
-        nb_load = load_conn.sum()
         if nb_load:
-            bus_load = np.arange(load_bus[load_conn].max() + 1)
-            map_mat = csr_matrix(
-                (np.ones(nb_load), (load_bus[load_conn], np.arange(nb_load))),
-                shape=(bus_load.shape[0], nb_load),
-                dtype=dt_float,
-            )
-            data[bus_load] -= map_mat.dot(load_vect[load_conn])
+            data[:map_mat_load.shape[0]] -= map_mat_load.dot(load_vect[load_conn])
 
         # handle storage
-        nb_stor = stor_conn.sum()
         if nb_stor:
-            bus_stor = np.arange(stor_bus[stor_conn].max() + 1)
-            map_mat = csr_matrix(
-                (np.ones(nb_stor), (stor_bus[stor_conn], np.arange(nb_stor))),
-                shape=(bus_stor.shape[0], nb_stor),
-                dtype=dt_float,
-            )
-            data[bus_stor] -= map_mat.dot(stor_vect[stor_conn])
+            data[:map_mat_stor.shape[0]] -= map_mat_stor.dot(stor_vect[stor_conn])
 
         if cls.shunts_data_available:
             # handle shunts
@@ -2189,17 +2198,66 @@ class BaseObservation(GridObjects):
                 data[bus_shunt] -= map_mat.dot(sh_vect[sh_conn])
 
         # powerlines
-        data[np.arange(nb_lor) + nb_bus] -= or_vect[lor_conn]
-        data[np.arange(nb_lex) + nb_bus + nb_lor] -= ex_vect[lex_conn]
-        row_ind = np.concatenate((all_indx, lor_bus[lor_conn], lex_bus[lex_conn]))
-        col_ind = np.concatenate((all_indx, lex_bus[lex_conn], lor_bus[lor_conn]))
+        data[nb_bus:(nb_bus + nb_lor)] -= or_vect[lor_conn]
+        data[(nb_bus + nb_lor):] -= ex_vect[lex_conn]
         res = csr_matrix(
             (data, (row_ind, col_ind)), shape=(nb_bus, nb_bus), dtype=dt_float
         )
         if not as_csr_matrix:
             res = res.toarray()
 
-        return res, (load_bus, prod_bus, stor_bus, lor_bus, lex_bus)
+        # the cache is shared, the vectors in it should not be modified
+        return res, (1 * load_bus, 1 * prod_bus, 1 * stor_bus, 1 * lor_bus, 1 * lex_bus)
+
+    def _aux_build_flow_bus_struct(self):
+        """
+        see in flow_bus_matrix, computes everything that depends only on the topology
+        (results are stored in the topology cache)
+        """
+        cls = type(self)
+        nb_bus, unique_bus, bus_or, bus_ex = self._aux_fun_get_bus()
+        # convert the bus to be "id of row or column in the matrix" instead of the bus id with
+        # the "grid2op convention"
+        all_indx = np.arange(nb_bus)
+        tmplate = np.arange(np.max(unique_bus) + 1)
+        tmplate[unique_bus] = all_indx
+
+        def _aux_map_mat(obj_bus, obj_conn, nb_obj):
+            # matrix (nb_bus x nb_obj) to sum the values of the objects connected to the same bus
+            if not nb_obj:
+                return None
+            return csr_matrix(
+                (np.ones(nb_obj), (obj_bus[obj_conn], np.arange(nb_obj))),
+                shape=(obj_bus[obj_conn].max() + 1, nb_obj),
+                dtype=dt_float,
+            )
+
+        res_inj = []
+        for pos_topo_vect, to_subid in ((cls.gen_pos_topo_vect, cls.gen_to_subid),
+                                        (cls.load_pos_topo_vect, cls.load_to_subid),
+                                        (cls.storage_pos_topo_vect, cls.storage_to_subid)):
+            obj_bus, obj_conn = self._get_bus_id(pos_topo_vect, to_subid)
+            obj_bus = tmplate[obj_bus]
+            nb_obj = obj_conn.sum()
+            res_inj.append((obj_bus, obj_conn, nb_obj, _aux_map_mat(obj_bus, obj_conn, nb_obj)))
+
+        lor_bus, lor_conn = self._get_bus_id(
+            cls.line_or_pos_topo_vect, cls.line_or_to_subid
+        )
+        lex_bus, lex_conn = self._get_bus_id(
+            cls.line_ex_pos_topo_vect, cls.line_ex_to_subid
+        )
+        lor_bus = tmplate[lor_bus]
+        lex_bus = tmplate[lex_bus]
+        nb_lor = lor_conn.sum()
+        nb_lex = lex_conn.sum()
+        row_ind = np.concatenate((all_indx, lor_bus[lor_conn], lex_bus[lex_conn]))
+        col_ind = np.concatenate((all_indx, lex_bus[lex_conn], lor_bus[lor_conn]))
+        return (nb_bus, all_indx,
+                res_inj[0], res_inj[1], res_inj[2],
+                (lor_bus, lor_conn, nb_lor),
+                (lex_bus, lex_conn, nb_lex),
+                row_ind, col_ind)
 
     def _add_edges_simple(self, vector, attr_nm, lor_bus, lex_bus, graph, fun_reduce=None):
         """add the edges, when the attributes are common for the all the powerline"""
@@ -2274,13 +2332,13 @@ class BaseObservation(GridObjects):
         networkx.set_edge_attributes(graph, dict_or, "{}_or".format(attr_nm))
         networkx.set_edge_attributes(graph, dict_ex, "{}_ex".format(attr_nm))
 
-    def as_networkx(self) -> networkx.Graph:
+    def as_networkx(self) -> "networkx.Graph":
         """Old name for :func:`BaseObservation.get_energy_graph`,
         will be removed in the future.
         """
         return self.get_energy_graph()
     
-    def get_energy_graph(self) -> networkx.Graph:
+    def get_energy_graph(self) -> "networkx.Graph":
         """
         Convert this observation as a networkx graph. This graph is the graph "seen" by
         "the electron" / "the energy" of the power grid.
@@ -2896,7 +2954,7 @@ class BaseObservation(GridObjects):
                                                  )
         return sto_ids
     
-    def get_elements_graph(self) -> networkx.DiGraph:
+    def get_elements_graph(self) -> "networkx.DiGraph":
         """This function returns the "elements graph" as a networkx object.
         
         .. seealso::
@@ -3338,6 +3396,100 @@ class BaseObservation(GridObjects):
         There is no coupling between the different simulation that you perform here.
         
         """
+        timestamp, inj_action = self._aux_get_forecast_for_simulate(time_step)
+        self._obs_env.init(
+            inj_action,
+            time_stamp=timestamp,
+            obs=self,
+            time_step=time_step,
+        )
+
+        sim_obs, *rest = self._obs_env.simulate(action)
+        sim_obs = self._obs_env.get_obs(_update_state=False)  # copy of sim_obs (possibly from the observation pool)
+        if self._forecasted_inj:
+            # allow "chain" to simulate
+            sim_obs.action_helper = self.action_helper  # no copy !
+            sim_obs._obs_env = self._obs_env  # no copy
+            sim_obs._forecasted_inj = self._forecasted_inj[1:]  # remove the first one
+            sim_obs._update_internal_env_params(self._obs_env)
+        return (sim_obs, *rest)  # parentheses are needed for python 3.6 at least.
+
+    def simulate_batch(self,
+                       actions: List["grid2op.Action.BaseAction"],
+                       time_step: int=1) -> Dict[str, Union[np.ndarray, List[STEP_INFO_TYPING]]]:
+        """
+        This method simulates the effect of multiple actions on the same forecast powergrid state.
+
+        It gives the same results as calling :func:`BaseObservation.simulate` for each action 
+        of `actions` but it is faster: the forecast state is computed only once (and not once per 
+        action) and no observation is built / copied for each action.
+
+        Each action counts as one call to `simulate` (for example regarding the maximum
+        number of calls to simulate allowed per step or per episode).
+        
+        .. versionadded:: 1.10.5
+        
+        Examples
+        ---------
+        
+        This can be used, for example, to find the action that minimizes the maximum flow 
+        among a list of candidates:
+        
+        .. code-block:: python
+
+            import numpy as np
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"  # or any other name
+            env = grid2op.make(env_name)
+            obs = env.reset()
+            
+            candidates = [env.action_space(), ...]  # list of grid2op actions
+            res = obs.simulate_batch(candidates)
+            
+            max_rho = res["rho"].max(axis=1)
+            max_rho[res["done"]] = np.inf
+            best_action = candidates[np.argmin(max_rho)]
+            
+        Parameters
+        ----------
+        actions: ``list``
+            The list of the actions (:class:`grid2op.Action.BaseAction`) to simulate
+            
+        time_step: ``int``
+            The time step of the forecasted grid to perform the actions on 
+            (see :func:`BaseObservation.simulate`)
+
+        Raises
+        ------
+        :class:`grid2op.Exceptions.NoForecastAvailable`
+            if no forecast are available for the time_step querried.
+            
+        Returns
+        -------
+        res: ``dict``
+            A dictionnary with keys:
+            
+            - "rho": ``numpy.ndarray`` with shape `(len(actions), n_line)` the relative flows 
+              on each powerline for each action (0. if the simulation lead to a game over)
+            - "p_or": ``numpy.ndarray`` with shape `(len(actions), n_line)` the active flows 
+              (origin side) on each powerline for each action
+            - "a_or": ``numpy.ndarray`` with shape `(len(actions), n_line)` the current flows 
+              (origin side) on each powerline for each action
+            - "reward": ``numpy.ndarray`` with shape `(len(actions),)` the simulated rewards
+            - "done": ``numpy.ndarray`` with shape `(len(actions),)` whether each simulation 
+              lead to a game over
+            - "info": ``list`` of the `len(actions)` "info" returned by each simulation
+              
+        """
+        timestamp, inj_action = self._aux_get_forecast_for_simulate(time_step)
+        return self._obs_env.simulate_batch(actions,
+                                            inj_action,
+                                            time_stamp=timestamp,
+                                            obs=self,
+                                            time_step=time_step)
+        
+    def _aux_get_forecast_for_simulate(self, time_step: int):
+        """check that simulate can be used and retrieve the forecast for the given time step"""
         if self.action_helper is None:
             raise NoForecastAvailable(
                 "No forecasts are available for this instance of BaseObservation "
@@ -3372,22 +3524,7 @@ class BaseObservation(GridObjects):
 
         timestamp = self._forecasted_grid_act[time_step]["timestamp"]
         inj_action = self._forecasted_grid_act[time_step]["inj_action"]
-        self._obs_env.init(
-            inj_action,
-            time_stamp=timestamp,
-            obs=self,
-            time_step=time_step,
-        )
-
-        sim_obs, *rest = self._obs_env.simulate(action)
-        sim_obs = copy.deepcopy(sim_obs)
-        if self._forecasted_inj:
-            # allow "chain" to simulate
-            sim_obs.action_helper = self.action_helper  # no copy !
-            sim_obs._obs_env = self._obs_env  # no copy
-            sim_obs._forecasted_inj = self._forecasted_inj[1:]  # remove the first one
-            sim_obs._update_internal_env_params(self._obs_env)
-        return (sim_obs, *rest)  # parentheses are needed for python 3.6 at least.
+        return timestamp, inj_action
 
     def copy(self, env=None) -> Self:
         """
@@ -133,6 +133,13 @@ class ObservationSpace(SerializableObservationSpace):
         self._real_env_kwargs = {}
         self._observation_bk_class = observation_bk_class
         self._observation_bk_kwargs = observation_bk_kwargs
+
+        # observation pool (deactivated by default, see `set_obs_pool_size`)
+        self._obs_pool_size = 0
+        self._obs_pool = []  # observations returned by the environment
+        self._obs_pool_id = 0
+        self._obs_pool_sim = []  # observations returned by `obs.simulate`
+        self._obs_pool_sim_id = 0
     
     def set_real_env_kwargs(self, env):
         if not self.with_forecast:
@@ -415,13 +422,22 @@ class ObservationSpace(SerializableObservationSpace):
             self.obs_env.update_grid(env)
             obs_env_obs = self.obs_env if self.obs_env.is_valid() else None
         
-        res = self.observationClass(
-            obs_env=obs_env_obs,
-            action_helper=self.action_helper_env,
-            random_prng=self.space_prng,
-            kwargs_env=self._real_env_kwargs,
-            **self._ptr_kwargs_observation
-        )
+        if self._obs_pool_size:
+            res = self._get_obs_from_pool(self.observationClass)
+            res._obs_env = obs_env_obs
+            res.action_helper = self.action_helper_env
+            res.random_prng = self.space_prng
+            res._ptr_kwargs_env = self._real_env_kwargs
+            if not _update_state:
+                res.reset()
+        else:
+            res = self.observationClass(
+                obs_env=obs_env_obs,
+                action_helper=self.action_helper_env,
+                random_prng=self.space_prng,
+                kwargs_env=self._real_env_kwargs,
+                **self._ptr_kwargs_observation
+            )
         self.__nb_simulate_called_this_step = 0
         if _update_state:
             # TODO how to make sure that whatever the number of time i call "simulate" i still get the same observations
@@ -429,6 +445,109 @@ class ObservationSpace(SerializableObservationSpace):
             res.update(env=env, with_forecast=self.with_forecast)
         return res
 
+    def set_obs_pool_size(self, pool_size: int) -> None:
+        """
+        .. versionadded:: 1.10.5
+
+        Activate (or deactivate if `pool_size` is 0, which is the default) the recycling of the
+        observations.
+
+        When activated, the observations returned by the environment (`env.reset`, `env.step`,
+        `env.get_obs`) are taken from a ring of `pool_size` preallocated observations and their
+        data are written in place instead of allocating (and copying) a new observation each time. The
+        same holds (with another ring of the same size) for the observations returned by
+        `obs.simulate`.
+
+        This reduces the time spent allocating observations (and the pressure on the garbage
+        collector) for example in loops performing lots of `obs.simulate`.
+
+        .. warning::
+            An observation returned by the environment is only valid until `pool_size - 1` other
+            observations have been returned by the environment (and likewise for the observations
+            returned by `obs.simulate`). After that, it is overwritten.
+            If you need to keep an observation for longer, call `obs.copy()` (the copy is
+            never recycled).
+
+        Parameters
+        ----------
+        pool_size: ``int``
+            Number of observations kept in each pool. It should be 0 (deactivated) or at least 2.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"
+            env = grid2op.make(env_name)
+            env.set_obs_pool_size(4)  # or env.observation_space.set_obs_pool_size(4)
+
+            obs = env.reset()
+            for act in [env.action_space(), ...]:
+                # no observation is allocated here
+                sim_obs, sim_r, sim_d, sim_i = obs.simulate(act)
+
+        """
+        try:
+            pool_size = int(pool_size)
+        except (TypeError, ValueError) as exc_:
+            raise EnvError(f"The size of the observation pool should be an integer, "
+                           f"found {pool_size}") from exc_
+        if pool_size < 0 or pool_size == 1:
+            raise EnvError(f"The size of the observation pool should be 0 (to deactivate it) "
+                           f"or at least 2, found {pool_size}")
+        self._obs_pool_size = pool_size
+        self._obs_pool = []
+        self._obs_pool_id = 0
+        self._obs_pool_sim = []
+        self._obs_pool_sim_id = 0
+
+    @property
+    def obs_pool_size(self) -> int:
+        """Size of the observation pool (0 if deactivated), see :func:`ObservationSpace.set_obs_pool_size`"""
+        return self._obs_pool_size
+
+    def _get_obs_from_pool(self, obs_cls, simulated=False):
+        """returns the next observation of the pool (it is created if needed)"""
+        if simulated:
+            pool, pool_id = self._obs_pool_sim, self._obs_pool_sim_id
+            self._obs_pool_sim_id = (pool_id + 1) % self._obs_pool_size
+        else:
+            pool, pool_id = self._obs_pool, self._obs_pool_id
+            self._obs_pool_id = (pool_id + 1) % self._obs_pool_size
+
+        if pool_id < len(pool) and type(pool[pool_id]) is obs_cls:
+            return pool[pool_id]
+        res = obs_cls(obs_env=None,
+                      action_helper=self.action_helper_env,
+                      random_prng=self.space_prng,
+                      kwargs_env=self._real_env_kwargs,
+                      **self._ptr_kwargs_observation)
+        if pool_id < len(pool):
+            pool[pool_id] = res
+        else:
+            pool.append(res)
+        return res
+
+    def _copy_obs(self, obs, simulated=False):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Returns a copy of `obs`, taken from the observation pool if it is activated
+        (otherwise it is a regular `copy.deepcopy(obs)`)
+        """
+        if not self._obs_pool_size:
+            return copy.deepcopy(obs)
+        res = self._get_obs_from_pool(type(obs), simulated=simulated)
+        if res is obs:
+            # never copy an observation into itself
+            res = self._get_obs_from_pool(type(obs), simulated=simulated)
+        obs._deepcopy_into(res)
+        return res
+
     def size_obs(self):
         """
         Size if the observation vector would be flatten
@@ -503,6 +622,13 @@ class ObservationSpace(SerializableObservationSpace):
         
         new_obj._ObsEnv_class = self._ObsEnv_class
 
+        # the observations of the pool are not shared
+        new_obj._obs_pool_size = self._obs_pool_size
+        new_obj._obs_pool = []
+        new_obj._obs_pool_id = 0
+        new_obj._obs_pool_sim = []
+        new_obj._obs_pool_sim_id = 0
+
     def copy(self, copy_backend=False, env=None):
         """
         INTERNAL
@@ -8,7 +8,10 @@
 
 import logging
 import copy
+import numpy as np
 
+from grid2op.dtypes import dt_int, dt_float, dt_bool
+from grid2op.Exceptions import Grid2OpException
 from grid2op.Space import SerializableSpace
 from grid2op.Observation.completeObservation import CompleteObservation
 
@@ -99,3 +102,211 @@ class SerializableObservationSpace(SerializableSpace):
         elif attr_name == "prod_v":
             attr_name = "gen_v"
         return super().get_indx_extract(attr_name)
+
+    # node and edges features available in `get_energy_graph_batch`
+    GRAPH_NODE_FEATURES = ("p", "q", "v", "theta", "sub_id", "local_bus_id", "cooldown")
+    GRAPH_EDGE_FEATURES = ("p_or", "p_ex", "q_or", "q_ex", "a_or", "a_ex",
+                           "v_or", "v_ex", "theta_or", "theta_ex",
+                           "rho", "cooldown", "thermal_limit", "timestep_overflow")
+    _GRAPH_NODE_ATTR = {"p": ("gen_p", "load_p"),
+                        "q": ("gen_q", "load_q"),
+                        "v": ("v_or", "v_ex"),
+                        "theta": ("theta_or", "theta_ex"),
+                        "sub_id": (),
+                        "local_bus_id": (),
+                        "cooldown": ("time_before_cooldown_sub", )}
+    _GRAPH_EDGE_ATTR = {"cooldown": "time_before_cooldown_line", "thermal_limit": "_thermal_limit"}
+
+    def _aux_extract_batch(self, obs_vect, attr_name):
+        beg_, end_, dtype = self.get_indx_extract(attr_name)
+        return obs_vect[:, beg_:end_]
+
+    def get_energy_graph_batch(self, obs_vect, node_features=None, edge_features=None):
+        """
+        .. versionadded:: 1.10.5
+
+        Computes the "energy graph" (see :func:`grid2op.Observation.BaseObservation.get_energy_graph`)
+        of a whole stack of observations, represented as vectors (for example the observations
+        stored by :class:`grid2op.Episode.EpisodeData` or :class:`grid2op.Episode.CompactEpisodeData`),
+        with numpy only (networkx is not used).
+
+        The results are padded so that all the graphs have the same size, they can directly be used
+        to build the "edge_index" / "x" / "edge_attr" tensors of graph neural network libraries
+        (*eg* pytorch geometric or DGL):
+
+        - there is one node per possible bus of the grid (`n_busbar_per_sub * n_sub` nodes), the node
+          `k` represents the bus with global id `k` (see :func:`grid2op.Space.GridObjects.local_bus_to_global`).
+          `node_mask` tells which of them are used (at least one element connected to it)
+        - there is one edge per powerline (`n_line` edges), the edge `l` represents the powerline `l`.
+          `edge_mask` tells which of them are connected. Contrary to `get_energy_graph`, parallel
+          powerlines are not merged into a single edge.
+
+        Rows of `obs_vect` that are not valid (for example full of `nan` when an episode
+        is over) have all their nodes and edges masked.
+
+        Parameters
+        ----------
+        obs_vect: ``numpy.ndarray``
+            The observations, as vectors, shape `(N, obs_size)` (or `(obs_size,)` for a single observation)
+
+        node_features: ``list``, optional
+            Name of the features of the nodes (by default all the ones of
+            :attr:`SerializableObservationSpace.GRAPH_NODE_FEATURES` that can be computed from
+            the vector representation of the observation). "p" (resp. "q") is the sum of the
+            active (resp. reactive) power produced at this bus (generators - loads - storage units, the shunts
+            are not taken into account as they are not part of the vector representation), "v" and "theta"
+            are the voltage magnitude (kV) and angle (deg) of the bus (read from the powerlines), "cooldown"
+            is the cooldown of the substation.
+
+        edge_features: ``list``, optional
+            Name of the features of the edges (by default all the ones of
+            :attr:`SerializableObservationSpace.GRAPH_EDGE_FEATURES` that can be computed from
+            the vector representation of the observation). They are the attributes of the observation
+            with the same name ("cooldown" being `time_before_cooldown_line`)
+
+        Returns
+        -------
+        res: ``dict``
+            With keys:
+
+            - "node_features": ``numpy.ndarray`` shape `(N, n_busbar_per_sub * n_sub, len(node_features))`
+            - "node_mask": ``numpy.ndarray`` of bool, shape `(N, n_busbar_per_sub * n_sub)`
+            - "edge_index": ``numpy.ndarray`` of int, shape `(N, 2, n_line)`, with the node
+              of the origin side (first row) and of the extremity side (second row) of each powerline
+              (-1 if the powerline is disconnected)
+            - "edge_features": ``numpy.ndarray`` shape `(N, n_line, len(edge_features))`
+            - "edge_mask": ``numpy.ndarray`` of bool, shape `(N, n_line)`
+            - "node_feature_names": the name of the node features
+            - "edge_feature_names": the name of the edge features
+
+            Features of masked nodes and edges are 0.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            from grid2op.Episode import EpisodeData
+            env = grid2op.make("l2rpn_case14_sandbox")
+            path_agent = ...  # where the runner saved the episodes
+            episode_studied = ...
+            this_episode = EpisodeData.from_disk(path_agent, episode_studied)
+            # the stored vectors (memory mapped for the "npy" format), shape (N, obs_size)
+            obs_vect = this_episode.observations.collection
+
+            graphs = env.observation_space.get_energy_graph_batch(obs_vect)
+
+            # for pytorch geometric for example
+            i = 0
+            edge_index = graphs["edge_index"][i][:, graphs["edge_mask"][i]]
+            edge_attr = graphs["edge_features"][i][graphs["edge_mask"][i]]
+            x = graphs["node_features"][i]
+
+        """
+        cls = type(self)
+        # features that can be computed from the vector representation
+        node_attrs = dict(cls._GRAPH_NODE_ATTR)
+        if cls.n_storage:
+            # the storage units are taken into account in "p" when there are some on the grid
+            node_attrs["p"] = node_attrs["p"] + ("storage_power", )
+        avail_node = [el for el in cls.GRAPH_NODE_FEATURES
+                      if all(attr_nm in self._to_extract_vect for attr_nm in node_attrs[el])]
+        avail_edge = [el for el in cls.GRAPH_EDGE_FEATURES
+                      if cls._GRAPH_EDGE_ATTR.get(el, el) in self._to_extract_vect]
+        if node_features is None:
+            node_features = avail_node
+        if edge_features is None:
+            edge_features = avail_edge
+        for el in node_features:
+            if el not in avail_node:
+                raise Grid2OpException(f"Unknown node feature \"{el}\", available features are "
+                                       f"{avail_node}")
+        for el in edge_features:
+            if el not in avail_edge:
+                raise Grid2OpException(f"Unknown edge feature \"{el}\", available features are "
+                                       f"{avail_edge}")
+        obs_vect = np.asarray(obs_vect)
+        if obs_vect.ndim == 1:
+            obs_vect = obs_vect.reshape(1, -1)
+        if obs_vect.ndim != 2 or obs_vect.shape[1] != self.size():
+            raise Grid2OpException(f"The observations should be given as an array of shape (N, {self.size()}), "
+                                   f"you provided an array of shape {obs_vect.shape}")
+        nb_obs = obs_vect.shape[0]
+        nb_node = cls.n_busbar_per_sub * cls.n_sub
+        rows = np.arange(nb_obs).reshape(-1, 1)
+
+        # global bus of each element (-1 if disconnected)
+        topo_vect = self._aux_extract_batch(obs_vect, "topo_vect")
+        valid = np.isfinite(topo_vect).all(axis=1)
+        topo_vect = np.where(valid.reshape(-1, 1), topo_vect, -1).astype(dt_int)
+        elem_bus = cls.local_bus_to_global(topo_vect,
+                                           np.broadcast_to(cls._topo_vect_to_sub, topo_vect.shape))
+        elem_conn = elem_bus >= 0
+        node_mask = np.zeros((nb_obs, nb_node), dtype=dt_bool)
+        node_mask[np.broadcast_to(rows, elem_bus.shape)[elem_conn], elem_bus[elem_conn]] = True
+
+        lor_bus = elem_bus[:, cls.line_or_pos_topo_vect]
+        lex_bus = elem_bus[:, cls.line_ex_pos_topo_vect]
+        line_status = self._aux_extract_batch(obs_vect, "line_status")
+        edge_mask = ((np.where(valid.reshape(-1, 1), line_status, 0.) > 0.5) & 
+                     (lor_bus >= 0) & (lex_bus >= 0))
+        edge_index = np.full((nb_obs, 2, cls.n_line), fill_value=-1, dtype=dt_int)
+        edge_index[:, 0, :][edge_mask] = lor_bus[edge_mask]
+        edge_index[:, 1, :][edge_mask] = lex_bus[edge_mask]
+        line_rows = np.broadcast_to(rows, edge_mask.shape)[edge_mask]
+
+        def _aux_bus_sum(vect, pos_topo_vect):
+            # sum the values of all the elements connected to the same bus
+            obj_bus = elem_bus[:, pos_topo_vect]
+            obj_conn = obj_bus >= 0
+            flat_id = (np.broadcast_to(rows, obj_bus.shape)[obj_conn] * nb_node + 
+                       obj_bus[obj_conn])
+            return np.bincount(flat_id, weights=vect[obj_conn],
+                               minlength=nb_obs * nb_node).reshape(nb_obs, nb_node)
+
+        def _aux_line_to_bus(attr_or, attr_ex):
+            # value of the bus read from the powerline(s) connected to it
+            res = np.zeros((nb_obs, nb_node), dtype=dt_float)
+            res[line_rows, lor_bus[edge_mask]] = self._aux_extract_batch(obs_vect, attr_or)[edge_mask]
+            res[line_rows, lex_bus[edge_mask]] = self._aux_extract_batch(obs_vect, attr_ex)[edge_mask]
+            return res
+
+        node_feats = np.zeros((nb_obs, nb_node, len(node_features)), dtype=dt_float)
+        for feat_id, feat_nm in enumerate(node_features):
+            if feat_nm == "p":
+                val = (_aux_bus_sum(self._aux_extract_batch(obs_vect, "gen_p"), cls.gen_pos_topo_vect) - 
+                       _aux_bus_sum(self._aux_extract_batch(obs_vect, "load_p"), cls.load_pos_topo_vect))
+                if cls.n_storage:
+                    val -= _aux_bus_sum(self._aux_extract_batch(obs_vect, "storage_power"),
+                                        cls.storage_pos_topo_vect)
+            elif feat_nm == "q":
+                val = (_aux_bus_sum(self._aux_extract_batch(obs_vect, "gen_q"), cls.gen_pos_topo_vect) - 
+                       _aux_bus_sum(self._aux_extract_batch(obs_vect, "load_q"), cls.load_pos_topo_vect))
+            elif feat_nm == "v":
+                val = _aux_line_to_bus("v_or", "v_ex")
+            elif feat_nm == "theta":
+                val = _aux_line_to_bus("theta_or", "theta_ex")
+            elif feat_nm == "sub_id":
+                val = np.arange(nb_node) % cls.n_sub
+            elif feat_nm == "local_bus_id":
+                val = np.arange(nb_node) // cls.n_sub + 1
+            elif feat_nm == "cooldown":
+                val = self._aux_extract_batch(obs_vect, "time_before_cooldown_sub")[:, np.arange(nb_node) % cls.n_sub]
+            node_feats[:, :, feat_id] = val
+        node_feats[~node_mask] = 0.
+
+        edge_feats = np.zeros((nb_obs, cls.n_line, len(edge_features)), dtype=dt_float)
+        for feat_id, feat_nm in enumerate(edge_features):
+            attr_nm = cls._GRAPH_EDGE_ATTR.get(feat_nm, feat_nm)
+            edge_feats[:, :, feat_id] = self._aux_extract_batch(obs_vect, attr_nm)
+        edge_feats[~edge_mask] = 0.
+
+        return {"node_features": node_feats,
+                "node_mask": node_mask,
+                "edge_index": edge_index,
+                "edge_features": edge_feats,
+                "edge_mask": edge_mask,
+                "node_feature_names": list(node_features),
+                "edge_feature_names": list(edge_features),
+                }
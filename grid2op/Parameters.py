@@ -161,6 +161,23 @@ class Parameters:
             `env.reset(options={"init state": ...})` (see doc of :func:`grid2op.Environment.Environment.reset` 
             for more information)
 
+    REDISPATCHING_SOLVER: ``str``
+        Which method is used by the environment to compute the redispatching (and to make sure that
+        the storage units and the curtailment actions are compensated by the generators) at each step.
+        
+        It can be:
+        
+        - "SLSQP" (default): the problem is solved with the `scipy.optimize.minimize` function (using the
+          "SLSQP" method)
+        - "closed_form": the problem is solved exactly by a dedicated method (with complexity
+          `O(n_gen log(n_gen))`). This is much faster than the default. If this method fails, "SLSQP" is
+          used.
+          
+        Note that when some generators are not redispatched by the agent, the problem solved by the environment
+        can have multiple solutions. In this case both methods might give different (but equally valid) results.
+        
+        .. versionadded:: 1.10.5
+        
     """
 
     def __init__(self, parameters_path=None):
@@ -234,6 +251,9 @@ class Parameters:
         self.MAX_SIMULATE_PER_STEP = dt_int(-1)
         self.MAX_SIMULATE_PER_EPISODE = dt_int(-1)
 
+        # method used to compute the redispatching
+        self.REDISPATCHING_SOLVER = "SLSQP"
+
         if parameters_path is not None:
             if os.path.isfile(parameters_path):
                 self.init_from_json(parameters_path)
@@ -387,6 +407,9 @@ class Parameters:
             self.IGNORE_INITIAL_STATE_TIME_SERIE = Parameters._isok_txt(
                 dict_["IGNORE_INITIAL_STATE_TIME_SERIE"]
             )
+
+        if "REDISPATCHING_SOLVER" in dict_:
+            self.REDISPATCHING_SOLVER = str(dict_["REDISPATCHING_SOLVER"])
             
         authorized_keys = set(self.__dict__.keys())
         authorized_keys = authorized_keys | {
@@ -437,6 +460,7 @@ class Parameters:
         res["MAX_SIMULATE_PER_STEP"] = int(self.MAX_SIMULATE_PER_STEP)
         res["MAX_SIMULATE_PER_EPISODE"] = int(self.MAX_SIMULATE_PER_EPISODE)
         res["IGNORE_INITIAL_STATE_TIME_SERIE"] = int(self.IGNORE_INITIAL_STATE_TIME_SERIE)
+        res["REDISPATCHING_SOLVER"] = str(self.REDISPATCHING_SOLVER)
         return res
 
     def init_from_json(self, json_path):
@@ -741,3 +765,8 @@ class Parameters:
             raise RuntimeError(
                 f'Impossible to convert IGNORE_INITIAL_STATE_TIME_SERIE to bool with error \n:"{exc_}"'
             ) from exc_
+
+        if self.REDISPATCHING_SOLVER not in ["SLSQP", "closed_form"]:
+            raise RuntimeError(
+                f'REDISPATCHING_SOLVER should be either "SLSQP" or "closed_form", we found {self.REDISPATCHING_SOLVER}'
+            )
@@ -6,13 +6,15 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
-import networkx as nx
 import numpy as np
 import copy
 import math
 
+from grid2op._glop_lazy_import import LazyModule
 from grid2op.PlotGrid.PlotUtil import PlotUtil as pltu
 
+nx = LazyModule("networkx")
+
 
 def layout_obs_sub_only(obs, scale=1000.0):
     n_sub = obs.n_sub
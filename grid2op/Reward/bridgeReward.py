@@ -7,11 +7,13 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
 import numpy as np
-import networkx as nx
 
+from grid2op._glop_lazy_import import LazyModule
 from grid2op.Reward.baseReward import BaseReward
 from grid2op.dtypes import dt_float
 
+nx = LazyModule("networkx")
+
 
 class BridgeReward(BaseReward):
     """
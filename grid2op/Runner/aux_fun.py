@@ -7,6 +7,8 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
 import copy
+import multiprocessing.util
+import os
 import time
 import warnings
 import numpy as np
@@ -15,6 +17,7 @@ from grid2op.Environment import Environment
 from grid2op.Agent import BaseAgent
 
 from grid2op.Episode import EpisodeData, CompactEpisodeData
+from grid2op.Episode._npyStream import _NpyStream
 from grid2op.Runner.FakePBar import _FakePbar
 from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Chronics import ChronicsHandler
@@ -35,6 +38,18 @@ def _aux_add_data(reward, env, episode,
         info,
     )
     return reward
+
+
+def _aux_make_array(episode_path, flush_every, file_name, shape, fill_value, dtype):
+    """make the array that will store the data of an episode, it is written on the hard drive
+    by chunks of `flush_every` rows if `episode_path` is not None"""
+    if episode_path is None:
+        return np.full(shape, fill_value=fill_value, dtype=dtype)
+    return _NpyStream(EpisodeData._aux_npy_path(os.path.join(episode_path, file_name)),
+                      shape,
+                      dtype,
+                      chunk_size=flush_every + 1,  # there is one more observation than actions
+                      fill_value=fill_value)
                 
                 
 def _aux_one_process_parrallel(
@@ -49,15 +64,26 @@ def _aux_one_process_parrallel(
     add_nb_highres_sim=False,
     init_states=None,
     reset_options=None,
+    add_timings=False,
+    env_agent=None,
+    setup_start=None,
 ):
-    """this is out of the runner, otherwise it does not work on windows / macos"""
+    """this is out of the runner, otherwise it does not work on windows / macos
+    
+    If `env_agent` is provided, this environment and this agent are used (and not closed) instead of
+    new ones being created for each episode."""
     parameters = copy.deepcopy(runner.parameters)
     nb_episode_this_process = len(episode_this_process)
     res = [(None, None, None) for _ in range(nb_episode_this_process)]
     for i, ep_id in enumerate(episode_this_process):
         # `ep_id`: grid2op id of the episode i want to play
         # `i`: my id of the episode played (0, 1, ... episode_this_process)
-        env, agent = runner._new_env(parameters=parameters)
+        if setup_start is None or i > 0:
+            setup_start = time.perf_counter()
+        if env_agent is None:
+            env, agent = runner._new_env(parameters=parameters)
+        else:
+            env, agent = env_agent
         try:
             env_seed = None
             if env_seeds is not None:
@@ -87,22 +113,80 @@ def _aux_one_process_parrallel(
                 agent_seed=agt_seed,
                 detailed_output=add_detailed_output,
                 use_compact_episode_data=runner.use_compact_episode_data,
+                episode_storage_format=runner.episode_storage_format,
+                episode_flush_every=runner.episode_flush_every,
                 init_state=init_state,
-                reset_option=reset_option
+                reset_option=reset_option,
+                add_timings=add_timings,
+                setup_start=setup_start,
             )
-            (name_chron, cum_reward, nb_time_step, max_ts, episode_data, nb_highres_sim)  = tmp_
+            (name_chron, cum_reward, nb_time_step, max_ts, episode_data, nb_highres_sim, timings)  = tmp_
             id_chron = env.chronics_handler.get_id()
             res[i] = (id_chron, name_chron, float(cum_reward), nb_time_step, max_ts)
             
             if add_detailed_output:
                 res[i] = (*res[i], episode_data)
             if add_nb_highres_sim:
-                res[i] = (*res[i], nb_highres_sim)                
+                res[i] = (*res[i], nb_highres_sim)
+            if add_timings:
+                res[i] = (*res[i], timings)
         finally:
-            env.close()
+            if env_agent is None:
+                env.close()
     return res
 
 
+# runner (and arguments common to all the episodes) used by the process of the pool
+# (set by `_aux_init_worker` when the process starts)
+_WORKER_RUNNER = None
+_WORKER_KWARGS = None
+# environment and agent of the process of the pool (when `runner.reuse_env` is True)
+_WORKER_ENV_AGENT = None
+
+
+def _aux_init_worker(runner, kwargs):
+    """this is out of the runner, otherwise it does not work on windows / macos"""
+    global _WORKER_RUNNER, _WORKER_KWARGS, _WORKER_ENV_AGENT
+    _WORKER_RUNNER = runner
+    _WORKER_KWARGS = kwargs
+    _WORKER_ENV_AGENT = None
+    # the environment reused by this process is closed when the pool ends
+    multiprocessing.util.Finalize(None, _aux_close_worker_env, exitpriority=10)
+
+
+def _aux_close_worker_env():
+    global _WORKER_ENV_AGENT
+    if _WORKER_ENV_AGENT is not None:
+        env, _ = _WORKER_ENV_AGENT
+        _WORKER_ENV_AGENT = None
+        env.close()
+
+
+def _aux_run_one_task(task):
+    """run one episode in a process of the pool (see `_aux_init_worker`),
+    `task` is `(episode_idx, ep_id, env_seed, agent_seed, init_state, reset_option)`"""
+    global _WORKER_ENV_AGENT
+    episode_idx, ep_id, env_seed, agent_seed, init_state, reset_option = task
+    setup_start = time.perf_counter()
+    if _WORKER_RUNNER.reuse_env and _WORKER_ENV_AGENT is None:
+        # the environment and the agent are built for the first episode played by this process
+        # and then used for all the others
+        _WORKER_ENV_AGENT = _WORKER_RUNNER._new_env(parameters=copy.deepcopy(_WORKER_RUNNER.parameters))
+    res = _aux_one_process_parrallel(
+        _WORKER_RUNNER,
+        [ep_id],
+        episode_idx,
+        env_seeds=[env_seed],
+        agent_seeds=[agent_seed],
+        init_states=[init_state],
+        reset_options=[reset_option],
+        env_agent=_WORKER_ENV_AGENT,
+        setup_start=setup_start,
+        **_WORKER_KWARGS
+    )
+    return episode_idx, res[0]
+
+
 def _aux_run_one_episode(
     env: Environment,
     agent: BaseAgent,
@@ -117,7 +201,13 @@ def _aux_run_one_episode(
     use_compact_episode_data=False,
     init_state=None,
     reset_option=None,
+    add_timings=False,
+    episode_storage_format="npz",
+    episode_flush_every=None,
+    setup_start=None,
 ):
+    if setup_start is None:
+        setup_start = time.perf_counter()
     done = False
     time_step = int(0)
     time_act = 0.0
@@ -156,10 +246,18 @@ def _aux_run_one_episode(
     # reset the number of calls to high resolution simulator
     env._highres_sim_counter._HighResSimCounter__nb_highres_called = 0
     
+    # only the steps of this episode are profiled
+    # (the environment can be reused from a previous run with other settings)
+    env.enable_timings(add_timings)
+    env.reset_timings()
+    
     # seed and reset the agent
     if agent_seed is not None:
         agent.seed(agent_seed)
     agent.reset(obs)
+    setup_time = time.perf_counter() - setup_start
+    if add_timings:
+        env._timings.record("setup", setup_time)
 
     # compute the size and everything if it needs to be stored
     nb_timestep_max = env.chronics_handler.max_timestep()
@@ -179,30 +277,37 @@ def _aux_run_one_episode(
             (1, env._oppSpace.action_space.size()), fill_value=0.0, dtype=dt_float
         )
         
+        flush_every = None
+        episode_path = None
+        if efficient_storing and path_save is not None and episode_flush_every is not None:
+            # the largest arrays are written on the hard drive during the episode
+            flush_every = int(episode_flush_every)
+            episode_path = os.path.join(os.path.abspath(path_save), env.chronics_handler.get_name())
+            os.makedirs(episode_path, exist_ok=True)
+        
         if efficient_storing:
             times = np.full(nb_timestep_max, fill_value=np.NaN, dtype=dt_float)
             rewards = np.full(nb_timestep_max, fill_value=np.NaN, dtype=dt_float)
-            actions = np.full(
-                (nb_timestep_max, env.action_space.n), fill_value=np.NaN, dtype=dt_float
-            )
-            env_actions = np.full(
-                (nb_timestep_max, env._helper_action_env.n),
-                fill_value=np.NaN,
-                dtype=dt_float,
-            )
-            observations = np.full(
-                (nb_timestep_max + 1, env.observation_space.n),
-                fill_value=np.NaN,
-                dtype=dt_float,
-            )
-            disc_lines = np.full(
-                (nb_timestep_max, env.backend.n_line), fill_value=np.NaN, dtype=dt_bool
-            )
-            attack = np.full(
-                (nb_timestep_max, env._opponent_action_space.n),
-                fill_value=0.0,
-                dtype=dt_float,
-            )
+            actions = _aux_make_array(episode_path, flush_every, EpisodeData.ACTIONS_FILE,
+                                      (nb_timestep_max, env.action_space.n),
+                                      fill_value=np.NaN,
+                                      dtype=dt_float)
+            env_actions = _aux_make_array(episode_path, flush_every, EpisodeData.ENV_ACTIONS_FILE,
+                                          (nb_timestep_max, env._helper_action_env.n),
+                                          fill_value=np.NaN,
+                                          dtype=dt_float)
+            observations = _aux_make_array(episode_path, flush_every, EpisodeData.OBSERVATIONS_FILE,
+                                           (nb_timestep_max + 1, env.observation_space.n),
+                                           fill_value=np.NaN,
+                                           dtype=dt_float)
+            disc_lines = _aux_make_array(episode_path, flush_every, EpisodeData.LINES_FAILURES,
+                                         (nb_timestep_max, env.backend.n_line),
+                                         fill_value=np.NaN,
+                                         dtype=dt_bool)
+            attack = _aux_make_array(episode_path, flush_every, EpisodeData.ATTACK,
+                                     (nb_timestep_max, env._opponent_action_space.n),
+                                     fill_value=0.0,
+                                     dtype=dt_float)
             legal = np.full(nb_timestep_max, fill_value=True, dtype=dt_bool)
             ambiguous = np.full(nb_timestep_max, fill_value=False, dtype=dt_bool)
         else:
@@ -252,11 +357,13 @@ def _aux_run_one_episode(
             legal=legal,
             ambiguous=ambiguous,
             has_legal_ambiguous=True,
+            storage_format=episode_storage_format,
+            flush_every=flush_every,
         )
         if need_store_first_act:
             # I need to manually force in the first observation (otherwise it's not computed)
             episode.observations.objects[0] = episode.observations.helper.from_vect(
-                observations[time_step, :]
+                obs.to_vect()
             )
         episode.set_parameters(env)
 
@@ -313,6 +420,7 @@ def _aux_run_one_episode(
     if not use_compact_episode_data:
         episode.set_meta(env, time_step, float(cum_reward), env_seed, agent_seed)
     li_text = [
+        "Setup (env + agent): {:.2f}s",
         "Env: {:.2f}s",
         "\t - apply act {:.2f}s",
         "\t - run pf: {:.2f}s",
@@ -324,6 +432,7 @@ def _aux_run_one_episode(
     msg_ = "\n".join(li_text)
     logger.info(
         msg_.format(
+            setup_time,
             env._time_apply_act + env._time_powerflow + env._time_extract_obs,
             env._time_apply_act,
             env._time_powerflow,
@@ -343,7 +452,8 @@ def _aux_run_one_episode(
             int(time_step),
             int(max_ts),
             episode,
-            env.nb_highres_called)
+            env.nb_highres_called,
+            env.get_timings() if add_timings else None)
 
 
 def _aux_make_progress_bar(pbar, total, next_pbar):
@@ -7,6 +7,7 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
 import os
+import time
 import warnings
 import copy
 import numpy as np
@@ -21,6 +22,7 @@ from grid2op.Opponent.opponentSpace import OpponentSpace
 from grid2op.Reward import FlatReward, BaseReward
 from grid2op.Rules import AlwaysLegal
 from grid2op.Environment import Environment
+from grid2op.Environment import StepTimings
 from grid2op.Chronics import ChronicsHandler, GridStateFromFile, GridValue, MultifolderWithCache
 from grid2op.Backend import Backend, PandaPowerBackend
 from grid2op.Parameters import Parameters
@@ -39,14 +41,16 @@ from grid2op._glop_platform_info import _IS_WINDOWS, _IS_LINUX, _IS_MACOS
 from grid2op.Runner.aux_fun import (
     _aux_run_one_episode,
     _aux_make_progress_bar,
-    _aux_one_process_parrallel,
+    _aux_init_worker,
+    _aux_run_one_task,
 )
 from grid2op.Runner.basic_logger import DoNothingLog, ConsoleLog
 
 
 runner_returned_type = Union[Tuple[str, str, float, int, int],
                              Tuple[str, str, float, int, int, EpisodeData],
-                             Tuple[str, str, float, int, int, EpisodeData, int]]
+                             Tuple[str, str, float, int, int, EpisodeData, int],
+                             Tuple[str, str, float, int, int, EpisodeData, int, StepTimings]]
 
 # TODO have a vectorized implementation of everything in case the agent is able to act on multiple environment
 # at the same time. This might require a lot of work, but would be totally worth it!
@@ -396,6 +400,10 @@ class Runner(object):
         observation_bk_class=None,
         observation_bk_kwargs=None,
         mp_context=None,
+        episode_storage_format="npz",
+        episode_flush_every=None,
+        reuse_env=False,
+        warmup_fn=None,
         # experimental: whether to read from local dir or generate the classes on the fly:
         _read_from_local_dir=None,
         _is_test=False,  # TODO not implemented !!
@@ -462,6 +470,41 @@ class Runner(object):
             Whether to use :class:`grid2op.Episode.CompactEpisodeData` instead of :class:`grid2op.Episode.EpisodeData` to store 
             Episode to disk (allows it to be replayed later). Defaults to False.
 
+        episode_storage_format: ``str``, optional
+            .. versionadded:: 1.10.5
+
+            Format used by :class:`grid2op.Episode.EpisodeData` to store the episodes: "npz" (default, compressed)
+            or "npy" (uncompressed but can be memory mapped, see :class:`grid2op.Episode.EpisodeDataset`).
+            It is not used by :class:`grid2op.Episode.CompactEpisodeData`.
+
+        episode_flush_every: ``int``, optional
+            .. versionadded:: 1.10.5
+
+            If set (it requires `episode_storage_format="npy"`), the actions, observations etc. of the episodes
+            are written on the hard drive every `episode_flush_every` steps instead of being kept in memory
+            until the end of the episode. This bounds the memory used to store long episodes and the steps
+            already written can be read (with :func:`grid2op.Episode.EpisodeData.from_disk`) even if
+            the episode is not complete (for example if the process crashed).
+            It cannot be used with `use_compact_episode_data=True`.
+
+        reuse_env: ``bool``, optional
+            .. versionadded:: 1.10.5
+
+            By default (``False``) a new environment (and a new agent) is built for each episode.
+            If ``True``, they are built once per process (in the main process for a sequential run, in each
+            process of the pool when `nb_process` > 1) and reused (with `env.reset(...)` and `agent.reset(...)`)
+            for all the episodes played by this process, which avoids paying the cost of building
+            them (loading the grid, the time series, the observation backend etc.) at each episode.
+            Your agent should then be properly reset by its `agent.reset(obs)` method.
+
+        warmup_fn: ``callable``, optional
+            .. versionadded:: 1.10.5
+
+            A function called, as `warmup_fn(env, agent)`, each time the runner builds an environment and an agent
+            (so once per process if `reuse_env=True`), for example to load some data or to compile some code
+            before the first episode. It should be picklable if `nb_process` > 1. The time it takes is
+            part of the "setup" time of the episode (see `add_timings` in :func:`Runner.run`).
+
         # TODO documentation on the opponent
         # TOOD doc for the attention budget
         """
@@ -635,6 +678,26 @@ class Runner(object):
             self.logger = logger.getChild("grid2op_Runner")
 
         self.use_compact_episode_data = use_compact_episode_data
+        if episode_storage_format not in EpisodeData.STORAGE_FORMATS:
+            raise Grid2OpException(f"Unknown episode storage format \"{episode_storage_format}\", it should be "
+                                   f"one of {EpisodeData.STORAGE_FORMATS}")
+        self.episode_storage_format = episode_storage_format
+        if episode_flush_every is not None:
+            episode_flush_every = int(episode_flush_every)
+            if episode_flush_every <= 0:
+                raise Grid2OpException("`episode_flush_every` should be a positive integer.")
+            if episode_storage_format != "npy":
+                raise Grid2OpException("`episode_flush_every` can only be used with "
+                                       "`episode_storage_format=\"npy\"`.")
+            if use_compact_episode_data:
+                raise Grid2OpException("`episode_flush_every` cannot be used with "
+                                       "`use_compact_episode_data=True`.")
+        self.episode_flush_every = episode_flush_every
+        self.reuse_env = bool(reuse_env)
+        if warmup_fn is not None and not callable(warmup_fn):
+            raise Grid2OpException("`warmup_fn` should be a function taking as input an environment and an agent.")
+        self.warmup_fn = warmup_fn
+        self._reused_env_agent = None
 
         # store _parameters
         self.init_env_path = init_env_path
@@ -725,7 +788,8 @@ class Runner(object):
             pass
             with warnings.catch_warnings():
                 warnings.filterwarnings("ignore")
-                with self.init_env() as env:
+                env, self.agent = self._new_env(self.parameters, warmup=False)
+                with env:
                     bk_class = type(env.backend)
                     pass
 
@@ -753,7 +817,7 @@ class Runner(object):
             res = self.backendClass(**this_kwargs)
         return res
     
-    def _new_env(self, parameters) -> Tuple[BaseEnv, BaseAgent]:
+    def _new_env(self, parameters, warmup=True) -> Tuple[BaseEnv, BaseAgent]:
         chronics_handler = ChronicsHandler(
             chronicsClass=self.gridStateclass,
             path=self.path_chron,
@@ -815,6 +879,8 @@ class Runner(object):
                 agent = copy.copy(self.agent)
             else:
                 agent = self.agent
+        if warmup and self.warmup_fn is not None:
+            self.warmup_fn(res, agent)
         return res, agent
 
     def init_env(self) -> BaseEnv:
@@ -853,6 +919,7 @@ class Runner(object):
         add_nb_highres_sim=False,
         init_state=None,
         reset_options=None,
+        add_timings=False,
     ) -> runner_returned_type:
         """
         INTERNAL
@@ -876,6 +943,9 @@ class Runner(object):
         add_nb_highres_sim: 
             See descr. of :func:`Runner.run` method
 
+        add_timings: 
+            See descr. of :func:`Runner.run` method
+
         Returns
         -------
         TODO DEPRECATED DOC
@@ -888,8 +958,17 @@ class Runner(object):
             because there were no more data)
 
         """
+        setup_start = time.perf_counter()
         self.reset()
-        with self.init_env() as env:  
+        if self.reuse_env:
+            # environment and agent reused between episodes
+            if self._reused_env_agent is None:
+                self._reused_env_agent = self._new_env(self.parameters)
+            env, agent = self._reused_env_agent
+        else:
+            env = self.init_env()
+            agent = self.agent
+        try:
             # small piece of code to detect the 
             # episode id
             if episode_id is None:
@@ -903,7 +982,7 @@ class Runner(object):
                 indx = episode_id                      
             res = _aux_run_one_episode(
                 env,
-                self.agent,
+                agent,
                 self.logger,
                 indx,
                 path_save,
@@ -913,18 +992,28 @@ class Runner(object):
                 agent_seed=agent_seed,
                 detailed_output=detailed_output,
                 use_compact_episode_data = self.use_compact_episode_data,
+                episode_storage_format=self.episode_storage_format,
+                episode_flush_every=self.episode_flush_every,
                 init_state=init_state,
                 reset_option=reset_options,
+                add_timings=add_timings,
+                setup_start=setup_start,
             )
             if max_iter is not None:
                 env.chronics_handler._set_max_iter(-1)
             
             id_chron = env.chronics_handler.get_id()
-        # `res` here necessarily contains detailed_output and nb_highres_call  
+        finally:
+            if not self.reuse_env:
+                env.close()
+        # `res` here necessarily contains detailed_output, nb_highres_call and timings
+        *res, timings = res
         if not add_nb_highres_sim:
             res = res[:-1]
         if not detailed_output:
             res = res[:-1]
+        if add_timings:
+            res = (*res, timings)
         
         # new in 1.10.2: id_chron is computed from here
         res = (id_chron, *res)
@@ -943,6 +1032,7 @@ class Runner(object):
         add_nb_highres_sim=False,
         init_states=None,
         reset_options=None,
+        add_timings=False,
     ) -> List[runner_returned_type]:
         """
         INTERNAL
@@ -986,6 +1076,9 @@ class Runner(object):
         
         init_states: 
             see :func:`Runner.run` method
+        
+        add_timings: 
+            see :func:`Runner.run` method
 
         Returns
         -------
@@ -1031,15 +1124,7 @@ class Runner(object):
                         if KEY_TIME_SERIE_ID in reset_opt:
                             ep_id = int(reset_opt[KEY_TIME_SERIE_ID])
                             del reset_opt[KEY_TIME_SERIE_ID]
-                (
-                    id_chron,
-                    name_chron,
-                    cum_reward,
-                    nb_time_step,
-                    max_ts,
-                    episode_data,
-                    nb_call_highres_sim,
-                ) = self.run_one_episode(
+                res_ep = self.run_one_episode(
                     path_save=path_save,
                     indx=ep_id,
                     episode_id=ep_id,
@@ -1050,8 +1135,18 @@ class Runner(object):
                     detailed_output=True,
                     add_nb_highres_sim=True,
                     init_state=init_state,
-                    reset_options=reset_opt
+                    reset_options=reset_opt,
+                    add_timings=add_timings,
                 )
+                (
+                    id_chron,
+                    name_chron,
+                    cum_reward,
+                    nb_time_step,
+                    max_ts,
+                    episode_data,
+                    nb_call_highres_sim,
+                ) = res_ep[:7]
                 res[i] = (id_chron,
                           name_chron,
                           float(cum_reward),
@@ -1062,6 +1157,9 @@ class Runner(object):
                     res[i] = (*res[i], episode_data)
                 if add_nb_highres_sim:
                     res[i] = (*res[i], nb_call_highres_sim)
+                if add_timings:
+                    # the timings are returned last, only when asked for
+                    res[i] = (*res[i], res_ep[7])
                 pbar_.update(1)
         return res
 
@@ -1078,6 +1176,9 @@ class Runner(object):
         add_nb_highres_sim=False,
         init_states=None,
         reset_options=None,
+        add_timings=False,
+        pbar=False,
+        expected_lengths=None,
     ) -> List[runner_returned_type]:
         """
         INTERNAL
@@ -1086,6 +1187,11 @@ class Runner(object):
 
         This method will run in parallel, independently the nb_episode over nb_process.
 
+        .. versionchanged:: 1.10.5
+            The episodes are not split between the processes before they start: each process plays a new
+            episode as soon as it is done with the previous one (so that a process does not stay idle
+            while another one still has many episodes to play).
+
         In case the agent cannot be cloned using `copy.copy`: nb_process is set to 1
 
         Note that it restarts completely the :attr:`Runner.backend` and :attr:`Runner.env` if the computation
@@ -1123,14 +1229,23 @@ class Runner(object):
         
         init_states:
             See :func:`Runner.run` method
+        
+        add_timings:
+            See :func:`Runner.run` method
+
+        pbar:
+            See :func:`Runner.run` method (only the progress bar at the "episode" level is used)
+
+        expected_lengths:
+            See :func:`Runner.run` method
             
         Returns
         -------
         res: ``list``
             List of tuple. Each tuple having 3 elements:
 
-              - "i" unique identifier of the episode (compared to :func:`Runner.run_sequential`, the elements of the
-                returned list are not necessarily sorted by this value)
+              - "i" unique identifier of the episode (as for :func:`Runner.run_sequential`, the elements of the
+                returned list are in the same order as the episodes, even if they are not computed in this order)
               - "cum_reward" the cumulative reward obtained by the :attr:`Runner.BaseAgent` on this episode i
               - "nb_time_step": the number of time steps played in this episode.
               - "max_ts" : the maximum number of time steps of the chronics
@@ -1153,6 +1268,7 @@ class Runner(object):
             return self._run_sequential(
                 nb_episode,
                 path_save=path_save,
+                pbar=pbar,
                 env_seeds=env_seeds,
                 max_iter=max_iter,
                 agent_seeds=agent_seeds,
@@ -1160,7 +1276,8 @@ class Runner(object):
                 add_detailed_output=add_detailed_output,
                 add_nb_highres_sim=add_nb_highres_sim,
                 init_states=init_states,
-                reset_options=reset_options
+                reset_options=reset_options,
+                add_timings=add_timings,
             )
         else:
             if  self._local_dir_cls is not None:
@@ -1168,89 +1285,64 @@ class Runner(object):
             self._clean_up()
 
             nb_process = int(nb_process)
-            process_ids = [[] for i in range(nb_process)]
+            # each episode is a task, the tasks are given to the processes when they are available
+            tasks = []
             for i in range(nb_episode):
-                if episode_id is None:
-                    # user does not provide episode_id
-                    if reset_options is not None:
-                        # we copy them, because we might delete some things from them
-                        reset_options = [el.copy() for el in reset_options]  
-                        
-                        # we check if the reset_options contains the "time serie id"
-                        if KEY_TIME_SERIE_ID in reset_options[i]:
-                            this_ep_id = int(reset_options[i][KEY_TIME_SERIE_ID])
-                            del reset_options[i][KEY_TIME_SERIE_ID]
-                        else:
-                            this_ep_id = i
-                    else:
-                        this_ep_id = i
-                    process_ids[i % nb_process].append(this_ep_id)
-                else:
+                reset_option = None
+                if reset_options is not None:
+                    # we copy it because we might remove the "time serie id"
+                    # from it
+                    reset_option = reset_options[i].copy()
+                this_ep_id = i
+                if episode_id is not None:
                     # user provided episode_id, we use this one
-                    process_ids[i % nb_process].append(episode_id[i])
+                    this_ep_id = episode_id[i]
+                elif reset_option is not None and KEY_TIME_SERIE_ID in reset_option:
+                    # we check if the reset_options contains the "time serie id"
+                    this_ep_id = int(reset_option[KEY_TIME_SERIE_ID])
+                    del reset_option[KEY_TIME_SERIE_ID]
+                tasks.append((i,
+                              this_ep_id,
+                              env_seeds[i] if env_seeds is not None else None,
+                              agent_seeds[i] if agent_seeds is not None else None,
+                              init_states[i] if init_states is not None else None,
+                              reset_option))
+            if expected_lengths is not None:
+                # longest episodes first, so that no process is left with a long episode at the end
+                order = np.argsort(-np.asarray(expected_lengths, dtype=float), kind="stable")
+                tasks = [tasks[i] for i in order]
 
-            if env_seeds is None:
-                seeds_env_res = [None for _ in range(nb_process)]
-            else:
-                # split the seeds according to the process
-                seeds_env_res = [[] for _ in range(nb_process)]
-                for i in range(nb_episode):
-                    seeds_env_res[i % nb_process].append(env_seeds[i])
-
-            if agent_seeds is None:
-                seeds_agt_res = [None for _ in range(nb_process)]
-            else:
-                # split the seeds according to the process
-                seeds_agt_res = [[] for _ in range(nb_process)]
-                for i in range(nb_episode):
-                    seeds_agt_res[i % nb_process].append(agent_seeds[i])
-                    
-            if init_states is None:
-                init_states_res = [None for _ in range(nb_process)]
-            else:
-                # split the init states according to the process
-                init_states_res = [[] for _ in range(nb_process)]
-                for i in range(nb_episode):
-                    init_states_res[i % nb_process].append(init_states[i])
-
-            if reset_options is None:
-                reset_options_res = [None for _ in range(nb_process)]
-            else:
-                # split the reset options according to the process
-                reset_options_res = [[] for _ in range(nb_process)]
-                for i in range(nb_episode):
-                    reset_options_res[i % nb_process].append(reset_options[i])
-                
-            res = []
             if _IS_LINUX:
-                lists = [(self,) for _ in enumerate(process_ids)]
+                runner = self
             else:
-                lists = [(Runner(**self._get_params()),) for _ in enumerate(process_ids)]
-            for i, pn in enumerate(process_ids):
-                lists[i] = (*lists[i],
-                            pn,
-                            i,
-                            path_save,
-                            seeds_env_res[i],
-                            seeds_agt_res[i],
-                            max_iter,
-                            add_detailed_output,
-                            add_nb_highres_sim,
-                            init_states_res[i],
-                            reset_options_res[i])
+                runner = Runner(**self._get_params())
+            kwargs_worker = dict(path_save=path_save,
+                                 max_iter=max_iter,
+                                 add_detailed_output=add_detailed_output,
+                                 add_nb_highres_sim=add_nb_highres_sim,
+                                 add_timings=add_timings)
             if self._mp_context is not None:
-                with self._mp_context.Pool(nb_process) as p:
-                    tmp = p.starmap(_aux_one_process_parrallel, lists)
+                ctx = self._mp_context
+            elif get_start_method() == 'spawn':
+                # https://github.com/rte-france/Grid2Op/issues/600
+                ctx = get_context("spawn")
             else:
-                if get_start_method() == 'spawn':
-                    # https://github.com/rte-france/Grid2Op/issues/600
-                    with get_context("spawn").Pool(nb_process) as p:
-                        tmp = p.starmap(_aux_one_process_parrallel, lists)
-                else:            
-                    with Pool(nb_process) as p:
-                        tmp = p.starmap(_aux_one_process_parrallel, lists)
-            for el in tmp:
-                res += el
+                ctx = None
+            pool_cls = ctx.Pool if ctx is not None else Pool
+
+            res = [None for _ in range(nb_episode)]
+            next_pbar = [False]
+            with _aux_make_progress_bar(pbar, nb_episode, next_pbar) as pbar_:
+                with pool_cls(nb_process,
+                              initializer=_aux_init_worker,
+                              initargs=(runner, kwargs_worker)) as p:
+                    for episode_idx, el in p.imap_unordered(_aux_run_one_task, tasks, chunksize=1):
+                        # results are retrieved as soon as an episode is over
+                        res[episode_idx] = el
+                        pbar_.update(1)
+                    # let the processes exit properly (and close the environment they reused)
+                    p.close()
+                    p.join()
         return res
 
     def _get_params(self):
@@ -1293,6 +1385,10 @@ class Runner(object):
             "has_attention_budget": self._has_attention_budget,
             "logger": self.logger,
             "use_compact_episode_data": self.use_compact_episode_data,
+            "episode_storage_format": self.episode_storage_format,
+            "episode_flush_every": self.episode_flush_every,
+            "reuse_env": self.reuse_env,
+            "warmup_fn": self.warmup_fn,
             "kwargs_observation": self._kwargs_observation,
             "observation_bk_class": self._observation_bk_class,
             "observation_bk_kwargs": self._observation_bk_kwargs,
@@ -1315,7 +1411,10 @@ class Runner(object):
         close the environment if it has been created
 
         """
-        pass
+        if self._reused_env_agent is not None:
+            env, _ = self._reused_env_agent
+            self._reused_env_agent = None
+            env.close()
 
     def run(
         self,
@@ -1332,6 +1431,8 @@ class Runner(object):
         add_nb_highres_sim=False,
         init_states=None,
         reset_options=None,
+        add_timings=False,
+        expected_lengths=None,
     ) -> List[runner_returned_type]:
         """
         Main method of the :class:`Runner` class. It will either call :func:`Runner._run_sequential` if "nb_process" is
@@ -1399,6 +1500,19 @@ class Runner(object):
             Whether to add an estimated number of "high resolution simulator" called performed by the agent (either by
             obs.simulate, or by obs.get_forecast_env or by obs.get_simulator)
         
+        add_timings: ``bool``
+            (added in grid2op 1.10.5) Whether to add the detailed timings (a 
+            :class:`grid2op.Environment.StepTimings`) of the steps of each episode to the results. They
+            are computed in the process that played the episode and can be merged with 
+            :func:`grid2op.Environment.StepTimings.aggregate`.
+        
+        expected_lengths: ``list``
+            (added in grid2op 1.10.5) Only used when `nb_process` > 1. For each of the `nb_episode`, an estimation
+            of how long it will take to compute (for example the number of steps played in a previous evaluation,
+            or the number of steps of the time series). If provided, the longest episodes are started
+            first, which reduces the time during which some processes are idle at the end of the evaluation.
+            The results are returned in the same order whether it is provided or not.
+            
         init_states:
             (added in grid2op 1.10.2) Possibility to set the initial state of the powergrid (when calling `env.reset`). 
             It should either be:
@@ -1461,6 +1575,9 @@ class Runner(object):
                 if `add_detailed_output=True`
               - "add_nb_highres_sim": [Optional] The estimated number of calls to high resolution simulator made
                 by the agent. Only preset if `add_nb_highres_sim=True` in the kwargs
+              - "timings": [Optional] The :class:`grid2op.Environment.StepTimings` of this episode, only present
+                if `add_timings=True` in the kwargs. They can be merged with
+                :func:`grid2op.Environment.StepTimings.aggregate`
 
         Examples
         --------
@@ -1644,6 +1761,13 @@ class Runner(object):
                     "".format(nb_episode, len(episode_id))
                 )
 
+        if expected_lengths is not None:
+            if len(expected_lengths) != nb_episode:
+                raise RuntimeError(
+                    'You want to compute "{}" run(s) but provide only "{}" different expected lengths.'
+                    "".format(nb_episode, len(expected_lengths))
+                )
+
         if init_states is not None:
             if isinstance(init_states, (dict, BaseAction)):
                 # user provided one initial state, I copy it to all 
@@ -1724,7 +1848,8 @@ class Runner(object):
                         add_detailed_output=add_detailed_output,
                         add_nb_highres_sim=add_nb_highres_sim,
                         init_states=init_states,
-                        reset_options=reset_options
+                        reset_options=reset_options,
+                        add_timings=add_timings,
                     )
                 else:
                     if add_detailed_output and (_IS_WINDOWS or _IS_MACOS):
@@ -1744,7 +1869,8 @@ class Runner(object):
                             add_detailed_output=add_detailed_output,
                             add_nb_highres_sim=add_nb_highres_sim,
                             init_states=init_states,
-                            reset_options=reset_options
+                            reset_options=reset_options,
+                            add_timings=add_timings,
                         )
                     else:
                         self.logger.info("Parallel runner used.")
@@ -1752,6 +1878,8 @@ class Runner(object):
                             nb_episode,
                             nb_process=nb_process,
                             path_save=path_save,
+                            pbar=pbar,
+                            expected_lengths=expected_lengths,
                             env_seeds=env_seeds,
                             max_iter=max_iter,
                             agent_seeds=agent_seeds,
@@ -1759,7 +1887,8 @@ class Runner(object):
                             add_detailed_output=add_detailed_output,
                             add_nb_highres_sim=add_nb_highres_sim,
                             init_states=init_states,
-                            reset_options=reset_options
+                            reset_options=reset_options,
+                            add_timings=add_timings,
                         )
             finally:
                 self._clean_up()
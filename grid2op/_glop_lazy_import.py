@@ -0,0 +1,53 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+# this module allows to defer the import of some "heavy" third party packages (pandapower, networkx, ...)
+# until they are really used. This speeds up (by a lot) the `import grid2op` statement.
+# For the same reason, `scipy.optimize` (only needed to compute the redispatching) is imported
+# in the functions that use it.
+
+import importlib
+
+
+class LazyModule(object):
+    """
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    Stand-in for a python module that is imported only the first time one of its
+    attribute is accessed.
+
+    It is meant to be used at the top of a grid2op module, for example
+    `pp = LazyModule("pandapower")` replaces `import pandapower as pp`.
+
+    .. versionadded:: 1.10.5
+
+    """
+    def __init__(self, module_name: str):
+        self.__dict__["_lazy_module_name"] = module_name
+        self.__dict__["_lazy_module"] = None
+
+    def _lazy_load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = importlib.import_module(self.__dict__["_lazy_module_name"])
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr_nm):
+        return getattr(self._lazy_load(), attr_nm)
+
+    def __setattr__(self, attr_nm, value):
+        setattr(self._lazy_load(), attr_nm, value)
+
+    def __dir__(self):
+        return dir(self._lazy_load())
+
+    def __repr__(self):
+        if self.__dict__["_lazy_module"] is None:
+            return f"<lazy module '{self.__dict__['_lazy_module_name']}' (not loaded yet)>"
+        return repr(self.__dict__["_lazy_module"])
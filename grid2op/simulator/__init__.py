@@ -6,6 +6,8 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
-__all__ = ["Simulator"]
+__all__ = ["Simulator", "ContingencyAnalysis", "SensitivitySimulator"]
 
 from grid2op.simulator.simulator import Simulator
+from grid2op.simulator.contingencyAnalysis import ContingencyAnalysis
+from grid2op.simulator.sensitivitySimulator import SensitivitySimulator
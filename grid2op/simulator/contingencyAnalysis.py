@@ -0,0 +1,264 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+from multiprocessing import get_start_method, get_context, Pool
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from grid2op.dtypes import dt_float, dt_bool, dt_int
+from grid2op.Environment import BaseEnv
+from grid2op.Backend import Backend
+from grid2op.Observation.baseObservation import BaseObservation
+from grid2op.Exceptions import SimulatorError
+
+
+# backend used by each worker of the process pool (initialized once per process)
+_WORKER_BACKEND: Optional[Backend] = None
+
+
+def _aux_init_worker(backend: Backend) -> None:
+    global _WORKER_BACKEND
+    _WORKER_BACKEND = backend
+
+
+def _aux_compute_contingencies(backend: Backend,
+                               state_act: "grid2op.Action.CompleteAction",
+                               contingencies: List[np.ndarray],
+                               th_lim: np.ndarray,
+                               is_dc: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """compute the flows (relative to `th_lim`) after each contingency, starting from the state `state_act`"""
+    cls = type(backend)
+    rho = np.full((len(contingencies), cls.n_line), fill_value=np.NaN, dtype=dt_float)
+    converged = np.zeros(len(contingencies), dtype=dt_bool)
+    backend_action = cls.my_bk_act_class()
+    lines_disc = np.zeros(cls.n_line, dtype=dt_bool)
+    for cont_id, lines_id in enumerate(contingencies):
+        # back to the initial state
+        backend_action.reset()
+        backend_action += state_act
+        backend.apply_action(backend_action)
+
+        lines_disc[:] = False
+        lines_disc[lines_id] = True
+        backend._disconnect_lines(lines_disc)
+        try:
+            conv, _ = backend.runpf(is_dc=is_dc)
+        except Exception:
+            conv = False
+        if conv:
+            rho[cont_id] = backend.get_line_flow() / th_lim
+            converged[cont_id] = True
+    return rho, converged
+
+
+def _aux_worker_compute(state_vect: np.ndarray,
+                        contingencies: List[np.ndarray],
+                        th_lim: np.ndarray,
+                        is_dc: bool) -> Tuple[np.ndarray, np.ndarray]:
+    backend = _WORKER_BACKEND
+    state_act = type(backend)._complete_action_class()
+    state_act.from_vect(state_vect, check_legit=False)
+    return _aux_compute_contingencies(backend, state_act, contingencies, th_lim, is_dc)
+
+
+class ContingencyAnalysis(object):
+    """
+    .. versionadded:: 1.10.5
+
+    This class allows to compute the flows on all the powerlines after a (possibly large) list of contingencies
+    (*eg* all the "n-1": disconnection of each powerline one by one) starting from a given state of the grid.
+
+    Compared to using multiple :class:`grid2op.Reward.N1Reward` (or multiple `obs.simulate`) the backends are
+    copied only once (and not once per contingency) and the computation can be split across
+    multiple processes, each one of them having its own backend, initialized once and reused
+    for all subsequent calls to :func:`ContingencyAnalysis.compute`.
+
+    Each contingency is a list of powerlines disconnected at the same time.
+
+    Notes
+    -----
+    The flows are computed with the same backend as the one provided (or the one of the environment), with an AC
+    powerflow by default (or a DC one if `is_dc=True`, which is faster but less accurate).
+
+    No "protection" is simulated: powerlines are not disconnected even if they are above their thermal limits.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import grid2op
+        from grid2op.simulator import ContingencyAnalysis
+        env_name = "l2rpn_case14_sandbox"
+        env = grid2op.make(env_name)
+        obs = env.reset()
+
+        # all the "n-1" on 2 processes
+        with ContingencyAnalysis(env, nb_process=2) as cont_an:
+            rho = cont_an.compute(obs)  # shape (env.n_line, env.n_line)
+            # rho[cont_id, line_id] is the flow on `line_id` after contingency `cont_id`
+            # (NaN if the powerflow diverged for this contingency)
+            worst_contingency = rho.max(axis=1).argmax()
+
+        # you can also specify the contingencies (by id or by names, possibly multiple
+        # powerlines at the same time)
+        cont_an = ContingencyAnalysis(env, contingencies=[0, "1_3_3", [4, 5]])
+        rho = cont_an.compute(obs)  # shape (3, env.n_line)
+        cont_an.close()
+
+    """
+    def __init__(self,
+                 backend: Union[Backend, BaseEnv],
+                 contingencies: Optional[Iterable[Union[int, str, Iterable[Union[int, str]]]]] = None,
+                 nb_process: int = 1,
+                 is_dc: bool = False,
+                 mp_context=None):
+        self._backend: Optional[Backend] = None
+        self._pool = None
+        if isinstance(backend, BaseEnv):
+            backend = backend.backend
+        if not isinstance(backend, Backend):
+            raise SimulatorError(f"The \"backend\" argument should be an object "
+                                 f"of type \"Backend\" (or \"BaseEnv\") you provided {backend}")
+        if not backend._can_be_copied:
+            raise SimulatorError("Impossible to make a ContingencyAnalysis when you "
+                                 "cannot copy the backend.")
+        try:
+            nb_process = int(nb_process)
+        except (TypeError, ValueError) as exc_:
+            raise SimulatorError(f"`nb_process` should be an integer, found {nb_process}") from exc_
+        if nb_process <= 0:
+            raise SimulatorError(f"`nb_process` should be > 0, found {nb_process}")
+
+        self._backend = backend.copy()
+        self._nb_process: int = nb_process
+        self._is_dc: bool = bool(is_dc)
+        self._mp_context = mp_context
+        if contingencies is None:
+            # all "n-1"
+            contingencies = range(type(self._backend).n_line)
+        self._contingencies: List[np.ndarray] = [self._aux_get_lines_id(el) for el in contingencies]
+        self._converged: Optional[np.ndarray] = None
+
+    def _aux_get_lines_id(self, contingency) -> np.ndarray:
+        cls = type(self._backend)
+        if isinstance(contingency, (int, np.integer, str)):
+            contingency = [contingency]
+        res = []
+        for el in contingency:
+            if isinstance(el, str):
+                tmp = np.nonzero(cls.name_line == el)[0]
+                if tmp.shape[0] == 0:
+                    raise SimulatorError(f"No powerline named \"{el}\" on the grid.")
+                res.append(int(tmp[0]))
+            elif isinstance(el, (int, np.integer)):
+                if el < 0 or el >= cls.n_line:
+                    raise SimulatorError(f"Invalid powerline id {el}: it should be >= 0 and < {cls.n_line}.")
+                res.append(int(el))
+            else:
+                raise SimulatorError(f"Each contingency should be made of powerline id (int) or "
+                                     f"powerline names (str), found {el}")
+        return np.array(res, dtype=dt_int)
+
+    @property
+    def contingencies(self) -> List[np.ndarray]:
+        """The list of contingencies (each one is an array of powerline ids disconnected together)"""
+        return [el.copy() for el in self._contingencies]
+
+    @property
+    def nb_contingency(self) -> int:
+        return len(self._contingencies)
+
+    @property
+    def converged(self) -> Optional[np.ndarray]:
+        """For each contingency, whether the powerflow converged during the last call
+        to :func:`ContingencyAnalysis.compute`"""
+        return self._converged
+
+    def _get_pool(self):
+        if self._pool is None:
+            initargs = (self._backend.copy(), )
+            if self._mp_context is not None:
+                self._pool = self._mp_context.Pool(self._nb_process, _aux_init_worker, initargs)
+            elif get_start_method() == 'spawn':
+                self._pool = get_context("spawn").Pool(self._nb_process, _aux_init_worker, initargs)
+            else:
+                self._pool = Pool(self._nb_process, _aux_init_worker, initargs)
+        return self._pool
+
+    def compute(self, state: Union[BaseObservation, Backend]) -> np.ndarray:
+        """
+        Compute the flows after each contingency starting from the state `state`.
+
+        Parameters
+        ----------
+        state: Union[:class:`grid2op.Observation.BaseObservation`, :class:`grid2op.Backend.Backend`]
+            The state of the grid from which the contingencies are applied (for example the
+            observation given by the environment, or a backend on which a powerflow has been run)
+
+        Returns
+        -------
+        rho: ``np.ndarray``
+            Matrix of shape `(nb_contingency, n_line)`: `rho[cont_id, line_id]` is the flow (in A)
+            on powerline `line_id` after contingency `cont_id`, divided by its thermal limit. It
+            is `NaN` for all powerlines if the powerflow diverged for this contingency (see
+            :attr:`ContingencyAnalysis.converged`).
+
+        """
+        if self._backend is None:
+            raise SimulatorError("This ContingencyAnalysis is closed, you cannot use it anymore.")
+        if isinstance(state, BaseObservation):
+            state_act = self._backend._get_action_from_obs(state)
+            th_lim = 1.0 * state.thermal_limit
+        elif isinstance(state, Backend):
+            state_act = state.get_action_to_set()
+            th_lim = state.get_thermal_limit()
+        else:
+            raise SimulatorError(f"The state should be an observation or a backend, found {type(state)}")
+        th_lim = th_lim.astype(dt_float)
+        th_lim[th_lim <= 1] = 1  # assign 1 for the thermal limit (as in N1Reward)
+
+        nb_cont = len(self._contingencies)
+        if self._nb_process == 1 or nb_cont <= 1:
+            rho, converged = _aux_compute_contingencies(self._backend,
+                                                        state_act,
+                                                        self._contingencies,
+                                                        th_lim,
+                                                        self._is_dc)
+        else:
+            state_vect = state_act.to_vect()
+            chunks = [el for el in np.array_split(np.arange(nb_cont), self._nb_process) if el.shape[0]]
+            lists = [(state_vect,
+                      [self._contingencies[cont_id] for cont_id in chunk],
+                      th_lim,
+                      self._is_dc) for chunk in chunks]
+            tmp = self._get_pool().starmap(_aux_worker_compute, lists)
+            rho = np.concatenate([el[0] for el in tmp], axis=0)
+            converged = np.concatenate([el[1] for el in tmp], axis=0)
+        self._converged = converged
+        return rho
+
+    def close(self) -> None:
+        """Close the process pool (if any) and the backend used for the computation"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+
+    def __enter__(self) -> "ContingencyAnalysis":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        self.close()
@@ -0,0 +1,435 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from grid2op.dtypes import dt_float, dt_bool, dt_int
+from grid2op.Environment import BaseEnv
+from grid2op.Action import BaseAction
+from grid2op.Backend import Backend
+from grid2op.Observation.baseObservation import BaseObservation
+from grid2op.Exceptions import SimulatorError
+
+
+class SensitivitySimulator(object):
+    """
+    .. versionadded:: 1.10.5
+
+    This class gives a (fast) approximation of the flows on the powerlines after some actions, based on
+    the linear sensitivities of the DC approximation:
+
+    - the "PTDF" (power transfer distribution factors) give the variation of the flows after a change in the
+      injections (redispatching, curtailment, storage units, ...)
+    - the "LODF" (line outage distribution factors) give the variation of the flows after the disconnection
+      of some powerlines
+
+    Everything is computed with numpy, from the susceptance of the powerlines given once by the backend
+    (see :func:`grid2op.Backend.Backend.get_dc_line_susceptance`). Sensitivities are only re computed when
+    an action changes the topology (*eg* bus splitting or powerline reconnection). They are kept in a cache
+    (of `SensitivitySimulator.TOPO_CACHE_SIZE` topologies) so that the same topologies are not
+    factorized twice.
+
+    The variations of the flows given by the DC approximation are added to the (AC) flows of the
+    observation used to set the state of the simulator. Reactive power flows and voltages are those of this
+    observation.
+
+    It is meant to discard quickly the "bad" actions before checking the remaining ones with `obs.simulate`
+    or a :class:`grid2op.simulator.Simulator`. Unlike them, it does not take into account the
+    time (ramps, storage capacity, etc.) nor the protections.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import numpy as np
+        import grid2op
+        from grid2op.simulator import SensitivitySimulator
+        env_name = "l2rpn_case14_sandbox"
+        env = grid2op.make(env_name)
+        obs = env.reset()
+
+        sens_sim = SensitivitySimulator(env)
+        sens_sim.set_state(obs)
+
+        actions = [env.action_space({"set_line_status": [(l_id, -1)]}) for l_id in range(env.n_line)]
+        rho = sens_sim.predict(actions)  # shape (len(actions), env.n_line)
+        # and then check only the most promising ones with obs.simulate
+        best_act_id = np.nanmax(rho, axis=1).argsort()[:3]
+
+    """
+    # maximum number of topologies for which the sensitivities are kept in cache
+    TOPO_CACHE_SIZE = 16
+
+    # below this threshold an outage is considered to split the grid
+    _TOL_ISLANDING = 1e-6
+
+    def __init__(self, backend: Union[Backend, BaseEnv]):
+        if isinstance(backend, BaseEnv):
+            backend = backend.backend
+        if not isinstance(backend, Backend):
+            raise SimulatorError(f"The \"backend\" argument should be an object "
+                                 f"of type \"Backend\" (or \"BaseEnv\") you provided {backend}")
+        try:
+            self._b: np.ndarray = backend.get_dc_line_susceptance().astype(np.float64)
+        except NotImplementedError as exc_:
+            raise SimulatorError(f"Impossible to use a SensitivitySimulator with backend {type(backend)}: "
+                                 f"{exc_}") from exc_
+        cls = type(backend)
+        self._grid_cls = cls
+        self._n_bus_tot: int = cls.n_busbar_per_sub * cls.n_sub
+
+        # slack: the imbalance is shared among the generators proportionally to this
+        slack_weights = (cls.gen_pmax * cls.gen_redispatchable).astype(np.float64)
+        if slack_weights.sum() <= 0.:
+            slack_weights = np.ones(cls.n_gen, dtype=np.float64)
+        self._slack_weights: np.ndarray = slack_weights
+
+        self._topo_cache: OrderedDict = OrderedDict()
+
+        # base state (see `set_state`)
+        self._is_init: bool = False
+        self._topo: Optional[np.ndarray] = None
+        self._gen_p: Optional[np.ndarray] = None
+        self._inj: Optional[np.ndarray] = None
+        self._p_or: Optional[np.ndarray] = None
+        self._q_or: Optional[np.ndarray] = None
+        self._v_or: Optional[np.ndarray] = None
+        self._th_lim: Optional[np.ndarray] = None
+        self._dc_base: Optional[np.ndarray] = None
+        self._valid: Optional[np.ndarray] = None
+
+    def set_state(self, obs: BaseObservation) -> None:
+        """
+        Set the state (topology, injections and flows) from which the effect of the actions are computed.
+
+        Parameters
+        ----------
+        obs : :class:`grid2op.Observation.BaseObservation`
+            The observation describing the state of the grid
+
+        Raises
+        ------
+        SimulatorError
+            If the observation is not valid (game over) or if the grid is split in multiple
+            islands.
+        """
+        if not isinstance(obs, BaseObservation):
+            raise SimulatorError(f"The state should be set from an observation, found {type(obs)}")
+        if obs._is_done:
+            raise SimulatorError("Impossible to set the state of the simulator from an observation "
+                                 "corresponding to a \"game over\".")
+        cls = self._grid_cls
+        self._topo = obs.topo_vect.astype(dt_int)
+        self._gen_p = obs.gen_p.astype(np.float64)
+        inj = np.zeros(cls.dim_topo, dtype=np.float64)
+        inj[cls.load_pos_topo_vect] = -obs.load_p
+        inj[cls.gen_pos_topo_vect] = obs.gen_p
+        if cls.n_storage:
+            inj[cls.storage_pos_topo_vect] = -obs.storage_power
+        self._inj = inj
+
+        line_co = obs.line_status
+        self._p_or = np.where(line_co, obs.p_or, 0.).astype(np.float64)
+        self._q_or = np.where(line_co, obs.q_or, 0.).astype(np.float64)
+
+        # voltage of the substation (used for the powerlines disconnected in this state)
+        v_sub = np.zeros(cls.n_sub, dtype=np.float64)
+        for to_subid, v in [(cls.line_or_to_subid, obs.v_or),
+                            (cls.line_ex_to_subid, obs.v_ex),
+                            (cls.load_to_subid, obs.load_v),
+                            (cls.gen_to_subid, obs.gen_v)]:
+            np.maximum.at(v_sub, to_subid, v)
+        self._v_or = np.where(obs.v_or > 0., obs.v_or, v_sub[cls.line_or_to_subid]).astype(np.float64)
+
+        th_lim = obs.thermal_limit.astype(np.float64)
+        th_lim[th_lim <= 1.] = 1.
+        self._th_lim = th_lim
+
+        dc_base, is_ok = self._aux_dc_flows(self._topo, self._inj)
+        if not is_ok:
+            raise SimulatorError("Impossible to set the state of the simulator from a grid "
+                                 "split in multiple islands.")
+        self._dc_base = dc_base
+        self._is_init = True
+
+    def _check_init(self):
+        if not self._is_init:
+            raise SimulatorError("The simulator is not initialized. Have you used "
+                                 "`sensitivity_simulator.set_state(obs)` ?")
+
+    def _aux_get_topo_cache(self, bus_or: np.ndarray, bus_ex: np.ndarray, line_co: np.ndarray) -> Dict:
+        """compute (or retrieve from the cache) the sensitivities for the given topology"""
+        key = bus_or.tobytes() + bus_ex.tobytes() + line_co.tobytes()
+        cache = self._topo_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import connected_components
+
+        nb_bus = self._n_bus_tot
+        lines = np.nonzero(line_co)[0]
+        b = self._b[lines]
+        f_bus = bus_or[lines]
+        t_bus = bus_ex[lines]
+
+        # labels of the connected components of the buses
+        adj = csr_matrix((np.ones(lines.shape[0]), (f_bus, t_bus)), shape=(nb_bus, nb_bus))
+        _, labels = connected_components(adj, directed=False)
+
+        # susceptance matrix, one reference bus (removed) per connected component
+        bbus = np.zeros((nb_bus, nb_bus), dtype=np.float64)
+        np.add.at(bbus, (f_bus, f_bus), b)
+        np.add.at(bbus, (t_bus, t_bus), b)
+        np.add.at(bbus, (f_bus, t_bus), -b)
+        np.add.at(bbus, (t_bus, f_bus), -b)
+        _, ref_bus = np.unique(labels, return_index=True)
+        keep = np.ones(nb_bus, dtype=dt_bool)
+        keep[ref_bus] = False
+        x_mat = np.zeros((nb_bus, nb_bus), dtype=np.float64)
+        if keep.any():
+            x_mat[np.ix_(keep, keep)] = np.linalg.inv(bbus[np.ix_(keep, keep)])
+
+        ptdf = np.zeros((self._grid_cls.n_line, nb_bus), dtype=np.float64)
+        ptdf[lines] = b.reshape(-1, 1) * (x_mat[f_bus] - x_mat[t_bus])
+        res = {"ptdf": ptdf, "labels": labels}
+        if self.TOPO_CACHE_SIZE > 0:
+            cache[key] = res
+            if len(cache) > self.TOPO_CACHE_SIZE:
+                cache.popitem(last=False)
+        return res
+
+    def _aux_get_bus(self, topo: np.ndarray) -> np.ndarray:
+        """global bus id of each element (-1 if disconnected)"""
+        cls = self._grid_cls
+        return np.where(topo > 0, cls._topo_vect_to_sub + (topo - 1) * cls.n_sub, -1)
+
+    def _aux_sensitivities(self, topo: np.ndarray) -> Tuple[Dict, np.ndarray, np.ndarray, np.ndarray]:
+        cls = self._grid_cls
+        bus = self._aux_get_bus(topo)
+        bus_or = bus[cls.line_or_pos_topo_vect]
+        bus_ex = bus[cls.line_ex_pos_topo_vect]
+        line_co = (bus_or >= 0) & (bus_ex >= 0)
+        bus_or = np.where(line_co, bus_or, 0)
+        bus_ex = np.where(line_co, bus_ex, 0)
+        return self._aux_get_topo_cache(bus_or, bus_ex, line_co), bus, bus_or, bus_ex
+
+    def _aux_bus_injection(self, topo: np.ndarray, bus: np.ndarray, inj: np.ndarray) -> np.ndarray:
+        """injection at each bus, the imbalance is compensated by the generators"""
+        cls = self._grid_cls
+        elt_co = topo > 0
+        gen_co = elt_co[cls.gen_pos_topo_vect]
+        slack_w = self._slack_weights * gen_co
+        if slack_w.sum() > 0.:
+            inj = inj.copy()
+            inj[cls.gen_pos_topo_vect] -= inj[elt_co].sum() * slack_w / slack_w.sum()
+        return np.bincount(bus[elt_co], weights=inj[elt_co], minlength=self._n_bus_tot)
+
+    def _aux_is_connected(self, topo: np.ndarray, bus: np.ndarray, labels: np.ndarray) -> bool:
+        """all the (non powerline) elements should be in the same connected component"""
+        cls = self._grid_cls
+        pos = np.concatenate((cls.load_pos_topo_vect, cls.gen_pos_topo_vect, cls.storage_pos_topo_vect))
+        pos = pos[topo[pos] > 0]
+        return np.unique(labels[bus[pos]]).shape[0] <= 1
+
+    def _aux_dc_flows(self, topo: np.ndarray, inj: np.ndarray) -> Tuple[np.ndarray, bool]:
+        sens, bus, *_ = self._aux_sensitivities(topo)
+        flows = sens["ptdf"] @ self._aux_bus_injection(topo, bus, inj)
+        return flows, self._aux_is_connected(topo, bus, sens["labels"])
+
+    def _aux_apply_action(self, act: BaseAction) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """returns the topology (before the powerline disconnections), the lines disconnected and the injections"""
+        cls = self._grid_cls
+        topo = self._topo.copy()
+        if act._modif_set_bus:
+            mask = act._set_topo_vect != 0
+            topo[mask] = act._set_topo_vect[mask]
+        if act._modif_change_bus:
+            mask = act._change_bus_vect & (topo > 0)
+            topo[mask] = 3 - topo[mask]
+
+        or_pos = cls.line_or_pos_topo_vect
+        ex_pos = cls.line_ex_pos_topo_vect
+        line_co = (topo[or_pos] > 0) & (topo[ex_pos] > 0)
+        if act._modif_set_status:
+            line_co[act._set_line_status == -1] = False
+            reco = act._set_line_status == 1
+            line_co[reco] = True
+        if act._modif_change_status:
+            line_co[act._switch_line_status] = ~line_co[act._switch_line_status]
+        # powerlines reconnected without any information about the bus are connected to bus 1
+        for pos in (or_pos, ex_pos):
+            reco = line_co & (topo[pos] <= 0)
+            topo[pos[reco]] = 1
+            topo[pos[~line_co]] = -1
+
+        # the powerlines disconnected by the action are handled with the "LODF"
+        base_co = (self._topo[or_pos] > 0) & (self._topo[ex_pos] > 0)
+        lines_disc = np.nonzero(base_co & ~line_co)[0]
+        topo[or_pos[lines_disc]] = self._topo[or_pos[lines_disc]]
+        topo[ex_pos[lines_disc]] = self._topo[ex_pos[lines_disc]]
+
+        inj = self._inj
+        if act._modif_inj or act._modif_redispatch or act._modif_storage or act._modif_curtailment:
+            inj = inj.copy()
+            gen_p = self._gen_p
+            if act._modif_inj:
+                for key, pos, sign in [("prod_p", cls.gen_pos_topo_vect, 1.), ("load_p", cls.load_pos_topo_vect, -1.)]:
+                    if key in act._dict_inj:
+                        vals = act._dict_inj[key]
+                        mask = np.isfinite(vals)
+                        inj[pos[mask]] = sign * vals[mask]
+                        if key == "prod_p":
+                            gen_p = np.where(mask, vals, gen_p)
+            if act._modif_curtailment:
+                mask = act._curtail != -1.
+                inj[cls.gen_pos_topo_vect[mask]] = np.minimum(gen_p[mask], act._curtail[mask] * cls.gen_pmax[mask])
+            if act._modif_redispatch:
+                inj[cls.gen_pos_topo_vect] += act._redispatch
+            if act._modif_storage:
+                mask = act._storage_power != 0.
+                inj[cls.storage_pos_topo_vect[mask]] = -act._storage_power[mask]
+        return topo, lines_disc, inj
+
+    def predict(self, actions: Union[BaseAction, List[BaseAction]]) -> np.ndarray:
+        """
+        Estimate the flows after each action (all actions are applied on the state given to
+        :func:`SensitivitySimulator.set_state`).
+
+        Parameters
+        ----------
+        actions : Union[:class:`grid2op.Action.BaseAction`, List[:class:`grid2op.Action.BaseAction`]]
+            The action (or the list of actions) to evaluate
+
+        Returns
+        -------
+        rho: ``np.ndarray``
+            The estimated flows (in A) divided by the thermal limits, of shape `(len(actions), n_line)`.
+            Rows are `NaN` for the actions that would split the grid in multiple islands
+            (see :attr:`SensitivitySimulator.valid`).
+
+        """
+        self._check_init()
+        if isinstance(actions, BaseAction):
+            actions = [actions]
+        nb_act = len(actions)
+        cls = self._grid_cls
+        flows = np.zeros((nb_act, cls.n_line), dtype=np.float64)
+        valid = np.ones(nb_act, dtype=dt_bool)
+        line_co = np.zeros((nb_act, cls.n_line), dtype=dt_bool)
+
+        # actions with the same topology share the same sensitivities: group them
+        groups = {}
+        for act_id, act in enumerate(actions):
+            topo, lines_disc, inj = self._aux_apply_action(act)
+            key = topo.tobytes()
+            if key not in groups:
+                groups[key] = (topo, [])
+            groups[key][1].append((act_id, lines_disc, inj))
+
+        for topo, acts_info in groups.values():
+            sens, bus, bus_or, bus_ex = self._aux_sensitivities(topo)
+            ptdf = sens["ptdf"]
+            is_connected = self._aux_is_connected(topo, bus, sens["labels"])
+            act_ids = [el[0] for el in acts_info]
+            bus_inj = np.stack([self._aux_bus_injection(topo, bus, el[2]) for el in acts_info], axis=1)
+            # DC variation of the flows on top of the AC flows of the base state
+            est_flows = (ptdf @ bus_inj).T + (self._p_or - self._dc_base)
+            this_line_co = (topo[cls.line_or_pos_topo_vect] > 0) & (topo[cls.line_ex_pos_topo_vect] > 0)
+            for row, (act_id, lines_disc, _) in enumerate(acts_info):
+                line_co[act_id] = this_line_co
+                valid[act_id] = is_connected
+                this_flows = est_flows[row]
+                if lines_disc.shape[0] == 0:
+                    flows[act_id] = this_flows
+                    continue
+                # outage of the powerlines `lines_disc` with the LODF
+                h_mat = ptdf[:, bus_or[lines_disc]] - ptdf[:, bus_ex[lines_disc]]
+                m_mat = np.eye(lines_disc.shape[0]) - h_mat[lines_disc]
+                if abs(np.linalg.det(m_mat)) <= self._TOL_ISLANDING:
+                    valid[act_id] = False
+                    continue
+                flows[act_id] = this_flows + h_mat @ np.linalg.solve(m_mat, this_flows[lines_disc])
+                line_co[act_id, lines_disc] = False
+        return self._aux_to_rho(flows, line_co, valid)
+
+    def _aux_to_rho(self, flows: np.ndarray, line_co: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        flows[~line_co] = 0.
+        q_or = np.where(line_co, self._q_or, 0.)
+        a_or = 1000. * np.sqrt(flows ** 2 + q_or ** 2) / (np.sqrt(3.) * self._v_or)
+        rho = (a_or / self._th_lim).astype(dt_float)
+        rho[~valid] = np.NaN
+        self._valid = valid
+        return rho
+
+    def predict_n1(self) -> np.ndarray:
+        """
+        Estimate (with the LODF) the flows after the disconnection of each powerline, one at a time,
+        starting from the state given to :func:`SensitivitySimulator.set_state`.
+
+        It is equivalent to (but much faster than) `sensitivity_simulator.predict(actions)` where
+        `actions[l_id]` disconnects powerline `l_id`.
+
+        Returns
+        -------
+        rho: ``np.ndarray``
+            The estimated flows divided by the thermal limits, of shape `(n_line, n_line)`: `rho[l_id]`
+            gives the flows after the disconnection of powerline `l_id`. Rows are `NaN` for the
+            disconnections that would split the grid.
+        """
+        self._check_init()
+        cls = self._grid_cls
+        lodf = self.get_lodf()
+        line_co = np.tile((self._topo[cls.line_or_pos_topo_vect] > 0) & (self._topo[cls.line_ex_pos_topo_vect] > 0),
+                          (cls.n_line, 1))
+        np.fill_diagonal(line_co, False)
+        valid = np.isfinite(lodf).all(axis=0)
+        flows = self._p_or.reshape(1, -1) + np.nan_to_num(lodf.T) * self._p_or.reshape(-1, 1)
+        return self._aux_to_rho(flows, line_co, valid)
+
+    def get_ptdf(self) -> np.ndarray:
+        """
+        The PTDF of the current state: `ptdf[l_id, bus_id]` is the variation of the flow (in MW) on powerline `l_id`
+        when 1 MW is injected at bus `bus_id` (and withdrawn at the reference bus). Buses are
+        numbered as `sub_id + (local_bus - 1) * n_sub`.
+        """
+        self._check_init()
+        sens, *_ = self._aux_sensitivities(self._topo)
+        return sens["ptdf"].copy()
+
+    def get_lodf(self) -> np.ndarray:
+        """
+        The LODF of the current state: `lodf[l_id, k_id]` is the fraction of the flow of powerline `k_id` that
+        goes on powerline `l_id` when powerline `k_id` is disconnected (`NaN` if the disconnection of `k_id`
+        splits the grid, and 0 if `k_id` is already disconnected).
+        """
+        self._check_init()
+        cls = self._grid_cls
+        sens, bus, bus_or, bus_ex = self._aux_sensitivities(self._topo)
+        ptdf = sens["ptdf"]
+        h_mat = ptdf[:, bus_or] - ptdf[:, bus_ex]
+        line_co = (self._topo[cls.line_or_pos_topo_vect] > 0) & (self._topo[cls.line_ex_pos_topo_vect] > 0)
+        denom = 1. - np.diag(h_mat)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lodf = h_mat / denom.reshape(1, -1)
+        lodf[:, np.abs(denom) <= self._TOL_ISLANDING] = np.NaN
+        lodf[:, ~line_co] = 0.
+        # a powerline looses all its flow, unless it is already disconnected
+        np.fill_diagonal(lodf, np.where(line_co, -1., 0.))
+        return lodf
+
+    @property
+    def valid(self) -> Optional[np.ndarray]:
+        """For each action of the last call to :func:`SensitivitySimulator.predict` (or each contingency of the last
+        call to :func:`SensitivitySimulator.predict_n1`) whether the grid stays in one piece"""
+        return self._valid
@@ -14,8 +14,6 @@ except ImportError:
     
 import numpy as np
 import os
-from scipy.optimize import minimize
-from scipy.optimize import LinearConstraint
 
 from grid2op.dtypes import dt_float
 from grid2op.Environment import BaseEnv
@@ -312,6 +310,8 @@ class Simulator(object):
     def _adjust_controlable_gen(
         self, new_gen_p: np.ndarray, target_dispatch: np.ndarray, sum_target: float
     ) -> Optional[float]:
+        from scipy.optimize import minimize, LinearConstraint
+
         nb_dispatchable = self.current_obs.gen_redispatchable.sum()
 
         # which generators needs to be "optimized" -> the one where
@@ -583,6 +583,27 @@ class BaseTestLoadingBackendFunc(MakeBackend):
             assert not flows[i]
             assert np.sum(~flows) == 1
 
+    def test_disconnect_lines(self):
+        self.skip_if_needed()
+        mask = np.zeros(self.backend.n_line, dtype=dt_bool)
+        mask[[0, 5, self.backend.n_line - 1]] = True
+        backend_cpy = self.backend.copy()
+        backend_cpy._disconnect_lines(mask)
+        backend_ref = self.backend.copy()
+        for l_id in np.flatnonzero(mask):
+            backend_ref._disconnect_line(l_id)
+        assert np.array_equal(backend_cpy.get_line_status(), ~mask)
+        assert np.array_equal(backend_cpy.get_line_status(), backend_ref.get_line_status())
+        assert np.array_equal(backend_cpy.get_topo_vect(), backend_ref.get_topo_vect())
+        conv, *_  = backend_cpy.runpf()
+        conv_ref, *_  = backend_ref.runpf()
+        assert conv == conv_ref
+        if conv:
+            assert self.compare_vect(backend_cpy.get_line_flow(), backend_ref.get_line_flow())
+        # disconnecting nothing does nothing
+        backend_cpy._disconnect_lines(np.zeros(self.backend.n_line, dtype=dt_bool))
+        assert np.array_equal(backend_cpy.get_line_status(), ~mask)
+
     def test_donothing_action(self):
         self.skip_if_needed()
         conv, *_  = self.backend.runpf()
@@ -1758,6 +1779,11 @@ class BaseTestEnvPerformsCorrectCascadingFailures(MakeBackend):
         assert disco[self.id_first_line_disco] >= 0
         assert disco[self.id_2nd_line_disco] >= 0
         assert np.sum(disco >= 0) == 2
+        # check the information of each stage of the cascading failure
+        assert not infos[0]["line_status"][self.id_first_line_disco]
+        assert infos[0]["line_status"][self.id_2nd_line_disco]
+        assert not infos[1]["line_status"][self.id_2nd_line_disco]
+        assert np.all(infos[1]["a_or"][~infos[1]["line_status"]] == 0.)
 
     def test_nb_timestep_overflow_nodisc(self):
         # on this _grid, first line with id 18 is overheated,
@@ -1888,9 +1914,9 @@ class BaseTestEnvPerformsCorrectCascadingFailures(MakeBackend):
         assert disco[self.id_2nd_line_disco] >= 0
         assert np.sum(disco >= 0) == 2
         for i, grid_tmp in enumerate(infos):
-            assert not grid_tmp.get_line_status()[self.id_first_line_disco]
+            assert not grid_tmp["line_status"][self.id_first_line_disco]
             if i == 1:
-                assert not grid_tmp.get_line_status()[self.id_2nd_line_disco]
+                assert not grid_tmp["line_status"][self.id_2nd_line_disco]
 
 
 class BaseTestChangeBusAffectRightBus(MakeBackend):
@@ -8,6 +8,7 @@
 
 import warnings
 import unittest
+from multiprocessing import shared_memory
 from grid2op.tests.helper_path_test import *
 
 import grid2op
@@ -15,6 +16,7 @@ from grid2op.Environment import BaseMultiProcessEnvironment
 from grid2op.Environment import SingleEnvMultiProcess
 from grid2op.Environment import MultiEnvMultiProcess
 from grid2op.Observation import CompleteObservation
+from grid2op.Exceptions import MultiEnvException
 import pdb
 
 
@@ -174,5 +176,188 @@ class TestMultiEnvMultiProcess(unittest.TestCase):
                 assert np.any(seeds_1 != seeds_2)
 
 
+class TestSharedMemoryMultiProcess(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("rte_case5_example", test=True, _add_to_name=type(self).__name__)
+        self.nb_env = 2
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_make(self, use_shared_memory, obs_as_class=True):
+        self.env.seed(0)
+        return SingleEnvMultiProcess(env=self.env, nb_env=self.nb_env,
+                                     obs_as_class=obs_as_class,
+                                     use_shared_memory=use_shared_memory)
+
+    def test_same_as_pipe(self):
+        multi_envs_ref = self._aux_make(False, obs_as_class=False)
+        multi_envs = self._aux_make(True, obs_as_class=False)
+        assert multi_envs.use_shared_memory
+        assert not multi_envs_ref.use_shared_memory
+        obss = multi_envs.reset()
+        obss_ref = multi_envs_ref.reset()
+        assert obss.shape == (self.nb_env, self.env.observation_space.size())
+        assert np.array_equal(obss, obss_ref)
+        acts = [self.env.action_space({"set_line_status": [(0, -1)]}),
+                self.env.action_space()]
+        for _ in range(3):
+            obss, rews, dones, infos = multi_envs.step(acts)
+            obss_ref, rews_ref, dones_ref, infos_ref = multi_envs_ref.step(acts)
+            assert np.array_equal(obss, obss_ref)
+            assert np.array_equal(rews, rews_ref)
+            assert np.array_equal(dones, dones_ref)
+            for info, info_ref in zip(infos, infos_ref):
+                for key in ["is_illegal", "is_ambiguous", "is_dispatching_illegal", "is_illegal_reco"]:
+                    assert info[key] == info_ref[key], f"error for {key}"
+                assert np.array_equal(info["disc_lines"], info_ref["disc_lines"])
+                assert len(info["exception"]) == len(info_ref["exception"])
+        # the observations are views on the shared memory
+        del obss
+        multi_envs.close()
+        multi_envs_ref.close()
+
+    def test_obs_as_class(self):
+        multi_envs = self._aux_make(True)
+        obss = multi_envs.reset()
+        for ob in obss:
+            assert isinstance(ob, CompleteObservation)
+        obss, rews, dones, infos = multi_envs.step(
+            [self.env.action_space() for _ in range(multi_envs.nb_env)]
+        )
+        for ob in obss:
+            assert isinstance(ob, CompleteObservation)
+        sim_obss, sim_rs, sim_ds, sim_is = multi_envs.simulate(
+            [self.env.action_space() for _ in range(multi_envs.nb_env)]
+        )
+        for ob in sim_obss:
+            assert isinstance(ob, CompleteObservation)
+        multi_envs.close()
+
+    def test_close_with_views(self):
+        multi_envs = self._aux_make(True, obs_as_class=False)
+        obss = multi_envs.reset()
+        obss_ref = obss.copy()
+        shm_name = multi_envs._shm.name
+        # obss is a view on the shared memory
+        with self.assertWarns(UserWarning):
+            multi_envs.close()
+        assert np.array_equal(obss, obss_ref)
+        # the memory block is still destroyed
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=shm_name)
+        del obss
+
+
+class TestAsyncMultiProcess(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("rte_case5_example", test=True, _add_to_name=type(self).__name__)
+        self.nb_env = 3
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_make(self, use_shared_memory=False):
+        self.env.seed(0)
+        return SingleEnvMultiProcess(env=self.env, nb_env=self.nb_env,
+                                     obs_as_class=False,
+                                     use_shared_memory=use_shared_memory)
+
+    def _aux_test_same_as_step(self, use_shared_memory):
+        multi_envs_ref = self._aux_make()
+        multi_envs = self._aux_make(use_shared_memory)
+        multi_envs.reset()
+        multi_envs_ref.reset()
+        acts = [self.env.action_space() for _ in range(self.nb_env)]
+        for _ in range(3):
+            obss_ref, rews_ref, dones_ref, infos_ref = multi_envs_ref.step(acts)
+            multi_envs.step_async(acts)
+            obss, rews, dones, infos = multi_envs.step_wait()
+            assert np.array_equal(obss, obss_ref)
+            assert np.array_equal(rews, rews_ref)
+            assert np.array_equal(dones, dones_ref)
+        # the observations can be views on the shared memory
+        del obss
+        multi_envs.close()
+        multi_envs_ref.close()
+
+    def test_same_as_step(self):
+        self._aux_test_same_as_step(False)
+
+    def test_same_as_step_shm(self):
+        self._aux_test_same_as_step(True)
+
+    def _aux_test_subset(self, use_shared_memory):
+        multi_envs_ref = self._aux_make()
+        multi_envs = self._aux_make(use_shared_memory)
+        multi_envs.reset()
+        multi_envs_ref.reset()
+        acts = [self.env.action_space() for _ in range(self.nb_env)]
+        obss_ref, rews_ref, dones_ref, infos_ref = multi_envs_ref.step(acts)
+
+        # only 2 envs
+        multi_envs.step_async(acts[:2], env_ids=[2, 0])
+        ready_ids = multi_envs.poll(timeout=None)
+        assert len(ready_ids) >= 1
+        assert set(ready_ids).issubset({0, 2})
+        obss, rews, dones, infos = multi_envs.step_wait(env_ids=[0, 2])
+        assert obss.shape[0] == 2
+        assert np.array_equal(obss, obss_ref[[0, 2]])
+        assert np.array_equal(rews, rews_ref[[0, 2]])
+        assert len(infos) == 2
+
+        # the last one
+        multi_envs.step_async(acts[:1], env_ids=[1])
+        obss, rews, dones, infos = multi_envs.step_wait(timeout=60.)
+        assert obss.shape[0] == 1
+        assert np.array_equal(obss[0], obss_ref[1])
+        assert len(multi_envs.poll()) == 0
+        multi_envs.close()
+        multi_envs_ref.close()
+
+    def test_subset(self):
+        self._aux_test_subset(False)
+
+    def test_subset_shm(self):
+        self._aux_test_subset(True)
+
+    def test_errors(self):
+        multi_envs = self._aux_make()
+        multi_envs.reset()
+        acts = [self.env.action_space() for _ in range(self.nb_env)]
+        with self.assertRaises(MultiEnvException):
+            # nothing to wait for
+            multi_envs.step_wait()
+        with self.assertRaises(MultiEnvException):
+            # wrong number of actions
+            multi_envs.step_async(acts[:2])
+        with self.assertRaises(MultiEnvException):
+            # wrong env id
+            multi_envs.step_async(acts[:1], env_ids=[self.nb_env])
+        multi_envs.step_async(acts[:1], env_ids=[1])
+        with self.assertRaises(MultiEnvException):
+            # already busy
+            multi_envs.step_async(acts)
+        with self.assertRaises(MultiEnvException):
+            # not possible to reset while a step is computed
+            multi_envs.reset()
+        with self.assertRaises(MultiEnvException):
+            # env 0 is not busy
+            multi_envs.step_wait(env_ids=[0])
+        multi_envs.step_wait()
+        multi_envs.reset()
+        # closing while a step is being computed is possible
+        multi_envs.step_async(acts)
+        multi_envs.close()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1081,6 +1081,104 @@ class TestBasisObsBehaviour(unittest.TestCase):
         assert np.all(mat2.todense() == mat4.todense())
         assert np.all(mat1 == mat2.todense())
 
+    def test_topo_cache(self):
+        """test the graph structures are shared between observations with the same topology"""
+        obs = self.env.observation_space(self.env)
+        type(obs)._topo_cache = None
+        mat1 = obs.connectivity_matrix(as_csr_matrix=True)
+        bus_mat1 = obs.bus_connectivity_matrix(as_csr_matrix=True)
+        flow_mat1, (load1, *_) = obs.flow_bus_matrix()
+        assert len(type(obs)._topo_cache) == 1
+        # modifying the results does not modify the cache
+        mat1.data[:] = 2.0
+        bus_mat1.data[:] = 2.0
+        load1[:] = -2
+
+        obs2 = obs.copy()
+        obs2._connectivity_matrix_ = None
+        obs2._bus_connectivity_matrix_ = None
+        mat2 = obs2.connectivity_matrix(as_csr_matrix=True)
+        bus_mat2 = obs2.bus_connectivity_matrix(as_csr_matrix=True)
+        flow_mat2, (load2, *_) = obs2.flow_bus_matrix()
+        assert len(type(obs)._topo_cache) == 1
+        assert np.all(mat2.data == 1.0)
+        assert np.all(bus_mat2.data == 1.0)
+        assert np.all(load2 >= 0)
+        assert np.all(flow_mat1 == flow_mat2)
+
+        # another topology
+        obs2.topo_vect[obs2.load_pos_topo_vect[0]] = 2
+        obs2._connectivity_matrix_ = None
+        mat3 = obs2.connectivity_matrix()
+        assert len(type(obs)._topo_cache) == 2
+        assert mat3[obs2.load_pos_topo_vect[0]].sum() == 1.0
+
+        # cache can be deactivated
+        type(obs).TOPO_CACHE_SIZE = 0
+        try:
+            type(obs)._topo_cache = None
+            obs._connectivity_matrix_ = None
+            mat4 = obs.connectivity_matrix(as_csr_matrix=True)
+            assert len(type(obs)._topo_cache) == 0
+            assert np.all(mat4.todense() == mat2.todense())
+        finally:
+            del type(obs).TOPO_CACHE_SIZE
+
+    def test_topo_cache_threads(self):
+        """test the topology cache can be used by different threads"""
+        from concurrent.futures import ThreadPoolExecutor
+        obs = self.env.observation_space(self.env)
+        cls = type(obs)
+        cls.TOPO_CACHE_SIZE = 2
+        try:
+            cls._topo_cache = None
+            obss = []
+            for load_id in range(4):
+                obs_ = obs.copy()
+                obs_.topo_vect[obs_.load_pos_topo_vect[load_id]] = 2
+                obss.append(obs_)
+            refs = [obs_._aux_build_conn_mat_csr().todense() for obs_ in obss]
+
+            def _aux_conn_mat(obs_id):
+                res = []
+                for _ in range(50):
+                    obs_ = obss[obs_id].copy()
+                    obs_._connectivity_matrix_ = None
+                    res.append(np.array_equal(obs_.connectivity_matrix(), refs[obs_id]))
+                return all(res)
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                assert all(executor.map(_aux_conn_mat, range(4)))
+            assert len(cls._topo_cache) <= 2
+        finally:
+            del cls.TOPO_CACHE_SIZE
+
+    def test_conn_mat_random_topo(self):
+        """test the connectivity matrix against a naive implementation for different topologies"""
+        obs = self.env.observation_space(self.env)
+        cls = type(obs)
+        rng = np.random.default_rng(0)
+        for _ in range(10):
+            obs.topo_vect[:] = rng.choice([-1, 1, 2], size=obs.dim_topo, p=[0.1, 0.6, 0.3])
+            obs.line_status[:] = ((obs.topo_vect[cls.line_or_pos_topo_vect] != -1) &
+                                  (obs.topo_vect[cls.line_ex_pos_topo_vect] != -1))
+            obs._connectivity_matrix_ = None
+            mat = obs.connectivity_matrix()
+            ref_mat = np.zeros((obs.dim_topo, obs.dim_topo), dtype=dt_float)
+            for el1 in range(obs.dim_topo):
+                for el2 in range(obs.dim_topo):
+                    if obs.topo_vect[el1] == -1 or obs.topo_vect[el2] == -1:
+                        continue
+                    if (cls._topo_vect_to_sub[el1] == cls._topo_vect_to_sub[el2] and
+                        obs.topo_vect[el1] == obs.topo_vect[el2]):
+                        ref_mat[el1, el2] = 1.0
+            for l_id in np.flatnonzero(obs.line_status):
+                ref_mat[cls.line_or_pos_topo_vect[l_id], cls.line_ex_pos_topo_vect[l_id]] = 1.0
+                ref_mat[cls.line_ex_pos_topo_vect[l_id], cls.line_or_pos_topo_vect[l_id]] = 1.0
+            assert np.array_equal(mat, ref_mat)
+            obs._connectivity_matrix_ = None
+            assert np.array_equal(obs.connectivity_matrix(as_csr_matrix=True).todense(), ref_mat)
+
     def test_networkx_graph(self):
         obs = self.env.observation_space(self.env)
         graph = obs.get_energy_graph()
@@ -13,7 +13,9 @@ import numpy as np
 
 from grid2op import make
 
+from grid2op.Action import PlayableAction
 from grid2op.Backend import PandaPowerBackend
+from grid2op.Exceptions import BackendError
 
 from grid2op.tests.helper_path_test import HelperTests
 from grid2op.tests.BaseBackendTest import BaseTestNames
@@ -203,5 +205,70 @@ class TestChangeBusAffectRightBus2(unittest.TestCase):
         assert env.backend._grid["trafo"]["hv_bus"][2] == 4
 
 
+class TestResultsExtraction(unittest.TestCase):
+    """check the results read with numpy indexing match the pandapower result tables"""
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = make('educ_case14_storage', test=True, backend=PandaPowerBackend(),
+                            action_class=PlayableAction, _add_to_name=type(self).__name__)
+        self.env.reset(seed=0, options={"time serie id": 0})
+        # have some elements on bus 2
+        obs, reward, done, info = self.env.step(
+            self.env.action_space({"set_bus": {"substations_id": [(5, (1, 1, 2, 2, 1, 2, 2, 1))]}})
+        )
+        assert not done
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_ac(self):
+        backend = self.env.backend
+        grid = backend._grid
+        conv, exc_ = backend.runpf(is_dc=False)
+        assert conv
+        p_or_ref = np.concatenate((grid.res_line["p_from_mw"].values, grid.res_trafo["p_hv_mw"].values))
+        a_ex_ref = np.concatenate((grid.res_line["i_to_ka"].values, grid.res_trafo["i_lv_ka"].values)) * 1000.
+        assert np.allclose(backend.p_or, p_or_ref)
+        assert np.allclose(backend.a_ex, a_ex_ref)
+        load_v_ref = grid.res_bus.loc[grid.load["bus"].values]["vm_pu"].values * backend.load_pu_to_kv
+        assert np.allclose(backend.load_v, load_v_ref)
+        storage_theta_ref = grid.res_bus.loc[grid.storage["bus"].values]["va_degree"].values
+        assert np.allclose(backend.storage_theta, storage_theta_ref)
+        assert np.allclose(backend.prod_q[:-1], grid.res_gen["q_mvar"].values[:-1])
+
+    def test_missing_column(self):
+        backend = self.env.backend
+        grid = backend._grid
+        grid.res_line = grid.res_line.drop(columns=["p_from_mw"])
+        with self.assertRaises(BackendError):
+            backend._aux_get_res_plan()
+
+    def test_missing_bus(self):
+        backend = self.env.backend
+        grid = backend._grid
+        bus_id = grid.load["bus"].iat[0]
+        grid.res_bus = grid.res_bus.drop(index=[bus_id])
+        # the results of another bus are not used instead
+        with self.assertRaises(BackendError):
+            backend._loads_info()
+
+    def test_dc_load_v(self):
+        backend = self.env.backend
+        cls = type(backend)
+        conv, exc_ = backend.runpf(is_dc=True)
+        assert conv
+        # reference: the first generator on the same bus as the load, if any
+        load_v_ref = 1.0 * backend.load_pu_to_kv
+        for l_id in range(cls.n_load):
+            for g_id in (cls.gen_to_subid == cls.load_to_subid[l_id]).nonzero()[0]:
+                if (backend._topo_vect[cls.load_pos_topo_vect[l_id]] == 
+                    backend._topo_vect[cls.gen_pos_topo_vect[g_id]]):
+                    load_v_ref[l_id] = backend.prod_v[g_id]
+                    break
+        assert np.allclose(backend.load_v, load_v_ref)
+        assert (backend.load_v != backend.load_pu_to_kv).any()
+
+
 if __name__ == "__main__":
     unittest.main()
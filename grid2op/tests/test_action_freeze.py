@@ -0,0 +1,116 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Converter import IdToAct
+from grid2op.Exceptions import AmbiguousAction
+
+
+class TestActionFreeze(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox",
+                                    test=True,
+                                    _add_to_name=type(self).__name__)
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.obs = self.env.reset()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_cannot_modify(self):
+        act = self.env.action_space({"set_line_status": [(0, -1)]})
+        assert not act.is_frozen
+        assert act.freeze() is act
+        assert act.is_frozen
+        with self.assertRaises(AmbiguousAction):
+            act.update({"set_line_status": [(1, -1)]})
+        with self.assertRaises(AmbiguousAction):
+            act += self.env.action_space({"set_line_status": [(1, -1)]})
+        with self.assertRaises(AmbiguousAction):
+            act.reset()
+        with self.assertRaises(AmbiguousAction):
+            act.from_vect(act.to_vect())
+        with self.assertRaises(Exception):
+            act.line_set_status = [(1, -1)]
+        assert act == self.env.action_space({"set_line_status": [(0, -1)]})
+
+        # copies can be modified
+        act_cpy = act.copy()
+        assert not act_cpy.is_frozen
+        act_cpy.update({"set_line_status": [(1, -1)]})
+        assert act_cpy != act
+
+    def test_cache(self):
+        act = self.env.action_space({"set_bus": {"lines_or_id": [(0, -1)],
+                                                 "substations_id": [(5, [1, 1, 2, 2, 1, 2, 2])]}})
+        act_ref = act.copy()
+        act.freeze()
+        assert act.is_ambiguous() == act_ref.is_ambiguous()
+        line_status = self.obs.line_status.copy()
+        for status in [None, line_status, ~line_status]:
+            lines_impacted, subs_impacted = act.get_topological_impact(status)
+            lines_ref, subs_ref = act_ref.get_topological_impact(status)
+            assert np.array_equal(lines_impacted, lines_ref)
+            assert np.array_equal(subs_impacted, subs_ref)
+            # cached result
+            lines_impacted2, _ = act.get_topological_impact(status)
+            assert lines_impacted2 is lines_impacted
+
+        act = self.env.action_space({"set_line_status": [(0, -1)], "change_line_status": [0]}).freeze()
+        ambiguous, except_ = act.is_ambiguous()
+        assert ambiguous
+        assert isinstance(except_, AmbiguousAction)
+
+    def test_idtoact(self):
+        converter = IdToAct(self.env.action_space)
+        converter.init_converter()
+        assert all(act.is_frozen for act in converter.all_actions)
+
+        env_ref = self.env.copy()
+        for act_id in [0, 1, 42, 100, converter.n - 1]:
+            act = converter.convert_act(act_id)
+            obs, reward, done, info = self.env.step(act)
+            obs_ref, reward_ref, done_ref, info_ref = env_ref.step(act.copy())
+            assert obs == obs_ref
+            assert reward == reward_ref
+            assert done == done_ref
+            assert info["is_illegal"] == info_ref["is_illegal"]
+            assert info["is_ambiguous"] == info_ref["is_ambiguous"]
+            if done:
+                break
+        env_ref.close()
+
+    def test_storage_redisp(self):
+        # the environment temporarily modifies the redispatching and the storage of the action
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make("educ_case14_storage", test=True, _add_to_name=type(self).__name__)
+        act = env.action_space({"redispatch": [(0, 1.)], "set_storage": [(0, 2.)]})
+        act_ref = act.copy()
+        act.freeze()
+        env.seed(0)
+        env.set_id(0)
+        env.reset()
+        obs, reward, done, info = env.step(act)
+        assert not info["is_ambiguous"]
+        assert not info["is_illegal"]
+        assert act == act_ref
+        assert np.allclose(obs.target_dispatch, act_ref.redispatch)
+        env.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+
+from grid2op.tests.helper_path_test import *
+
+import grid2op
+from grid2op.Chronics import FromHandlers, FromNPY
+from grid2op.Chronics.handlers import (CSVHandler,
+                                       CSVForecastHandler,
+                                       CSVMaintenanceHandler,
+                                       NoisyForecastHandler)
+from grid2op.Exceptions import ChronicsError
+from grid2op.Parameters import Parameters
+
+
+class TestChronicsSeek(unittest.TestCase):
+    """test that seeking in the time series gives the same data as reading all the steps"""
+    def setUp(self) -> None:
+        self.env_path = os.path.join(PATH_DATA_TEST, "env_14_test_maintenance")
+        self.param = Parameters()
+        self.param.NO_OVERFLOW_DISCONNECTION = True
+        self.nb_skip = 100
+
+    def _aux_make(self, **kwargs):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make(self.env_path,
+                               test=True,
+                               param=self.param,
+                               _add_to_name=type(self).__name__,
+                               **kwargs)
+            # "set_id" warns for the time series without multiple folders (eg FromNPY)
+            env.set_id(0)
+        env.seed(0)
+        env.reset()
+        return env
+
+    def _aux_get_data(self, env):
+        data = env.chronics_handler.real_data
+        if hasattr(data, "data"):
+            # multi folder
+            data = data.data
+        return data
+
+    def _aux_compare_next(self, data_ref, data):
+        dt_ref, res_ref, *arrays_ref = data_ref.load_next()
+        dt, res, *arrays = data.load_next()
+        assert dt == dt_ref
+        assert data.curr_iter == data_ref.curr_iter
+        for key in ["injection", "maintenance", "hazards"]:
+            assert (key in res) == (key in res_ref), f"error for {key}"
+        for key, val in res_ref["injection"].items():
+            assert np.array_equal(val, res["injection"][key]), f"error for {key}"
+        if "maintenance" in res_ref:
+            assert np.array_equal(res_ref["maintenance"], res["maintenance"])
+        for arr_ref, arr in zip(arrays_ref, arrays):
+            if arr_ref is None:
+                assert arr is None
+            else:
+                assert np.array_equal(arr_ref, arr)
+        for (dt_ref, for_ref), (dt, for_) in zip(data_ref.forecasts(), data.forecasts()):
+            assert dt == dt_ref
+            for key, val in for_ref.get("injection", {}).items():
+                assert np.array_equal(val, for_["injection"][key]), f"error for forecast {key}"
+
+    def _aux_test_seek(self, env_ref, env):
+        data_ref = self._aux_get_data(env_ref)
+        data = self._aux_get_data(env)
+        # read the steps one by one for the reference
+        for _ in range(self.nb_skip):
+            data_ref.load_next()
+            data_ref.forecasts()
+        data.seek(data.curr_iter + self.nb_skip)
+        for _ in range(3):
+            self._aux_compare_next(data_ref, data)
+
+    def test_grid_state_from_file(self):
+        env_ref = self._aux_make()
+        env = self._aux_make()
+        self._aux_test_seek(env_ref, env)
+        # maintenance are properly computed
+        assert np.any(self._aux_get_data(env).maintenance_time[self.nb_skip] >= 0)
+
+        # it is not possible to go back in time
+        with self.assertRaises(ChronicsError):
+            env.chronics_handler.seek(1)
+        # nor to go after the end of the data
+        with self.assertRaises(StopIteration):
+            env.chronics_handler.seek(100_000)
+        env_ref.close()
+        env.close()
+
+    def test_chunk(self):
+        env_ref = self._aux_make()
+        env = self._aux_make()
+        for el in [env_ref, env]:
+            el.chronics_handler.set_chunk_size(17)
+            el.set_id(0)
+            el.reset()
+        # data are read by chunk, they are read one after the other
+        self._aux_test_seek(env_ref, env)
+        env_ref.close()
+        env.close()
+
+    def _aux_handlers_kwargs(self):
+        return {"gridvalueClass": FromHandlers,
+                "gen_p_handler": CSVHandler("prod_p"),
+                "load_p_handler": CSVHandler("load_p"),
+                "load_q_handler": CSVHandler("load_q"),
+                "gen_v_handler": CSVHandler("prod_v"),
+                "maintenance_handler": CSVMaintenanceHandler(),
+                "gen_p_for_handler": CSVForecastHandler("prod_p_forecasted"),
+                "gen_v_for_handler": CSVForecastHandler("prod_v_forecasted"),
+                "load_p_for_handler": CSVForecastHandler("load_p_forecasted"),
+                "load_q_for_handler": CSVForecastHandler("load_q_forecasted"),
+                }
+
+    def test_from_handlers(self):
+        env_ref = self._aux_make(data_feeding_kwargs=self._aux_handlers_kwargs())
+        env = self._aux_make(data_feeding_kwargs=self._aux_handlers_kwargs())
+        assert all(handl.can_seek(self.nb_skip) for handl in self._aux_get_data(env)._active_handlers)
+        self._aux_test_seek(env_ref, env)
+        env_ref.close()
+        env.close()
+
+    def test_from_handlers_noisy(self):
+        kwargs_ref = self._aux_handlers_kwargs()
+        kwargs_ref["load_p_for_handler"] = NoisyForecastHandler("load_p_forecasted")
+        kwargs = self._aux_handlers_kwargs()
+        kwargs["load_p_for_handler"] = NoisyForecastHandler("load_p_forecasted")
+        env_ref = self._aux_make(data_feeding_kwargs=kwargs_ref)
+        env = self._aux_make(data_feeding_kwargs=kwargs)
+        # noise is sampled at each step: steps are all read to keep the same forecasts
+        assert not self._aux_get_data(env).load_p_for_handler.can_seek(self.nb_skip)
+        self._aux_test_seek(env_ref, env)
+        env_ref.close()
+        env.close()
+
+    def test_from_npy(self):
+        env_tmp = self._aux_make()
+        data_tmp = self._aux_get_data(env_tmp)
+        kwargs = {"load_p": 1.0 * data_tmp.load_p,
+                  "load_q": 1.0 * data_tmp.load_q,
+                  "prod_p": 1.0 * data_tmp.prod_p,
+                  "prod_v": 1.0 * data_tmp.prod_v,
+                  "maintenance": 1 * data_tmp.maintenance}
+        env_tmp.close()
+        env_ref = self._aux_make(chronics_class=FromNPY, data_feeding_kwargs=kwargs)
+        env = self._aux_make(chronics_class=FromNPY, data_feeding_kwargs=kwargs)
+        self._aux_test_seek(env_ref, env)
+        with self.assertRaises(StopIteration):
+            env.chronics_handler.seek(100_000)
+        env_ref.close()
+        env.close()
+
+    def test_env_init_ts(self):
+        env_ref = self._aux_make()
+        env = self._aux_make()
+        obs = env.reset(options={"time serie id": 0, "init ts": self.nb_skip})
+        env_ref.set_id(0)
+        env_ref.reset()
+        for _ in range(self.nb_skip):
+            obs_ref, *_ = env_ref.step(env_ref.action_space())
+        assert obs.get_time_stamp() == obs_ref.get_time_stamp()
+        assert np.array_equal(obs.load_p, obs_ref.load_p)
+        assert np.array_equal(obs.time_next_maintenance, obs_ref.time_next_maintenance)
+        assert np.array_equal(obs.duration_next_maintenance, obs_ref.duration_next_maintenance)
+        env_ref.close()
+        env.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Exceptions import SimulatorError
+from grid2op.Reward import N1Reward
+from grid2op.simulator import ContingencyAnalysis
+
+
+class TestContingencyAnalysis(unittest.TestCase):
+    def setUp(self) -> None:
+        self.lines_id = [0, 3, 7, 12]
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox",
+                                    test=True,
+                                    other_rewards={f"line_{l_id}": N1Reward(l_id=l_id) for l_id in self.lines_id},
+                                    _add_to_name=type(self).__name__)
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.env.reset()
+        self.obs, _, _, self.info = self.env.step(self.env.action_space())
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_same_as_n1reward(self):
+        with ContingencyAnalysis(self.env, contingencies=self.lines_id) as cont_an:
+            assert cont_an.nb_contingency == len(self.lines_id)
+            rho = cont_an.compute(self.obs)
+            assert rho.shape == (len(self.lines_id), type(self.env).n_line)
+            assert cont_an.converged.all()
+            for cont_id, l_id in enumerate(self.lines_id):
+                assert abs(rho[cont_id].max() - self.info["rewards"][f"line_{l_id}"]) <= 1e-6
+                # the contingency is applied
+                assert rho[cont_id, l_id] == 0.
+            # same results when the state is given by a backend
+            rho_bk = cont_an.compute(self.env.backend)
+            assert np.allclose(rho, rho_bk, atol=1e-5)
+
+    def test_same_as_simulate(self):
+        l_id = 3
+        with ContingencyAnalysis(self.env, contingencies=[l_id]) as cont_an:
+            rho = cont_an.compute(self.obs)
+        sim_obs, *_ = self.obs.simulate(self.env.action_space({"set_line_status": [(l_id, -1)]}),
+                                        time_step=0)
+        assert np.allclose(rho[0], sim_obs.rho, atol=1e-5)
+
+    def test_all_n1_multiprocess(self):
+        with ContingencyAnalysis(self.env) as cont_an:
+            assert cont_an.nb_contingency == type(self.env).n_line
+            rho = cont_an.compute(self.obs)
+            converged = cont_an.converged
+        # some contingencies split the grid in two
+        assert not converged.all()
+        assert np.isnan(rho[~converged]).all()
+        assert not np.isnan(rho[converged]).any()
+
+        with ContingencyAnalysis(self.env, nb_process=2) as cont_an:
+            rho_mp = cont_an.compute(self.obs)
+            assert np.array_equal(cont_an.converged, converged)
+            # pool is reused
+            rho_mp2 = cont_an.compute(self.obs)
+        assert np.allclose(rho, rho_mp, equal_nan=True, atol=1e-5)
+        assert np.allclose(rho, rho_mp2, equal_nan=True, atol=1e-5)
+
+    def test_contingencies_def(self):
+        name_line = type(self.env).name_line
+        with ContingencyAnalysis(self.env, contingencies=[name_line[0], [1, name_line[2]]]) as cont_an:
+            contingencies = cont_an.contingencies
+            assert len(contingencies) == 2
+            assert np.array_equal(contingencies[0], [0])
+            assert np.array_equal(contingencies[1], [1, 2])
+            rho = cont_an.compute(self.obs)
+            assert rho[1, 1] == 0.
+            assert rho[1, 2] == 0.
+
+    def test_dc(self):
+        with ContingencyAnalysis(self.env, contingencies=self.lines_id, is_dc=True) as cont_an:
+            rho = cont_an.compute(self.obs)
+        assert rho.shape == (len(self.lines_id), type(self.env).n_line)
+        assert not np.isnan(rho).any()
+
+    def test_raise(self):
+        with self.assertRaises(SimulatorError):
+            ContingencyAnalysis(self.env, contingencies=["toto"])
+        with self.assertRaises(SimulatorError):
+            ContingencyAnalysis(self.env, contingencies=[type(self.env).n_line])
+        with self.assertRaises(SimulatorError):
+            ContingencyAnalysis(self.env, nb_process=0)
+        with self.assertRaises(SimulatorError):
+            ContingencyAnalysis(None)
+        cont_an = ContingencyAnalysis(self.env, contingencies=[0])
+        with self.assertRaises(SimulatorError):
+            cont_an.compute(None)
+        cont_an.close()
+        with self.assertRaises(SimulatorError):
+            cont_an.compute(self.obs)
+
+
+if __name__ == "__main__":
+    unittest.main()
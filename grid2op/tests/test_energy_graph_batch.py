@@ -0,0 +1,142 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import unittest
+import warnings
+
+import numpy as np
+
+import grid2op
+from grid2op.Exceptions import Grid2OpException
+
+
+class TestEnergyGraphBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True, _add_to_name=type(self).__name__)
+        self.obss = [self.env.reset(seed=0, options={"time serie id": 0})]
+        # change the topology (from the initial state each time)
+        acts = [self.env.action_space({"set_line_status": [(3, -1)]}),
+                self.env.action_space({"set_bus": {"substations_id": [(1, (1, 1, 1, 2, 2, 2))]}}),
+                self.env.action_space({"set_bus": {"substations_id": [(8, (1, 1, 2, 2, 1))]}}),
+                ]
+        for act in acts:
+            self.env.reset(seed=0, options={"time serie id": 0})
+            obs, reward, done, info = self.env.step(act)
+            assert not done, info["exception"]
+            self.obss.append(obs)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_same_as_energy_graph(self):
+        obs_vect = np.stack([obs.to_vect() for obs in self.obss])
+        res = self.env.observation_space.get_energy_graph_batch(obs_vect)
+        nb_node = self.env.n_sub * self.env.n_busbar_per_sub
+        assert res["node_features"].shape == (len(self.obss), nb_node, len(res["node_feature_names"]))
+        assert res["edge_index"].shape == (len(self.obss), 2, self.env.n_line)
+        assert res["edge_features"].shape == (len(self.obss), self.env.n_line, len(res["edge_feature_names"]))
+        id_p = res["node_feature_names"].index("p")
+        id_v = res["node_feature_names"].index("v")
+        id_sub = res["node_feature_names"].index("sub_id")
+        for i, obs in enumerate(self.obss):
+            graph = obs.get_energy_graph()
+            assert res["node_mask"][i].sum() == len(graph.nodes)
+            for node_id in graph.nodes:
+                glob_id = graph.nodes[node_id]["global_bus_id"]
+                assert res["node_mask"][i, glob_id]
+                assert abs(res["node_features"][i, glob_id, id_p] - graph.nodes[node_id]["p"]) <= 1e-4
+                assert abs(res["node_features"][i, glob_id, id_v] - graph.nodes[node_id]["v"]) <= 1e-4
+                assert res["node_features"][i, glob_id, id_sub] == graph.nodes[node_id]["sub_id"]
+
+            assert np.array_equal(res["edge_mask"][i], obs.line_status)
+            lor_bus, _ = obs._get_bus_id(obs.line_or_pos_topo_vect, obs.line_or_to_subid)
+            lex_bus, _ = obs._get_bus_id(obs.line_ex_pos_topo_vect, obs.line_ex_to_subid)
+            assert np.array_equal(res["edge_index"][i, 0], np.where(obs.line_status, lor_bus, -1))
+            assert np.array_equal(res["edge_index"][i, 1], np.where(obs.line_status, lex_bus, -1))
+            for feat_id, feat_nm in enumerate(res["edge_feature_names"]):
+                if feat_nm == "cooldown":
+                    ref = obs.time_before_cooldown_line
+                else:
+                    ref = getattr(obs, feat_nm)
+                assert np.allclose(res["edge_features"][i, :, feat_id], np.where(obs.line_status, ref, 0.))
+
+        # the graphs are balanced (no shunt in this environment)
+        for i in range(len(self.obss)):
+            mask = res["edge_mask"][i]
+            p_bus = np.zeros(nb_node)
+            np.add.at(p_bus, res["edge_index"][i, 0, mask], res["edge_features"][i, mask, 0])
+            np.add.at(p_bus, res["edge_index"][i, 1, mask], res["edge_features"][i, mask, 1])
+            assert np.allclose(p_bus, res["node_features"][i, :, id_p], atol=1e-3)
+
+    def test_single_obs_and_invalid(self):
+        obs = self.obss[1]
+        res = self.env.observation_space.get_energy_graph_batch(obs.to_vect(),
+                                                                node_features=["p", "cooldown"],
+                                                                edge_features=["rho"])
+        assert res["node_features"].shape[0] == 1
+        assert res["node_feature_names"] == ["p", "cooldown"]
+        assert res["edge_features"].shape == (1, self.env.n_line, 1)
+
+        # rows full of nan (episode over)
+        obs_vect = np.stack([obs.to_vect(), np.full(obs.to_vect().shape, fill_value=np.nan)])
+        res = self.env.observation_space.get_energy_graph_batch(obs_vect)
+        assert not res["node_mask"][1].any()
+        assert not res["edge_mask"][1].any()
+        assert (res["edge_index"][1] == -1).all()
+        assert np.isfinite(res["node_features"]).all()
+        assert np.isfinite(res["edge_features"]).all()
+
+    def test_errors(self):
+        obs_vect = self.obss[0].to_vect()
+        with self.assertRaises(Grid2OpException):
+            self.env.observation_space.get_energy_graph_batch(obs_vect, node_features=["unknown"])
+        with self.assertRaises(Grid2OpException):
+            self.env.observation_space.get_energy_graph_batch(obs_vect, edge_features=["theta_or"])
+        with self.assertRaises(Grid2OpException):
+            self.env.observation_space.get_energy_graph_batch(obs_vect[:-1])
+
+
+class TestEnergyGraphBatchStorage(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("educ_case14_storage", test=True, _add_to_name=type(self).__name__)
+        self.env.reset(seed=0, options={"time serie id": 0})
+        self.obs, reward, done, info = self.env.step(self.env.action_space({"set_storage": [(0, 1.), (1, -1.)]}))
+        assert not done, info["exception"]
+        assert (np.abs(self.obs.storage_power) > 0.).all()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_storage_in_p(self):
+        res = self.env.observation_space.get_energy_graph_batch(self.obs.to_vect(), node_features=["p"])
+        graph = self.obs.get_energy_graph()
+        for node_id in graph.nodes:
+            glob_id = graph.nodes[node_id]["global_bus_id"]
+            assert abs(res["node_features"][0, glob_id, 0] - graph.nodes[node_id]["p"]) <= 1e-4
+
+    def test_storage_not_in_vect(self):
+        obs_space = self.env.observation_space.copy()
+        del obs_space._to_extract_vect["storage_power"]
+        res = obs_space.get_energy_graph_batch(self.obs.to_vect())
+        # "p" cannot be computed without the storage units
+        assert "p" not in res["node_feature_names"]
+        assert "q" in res["node_feature_names"]
+        with self.assertRaises(Grid2OpException):
+            obs_space.get_energy_graph_batch(self.obs.to_vect(), node_features=["p"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import pickle
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Action import PlayableAction, PowerlineSetAction
+from grid2op.Environment import EnvState
+from grid2op.Exceptions import EnvError
+from grid2op.Opponent import RandomLineOpponent, BaseActionBudget
+from grid2op.Runner import Runner
+from grid2op.Chronics import FromOneEpisodeData
+
+
+class TestEnvGetSetState(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("educ_case14_storage",
+                                    test=True,
+                                    action_class=PlayableAction,
+                                    _add_to_name=type(self).__name__)
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.obs = self.env.reset()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _get_actions(self):
+        return [self.env.action_space(),
+                self.env.action_space({"set_line_status": [(0, -1)]}),
+                self.env.action_space({"redispatch": [(0, 2.)]}),
+                self.env.action_space({"set_storage": [(0, 3.)]}),
+                self.env.action_space({"set_bus": {"lines_or_id": [(3, 2), (4, 2)]}}),
+                ]
+
+    def _aux_play(self, env, act):
+        obs, reward, done, info = env.step(act)
+        obs2, reward2, done2, info2 = env.step(env.action_space())
+        return obs, reward, done, obs2, reward2, done2
+
+    def _aux_compare(self, res, res_ref):
+        obs, reward, done, obs2, reward2, done2 = res
+        obs_ref, reward_ref, done_ref, obs2_ref, reward2_ref, done2_ref = res_ref
+        assert obs == obs_ref
+        assert reward == reward_ref
+        assert done == done_ref
+        assert obs2 == obs2_ref
+        assert reward2 == reward2_ref
+        assert done2 == done2_ref
+
+    def test_get_state(self):
+        state = self.env.get_state()
+        assert isinstance(state, EnvState)
+        assert state.env_name == self.env.name
+        assert state.time_serie_id == self.env.chronics_handler.get_id()
+        assert state.nb_time_step == 0
+        assert state.time_stamp == self.obs.get_time_stamp()
+        assert state.nbytes > 0
+        # the state does not share memory with the environment
+        self.env.step(self.env.action_space({"set_line_status": [(0, -1)]}))
+        assert state._env_arrays["_line_status"][0]
+        assert state.nb_time_step == 0
+
+    def test_set_state_same_result(self):
+        env_ref = self.env.copy()
+        state = self.env.get_state()
+        for act in self._get_actions():
+            obs = self.env.set_state(state)
+            assert obs == self.obs
+            res = self._aux_play(self.env, act)
+            env_cpy = env_ref.copy()
+            res_ref = self._aux_play(env_cpy, act)
+            self._aux_compare(res, res_ref)
+            env_cpy.close()
+        env_ref.close()
+
+    def test_set_state_after_game_over(self):
+        state = self.env.get_state()
+        self.env.step(self.env.action_space({"set_bus": {"loads_id": [(0, -1)]}}))
+        assert self.env.done
+        obs = self.env.set_state(state)
+        assert obs == self.obs
+        obs, reward, done, info = self.env.step(self.env.action_space())
+        assert not done
+
+    def test_pickle(self):
+        state = self.env.get_state()
+        state2 = pickle.loads(pickle.dumps(state))
+        self.env.step(self.env.action_space({"redispatch": [(0, 2.)]}))
+        obs = self.env.set_state(state2)
+        assert obs == self.obs
+        state3 = state.copy()
+        obs = self.env.set_state(state3)
+        assert obs == self.obs
+
+    def test_raise(self):
+        state = self.env.get_state()
+        with self.assertRaises(EnvError):
+            self.env.set_state(None)
+        self.env.set_id(1)
+        self.env.reset()
+        with self.assertRaises(EnvError):
+            # different time series
+            self.env.set_state(state)
+        self.env.set_id(0)
+        self.env.reset()
+        self.env.set_state(state)
+        env_cpy = self.env.copy()
+        env_cpy.close()
+        with self.assertRaises(EnvError):
+            env_cpy.get_state()
+        with self.assertRaises(EnvError):
+            env_cpy.set_state(state)
+
+    def test_raise_chronics(self):
+        # the data read by chunk are not kept in memory
+        self.env.chronics_handler.set_chunk_size(17)
+        self.env.reset()
+        with self.assertRaises(EnvError):
+            self.env.get_state()
+
+
+class TestEnvGetSetStateFromEpisode(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make("l2rpn_case14_sandbox", test=True, _add_to_name=type(self).__name__)
+            env.set_id(0)
+            runner = Runner(**env.get_params_for_runner())
+            res = runner.run(nb_episode=1, max_iter=10, add_detailed_output=True)
+            env.close()
+            self.env = grid2op.make("l2rpn_case14_sandbox",
+                                    test=True,
+                                    chronics_class=FromOneEpisodeData,
+                                    data_feeding_kwargs={"ep_data": res[0][-1],
+                                                         "list_perfect_forecasts": [5]},
+                                    _add_to_name=type(self).__name__)
+        self.env.reset()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_current_inj(self):
+        self.env.step(self.env.action_space())
+        state = self.env.get_state()
+        load_p = 1. * self.env.chronics_handler.real_data.current_inj["injection"]["load_p"]
+        obs_ref, *_ = self.env.step(self.env.action_space())
+        for _ in range(2):
+            self.env.step(self.env.action_space())
+        obs = self.env.set_state(state)
+        # the forecasts are computed from the injections of the step the state was retrieved at
+        assert np.array_equal(self.env.chronics_handler.real_data.current_inj["injection"]["load_p"], load_p)
+        obs, *_ = self.env.step(self.env.action_space())
+        assert obs == obs_ref
+
+
+class TestEnvGetSetStateOpponent(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox",
+                                    test=True,
+                                    _add_to_name=type(self).__name__,
+                                    opponent_attack_cooldown=2,
+                                    opponent_attack_duration=3,
+                                    opponent_budget_per_ts=9999.,
+                                    opponent_init_budget=9999.,
+                                    opponent_action_class=PowerlineSetAction,
+                                    opponent_class=RandomLineOpponent,
+                                    opponent_budget_class=BaseActionBudget,
+                                    kwargs_opponent={"lines_attacked": ["1_3_3", "1_4_4", "3_6_15",
+                                                                        "9_10_12", "11_12_13", "12_13_14"]})
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.env.reset()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_opponent(self):
+        state = self.env.get_state()
+        env_ref = self.env.copy()
+        nb_step = 6
+        obs_ref = []
+        for _ in range(nb_step):
+            obs, reward, done, info = env_ref.step(env_ref.action_space())
+            obs_ref.append(obs)
+            if done:
+                break
+        # at least an attack happened
+        assert np.any([not np.all(el.line_status) for el in obs_ref])
+
+        for _ in range(2):
+            # modifies the state of the environment
+            for _ in range(3):
+                self.env.step(self.env.action_space({"set_line_status": [(0, -1)]}))
+            self.env.set_state(state)
+            for obs_r in obs_ref:
+                obs, reward, done, info = self.env.step(self.env.action_space())
+                assert obs == obs_r
+                assert np.array_equal(obs.time_since_last_attack, obs_r.time_since_last_attack)
+        env_ref.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import json
+import tempfile
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Runner import Runner
+from grid2op.Episode import EpisodeData, EpisodeDataset
+from grid2op.Exceptions import Grid2OpException
+
+
+class TestEpisodeDataNpy(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox",
+                                    test=True,
+                                    _add_to_name=type(self).__name__)
+        self.max_iter = 10
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path_npz = os.path.join(self.tmp_dir.name, "npz")
+        self.path_npy = os.path.join(self.tmp_dir.name, "npy")
+        for path, storage_format in [(self.path_npz, "npz"), (self.path_npy, "npy")]:
+            runner = Runner(**self.env.get_params_for_runner(), episode_storage_format=storage_format)
+            runner.run(nb_episode=2, max_iter=self.max_iter, path_save=path,
+                       env_seeds=[0, 1], episode_id=[0, 1])
+
+    def tearDown(self) -> None:
+        self.env.close()
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def test_files(self):
+        ep_path = os.path.join(self.path_npy, "0000")
+        for file_nm in EpisodeData.ATTR_EPISODE:
+            if file_nm.endswith(".npz"):
+                assert not os.path.exists(os.path.join(ep_path, file_nm))
+                assert os.path.exists(os.path.join(ep_path, file_nm[:-4] + ".npy"))
+        assert os.path.exists(os.path.join(ep_path, "legal_ambiguous.npy"))
+        assert len(EpisodeData.list_episode(self.path_npy)) == 2
+
+    def test_same_as_npz(self):
+        ep_npz = EpisodeData.from_disk(self.path_npz, "0000")
+        ep_npy = EpisodeData.from_disk(self.path_npy, "0000")
+        ep_lazy = EpisodeData.from_disk(self.path_npy, "0000", lazy=True)
+        assert ep_npy.storage_format == "npy"
+        assert isinstance(ep_lazy.observations.collection, np.memmap)
+        for ep in [ep_npy, ep_lazy]:
+            assert len(ep.observations) == len(ep_npz.observations) == self.max_iter + 1
+            assert len(ep.actions) == len(ep_npz.actions) == self.max_iter
+            for obs, obs_ref in zip(ep.observations, ep_npz.observations):
+                assert obs == obs_ref
+            for act, act_ref in zip(ep.actions, ep_npz.actions):
+                assert act == act_ref
+            assert np.array_equal(ep.rewards, ep_npz.rewards, equal_nan=True)
+        assert ep_lazy.observations[-1] == ep_npz.observations[-1]
+        assert ep_lazy.observations[2:4][1] == ep_npz.observations[3]
+        with self.assertRaises(Grid2OpException):
+            ep_lazy.observations[self.max_iter + 1]
+
+        # lazy also works with the compressed format
+        ep_lazy_npz = EpisodeData.from_disk(self.path_npz, "0000", lazy=True)
+        assert ep_lazy_npz.observations[5] == ep_npz.observations[5]
+
+    def test_energy_graph_batch(self):
+        # the stored vectors can be used in all modes (see `get_energy_graph_batch`)
+        ep_npz = EpisodeData.from_disk(self.path_npz, "0000")
+        res_ref = self.env.observation_space.get_energy_graph_batch(ep_npz.observations.collection)
+        for ep in [EpisodeData.from_disk(self.path_npy, "0000"),
+                   EpisodeData.from_disk(self.path_npy, "0000", lazy=True)]:
+            res = self.env.observation_space.get_energy_graph_batch(ep.observations.collection)
+            assert np.array_equal(res["node_features"], res_ref["node_features"])
+            assert np.array_equal(res["edge_mask"], res_ref["edge_mask"])
+        assert res_ref["node_features"].shape[0] == self.max_iter + 1
+
+    def test_dataset(self):
+        dataset = EpisodeDataset(self.path_npy)
+        assert dataset.nb_episode == 2
+        assert dataset.episode_names == ["0000", "0001"]
+        assert len(dataset) == 2 * self.max_iter
+        assert dataset.locate(self.max_iter + 3) == (1, 3)
+        assert dataset.locate(-1) == (1, self.max_iter - 1)
+
+        ep_ref = EpisodeData.from_disk(self.path_npz, "0001")
+        obs, act, reward, next_obs, done = dataset[self.max_iter + 3]
+        assert obs == ep_ref.observations[3]
+        assert act == ep_ref.actions[3]
+        assert reward == ep_ref.rewards[3]
+        assert next_obs == ep_ref.observations[4]
+        assert not done
+        *_, done = dataset[2 * self.max_iter - 1]
+        assert done
+        with self.assertRaises(Grid2OpException):
+            dataset[2 * self.max_iter]
+
+        # the index is stored, and used
+        path_index = os.path.join(self.path_npy, EpisodeDataset.INDEX_FILE)
+        with open(path_index, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        assert index["episodes"] == [["0000", self.max_iter], ["0001", self.max_iter]]
+        index["episodes"][0][1] = 5
+        with open(path_index, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        assert len(EpisodeDataset(self.path_npy)) == 5 + self.max_iter
+
+    def test_raise(self):
+        with self.assertRaises(Grid2OpException):
+            EpisodeDataset(os.path.join(self.tmp_dir.name, "toto"))
+        with self.assertRaises(Grid2OpException):
+            Runner(**self.env.get_params_for_runner(), episode_storage_format="toto")
+        dataset = EpisodeDataset(self.path_npz)
+        with self.assertRaises(Grid2OpException):
+            dataset.get_episode(2)
+        with self.assertRaises(Grid2OpException):
+            dataset.get_episode("toto")
+
+
+if __name__ == "__main__":
+    unittest.main()
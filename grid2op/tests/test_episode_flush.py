@@ -0,0 +1,150 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import tempfile
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Agent import DoNothingAgent, BaseAgent
+from grid2op.Runner import Runner
+from grid2op.Episode import EpisodeData
+from grid2op.Episode._npyStream import _NpyStream
+from grid2op.Exceptions import Grid2OpException
+
+
+class _CrashingAgent(DoNothingAgent):
+    def act(self, observation, reward, done=False):
+        if observation.current_step == 17:
+            raise RuntimeError("the agent crashed")
+        return super().act(observation, reward, done)
+
+
+class _GameOverAgent(BaseAgent):
+    def act(self, observation, reward, done=False):
+        if observation.current_step == 5:
+            # disconnecting a load is a game over
+            return self.action_space({"set_bus": {"loads_id": [(0, -1)]}})
+        return self.action_space()
+
+
+class TestEpisodeFlush(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox",
+                                    test=True,
+                                    _add_to_name=type(self).__name__)
+        self.max_iter = 30
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.kwargs_run = dict(nb_episode=1, max_iter=self.max_iter, episode_id=[0], env_seeds=[0])
+
+    def tearDown(self) -> None:
+        self.env.close()
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def _aux_run(self, name, agentClass=DoNothingAgent, **kwargs):
+        path = os.path.join(self.tmp_dir.name, name)
+        runner = Runner(**self.env.get_params_for_runner(),
+                        agentClass=agentClass,
+                        episode_storage_format="npy",
+                        **kwargs)
+        res = runner.run(path_save=path, **self.kwargs_run)
+        return path, res
+
+    def test_npy_stream(self):
+        path = os.path.join(self.tmp_dir.name, "stream.npy")
+        stream = _NpyStream(path, (10, 3), np.float32, chunk_size=4)
+        for i in range(6):
+            stream[i, :] = i
+        # 4 rows have been written, the file can be read
+        assert np.load(path).shape == (4, 3)
+        with self.assertRaises(Grid2OpException):
+            stream[2] = 0.
+        stream.close(8)
+        arr = np.load(path)
+        assert arr.shape == (8, 3)
+        assert np.all(arr[:6] == np.arange(6).reshape(-1, 1))
+        assert np.all(np.isnan(arr[6:]))
+
+    def test_same_as_not_flushed(self):
+        path_ref, res_ref = self._aux_run("ref")
+        path, res = self._aux_run("flush", episode_flush_every=7)
+        assert res[0][2:] == res_ref[0][2:]
+        ep_path = os.path.join(path, "0000")
+        assert not os.path.exists(os.path.join(ep_path, EpisodeData.PROGRESS))
+        assert len(EpisodeData.list_episode(path)) == 1
+        ep_ref = EpisodeData.from_disk(path_ref, "0000")
+        ep = EpisodeData.from_disk(path, "0000")
+        assert ep.meta == ep_ref.meta
+        assert len(ep.observations) == len(ep_ref.observations) == self.max_iter + 1
+        for obs, obs_ref in zip(ep.observations, ep_ref.observations):
+            assert obs == obs_ref
+        for act, act_ref in zip(ep.actions, ep_ref.actions):
+            assert act == act_ref
+        assert np.array_equal(ep.rewards, ep_ref.rewards, equal_nan=True)
+        assert np.array_equal(ep.legal, ep_ref.legal)
+
+    def test_game_over(self):
+        path_ref, res_ref = self._aux_run("ref", agentClass=_GameOverAgent)
+        path, res = self._aux_run("flush", agentClass=_GameOverAgent, episode_flush_every=4)
+        assert res[0][3] == res_ref[0][3] < self.max_iter
+        nb_ts = res[0][3]
+        ep_ref = EpisodeData.from_disk(path_ref, "0000")
+        ep = EpisodeData.from_disk(path, "0000")
+        # only the steps played are stored
+        assert ep.observations.collection.shape[0] == nb_ts + 1
+        assert len(ep.observations) == len(ep_ref.observations)
+        assert len(ep.actions) == len(ep_ref.actions) == nb_ts
+        for obs, obs_ref in zip(ep.observations, ep_ref.observations):
+            assert obs == obs_ref
+
+    def test_partial_episode(self):
+        path = os.path.join(self.tmp_dir.name, "crash")
+        runner = Runner(**self.env.get_params_for_runner(),
+                        agentClass=_CrashingAgent,
+                        episode_storage_format="npy",
+                        episode_flush_every=7)
+        with self.assertRaises(RuntimeError):
+            runner.run(path_save=path, **self.kwargs_run)
+        assert os.path.exists(os.path.join(path, "0000", EpisodeData.PROGRESS))
+        # the episode is not complete
+        assert len(EpisodeData.list_episode(path)) == 0
+        # but the steps written can be read
+        ep = EpisodeData.from_disk(path, "0000")
+        assert len(ep.actions) == 14
+        assert [obs.current_step for obs in ep.observations] == list(range(15))
+        ep_lazy = EpisodeData.from_disk(path, "0000", lazy=True)
+        assert ep_lazy.observations[-1] == ep.observations[-1]
+
+    def test_detailed_output(self):
+        runner = Runner(**self.env.get_params_for_runner(),
+                        episode_storage_format="npy",
+                        episode_flush_every=7)
+        res = runner.run(path_save=os.path.join(self.tmp_dir.name, "detailed"),
+                         add_detailed_output=True,
+                         **self.kwargs_run)
+        episode = res[0][-1]
+        assert len(episode.observations) == self.max_iter + 1
+        assert episode.observations[10].current_step == 10
+
+    def test_raise(self):
+        with self.assertRaises(Grid2OpException):
+            Runner(**self.env.get_params_for_runner(), episode_flush_every=7)
+        with self.assertRaises(Grid2OpException):
+            Runner(**self.env.get_params_for_runner(), episode_storage_format="npy", episode_flush_every=0)
+        with self.assertRaises(Grid2OpException):
+            Runner(**self.env.get_params_for_runner(), episode_storage_format="npy", episode_flush_every=7,
+                   use_compact_episode_data=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import grid2op
+
+HEAVY_MODULES = ["pandapower", "networkx", "scipy.optimize", "numba", "matplotlib", "plotly"]
+
+
+class TestImportTime(unittest.TestCase):
+    """check that `import grid2op` stays fast: the heavy dependencies should be loaded only when used"""
+    # budget (in seconds) for the cold `import grid2op`, it is voluntarily large to
+    # avoid false alarms on slow machines (it was more than 1.8s when pandapower, networkx etc.
+    # were imported eagerly on the machine that took ~1.1s with lazy imports)
+    IMPORT_TIME_BUDGET = 5.
+
+    def _aux_run(self, code, *python_args):
+        env = os.environ.copy()
+        grid2op_root = os.path.dirname(os.path.dirname(os.path.abspath(grid2op.__file__)))
+        env["PYTHONPATH"] = os.pathsep.join([grid2op_root] + [el for el in [env.get("PYTHONPATH")] if el])
+        res = subprocess.run([sys.executable, *python_args, "-c", code],
+                             capture_output=True, text=True, env=env, check=False)
+        assert res.returncode == 0, res.stderr
+        return res
+
+    def _aux_loaded(self, code):
+        code = ("import sys, json\n" + code +
+                f"\nprint(json.dumps([el for el in {HEAVY_MODULES} if el in sys.modules]))")
+        res = self._aux_run(code)
+        return json.loads(res.stdout.splitlines()[-1])
+
+    def test_heavy_modules_not_loaded(self):
+        loaded = self._aux_loaded("import grid2op")
+        assert loaded == [], f"modules {loaded} are imported with grid2op"
+
+    def test_loaded_on_first_use(self):
+        code = ("import warnings\nimport grid2op\n"
+                "with warnings.catch_warnings():\n"
+                "    warnings.filterwarnings('ignore')\n"
+                "    env = grid2op.make('l2rpn_case14_sandbox', test=True)\n"
+                "obs = env.reset(seed=0)\n")
+        loaded = self._aux_loaded(code)
+        assert "pandapower" in loaded
+        assert "scipy.optimize" in loaded
+
+        code = "import grid2op\nfrom grid2op.Reward import BridgeReward\n"
+        loaded = self._aux_loaded(code)
+        assert "networkx" not in loaded
+        loaded = self._aux_loaded(code + "from grid2op.Reward.bridgeReward import nx\ngraph = nx.Graph()\n")
+        assert "networkx" in loaded
+
+    @unittest.skipUnless(os.environ.get("GRID2OP_TEST_IMPORT_TIME"),
+                         "wall clock measure, set GRID2OP_TEST_IMPORT_TIME=1 to run it (on an idle machine)")
+    def test_import_time_budget(self):
+        # the "-X importtime" output is "import time: self [us] | cumulative | imported package"
+        res = self._aux_run("import grid2op", "-X", "importtime")
+        cumulative_us = None
+        for line in res.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            self_us, cum_us, pkg_nm = line[len("import time:"):].split("|")
+            if pkg_nm.strip() == "grid2op":
+                cumulative_us = int(cum_us)
+        assert cumulative_us is not None, "grid2op not found in the `-X importtime` output"
+        assert cumulative_us * 1e-6 <= self.IMPORT_TIME_BUDGET, \
+            f"`import grid2op` took {cumulative_us * 1e-6:.2f}s (budget {self.IMPORT_TIME_BUDGET:.2f}s)"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import copy
+import json
+import os
+import pickle
+import tempfile
+import unittest
+import warnings
+
+import numpy as np
+
+import grid2op
+from grid2op.Chronics import MultifolderWithCache, GridStateFromFileWithForecastsWithMaintenance
+from grid2op.Exceptions import ChronicsError
+from grid2op.tests.helper_path_test import PATH_DATA_TEST
+
+
+class TestMultifolderNPYCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.env_name = "l2rpn_case14_sandbox"
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.npy_cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env_ref = grid2op.make(self.env_name, test=True, _add_to_name=type(self).__name__,
+                                        chronics_class=MultifolderWithCache)
+        self.env_ref.chronics_handler.set_filter(lambda x: True)
+        self.env_ref.chronics_handler.reset()
+        self.env_ref.chronics_handler.real_data.build_npy_cache(self.npy_cache_dir)
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make(self.env_name, test=True, _add_to_name=type(self).__name__,
+                                    chronics_class=MultifolderWithCache,
+                                    data_feeding_kwargs={"npy_cache_dir": self.npy_cache_dir})
+        self.env.chronics_handler.set_filter(lambda x: True)
+        self.env.chronics_handler.reset()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env_ref.close()
+        self.env.close()
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def _aux_compare(self, env_ref, env, nb_step=10, seed=0, ts_id=0):
+        obs_ref = env_ref.reset(seed=seed, options={"time serie id": ts_id})
+        obs = env.reset(seed=seed, options={"time serie id": ts_id})
+        assert obs_ref == obs
+        for _ in range(nb_step):
+            obs_ref, reward_ref, done_ref, info_ref = env_ref.step(env_ref.action_space())
+            obs, reward, done, info = env.step(env.action_space())
+            assert obs_ref == obs
+            assert reward_ref == reward
+            assert done_ref == done
+            if done:
+                break
+
+    def test_files_written(self):
+        with open(os.path.join(self.npy_cache_dir, MultifolderWithCache.NPY_CACHE_META), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        assert len(meta["scenarios"]) == len(self.env_ref.chronics_handler.real_data.subpaths)
+        for scen_id, n_ in meta["scenarios"].items():
+            load_p = np.load(os.path.join(self.npy_cache_dir, scen_id, "load_p.npy"))
+            assert load_p.shape == (n_, self.env.n_load)
+            assert os.path.exists(os.path.join(self.npy_cache_dir, scen_id, "load_p_forecast.npy"))
+
+    def test_data_are_mapped(self):
+        for data in self.env.chronics_handler.real_data._cached_data:
+            assert isinstance(data.load_p, np.memmap)
+            assert isinstance(data.prod_p_forecast, np.memmap)
+            assert not data.load_p.flags.writeable
+        for data in self.env_ref.chronics_handler.real_data._cached_data:
+            assert not isinstance(data.load_p, np.memmap)
+
+    def test_same_results(self):
+        self._aux_compare(self.env_ref, self.env, ts_id=0)
+        self._aux_compare(self.env_ref, self.env, ts_id=1, seed=1)
+        # and the simulate (forecasts) are the same
+        obs_ref = self.env_ref.reset(seed=0, options={"time serie id": 0})
+        obs = self.env.reset(seed=0, options={"time serie id": 0})
+        sim_obs_ref, *_ = obs_ref.simulate(self.env_ref.action_space())
+        sim_obs, *_ = obs.simulate(self.env.action_space())
+        assert sim_obs_ref == sim_obs
+
+    def test_max_iter(self):
+        self.env.set_max_iter(5)
+        self.env.reset()
+        nb_step = 0
+        done = False
+        while not done:
+            *_, done, info = self.env.step(self.env.action_space())
+            nb_step += 1
+        assert nb_step == 5
+        # and the full data is still available
+        self.env.set_max_iter(-1)
+        self.env.reset()
+        assert self.env.max_episode_duration() == self.env_ref.max_episode_duration()
+
+    def test_copy_still_mapped(self):
+        env_cpy = self.env.copy()
+        for data in env_cpy.chronics_handler.real_data._cached_data:
+            assert isinstance(data.load_p, np.memmap)
+        self._aux_compare(self.env_ref, env_cpy)
+        env_cpy.close()
+
+        data = self.env.chronics_handler.real_data._cached_data[0]
+        data_pkl = pickle.loads(pickle.dumps(data))
+        assert isinstance(data_pkl.load_p, np.memmap)
+        assert np.array_equal(data_pkl.load_p, data.load_p)
+        data_cpy = copy.deepcopy(data)
+        assert isinstance(data_cpy.prod_v, np.memmap)
+
+    def test_kwargs(self):
+        kwargs = self.env.chronics_handler.kwargs
+        assert kwargs["npy_cache_dir"] == self.npy_cache_dir
+        # the env that built the cache now uses it
+        assert self.env_ref.chronics_handler.kwargs["npy_cache_dir"] == self.npy_cache_dir
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make(self.env_name, test=True, _add_to_name=type(self).__name__,
+                               chronics_class=MultifolderWithCache)
+        assert "npy_cache_dir" not in env.chronics_handler.kwargs
+        env.close()
+
+    def test_wrong_cache(self):
+        path_meta = os.path.join(self.npy_cache_dir, MultifolderWithCache.NPY_CACHE_META)
+        with open(path_meta, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        meta["name_line"] = meta["name_line"][::-1]
+        with open(path_meta, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        with self.assertRaises(ChronicsError):
+            self.env.chronics_handler.reset()
+
+    def test_missing_cache(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make(self.env_name, test=True, _add_to_name=type(self).__name__,
+                               chronics_class=MultifolderWithCache,
+                               data_feeding_kwargs={"npy_cache_dir": os.path.join(self.tmp_dir.name, "nothing")})
+        with self.assertWarns(UserWarning):
+            env.chronics_handler.set_filter(lambda x: True)
+            env.chronics_handler.reset()
+        self._aux_compare(self.env_ref, env)
+        env.close()
+
+
+class TestMultifolderNPYCacheMaintenance(unittest.TestCase):
+    """the maintenance are sampled at random: they are not cached but should be the same"""
+    def setUp(self) -> None:
+        self.env_path = os.path.join(PATH_DATA_TEST, "l2rpn_icaps_2021_small_test")
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.npy_cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        data_feeding_kwargs = {"gridvalueClass": GridStateFromFileWithForecastsWithMaintenance}
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env_ref = grid2op.make(self.env_path, test=True, _add_to_name=type(self).__name__,
+                                        chronics_class=MultifolderWithCache,
+                                        data_feeding_kwargs=data_feeding_kwargs)
+        self.env_ref.chronics_handler.set_filter(lambda x: True)
+        self.env_ref.chronics_handler.reset()
+        self.env_ref.chronics_handler.real_data.build_npy_cache(self.npy_cache_dir)
+
+        data_feeding_kwargs["npy_cache_dir"] = self.npy_cache_dir
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make(self.env_path, test=True, _add_to_name=type(self).__name__,
+                                    chronics_class=MultifolderWithCache,
+                                    data_feeding_kwargs=data_feeding_kwargs)
+        self.env.chronics_handler.set_filter(lambda x: True)
+        self.env.chronics_handler.reset()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env_ref.close()
+        self.env.close()
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def test_maintenance(self):
+        assert not os.path.exists(os.path.join(self.npy_cache_dir, "Scenario_april_000", "maintenance.npy"))
+        for seed in [0, 1]:
+            self.env_ref.reset(seed=seed, options={"time serie id": 0})
+            self.env.reset(seed=seed, options={"time serie id": 0})
+            data_ref = self.env_ref.chronics_handler.real_data.data
+            data = self.env.chronics_handler.real_data.data
+            assert isinstance(data.load_p, np.memmap)
+            assert not isinstance(data.maintenance, np.memmap)
+            assert np.array_equal(data_ref.maintenance, data.maintenance)
+            assert np.array_equal(data_ref.maintenance_time, data.maintenance_time)
+            assert np.array_equal(data_ref.maintenance_duration, data.maintenance_duration)
+
+    def test_same_obs(self):
+        obs_ref = self.env_ref.reset(seed=0, options={"time serie id": 0})
+        obs = self.env.reset(seed=0, options={"time serie id": 0})
+        assert obs_ref == obs
+        for _ in range(5):
+            obs_ref, *_ = self.env_ref.step(self.env_ref.action_space())
+            obs, *_ = self.env.step(self.env.action_space())
+            assert obs_ref == obs
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import copy
+import warnings
+import unittest
+import numpy as np
+
+from grid2op.tests.helper_path_test import *
+
+import grid2op
+from grid2op.Parameters import Parameters
+from grid2op.Chronics import MultifolderWithCache
+from grid2op.Exceptions import ChronicsError
+
+
+class TestMultifolderPrefetch(unittest.TestCase):
+    """test that the data read in the background are the same as the data read in env.reset"""
+    def _aux_make(self, env_name, prefetch):
+        param = Parameters()
+        param.NO_OVERFLOW_DISCONNECTION = True
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make(env_name,
+                               test=True,
+                               param=param,
+                               data_feeding_kwargs={"prefetch": prefetch},
+                               _add_to_name=type(self).__name__)
+        return env
+
+    def setUp(self) -> None:
+        self.env = self._aux_make("l2rpn_case14_sandbox", True)
+        self.env_ref = self._aux_make("l2rpn_case14_sandbox", False)
+        self.env.seed(0)
+        self.env_ref.seed(0)
+        self.nb_hit = 0
+        self.nb_miss = 0
+        multi_folder = self.env.chronics_handler.real_data
+        get_prefetched_data = multi_folder._get_prefetched_data
+        def _count_hits(*args):
+            res = get_prefetched_data(*args)
+            if res is not None:
+                self.nb_hit += 1
+            else:
+                self.nb_miss += 1
+            return res
+        multi_folder._get_prefetched_data = _count_hits
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        self.env_ref.close()
+        return super().tearDown()
+
+    def _aux_compare(self, env, env_ref, nb_step=3):
+        obs = env.reset()
+        obs_ref = env_ref.reset()
+        assert env.chronics_handler.get_name() == env_ref.chronics_handler.get_name()
+        for _ in range(nb_step):
+            assert obs.get_time_stamp() == obs_ref.get_time_stamp()
+            assert np.array_equal(obs.load_p, obs_ref.load_p)
+            assert np.array_equal(obs.gen_p, obs_ref.gen_p)
+            assert np.array_equal(obs.time_next_maintenance, obs_ref.time_next_maintenance)
+            obs, *_ = env.step(env.action_space())
+            obs_ref, *_ = env_ref.step(env_ref.action_space())
+
+    def test_kwargs(self):
+        assert self.env.chronics_handler.real_data._prefetch
+        assert not self.env_ref.chronics_handler.real_data._prefetch
+        assert self.env_ref.chronics_handler.real_data._prefetched is None
+        # the kwargs are kept when the environment is copied
+        env_cpy = self.env.copy()
+        assert env_cpy.chronics_handler.real_data._prefetch
+        self._aux_compare(env_cpy, self.env_ref)
+        env_cpy.close()
+
+    def test_same_data(self):
+        for _ in range(4):
+            self._aux_compare(self.env, self.env_ref)
+        assert self.nb_hit >= 3
+
+    def test_set_id(self):
+        self._aux_compare(self.env, self.env_ref)
+        nb_miss = self.nb_miss
+        # another time series is used: data are read again
+        self.env.set_id(0)
+        self.env_ref.set_id(0)
+        self._aux_compare(self.env, self.env_ref)
+        assert self.nb_miss == nb_miss + 1
+        # and the next one is read in the background
+        self._aux_compare(self.env, self.env_ref)
+        assert self.nb_miss == nb_miss + 1
+
+    def test_max_iter(self):
+        self._aux_compare(self.env, self.env_ref)
+        self.env.set_max_iter(10)
+        self.env_ref.set_max_iter(10)
+        self._aux_compare(self.env, self.env_ref)
+        self._aux_compare(self.env, self.env_ref)
+        assert self.env.chronics_handler.real_data.max_iter == 10
+        assert self.env.max_episode_duration() == 10
+
+    def test_deepcopy(self):
+        multi_folder = self.env.chronics_handler.real_data
+        assert multi_folder._prefetched is not None
+        cpy = copy.deepcopy(multi_folder)
+        assert cpy._prefetch
+        assert cpy._prefetched is None
+        assert cpy._prefetch_executor is None
+
+    def test_close(self):
+        self.env.reset()
+        multi_folder = self.env.chronics_handler.real_data
+        executor = multi_folder._prefetch_executor
+        assert executor is not None
+        assert multi_folder._prefetched is not None
+        self.env.close()
+        assert multi_folder._prefetch_executor is None
+        assert multi_folder._prefetched is None
+        # the data being read have been waited for
+        for thread in executor._threads:
+            assert not thread.is_alive()
+        # the environment is already closed
+        self.env = self._aux_make("l2rpn_case14_sandbox", True)
+
+    def test_with_cache(self):
+        with self.assertRaises(ChronicsError):
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                grid2op.make("l2rpn_case14_sandbox",
+                             test=True,
+                             chronics_class=MultifolderWithCache,
+                             data_feeding_kwargs={"prefetch": True},
+                             _add_to_name=type(self).__name__)
+
+    def test_random_maintenance(self):
+        """the data are seeded when used, not when read"""
+        env_name = os.path.join(PATH_DATA_TEST, "ieee118_R2subgrid_wcci_test_maintenance")
+        env = self._aux_make(env_name, True)
+        env_ref = self._aux_make(env_name, False)
+        for seed in [0, 1]:
+            env.seed(seed)
+            env_ref.seed(seed)
+            for _ in range(2):
+                self._aux_compare(env, env_ref, nb_step=1)
+                assert np.array_equal(env.chronics_handler.real_data.data.maintenance,
+                                      env_ref.chronics_handler.real_data.data.maintenance)
+        env.close()
+        env_ref.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
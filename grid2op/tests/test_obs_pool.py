@@ -0,0 +1,111 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+
+import grid2op
+from grid2op.Exceptions import EnvError
+
+
+class TestObsPool(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox",
+                                    test=True,
+                                    _add_to_name=type(self).__name__)
+            self.env_ref = grid2op.make("l2rpn_case14_sandbox",
+                                        test=True,
+                                        _add_to_name=type(self).__name__)
+        self.pool_size = 3
+        self.env.set_obs_pool_size(self.pool_size)
+        for env in [self.env, self.env_ref]:
+            env.seed(0)
+            env.set_id(0)
+        self.obs = self.env.reset()
+        self.obs_ref = self.env_ref.reset()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        self.env_ref.close()
+        return super().tearDown()
+
+    def test_step(self):
+        assert self.obs == self.obs_ref
+        all_obs = []
+        for _ in range(2 * self.pool_size):
+            obs, reward, done, info = self.env.step(self.env.action_space())
+            obs_ref, reward_ref, done_ref, info_ref = self.env_ref.step(self.env_ref.action_space())
+            assert obs == obs_ref
+            assert reward == reward_ref
+            assert done == done_ref
+            all_obs.append(obs)
+        # observations are recycled
+        assert len(set(id(el) for el in all_obs)) == self.pool_size
+        # the copies are not
+        obs_cpy = all_obs[-1].copy()
+        self.env.step(self.env.action_space())
+        obs_ref, *_ = self.env_ref.step(self.env_ref.action_space())
+        assert obs_cpy != obs_ref
+        assert all_obs[-1] is all_obs[-1 - self.pool_size]
+
+    def test_simulate(self):
+        acts = [self.env.action_space(),
+                self.env.action_space({"set_line_status": [(0, -1)]}),
+                self.env.action_space({"redispatch": [(0, 1.)]}),
+                self.env.action_space({"set_line_status": [(3, -1)]}),
+                ]
+        all_sim_obs = []
+        for act in acts:
+            sim_obs, sim_r, sim_d, sim_i = self.obs.simulate(act)
+            sim_obs_ref, sim_r_ref, sim_d_ref, sim_i_ref = self.obs_ref.simulate(act)
+            assert sim_obs == sim_obs_ref
+            assert sim_r == sim_r_ref
+            assert sim_d == sim_d_ref
+            all_sim_obs.append(sim_obs)
+        assert len(set(id(el) for el in all_sim_obs)) == self.pool_size
+        # the observation of the environment is not modified
+        assert self.obs == self.obs_ref
+
+        # "chained" simulate
+        sim_obs1, *_ = self.obs.simulate(acts[1])
+        sim_obs2, *_ = sim_obs1.simulate(acts[3], time_step=0)
+        sim_obs1_ref, *_ = self.obs_ref.simulate(acts[1])
+        sim_obs2_ref, *_ = sim_obs1_ref.simulate(acts[3], time_step=0)
+        assert sim_obs1 == sim_obs1_ref
+        assert sim_obs2 == sim_obs2_ref
+
+    def test_copy_env(self):
+        env_cpy = self.env.copy()
+        assert env_cpy.observation_space.obs_pool_size == self.pool_size
+        obs_cpy, *_ = env_cpy.step(env_cpy.action_space())
+        obs, *_ = self.env.step(self.env.action_space())
+        assert obs_cpy is not obs
+        assert obs_cpy == obs
+        env_cpy.close()
+
+    def test_deactivate(self):
+        self.env.set_obs_pool_size(0)
+        all_obs = []
+        for _ in range(2 * self.pool_size):
+            obs, *_ = self.env.step(self.env.action_space())
+            all_obs.append(obs)
+        assert len(set(id(el) for el in all_obs)) == len(all_obs)
+
+    def test_raise(self):
+        with self.assertRaises(EnvError):
+            self.env.set_obs_pool_size(1)
+        with self.assertRaises(EnvError):
+            self.env.set_obs_pool_size(-1)
+        with self.assertRaises(EnvError):
+            self.env.set_obs_pool_size("toto")
+
+
+if __name__ == "__main__":
+    unittest.main()
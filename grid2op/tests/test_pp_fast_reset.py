@@ -0,0 +1,166 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import numpy as np
+import unittest
+import warnings
+
+import grid2op
+from grid2op.Backend import PandaPowerBackend
+from grid2op.tests.BaseBackendTest import BaseTestLoadingBackendFunc
+from grid2op.tests.BaseBackendTest import BaseTestTopoAction
+from grid2op.tests.BaseBackendTest import BaseTestStorageAction
+
+
+def _make_backend(detailed_infos_for_cascading_failures=False):
+    return PandaPowerBackend(
+        detailed_infos_for_cascading_failures=detailed_infos_for_cascading_failures,
+        fast_reset=True,
+    )
+
+
+class TestFastReset(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True,
+                                    backend=_make_backend(),
+                                    _add_to_name=type(self).__name__)
+            self.env_ref = grid2op.make("l2rpn_case14_sandbox", test=True,
+                                        backend=PandaPowerBackend(),
+                                        _add_to_name=type(self).__name__)
+        self.env.reset(seed=0, options={"time serie id": 0})
+        self.env_ref.reset(seed=0, options={"time serie id": 0})
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        self.env_ref.close()
+        return super().tearDown()
+
+    def _aux_compare_obs(self, obs, obs_ref):
+        assert np.allclose(obs.rho, obs_ref.rho, atol=1e-5)
+        assert np.allclose(obs.v_or, obs_ref.v_or, atol=1e-3)
+        assert np.allclose(obs.gen_q, obs_ref.gen_q, atol=1e-3)
+        assert np.array_equal(obs.topo_vect, obs_ref.topo_vect)
+        assert np.array_equal(obs.line_status, obs_ref.line_status)
+
+    def _aux_reset(self, ts_id):
+        obs = self.env.reset(seed=0, options={"time serie id": ts_id})
+        obs_ref = self.env_ref.reset(seed=0, options={"time serie id": ts_id})
+        self._aux_compare_obs(obs, obs_ref)
+
+    def test_kwargs(self):
+        assert self.env.backend._fast_reset
+        assert not self.env_ref.backend._fast_reset
+        cpy = self.env.backend.copy()
+        assert cpy._fast_reset
+        # the simulate backend has the same options
+        obs = self.env.get_obs()
+        assert obs._obs_env.backend._fast_reset
+
+    def test_grid_not_copied(self):
+        grid = self.env.backend._grid
+        self.env.step(self.env.action_space({"set_line_status": [(0, -1)]}))
+        self.env.reset(seed=0, options={"time serie id": 0})
+        assert self.env.backend._grid is grid
+        assert self.env.backend._grid.line["in_service"].all()
+        # the reference backend copies the grid
+        grid_ref = self.env_ref.backend._grid
+        self.env_ref.reset(seed=0, options={"time serie id": 0})
+        assert self.env_ref.backend._grid is not grid_ref
+
+    def test_same_results(self):
+        acts = [{"set_line_status": [(0, -1)]},
+                {},
+                {"set_bus": {"substations_id": [(1, (1, 2, 2, 1, 1, 2))]}},
+                {},
+                ]
+        for ts_id in [0, 1, 0]:
+            for act_dict in acts:
+                obs, reward, done, info = self.env.step(self.env.action_space(act_dict))
+                obs_ref, reward_ref, done_ref, info_ref = self.env_ref.step(self.env_ref.action_space(act_dict))
+                assert not done_ref
+                assert done == done_ref
+                self._aux_compare_obs(obs, obs_ref)
+            # the grid is properly set back to its original state
+            self._aux_reset(ts_id)
+
+    def test_topo_vect_at(self):
+        """the bus of the elements modified by an action are read directly from the grid"""
+        backend = self.env.backend
+        all_pos = np.arange(type(backend).dim_topo)
+        act_dict = {"set_line_status": [(0, -1)],
+                    "set_bus": {"substations_id": [(1, (1, 2, 2, 1, 1, 2))]}}
+        for act in [self.env.action_space(), self.env.action_space(act_dict)]:
+            self.env.step(act)
+            assert np.array_equal(backend._get_topo_vect_at(all_pos), backend._get_topo_vect())
+            some_pos = np.array([5, 0, 3])
+            assert np.array_equal(backend._get_topo_vect_at(some_pos), backend._get_topo_vect()[some_pos])
+        # the grid is read, not the topo_vect of the last powerflow
+        backend._grid.line["in_service"].iat[1] = False
+        pos_or = type(backend).line_or_pos_topo_vect[1]
+        assert backend._get_topo_vect_at(np.array([pos_or]))[0] == -1
+        assert backend.get_topo_vect()[pos_or] == 1
+
+    def test_after_game_over(self):
+        # powerflow diverges
+        load_p = 1. * self.env.get_obs().load_p
+        for env in [self.env, self.env_ref]:
+            env.backend._grid.load["p_mw"] = 10. * load_p
+            conv, exc_ = env.backend.runpf()
+            assert not conv
+        self._aux_reset(1)
+        # game over because of an illegal topology
+        act_dict = {"set_bus": {"loads_id": [(0, 2)]}}
+        obs, reward, done, info = self.env.step(self.env.action_space(act_dict))
+        obs_ref, reward_ref, done_ref, info_ref = self.env_ref.step(self.env_ref.action_space(act_dict))
+        assert done_ref
+        assert done
+        self._aux_reset(0)
+        for _ in range(3):
+            obs, *_ = self.env.step(self.env.action_space())
+            obs_ref, *_ = self.env_ref.step(self.env_ref.action_space())
+            self._aux_compare_obs(obs, obs_ref)
+
+
+class TestLoadingBackendFuncFastReset(BaseTestLoadingBackendFunc, unittest.TestCase):
+    def setUp(self):
+        BaseTestLoadingBackendFunc.setUp(self)
+
+    def tearDown(self):
+        BaseTestLoadingBackendFunc.tearDown(self)
+
+    def make_backend(self, detailed_infos_for_cascading_failures=False):
+        return _make_backend(detailed_infos_for_cascading_failures)
+
+
+class TestTopoActionFastReset(BaseTestTopoAction, unittest.TestCase):
+    def setUp(self):
+        BaseTestTopoAction.setUp(self)
+
+    def tearDown(self):
+        BaseTestTopoAction.tearDown(self)
+
+    def make_backend(self, detailed_infos_for_cascading_failures=False):
+        return _make_backend(detailed_infos_for_cascading_failures)
+
+
+class TestStorageActionFastReset(BaseTestStorageAction, unittest.TestCase):
+    def setUp(self):
+        BaseTestStorageAction.setUp(self)
+
+    def tearDown(self):
+        BaseTestStorageAction.tearDown(self)
+
+    def make_backend(self, detailed_infos_for_cascading_failures=False):
+        return _make_backend(detailed_infos_for_cascading_failures)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import numpy as np
+import unittest
+import warnings
+
+import grid2op
+from grid2op.Backend import PandaPowerBackend
+from grid2op.tests.BaseBackendTest import BaseTestLoadingBackendFunc
+from grid2op.tests.BaseBackendTest import BaseTestTopoAction
+from grid2op.tests.BaseBackendTest import BaseTestEnvPerformsCorrectCascadingFailures
+from grid2op.tests.BaseBackendTest import BaseTestStorageAction
+
+
+def _make_backend(detailed_infos_for_cascading_failures=False):
+    return PandaPowerBackend(
+        detailed_infos_for_cascading_failures=detailed_infos_for_cascading_failures,
+        warm_start=True,
+        skip_identical_pf=True,
+    )
+
+
+class TestWarmStartSkipPF(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True,
+                                    backend=_make_backend(),
+                                    _add_to_name=type(self).__name__)
+            self.env_ref = grid2op.make("l2rpn_case14_sandbox", test=True,
+                                        backend=PandaPowerBackend(),
+                                        _add_to_name=type(self).__name__)
+        self.env.reset(seed=0, options={"time serie id": 0})
+        self.env_ref.reset(seed=0, options={"time serie id": 0})
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        self.env_ref.close()
+        return super().tearDown()
+
+    def test_kwargs(self):
+        assert self.env.backend._warm_start
+        assert self.env.backend._skip_identical_pf
+        assert not self.env_ref.backend._warm_start
+        assert not self.env_ref.backend._skip_identical_pf
+        cpy = self.env.backend.copy()
+        assert cpy._warm_start
+        assert cpy._skip_identical_pf
+        # the simulate backend has the same options
+        obs = self.env.get_obs()
+        assert obs._obs_env.backend._warm_start
+        assert obs._obs_env.backend._skip_identical_pf
+
+    def test_same_results(self):
+        acts = [{},
+                {"set_line_status": [(0, -1)]},
+                {},
+                {},
+                {},
+                {"set_line_status": [(0, +1)]},
+                {},
+                {"set_bus": {"substations_id": [(1, (1, 2, 2, 1, 1, 2))]}},
+                {},
+                ]
+        for act_dict in acts:
+            obs, reward, done, info = self.env.step(self.env.action_space(act_dict))
+            obs_ref, reward_ref, done_ref, info_ref = self.env_ref.step(self.env_ref.action_space(act_dict))
+            assert not done_ref
+            assert done == done_ref
+            assert info["is_illegal"] == info_ref["is_illegal"]
+            assert np.allclose(obs.rho, obs_ref.rho, atol=1e-5)
+            assert np.allclose(obs.v_or, obs_ref.v_or, atol=1e-3)
+            assert np.allclose(obs.gen_q, obs_ref.gen_q, atol=1e-3)
+        stats = self.env.backend.get_pf_stats()
+        assert stats["warm_start_hits"] >= 1
+        assert stats["warm_start_misses"] >= 1
+        assert self.env_ref.backend.get_pf_stats()["warm_start_hits"] == 0
+
+    def test_skip_pf(self):
+        obs = self.env.get_obs()
+        sim_obs, *_ = obs.simulate(self.env.action_space())
+        stats = obs._obs_env.backend.get_pf_stats()
+        sim_obs2, *_ = obs.simulate(self.env.action_space())
+        stats2 = obs._obs_env.backend.get_pf_stats()
+        assert stats2["skip_hits"] == stats["skip_hits"] + 1
+        assert np.array_equal(sim_obs.rho, sim_obs2.rho)
+
+        # a different action is not skipped
+        sim_obs3, *_ = obs.simulate(self.env.action_space({"set_line_status": [(0, -1)]}))
+        stats3 = obs._obs_env.backend.get_pf_stats()
+        assert stats3["skip_hits"] == stats2["skip_hits"]
+        assert stats3["skip_misses"] == stats2["skip_misses"] + 1
+        assert not np.array_equal(sim_obs.rho, sim_obs3.rho)
+
+    def test_skip_pf_is_dc(self):
+        backend = self.env.backend
+        nb_hits = backend.get_pf_stats()["skip_hits"]
+        p_or_ac = 1. * backend.p_or
+        conv, exc_ = backend.runpf(is_dc=True)
+        assert conv
+        assert backend.get_pf_stats()["skip_hits"] == nb_hits
+        assert not np.allclose(backend.p_or, p_or_ac)
+        conv, exc_ = backend.runpf(is_dc=True)
+        assert conv
+        assert backend.get_pf_stats()["skip_hits"] == nb_hits + 1
+
+        # warm start is not used after a DC powerflow
+        nb_ws_hits = backend.get_pf_stats()["warm_start_hits"]
+        conv, exc_ = backend.runpf(is_dc=False)
+        assert conv
+        assert backend.get_pf_stats()["warm_start_hits"] == nb_ws_hits
+        assert np.allclose(backend.p_or, p_or_ac, atol=1e-4)
+
+
+class _PPOtherSignature(PandaPowerBackend):
+    def __init__(self,
+                 detailed_infos_for_cascading_failures=False,
+                 lightsim2grid=False,
+                 dist_slack=False,
+                 max_iter=10,
+                 can_be_copied=True,
+                 with_numba=False):
+        super().__init__(detailed_infos_for_cascading_failures,
+                         lightsim2grid,
+                         dist_slack,
+                         max_iter,
+                         can_be_copied=can_be_copied,
+                         with_numba=with_numba)
+
+
+class _PPWithWarmStart(PandaPowerBackend):
+    def __init__(self,
+                 detailed_infos_for_cascading_failures=False,
+                 lightsim2grid=False,
+                 dist_slack=False,
+                 max_iter=10,
+                 can_be_copied=True,
+                 with_numba=False,
+                 warm_start=False):
+        super().__init__(detailed_infos_for_cascading_failures,
+                         lightsim2grid,
+                         dist_slack,
+                         max_iter,
+                         can_be_copied=can_be_copied,
+                         with_numba=with_numba,
+                         warm_start=warm_start)
+
+
+class TestKwargsInheritance(unittest.TestCase):
+    def test_other_signature(self):
+        backend = _PPOtherSignature()
+        assert "warm_start" not in backend._my_kwargs
+        assert "skip_identical_pf" not in backend._my_kwargs
+        cpy = backend.copy()
+        assert not cpy._warm_start
+
+    def test_opt_in(self):
+        backend = _PPWithWarmStart(warm_start=True)
+        assert backend._my_kwargs["warm_start"]
+        assert "skip_identical_pf" not in backend._my_kwargs
+        cpy = backend.copy()
+        assert cpy._warm_start
+        assert not cpy._skip_identical_pf
+
+    def test_base_class(self):
+        backend = PandaPowerBackend(warm_start=True)
+        assert backend._my_kwargs["warm_start"]
+        assert not backend._my_kwargs["skip_identical_pf"]
+        assert not backend._my_kwargs["fast_reset"]
+
+
+class TestLoadingBackendFuncWarmStart(BaseTestLoadingBackendFunc, unittest.TestCase):
+    def setUp(self):
+        BaseTestLoadingBackendFunc.setUp(self)
+
+    def tearDown(self):
+        BaseTestLoadingBackendFunc.tearDown(self)
+
+    def make_backend(self, detailed_infos_for_cascading_failures=False):
+        return _make_backend(detailed_infos_for_cascading_failures)
+
+
+class TestTopoActionWarmStart(BaseTestTopoAction, unittest.TestCase):
+    def setUp(self):
+        BaseTestTopoAction.setUp(self)
+
+    def tearDown(self):
+        BaseTestTopoAction.tearDown(self)
+
+    def make_backend(self, detailed_infos_for_cascading_failures=False):
+        return _make_backend(detailed_infos_for_cascading_failures)
+
+
+class TestCascadingFailuresWarmStart(BaseTestEnvPerformsCorrectCascadingFailures, unittest.TestCase):
+    def setUp(self):
+        BaseTestEnvPerformsCorrectCascadingFailures.setUp(self)
+
+    def tearDown(self):
+        BaseTestEnvPerformsCorrectCascadingFailures.tearDown(self)
+
+    def make_backend(self, detailed_infos_for_cascading_failures=False):
+        return _make_backend(detailed_infos_for_cascading_failures)
+
+
+class TestStorageActionWarmStart(BaseTestStorageAction, unittest.TestCase):
+    def setUp(self):
+        BaseTestStorageAction.setUp(self)
+
+    def tearDown(self):
+        BaseTestStorageAction.tearDown(self)
+
+    def make_backend(self, detailed_infos_for_cascading_failures=False):
+        return _make_backend(detailed_infos_for_cascading_failures)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import numpy as np
+import unittest
+import warnings
+from scipy.optimize import minimize, LinearConstraint
+
+import grid2op
+from grid2op.Parameters import Parameters
+from grid2op.Environment._dispatchSolver import closed_form_dispatch
+
+
+class TestClosedFormSolver(unittest.TestCase):
+    """test the solver itself, against SLSQP"""
+    def _aux_slsqp(self, fun, n, total, lo, hi):
+        res = minimize(fun,
+                       np.zeros(n),
+                       method="SLSQP",
+                       constraints=[LinearConstraint(np.ones((1, n)), total, total),
+                                    LinearConstraint(np.eye(n), lo, hi)],
+                       options={"ftol": 1e-12})
+        return res.fun
+
+    def test_random_problems(self):
+        rng = np.random.default_rng(0)
+        for _ in range(100):
+            n = rng.integers(1, 12)
+            weights = rng.uniform(0.1, 2., n)
+            target = rng.normal(0., 5., n)
+            lo = -rng.uniform(0., 10., n)
+            hi = rng.uniform(0., 10., n)
+            is_modified = rng.random(n) <= 0.5
+            total = rng.uniform(lo.sum(), hi.sum())
+            res = closed_form_dispatch(weights, target, is_modified, lo, hi, total, 1e-6)
+            assert res is not None
+            assert abs(res.sum() - total) <= 1e-6
+            assert (res >= lo - 1e-9).all()
+            assert (res <= hi + 1e-9).all()
+            if not is_modified.any():
+                continue
+            fun = lambda x: (weights[is_modified] * (x[is_modified] - target[is_modified])**2).sum()
+            assert fun(res) <= self._aux_slsqp(fun, n, total, lo, hi) + 1e-5
+
+    def test_infeasible(self):
+        weights = np.ones(3)
+        target = np.zeros(3)
+        is_modified = np.array([True, False, False])
+        lo = -np.ones(3)
+        hi = np.ones(3)
+        assert closed_form_dispatch(weights, target, is_modified, lo, hi, 4., 1e-6) is None
+        assert closed_form_dispatch(weights, target, is_modified, lo, hi, -4., 1e-6) is None
+        res = closed_form_dispatch(weights, target, is_modified, lo, hi, 3., 1e-6)
+        assert np.allclose(res, hi)
+
+    def test_free_gen_first(self):
+        weights = np.array([1., 1., 3.])
+        target = np.array([2., 0., 0.])
+        is_modified = np.array([True, False, False])
+        lo = -10. * np.ones(3)
+        hi = 10. * np.ones(3)
+        res = closed_form_dispatch(weights, target, is_modified, lo, hi, 0., 1e-6)
+        assert np.allclose(res, [2., -1.5, -0.5])
+
+        # free generators cannot absorb everything
+        lo = np.array([-10., -1., -1.])
+        res = closed_form_dispatch(weights, target, is_modified, lo, hi, 0., 1e-6)
+        assert np.allclose(res, [2., -1., -1.])
+
+
+class TestClosedFormEnv(unittest.TestCase):
+    """test the solver is properly used by the environment"""
+    def setUp(self) -> None:
+        param = Parameters()
+        param.REDISPATCHING_SOLVER = "closed_form"
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("rte_case14_redisp", test=True, param=param, _add_to_name=type(self).__name__)
+            self.env_ref = grid2op.make("rte_case14_redisp", test=True, _add_to_name=type(self).__name__)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        self.env_ref.close()
+        return super().tearDown()
+
+    def test_param(self):
+        assert self.env.parameters.REDISPATCHING_SOLVER == "closed_form"
+        assert self.env_ref.parameters.REDISPATCHING_SOLVER == "SLSQP"
+        param = Parameters()
+        param.REDISPATCHING_SOLVER = "something_else"
+        with self.assertRaises(RuntimeError):
+            param.check_valid()
+
+    def test_same_results(self):
+        obs = self.env.reset(seed=0, options={"time serie id": 0})
+        obs_ref = self.env_ref.reset(seed=0, options={"time serie id": 0})
+        acts = [{"redispatch": [(0, 2.)]},
+                {"redispatch": [(1, -3.)]},
+                {},
+                {"redispatch": [(0, -2.), (1, 3.)]},
+                {},
+                ]
+        for act_dict in acts:
+            obs, reward, done, info = self.env.step(self.env.action_space(act_dict))
+            obs_ref, *_ = self.env_ref.step(self.env_ref.action_space(act_dict))
+            assert not done
+            assert not info["exception"]
+            assert abs(obs.actual_dispatch.sum()) <= 1e-3
+            # same target (hence same objective function) as the SLSQP solver
+            assert np.allclose(obs.target_dispatch, obs_ref.target_dispatch)
+            # and the solution is at least as good (SLSQP is only approximate)
+            modified = self.env._already_modified_gen
+            err = (np.abs(obs.actual_dispatch - obs.target_dispatch)[modified]).sum()
+            err_ref = (np.abs(obs_ref.actual_dispatch - obs_ref.target_dispatch)[modified]).sum()
+            assert err <= err_ref + 1e-4
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+
+import grid2op
+from grid2op.Runner import Runner
+
+
+class _CountingPbar:
+    def __init__(self):
+        self.n = 0
+
+    def update(self, n):
+        self.n += n
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class TestRunnerDynamicSchedule(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox",
+                                    test=True,
+                                    _add_to_name=type(self).__name__)
+        self.runner = Runner(**self.env.get_params_for_runner())
+        # episodes of different lengths
+        self.max_steps = [3, 12, 5, 8]
+        self.reset_options = [{"max step": el} for el in self.max_steps]
+        self.kwargs = dict(nb_episode=4,
+                           episode_id=[0, 1, 0, 1],
+                           env_seeds=[0, 1, 2, 3],
+                           reset_options=self.reset_options)
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_same_as_sequential(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            res_seq = self.runner.run(nb_process=1, **self.kwargs)
+            res_par = self.runner.run(nb_process=2, **self.kwargs)
+        assert [el[3] for el in res_par] == self.max_steps
+        assert [el[1] for el in res_par] == ["0000", "0001", "0000", "0001"]
+        for el_seq, el_par in zip(res_seq, res_par):
+            assert el_seq[1:] == el_par[1:]
+
+    def test_expected_lengths(self):
+        pbar = _CountingPbar()
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            res_ref = self.runner.run(nb_process=2, **self.kwargs)
+            res = self.runner.run(nb_process=2, expected_lengths=self.max_steps, pbar=pbar, **self.kwargs)
+        # results are in the order of the episodes, not in the order of computation
+        assert res == res_ref
+        assert pbar.n == 4
+
+    def test_raise(self):
+        with self.assertRaises(RuntimeError):
+            self.runner.run(nb_process=2, expected_lengths=[1, 2], **self.kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
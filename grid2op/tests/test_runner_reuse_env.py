@@ -0,0 +1,101 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import tempfile
+import warnings
+import unittest
+
+import grid2op
+from grid2op.Agent import RandomAgent
+from grid2op.Runner import Runner
+from grid2op.Exceptions import Grid2OpException
+
+
+def _warmup_fn(env, agent):
+    # count the number of environments built (in the process)
+    env.nb_warmup_runner_test = 1
+    with open(os.path.join(os.environ["GRID2OP_TEST_WARMUP_DIR"], f"{os.getpid()}_{id(env)}"), "w") as f:
+        f.write("warmup")
+
+
+def _warmup_fn_close(env, agent):
+    # write a file when the environment is closed (in the process)
+    env_close = env.close
+    def close():
+        with open(os.path.join(os.environ["GRID2OP_TEST_WARMUP_DIR"], f"closed_{os.getpid()}_{id(env)}"), "w") as f:
+            f.write("closed")
+        env_close()
+    env.close = close
+
+
+class TestRunnerReuseEnv(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox",
+                                    test=True,
+                                    _add_to_name=type(self).__name__)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.environ["GRID2OP_TEST_WARMUP_DIR"] = self.tmp_dir.name
+        self.kwargs = dict(nb_episode=4,
+                           max_iter=10,
+                           episode_id=[0, 1, 0, 1],
+                           env_seeds=[0, 1, 2, 3],
+                           agent_seeds=[4, 5, 6, 7])
+
+    def tearDown(self) -> None:
+        self.env.close()
+        self.tmp_dir.cleanup()
+        del os.environ["GRID2OP_TEST_WARMUP_DIR"]
+        return super().tearDown()
+
+    def _aux_run(self, nb_process, **kwargs):
+        runner = Runner(**self.env.get_params_for_runner(), agentClass=RandomAgent, **kwargs)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            res = runner.run(nb_process=nb_process, add_timings=True, **self.kwargs)
+        return runner, res
+
+    def _aux_nb_warmup(self):
+        return len(os.listdir(self.tmp_dir.name))
+
+    def test_sequential(self):
+        _, res_ref = self._aux_run(1, warmup_fn=_warmup_fn)
+        assert self._aux_nb_warmup() == 4
+        runner, res = self._aux_run(1, reuse_env=True, warmup_fn=_warmup_fn)
+        # only one more environment has been built
+        assert self._aux_nb_warmup() == 5
+        for el, el_ref in zip(res, res_ref):
+            assert el[:-1] == el_ref[:-1]
+            assert el[-1].count("setup") == 1
+        # environment is closed at the end of the run
+        assert runner._reused_env_agent is None
+
+    def test_parallel(self):
+        _, res_ref = self._aux_run(1)
+        _, res = self._aux_run(2, reuse_env=True, warmup_fn=_warmup_fn)
+        assert self._aux_nb_warmup() <= 2
+        for el, el_ref in zip(res, res_ref):
+            assert el[:-1] == el_ref[:-1]
+            assert el[-1].count("setup") == 1
+
+    def test_parallel_close(self):
+        self._aux_run(2, reuse_env=True, warmup_fn=_warmup_fn_close)
+        # the environments reused by the processes are closed when the pool ends
+        files = os.listdir(self.tmp_dir.name)
+        assert 1 <= len(files) <= 2
+        assert all(el.startswith("closed_") for el in files)
+
+    def test_raise(self):
+        with self.assertRaises(Grid2OpException):
+            Runner(**self.env.get_params_for_runner(), warmup_fn=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Exceptions import SimulatorError
+from grid2op.simulator import SensitivitySimulator, ContingencyAnalysis
+
+
+class TestSensitivitySimulator(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox",
+                                    test=True,
+                                    _add_to_name=type(self).__name__)
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.obs = self.env.reset()
+        self.sens_sim = SensitivitySimulator(self.env)
+        self.sens_sim.set_state(self.obs)
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_do_nothing(self):
+        rho = self.sens_sim.predict(self.env.action_space())
+        assert rho.shape == (1, type(self.env).n_line)
+        assert np.allclose(rho[0], self.obs.rho, atol=1e-5)
+
+    def test_n1(self):
+        n_line = type(self.env).n_line
+        acts = [self.env.action_space({"set_line_status": [(l_id, -1)]}) for l_id in range(n_line)]
+        rho = self.sens_sim.predict(acts)
+        valid = self.sens_sim.valid
+        rho_n1 = self.sens_sim.predict_n1()
+        assert np.array_equal(valid, self.sens_sim.valid)
+        assert np.allclose(rho, rho_n1, equal_nan=True, atol=1e-5)
+        assert (rho[valid, np.arange(n_line)[valid]] == 0.).all()
+
+        with ContingencyAnalysis(self.env) as cont_an:
+            rho_ac = cont_an.compute(self.obs)
+            converged = cont_an.converged
+        # same contingencies split the grid
+        assert np.array_equal(valid, converged)
+        assert np.isnan(rho[~valid]).all()
+        # the approximation is close to the AC powerflow
+        assert np.nanmax(np.abs(rho - rho_ac)) <= 0.5
+        assert np.nanargmax(np.nanmax(rho, axis=1)) == np.nanargmax(np.nanmax(rho_ac, axis=1))
+
+    def test_lodf(self):
+        lodf = self.sens_sim.get_lodf()
+        n_line = type(self.env).n_line
+        assert lodf.shape == (n_line, n_line)
+        assert np.allclose(np.diag(lodf), -1.)
+        ptdf = self.sens_sim.get_ptdf()
+        assert ptdf.shape == (n_line, type(self.env).n_busbar_per_sub * type(self.env).n_sub)
+
+    def test_same_as_simulate(self):
+        acts = [self.env.action_space({"redispatch": [(0, 5.)]}),
+                self.env.action_space({"change_line_status": [4]}),
+                self.env.action_space({"set_bus": {"substations_id": [(1, [1, 2, 2, 1, 1, 2])]}}),
+                self.env.action_space({"set_bus": {"substations_id": [(5, [1, 1, 2, 2, 1, 2, 2])]}}),
+                ]
+        rho = self.sens_sim.predict(acts)
+        assert self.sens_sim.valid.all()
+        for act, this_rho, atol in zip(acts, rho, [0.05, 0.05, 0.3, 0.3]):
+            sim_obs, sim_r, sim_d, sim_i = self.obs.simulate(act, time_step=0)
+            assert not sim_d
+            assert np.abs(this_rho - sim_obs.rho).max() <= atol
+
+    def test_topo_cache(self):
+        self.sens_sim.TOPO_CACHE_SIZE = 2
+        acts = [self.env.action_space({"set_bus": {"substations_id": [(1, [1, 2, 2, 1, 1, 2])]}}),
+                self.env.action_space({"set_bus": {"substations_id": [(5, [1, 1, 2, 2, 1, 2, 2])]}}),
+                ]
+        rho = self.sens_sim.predict(acts)
+        assert len(self.sens_sim._topo_cache) == 2
+        assert np.allclose(rho, self.sens_sim.predict(acts))
+
+    def test_islanding(self):
+        # the generator of substation 7 is only connected to the grid through powerline 18
+        rho = self.sens_sim.predict([self.env.action_space({"set_line_status": [(18, -1)]}),
+                                     self.env.action_space()])
+        assert np.array_equal(self.sens_sim.valid, [False, True])
+        assert np.isnan(rho[0]).all()
+
+    def test_lodf_disconnected(self):
+        obs, reward, done, info = self.env.step(self.env.action_space({"set_line_status": [(4, -1)]}))
+        assert not done
+        self.sens_sim.set_state(obs)
+        lodf = self.sens_sim.get_lodf()
+        assert (lodf[:, 4] == 0.).all()
+        assert np.allclose(np.delete(np.diag(lodf), 4), -1.)
+
+    def test_susceptance_static(self):
+        b_ref = self.env.backend.get_dc_line_susceptance()
+        # it is read when the grid is loaded, and does not need the results of a powerflow
+        backend = self.env.backend.copy()
+        backend._grid._ppc = None
+        assert np.array_equal(backend.get_dc_line_susceptance(), b_ref)
+        sens_sim = SensitivitySimulator(backend)
+        sens_sim.set_state(self.obs)
+        assert np.allclose(sens_sim.predict(self.env.action_space())[0], self.obs.rho, atol=1e-5)
+        backend.close()
+
+    def test_raise(self):
+        with self.assertRaises(SimulatorError):
+            SensitivitySimulator(None)
+        sens_sim = SensitivitySimulator(self.env.backend)
+        with self.assertRaises(SimulatorError):
+            sens_sim.predict(self.env.action_space())
+        with self.assertRaises(SimulatorError):
+            sens_sim.set_state(None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import numpy as np
+import unittest
+import warnings
+
+import grid2op
+from grid2op.Exceptions import NoForecastAvailable
+
+
+class TestSimulateBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True, _add_to_name=type(self).__name__)
+        self.obs = self.env.reset(seed=0, options={"time serie id": 0})
+        self.acts = [self.env.action_space(),
+                     self.env.action_space({"set_line_status": [(0, -1)]}),
+                     self.env.action_space({"set_bus": {"loads_id": [(0, -1)]}}),  # game over
+                     self.env.action_space({"redispatch": [(0, 2.)]}),
+                     self.env.action_space(),
+                     ]
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_check_same_as_simulate(self, res, time_step=1):
+        for act_id, act in enumerate(self.acts):
+            sim_o, sim_r, sim_d, sim_i = self.obs.simulate(act, time_step=time_step)
+            assert res["done"][act_id] == sim_d, f"error for action {act_id}"
+            assert np.allclose(res["reward"][act_id], sim_r), f"error for action {act_id}"
+            assert np.allclose(res["rho"][act_id], sim_o.rho), f"error for action {act_id}"
+            assert np.allclose(res["p_or"][act_id], sim_o.p_or), f"error for action {act_id}"
+            assert np.allclose(res["a_or"][act_id], sim_o.a_or), f"error for action {act_id}"
+            assert res["info"][act_id]["is_illegal"] == sim_i["is_illegal"], f"error for action {act_id}"
+            assert np.array_equal(res["info"][act_id]["disc_lines"], sim_i["disc_lines"]), f"error for action {act_id}"
+
+    def test_shapes(self):
+        res = self.obs.simulate_batch(self.acts)
+        nb_act = len(self.acts)
+        n_line = type(self.env).n_line
+        assert res["rho"].shape == (nb_act, n_line)
+        assert res["p_or"].shape == (nb_act, n_line)
+        assert res["a_or"].shape == (nb_act, n_line)
+        assert res["reward"].shape == (nb_act,)
+        assert res["done"].shape == (nb_act,)
+        assert len(res["info"]) == nb_act
+        assert not res["done"][0]
+        assert res["done"][2]
+
+    def test_same_as_simulate(self):
+        res = self.obs.simulate_batch(self.acts)
+        self._aux_check_same_as_simulate(res)
+
+    def test_same_as_simulate_other_ts(self):
+        res = self.obs.simulate_batch(self.acts, time_step=0)
+        self._aux_check_same_as_simulate(res, time_step=0)
+
+    def test_obs_not_modified(self):
+        rho_before = 1. * self.obs.rho
+        res = self.obs.simulate_batch(self.acts)
+        assert np.array_equal(self.obs.rho, rho_before)
+        # regular simulate still works after
+        sim_o, sim_r, sim_d, sim_i = self.obs.simulate(self.acts[0])
+        assert not sim_d
+        assert np.allclose(sim_o.rho, res["rho"][0])
+
+    def test_counts_as_simulate(self):
+        nb_before = self.env.nb_highres_called
+        self.obs.simulate_batch(self.acts)
+        assert self.env.nb_highres_called == nb_before + len(self.acts)
+
+    def test_raises_no_forecast(self):
+        with self.assertRaises(NoForecastAvailable):
+            self.obs.simulate_batch(self.acts, time_step=-1)
+        with self.assertRaises(NoForecastAvailable):
+            self.obs.simulate_batch(self.acts, time_step=10000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,238 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import json
+import unittest
+import warnings
+import numpy as np
+
+import grid2op
+from grid2op.Environment import StepTimings, SingleEnvMultiProcess
+from grid2op.Exceptions import EnvError
+from grid2op.Runner import Runner
+
+
+class TestStepTimings(unittest.TestCase):
+    """test the histograms themselves"""
+    def _aux_assert_same(self, timings, timings_ref):
+        for phase in StepTimings.PHASES:
+            assert (timings.histogram(phase)[0] == timings_ref.histogram(phase)[0]).all()
+            assert np.isclose(timings.total(phase), timings_ref.total(phase))
+            assert timings.percentile(phase, 0.) == timings_ref.percentile(phase, 0.) or timings.count(phase) == 0
+            assert timings.percentile(phase, 100.) == timings_ref.percentile(phase, 100.) or timings.count(phase) == 0
+
+    def test_percentile(self):
+        timings = StepTimings()
+        rng = np.random.default_rng(0)
+        vals = 10. ** rng.uniform(-5., -1., 10_000)
+        for el in vals:
+            timings.record("powerflow", el)
+        assert timings.count("powerflow") == vals.shape[0]
+        assert np.isclose(timings.total("powerflow"), vals.sum())
+        assert np.isclose(timings.mean("powerflow"), vals.mean())
+        for q in [1., 50., 90., 99.]:
+            ref = np.percentile(vals, q)
+            # relative error bounded by the width of the bins
+            assert abs(timings.percentile("powerflow", q) / ref - 1.) <= 0.15
+        assert timings.percentile("powerflow", 0.) == vals.min()
+        assert timings.percentile("powerflow", 100.) == vals.max()
+        assert np.isnan(timings.percentile("reward", 50.))
+
+    def test_out_of_bounds(self):
+        timings = StepTimings()
+        timings.record("step", 0.)
+        timings.record("step", 1e5)
+        counts, edges = timings.histogram("step")
+        assert counts[0] == 1
+        assert counts[-1] == 1
+        assert counts.shape[0] == edges.shape[0] + 1
+        assert timings.percentile("step", 10.) == 0.
+        assert timings.percentile("step", 90.) == 1e5
+
+    def test_merge(self):
+        timings1 = StepTimings()
+        timings2 = StepTimings()
+        timings_all = StepTimings()
+        rng = np.random.default_rng(1)
+        for el in 10. ** rng.uniform(-5., -1., 100):
+            timings1.record("rules", el)
+            timings_all.record("rules", el)
+        for el in 10. ** rng.uniform(-4., 0., 50):
+            timings2.record("rules", el)
+            timings_all.record("rules", el)
+        timings2.record("reward", 1e-3)
+        timings_all.record("reward", 1e-3)
+
+        res = StepTimings.aggregate([timings1, None, timings2])
+        self._aux_assert_same(res, timings_all)
+        assert timings1.count("rules") == 100  # not modified
+        timings1.merge(timings2)
+        self._aux_assert_same(timings1, timings_all)
+        with self.assertRaises(EnvError):
+            timings1.merge(None)
+
+    def test_to_dict(self):
+        timings = StepTimings()
+        assert timings.to_dict() == {}
+        timings.record("reward", 1e-4)
+        res = timings.to_dict()
+        assert list(res.keys()) == ["reward"]
+        assert res["reward"]["count"] == 1
+        assert res["reward"]["p50"] == 1e-4
+        json.dumps(res)
+        with self.assertRaises(EnvError):
+            timings.count("something_else")
+
+    def test_reset(self):
+        timings = StepTimings()
+        timings.record("step", 1e-2)
+        timings.reset()
+        assert timings.to_dict() == {}
+        assert timings.count("step") == 0
+
+
+class TestEnvTimings(unittest.TestCase):
+    """test the timings are properly computed by the environment"""
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True, _add_to_name=type(self).__name__)
+        self.env.reset(seed=0, options={"time serie id": 0})
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_not_enabled(self):
+        with self.assertRaises(EnvError):
+            self.env.get_timings()
+        # does not break anything
+        self.env.reset_timings()
+        self.env.step(self.env.action_space())
+        assert self.env._timings is None
+
+    def test_step(self):
+        self.env.enable_timings()
+        nb_step = 5
+        for _ in range(nb_step):
+            obs, reward, done, info = self.env.step(self.env.action_space())
+            assert not done
+        timings = self.env.get_timings()
+        for phase in ["step", "chronics", "rules", "create_bk_act", "redisp", "opponent",
+                      "apply_act", "powerflow", "extract_obs", "reward"]:
+            assert timings.count(phase) == nb_step, f"error for {phase}"
+        assert np.isclose(timings.total("powerflow"), self.env._time_powerflow)
+        assert np.isclose(timings.total("step"), self.env._time_step)
+        assert timings.total("step") >= timings.total("powerflow")
+
+        self.env.step(self.env.action_space())
+        assert self.env.get_timings().count("step") == nb_step + 1
+        # get_timings returns a copy
+        assert timings.count("step") == nb_step
+
+    def test_reset_and_disable(self):
+        self.env.enable_timings()
+        self.env.step(self.env.action_space())
+        # reset of the env does not reset the timings
+        self.env.reset()
+        assert self.env.get_timings().count("step") == 1
+        # but reset_timings does
+        self.env.reset_timings()
+        assert self.env.get_timings().count("step") == 0
+        self.env.step(self.env.action_space())
+        # enabling twice does not reset them
+        self.env.enable_timings()
+        assert self.env.get_timings().count("step") == 1
+        self.env.enable_timings(False)
+        with self.assertRaises(EnvError):
+            self.env.get_timings()
+
+    def test_copy(self):
+        self.env.enable_timings()
+        self.env.step(self.env.action_space())
+        env_cpy = self.env.copy()
+        env_cpy.step(env_cpy.action_space())
+        assert env_cpy.get_timings().count("step") == 2
+        assert self.env.get_timings().count("step") == 1
+        env_cpy.close()
+
+
+class TestTimingsMultiProcess(unittest.TestCase):
+    """test the timings can be gathered from different processes"""
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True, _add_to_name=type(self).__name__)
+        self.max_iter = 5
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_multi_process_env(self):
+        nb_env = 2
+        multi_env = SingleEnvMultiProcess(env=self.env, nb_env=nb_env)
+        try:
+            with self.assertRaises(EnvError):
+                multi_env.get_timings()
+            multi_env.enable_timings()
+            multi_env.reset_timings()
+            for _ in range(3):
+                multi_env.step([self.env.action_space() for _ in range(nb_env)])
+            all_timings = multi_env.get_timings(aggregate=False)
+            assert len(all_timings) == nb_env
+            for el in all_timings:
+                assert el.count("step") == 3
+            timings = multi_env.get_timings()
+            assert timings.count("step") == 3 * nb_env
+            assert (timings.histogram("powerflow")[0] ==
+                    StepTimings.aggregate(all_timings).histogram("powerflow")[0]).all()
+        finally:
+            multi_env.close()
+
+    def test_runner(self):
+        runner = Runner(**self.env.get_params_for_runner())
+        res = runner.run(nb_episode=2, max_iter=self.max_iter, episode_id=[0, 1])
+        assert len(res[0]) == 5
+        res = runner.run(nb_episode=2, max_iter=self.max_iter, add_timings=True, episode_id=[0, 1])
+        for el in res:
+            assert len(el) == 6
+            assert isinstance(el[-1], StepTimings)
+            assert el[-1].count("step") == self.max_iter
+        timings = StepTimings.aggregate([el[-1] for el in res])
+        assert timings.count("reward") == 2 * self.max_iter
+
+        res = runner.run(nb_episode=2, max_iter=self.max_iter, add_timings=True,
+                         add_nb_highres_sim=True, add_detailed_output=True,
+                         nb_process=2, episode_id=[0, 1])
+        for el in res:
+            assert len(el) == 8
+            assert isinstance(el[-1], StepTimings)
+            assert el[-1].count("powerflow") == self.max_iter
+
+        *_, timings = runner.run_one_episode(max_iter=self.max_iter, add_timings=True)
+        assert timings.count("chronics") == self.max_iter
+
+    def test_runner_not_enabled(self):
+        runner = Runner(**self.env.get_params_for_runner(), reuse_env=True)
+        res = runner.run_one_episode(max_iter=self.max_iter)
+        assert len(res) == 5
+        env, agent = runner._reused_env_agent
+        # the steps are not profiled if the timings are not asked for
+        assert env._timings is None
+        *_, timings = runner.run_one_episode(max_iter=self.max_iter, add_timings=True)
+        assert env._timings is not None
+        runner.run_one_episode(max_iter=self.max_iter)
+        assert env._timings is None
+        runner._clean_up()
+
+
+if __name__ == "__main__":
+    unittest.main()